@@ -25,8 +25,12 @@ from nautilus_trader.common.uuid cimport UUIDFactory
 from nautilus_trader.model.c_enums.order_side cimport OrderSide
 from nautilus_trader.model.events.account cimport AccountState
 from nautilus_trader.model.events.order cimport OrderFilled
+from nautilus_trader.model.events.position cimport PositionEvent
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.objects cimport Money
+from nautilus_trader.model.orders.base cimport Order
+from nautilus_trader.model.orders.base cimport PassiveOrder
+from nautilus_trader.model.position cimport Position
 
 
 cdef class AccountsManager:
@@ -34,12 +38,27 @@ cdef class AccountsManager:
     cdef UUIDFactory _uuid_factory
     cdef LoggerAdapter _log
     cdef CacheFacade _cache
+    cdef dict _order_contributions
+    cdef dict _order_totals
+    cdef dict _order_update_counts
+    cdef dict _position_contributions
+    cdef dict _position_totals
+    cdef dict _position_update_counts
+
+    cdef readonly int recompute_interval
+    """The number of incremental updates per instrument between full recomputes.\n\n:returns: `int`"""
 
     cdef AccountState update_balances(self, Account account, Instrument instrument, OrderFilled fill)
     cdef AccountState update_orders(self, Account account, Instrument instrument, list passive_orders_working, int64_t ts_event)
+    cdef AccountState update_order(self, Account account, Instrument instrument, Order order, int64_t ts_event)
+    cdef AccountState _recalculate_orders(self, Account account, Instrument instrument, list passive_orders_working, int64_t ts_event, bint check_drift)
+    cdef object _calculate_order_contribution(self, Account account, Instrument instrument, PassiveOrder order)
+    cdef AccountState _apply_order_total(self, Account account, Instrument instrument, OrderSide side, int64_t ts_event)
     cdef AccountState update_positions(self, MarginAccount account, Instrument instrument, list positions_open, int64_t ts_event)
-    cdef AccountState _update_balance_locked(self, CashAccount account, Instrument instrument, list passive_orders_working, int64_t ts_event)
-    cdef AccountState _update_margin_init(self, MarginAccount account, Instrument instrument, list passive_orders_working, int64_t ts_event)
+    cdef AccountState update_position(self, MarginAccount account, Instrument instrument, PositionEvent event, int64_t ts_event)
+    cdef AccountState _recalculate_positions(self, MarginAccount account, Instrument instrument, list positions_open, int64_t ts_event, bint check_drift)
+    cdef AccountState _apply_position_total(self, MarginAccount account, Instrument instrument, OrderSide side, int64_t ts_event)
+    cpdef void reset(self) except *
     cdef void _update_balance_single_currency(self, Account account, OrderFilled fill, Money pnl) except *
     cdef void _update_balance_multi_currency(self, Account account, OrderFilled fill, list pnls) except *
     cdef AccountState _generate_account_state(self, Account account, int64_t ts_event)
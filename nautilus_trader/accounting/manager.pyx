@@ -25,11 +25,14 @@ from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.common.uuid cimport UUIDFactory
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.model.c_enums.order_side cimport OrderSide
+from nautilus_trader.model.c_enums.position_side cimport PositionSide
 from nautilus_trader.model.c_enums.price_type cimport PriceType
 from nautilus_trader.model.currency cimport Currency
+from nautilus_trader.model.events.position cimport PositionEvent
 from nautilus_trader.model.identifiers cimport PositionId
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.objects cimport AccountBalance
+from nautilus_trader.model.orders.base cimport Order
 from nautilus_trader.model.orders.base cimport PassiveOrder
 from nautilus_trader.model.position cimport Position
 
@@ -46,6 +49,14 @@ cdef class AccountsManager:
         The logger for the manager.
     clock : Clock
         The clock for the manager.
+    recompute_interval : int, default 1000
+        The number of incremental order or position updates for an instrument
+        after which its totals are fully recomputed (guarding against drift).
+
+    Raises
+    ------
+    ValueError
+        If `recompute_interval` is not positive (> 0).
     """
 
     def __init__(
@@ -53,12 +64,26 @@ cdef class AccountsManager:
         CacheFacade cache not None,
         LoggerAdapter log not None,
         Clock clock not None,
+        int recompute_interval=1000,
     ):
+        Condition.positive_int(recompute_interval, "recompute_interval")
+
         self._clock = clock
         self._uuid_factory = UUIDFactory()
         self._log = log
         self._cache = cache
 
+        # Per instrument contributions of each working order / open position
+        # (in the instruments cost currency) and their running totals
+        self._order_contributions = {}     # type: dict[InstrumentId, dict[ClientOrderId, Decimal]]
+        self._order_totals = {}            # type: dict[InstrumentId, Decimal]
+        self._order_update_counts = {}     # type: dict[InstrumentId, int]
+        self._position_contributions = {}  # type: dict[InstrumentId, dict[PositionId, Decimal]]
+        self._position_totals = {}         # type: dict[InstrumentId, Decimal]
+        self._position_update_counts = {}  # type: dict[InstrumentId, int]
+
+        self.recompute_interval = recompute_interval
+
     cdef AccountState update_balances(
         self,
         Account account,
@@ -133,115 +158,237 @@ cdef class AccountsManager:
         list passive_orders_working,
         int64_t ts_event,
     ):
+        """
+        Update the locked balance (cash accounts) or initial (order) margin
+        (margin accounts) by a full recomputation over the given working orders.
+
+        Will return ``None`` if operation fails.
+
+        Parameters
+        ----------
+        account : Account
+            The account to update.
+        instrument : Instrument
+            The instrument for the update.
+        passive_orders_working : list[PassiveOrder]
+            The passive working orders for the update.
+        ts_event : int64
+            The UNIX timestamp (nanoseconds) when the account event occurred.
+
+        Returns
+        -------
+        AccountState or ``None``
+
+        """
         Condition.not_none(account, "account")
         Condition.not_none(instrument, "instrument")
         Condition.not_none(passive_orders_working, "orders_working")
 
-        if account.is_cash_account():
-            return self._update_balance_locked(
-                account,
-                instrument,
-                passive_orders_working,
-                ts_event,
-            )
-        elif account.is_margin_account():
-            return self._update_margin_init(
+        return self._recalculate_orders(
+            account,
+            instrument,
+            passive_orders_working,
+            ts_event,
+            check_drift=False,
+        )
+
+    cdef AccountState update_order(
+        self,
+        Account account,
+        Instrument instrument,
+        Order order,
+        int64_t ts_event,
+    ):
+        """
+        Update the locked balance (cash accounts) or initial (order) margin
+        (margin accounts) for a change in the given order.
+
+        Only the orders contribution is added or removed from the running total
+        for the instrument, with a full recomputation from the cache for the
+        first update and then every `recompute_interval` updates.
+
+        Will return ``None`` if operation fails.
+
+        Parameters
+        ----------
+        account : Account
+            The account to update.
+        instrument : Instrument
+            The instrument for the update.
+        order : Order
+            The order which changed.
+        ts_event : int64
+            The UNIX timestamp (nanoseconds) when the account event occurred.
+
+        Returns
+        -------
+        AccountState or ``None``
+
+        """
+        Condition.not_none(account, "account")
+        Condition.not_none(instrument, "instrument")
+        Condition.not_none(order, "order")
+
+        cdef dict contributions = self._order_contributions.get(instrument.id)
+        cdef int count = self._order_update_counts.get(instrument.id, 0) + 1
+        cdef Order o
+        if contributions is None or count >= self.recompute_interval:
+            return self._recalculate_orders(
                 account,
                 instrument,
-                passive_orders_working,
+                [o for o in self._cache.orders_working(
+                    venue=None,  # Faster query filtering
+                    instrument_id=instrument.id,
+                ) if o.is_passive_c()],
                 ts_event,
+                check_drift=contributions is not None,
             )
-        else:  # pragma: no cover (design-time error)
-            raise RuntimeError("invalid account type")
 
-    cdef AccountState _update_balance_locked(
+        self._order_update_counts[instrument.id] = count
+
+        total: Decimal = self._order_totals[instrument.id]
+        previous: Optional[Decimal] = contributions.pop(order.client_order_id, None)
+        if previous is not None:
+            total -= previous
+        if order.is_passive_c() and order.is_working_c():
+            contribution: Decimal = self._calculate_order_contribution(account, instrument, order)
+            contributions[order.client_order_id] = contribution
+            total += contribution
+        self._order_totals[instrument.id] = total
+
+        return self._apply_order_total(account, instrument, order.side, ts_event)
+
+    cdef AccountState _recalculate_orders(
         self,
-        CashAccount account,
+        Account account,
         Instrument instrument,
         list passive_orders_working,
         int64_t ts_event,
+        bint check_drift,
     ):
-        if not passive_orders_working:
-            account.clear_balance_locked(instrument.id)
-            return self._generate_account_state(
-                account=account,
-                ts_event=ts_event,
-            )
+        cdef dict contributions = {}
+        total: Decimal = Decimal(0)
 
-        total_locked: Decimal = Decimal(0)
-        base_xrate: Optional[Decimal] = None
-
-        cdef Currency currency = instrument.get_cost_currency()
         cdef PassiveOrder order
         for order in passive_orders_working:
             assert order.instrument_id == instrument.id
             assert order.is_working_c()
 
+            contribution: Decimal = self._calculate_order_contribution(account, instrument, order)
+            contributions[order.client_order_id] = contribution
+            total += contribution
+
+        if check_drift and self._order_totals.get(instrument.id) != total:
+            self._log.warning(
+                f"{instrument.id} incremental order total "
+                f"{self._order_totals.get(instrument.id)} drifted from {total}, "
+                f"reset to recomputed value.",
+            )
+
+        self._order_contributions[instrument.id] = contributions
+        self._order_totals[instrument.id] = total
+        self._order_update_counts[instrument.id] = 0
+
+        cdef OrderSide side = passive_orders_working[0].side if passive_orders_working else OrderSide.BUY
+        return self._apply_order_total(account, instrument, side, ts_event)
+
+    cdef object _calculate_order_contribution(
+        self,
+        Account account,
+        Instrument instrument,
+        PassiveOrder order,
+    ):
+        if account.is_cash_account():
             # Calculate balance locked
-            locked: Decimal = account.calculate_balance_locked(
+            return (<CashAccount>account).calculate_balance_locked(
                 instrument,
                 order.side,
                 order.quantity,
                 order.price,
             ).as_decimal()
+        elif account.is_margin_account():
+            # Calculate initial margin
+            return (<MarginAccount>account).calculate_margin_init(
+                instrument,
+                order.quantity,
+                order.price,
+            ).as_decimal()
+        else:  # pragma: no cover (design-time error)
+            raise RuntimeError("invalid account type")
 
-            if account.base_currency is not None:
-                if base_xrate is not None:
-                    locked *= base_xrate
-                    return
-
-                currency = account.base_currency
-                xrate: Decimal = self._calculate_xrate_to_base(
-                    instrument=instrument,
-                    account=account,
-                    side=order.side,
-                )
+    cdef AccountState _apply_order_total(
+        self,
+        Account account,
+        Instrument instrument,
+        OrderSide side,
+        int64_t ts_event,
+    ):
+        if not self._order_contributions[instrument.id]:
+            if account.is_cash_account():
+                (<CashAccount>account).clear_balance_locked(instrument.id)
+            else:
+                (<MarginAccount>account).clear_margin_init(instrument.id)
+            return self._generate_account_state(
+                account=account,
+                ts_event=ts_event,
+            )
 
-                if xrate == 0:
-                    self._log.debug(
-                        f"Cannot calculate balance locked: "
-                        f"insufficient data for "
-                        f"{instrument.get_cost_currency()}/{account.base_currency}."
-                    )
-                    return None  # Cannot calculate
+        total: Decimal = self._order_totals[instrument.id]
 
-                base_xrate = xrate  # Cache xrate
-                locked *= base_xrate  # Apply xrate
+        cdef Currency currency = instrument.get_cost_currency()
+        if account.base_currency is not None:
+            currency = account.base_currency
+            xrate: Decimal = self._calculate_xrate_to_base(
+                instrument=instrument,
+                account=account,
+                side=side,
+            )
 
-            # Increment total locked
-            total_locked += locked
+            if xrate == 0:
+                self._log.debug(
+                    f"Cannot calculate "
+                    f"{'balance locked' if account.is_cash_account() else 'initial (order) margin'}: "
+                    f"insufficient data for "
+                    f"{instrument.get_cost_currency()}/{account.base_currency}."
+                )
+                return None  # Cannot calculate
 
-        cdef Money locked_money = Money(total_locked, currency)
-        account.update_balance_locked(instrument.id, locked_money)
+            total *= xrate  # Apply xrate
 
-        self._log.info(f"{instrument.id} balance_locked={locked_money.to_str()}")
+        cdef Money money = Money(total, currency)
+        if account.is_cash_account():
+            (<CashAccount>account).update_balance_locked(instrument.id, money)
+            self._log.info(f"{instrument.id} balance_locked={money.to_str()}")
+        else:
+            (<MarginAccount>account).update_margin_init(instrument.id, money)
+            self._log.info(f"{instrument.id} margin_init={money.to_str()}")
 
         return self._generate_account_state(
             account=account,
             ts_event=ts_event,
         )
 
-    cdef AccountState _update_margin_init(
+    cdef AccountState update_positions(
         self,
         MarginAccount account,
         Instrument instrument,
-        list passive_orders_working,
+        list positions_open,
         int64_t ts_event,
     ):
         """
-        Update the initial (order) margin for margin accounts or locked balance
-        for cash accounts.
+        Update the maintenance (position) margin by a full recomputation over
+        the given open positions.
 
         Will return ``None`` if operation fails.
 
         Parameters
         ----------
-        account : MarginAccount
+        account : Account
             The account to update.
         instrument : Instrument
             The instrument for the update.
-        passive_orders_working : list[PassiveOrder]
-            The passive working orders for the update.
+        positions_open : list[Position]
+            The open positions for the update.
         ts_event : int64
             The UNIX timestamp (nanoseconds) when the account event occurred.
 
@@ -252,87 +399,41 @@ cdef class AccountsManager:
         """
         Condition.not_none(account, "account")
         Condition.not_none(instrument, "instrument")
-        Condition.not_none(passive_orders_working, "orders_working")
-
-        if not passive_orders_working:
-            account.clear_margin_init(instrument.id)
-            return self._generate_account_state(
-                account=account,
-                ts_event=ts_event,
-            )
-
-        total_margin_init: Decimal = Decimal(0)
-        base_xrate: Optional[Decimal] = None
-
-        cdef Currency currency = instrument.get_cost_currency()
-        cdef PassiveOrder order
-        for order in passive_orders_working:
-            assert order.instrument_id == instrument.id
-            assert order.is_working_c()
-
-            # Calculate initial margin
-            margin_init: Decimal = account.calculate_margin_init(
-                instrument,
-                order.quantity,
-                order.price,
-            ).as_decimal()
-
-            if account.base_currency is not None:
-                if base_xrate is not None:
-                    margin_init *= base_xrate
-                    return
-
-                currency = account.base_currency
-                xrate: Decimal = self._calculate_xrate_to_base(
-                    instrument=instrument,
-                    account=account,
-                    side=order.side,
-                )
-
-                if xrate == 0:
-                    self._log.debug(
-                        f"Cannot calculate initial (order) margin: "
-                        f"insufficient data for "
-                        f"{instrument.get_cost_currency()}/{account.base_currency}."
-                    )
-                    return None  # Cannot calculate
-
-                base_xrate = xrate  # Cache xrate
-                margin_init *= base_xrate  # Apply xrate
-
-            # Increment total initial margin
-            total_margin_init += margin_init
-
-        cdef Money margin_init_money = Money(total_margin_init, currency)
-        account.update_margin_init(instrument.id, margin_init_money)
-
-        self._log.info(f"{instrument.id} margin_init={margin_init_money.to_str()}")
+        Condition.not_none(positions_open, "positions_open")
 
-        return self._generate_account_state(
-            account=account,
-            ts_event=ts_event,
+        return self._recalculate_positions(
+            account,
+            instrument,
+            positions_open,
+            ts_event,
+            check_drift=False,
         )
 
-    cdef AccountState update_positions(
+    cdef AccountState update_position(
         self,
         MarginAccount account,
         Instrument instrument,
-        list positions_open,
+        PositionEvent event,
         int64_t ts_event,
     ):
         """
-        Update the maintenance (position) margin.
+        Update the maintenance (position) margin for a change in the position
+        of the given event.
+
+        Only the positions contribution is added or removed from the running
+        total for the instrument, with a full recomputation from the cache for
+        the first update and then every `recompute_interval` updates.
 
         Will return ``None`` if operation fails.
 
         Parameters
         ----------
-        account : Account
+        account : MarginAccount
             The account to update.
         instrument : Instrument
             The instrument for the update.
-        positions_open : list[Position]
-            The open positions for the update.
+        event : PositionEvent
+            The position event for the update.
         ts_event : int64
             The UNIX timestamp (nanoseconds) when the account event occurred.
 
@@ -343,59 +444,117 @@ cdef class AccountsManager:
         """
         Condition.not_none(account, "account")
         Condition.not_none(instrument, "instrument")
-        Condition.not_none(positions_open, "positions_open")
+        Condition.not_none(event, "event")
 
-        if not positions_open:
-            account.clear_margin_maint(instrument.id)
-            return self._generate_account_state(
-                account=account,
-                ts_event=ts_event,
+        cdef dict contributions = self._position_contributions.get(instrument.id)
+        cdef int count = self._position_update_counts.get(instrument.id, 0) + 1
+        if contributions is None or count >= self.recompute_interval:
+            return self._recalculate_positions(
+                account,
+                instrument,
+                self._cache.positions_open(
+                    venue=None,  # Faster query filtering
+                    instrument_id=instrument.id,
+                ),
+                ts_event,
+                check_drift=contributions is not None,
             )
 
-        total_margin_maint: Decimal = Decimal(0)
-        base_xrate: Optional[Decimal] = None
+        self._position_update_counts[instrument.id] = count
+
+        total: Decimal = self._position_totals[instrument.id]
+        previous: Optional[Decimal] = contributions.pop(event.position_id, None)
+        if previous is not None:
+            total -= previous
+        if event.side != PositionSide.FLAT:
+            contribution: Decimal = account.calculate_margin_maint(
+                instrument,
+                event.side,
+                event.quantity,
+                event.avg_px_open,
+            ).as_decimal()
+            contributions[event.position_id] = contribution
+            total += contribution
+        self._position_totals[instrument.id] = total
+
+        return self._apply_position_total(account, instrument, event.entry, ts_event)
+
+    cdef AccountState _recalculate_positions(
+        self,
+        MarginAccount account,
+        Instrument instrument,
+        list positions_open,
+        int64_t ts_event,
+        bint check_drift,
+    ):
+        cdef dict contributions = {}
+        total: Decimal = Decimal(0)
 
-        cdef Currency currency = instrument.get_cost_currency()
         cdef Position position
         for position in positions_open:
             assert position.instrument_id == instrument.id
             assert position.is_open_c()
 
             # Calculate margin
-            margin_maint: Decimal = account.calculate_margin_maint(
+            contribution: Decimal = account.calculate_margin_maint(
                 instrument,
                 position.side,
                 position.quantity,
                 position.avg_px_open,
             ).as_decimal()
+            contributions[position.id] = contribution
+            total += contribution
+
+        if check_drift and self._position_totals.get(instrument.id) != total:
+            self._log.warning(
+                f"{instrument.id} incremental position total "
+                f"{self._position_totals.get(instrument.id)} drifted from {total}, "
+                f"reset to recomputed value.",
+            )
 
-            if account.base_currency is not None:
-                if base_xrate is not None:
-                    margin_maint *= base_xrate
-                    return
+        self._position_contributions[instrument.id] = contributions
+        self._position_totals[instrument.id] = total
+        self._position_update_counts[instrument.id] = 0
 
-                currency = account.base_currency
-                xrate: Decimal = self._calculate_xrate_to_base(
-                    instrument=instrument,
-                    account=account,
-                    side=position.entry,
-                )
+        cdef OrderSide side = positions_open[0].entry if positions_open else OrderSide.BUY
+        return self._apply_position_total(account, instrument, side, ts_event)
 
-                if xrate == 0:
-                    self._log.debug(
-                        f"Cannot calculate maintenance (position) margin: "
-                        f"insufficient data for "
-                        f"{instrument.get_cost_currency()}/{account.base_currency})."
-                    )
-                    return None  # Cannot calculate
+    cdef AccountState _apply_position_total(
+        self,
+        MarginAccount account,
+        Instrument instrument,
+        OrderSide side,
+        int64_t ts_event,
+    ):
+        if not self._position_contributions[instrument.id]:
+            account.clear_margin_maint(instrument.id)
+            return self._generate_account_state(
+                account=account,
+                ts_event=ts_event,
+            )
 
-                base_xrate = xrate  # Cache xrate
-                margin_maint *= base_xrate  # Apply xrate
+        total: Decimal = self._position_totals[instrument.id]
 
-            # Increment total maintenance margin
-            total_margin_maint += margin_maint
+        cdef Currency currency = instrument.get_cost_currency()
+        if account.base_currency is not None:
+            currency = account.base_currency
+            xrate: Decimal = self._calculate_xrate_to_base(
+                instrument=instrument,
+                account=account,
+                side=side,
+            )
 
-        cdef Money margin_maint_money = Money(total_margin_maint, currency)
+            if xrate == 0:
+                self._log.debug(
+                    f"Cannot calculate maintenance (position) margin: "
+                    f"insufficient data for "
+                    f"{instrument.get_cost_currency()}/{account.base_currency})."
+                )
+                return None  # Cannot calculate
+
+            total *= xrate  # Apply xrate
+
+        cdef Money margin_maint_money = Money(total, currency)
         account.update_margin_maint(instrument.id, margin_maint_money)
 
         self._log.info(f"{instrument.id} margin_maint={margin_maint_money.to_str()}")
@@ -405,6 +564,20 @@ cdef class AccountsManager:
             ts_event=ts_event,
         )
 
+    cpdef void reset(self) except *:
+        """
+        Reset the manager.
+
+        All incremental totals are cleared and will be recomputed in full on
+        the next update.
+        """
+        self._order_contributions.clear()
+        self._order_totals.clear()
+        self._order_update_counts.clear()
+        self._position_contributions.clear()
+        self._position_totals.clear()
+        self._position_update_counts.clear()
+
     cdef void _update_balance_single_currency(
         self,
         Account account,
@@ -27,6 +27,13 @@ from nautilus_trader.model.tick_scheme.implementations.tiered import TieredTickS
 BETFAIR_VENUE = Venue("BETFAIR")
 BETFAIR_PRICE_PRECISION = 7
 
+# Maximum instructions per placeOrders / cancelOrders request
+BETFAIR_MAX_PLACE_INSTRUCTIONS = 200
+BETFAIR_MAX_CANCEL_INSTRUCTIONS = 60
+
+# Maximum length of the customerRef used to de-dupe requests
+BETFAIR_MAX_CUSTOMER_REF_LENGTH = 32
+
 """
 # ------------------------------- MAPPINGS ------------------------------- #
 
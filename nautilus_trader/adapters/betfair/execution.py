@@ -25,26 +25,27 @@ from nautilus_trader.accounting.factory import AccountFactory
 from nautilus_trader.adapters.betfair.client.core import BetfairClient
 from nautilus_trader.adapters.betfair.client.exceptions import BetfairAPIError
 from nautilus_trader.adapters.betfair.common import B2N_ORDER_STREAM_SIDE
+from nautilus_trader.adapters.betfair.common import BETFAIR_MAX_CANCEL_INSTRUCTIONS
+from nautilus_trader.adapters.betfair.common import BETFAIR_MAX_PLACE_INSTRUCTIONS
 from nautilus_trader.adapters.betfair.common import BETFAIR_VENUE
 from nautilus_trader.adapters.betfair.common import price_to_probability
 from nautilus_trader.adapters.betfair.common import probability_to_price
 from nautilus_trader.adapters.betfair.parsing import betfair_account_to_account_state
 from nautilus_trader.adapters.betfair.parsing import generate_order_status_report
+from nautilus_trader.adapters.betfair.parsing import generate_order_status_reports
 from nautilus_trader.adapters.betfair.parsing import generate_trades_list
-from nautilus_trader.adapters.betfair.parsing import order_cancel_all_to_betfair
-from nautilus_trader.adapters.betfair.parsing import order_cancel_to_betfair
-from nautilus_trader.adapters.betfair.parsing import order_submit_to_betfair
 from nautilus_trader.adapters.betfair.parsing import order_update_to_betfair
+from nautilus_trader.adapters.betfair.parsing import orders_cancel_to_betfair
+from nautilus_trader.adapters.betfair.parsing import orders_submit_to_betfair
 from nautilus_trader.adapters.betfair.providers import BetfairInstrumentProvider
 from nautilus_trader.adapters.betfair.sockets import BetfairOrderStreamClient
+from nautilus_trader.adapters.betfair.util import chunk
 from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.logging import LogColor
 from nautilus_trader.common.logging import Logger
 from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.core.datetime import millis_to_nanos
-from nautilus_trader.core.datetime import nanos_to_secs
-from nautilus_trader.core.datetime import secs_to_nanos
 from nautilus_trader.execution.messages import ExecutionReport
 from nautilus_trader.execution.messages import OrderStatusReport
 from nautilus_trader.live.execution_client import LiveExecutionClient
@@ -57,12 +58,14 @@ from nautilus_trader.model.commands.trading import CancelOrder
 from nautilus_trader.model.commands.trading import ModifyOrder
 from nautilus_trader.model.commands.trading import SubmitOrder
 from nautilus_trader.model.commands.trading import SubmitOrderList
+from nautilus_trader.model.commands.trading import TradingCommand
 from nautilus_trader.model.currency import Currency
 from nautilus_trader.model.events.account import AccountState
 from nautilus_trader.model.identifiers import AccountId
 from nautilus_trader.model.identifiers import ClientId
 from nautilus_trader.model.identifiers import ClientOrderId
 from nautilus_trader.model.identifiers import ExecutionId
+from nautilus_trader.model.identifiers import StrategyId
 from nautilus_trader.model.identifiers import Symbol
 from nautilus_trader.model.identifiers import VenueOrderId
 from nautilus_trader.model.objects import Money
@@ -126,7 +129,10 @@ class BetfairExecutionClient(LiveExecutionClient):
             cache=cache,
             clock=clock,
             logger=logger,
-            config={"name": "BetfairExecClient"},
+            config={
+                "name": "BetfairExecClient",
+                "reconciliation_concurrency": 4,
+            },
         )
 
         self._client: BetfairClient = client
@@ -140,6 +146,18 @@ class BetfairExecutionClient(LiveExecutionClient):
         self.pending_update_order_client_ids: Set[Tuple[ClientOrderId, VenueOrderId]] = set()
         self.published_executions: Dict[ClientOrderId, ExecutionId] = defaultdict(list)
 
+        # Orders queued per (market_id, strategy_id) while a placeOrders request
+        # for the same market is in flight, sent together in the next request.
+        self._pending_place_orders: Dict[Tuple[str, StrategyId], List] = {}
+
+        # Order stream updates can arrive before the `place_orders` response which
+        # carries the betId, these are buffered per venue order ID and replayed in
+        # order once the ID is registered (or dropped after the timeout).
+        self._order_update_timeout_secs = 10.0
+        self._pending_order_updates: Dict[VenueOrderId, List[Dict]] = {}
+        self._pending_order_timers: Dict[VenueOrderId, asyncio.TimerHandle] = {}
+        self._venue_order_id_waiters: Dict[VenueOrderId, List[asyncio.Future]] = defaultdict(list)
+
         AccountFactory.register_calculated_account(account_id.issuer)
 
     # -- CONNECTION HANDLERS -----------------------------------------------------------------------
@@ -224,71 +242,119 @@ class BetfairExecutionClient(LiveExecutionClient):
     def submit_order(self, command: SubmitOrder) -> None:
         PyCondition.not_none(command, "command")
 
-        self.create_task(self._submit_order(command))
+        self._queue_place_orders(command, [command.order])
 
-    async def _submit_order(self, command: SubmitOrder) -> None:
-        self._log.debug(f"Received submit_order {command}")
+    def submit_order_list(self, command: SubmitOrderList) -> None:
+        PyCondition.not_none(command, "command")
 
-        self.generate_order_submitted(
-            instrument_id=command.instrument_id,
-            strategy_id=command.strategy_id,
-            client_order_id=command.order.client_order_id,
-            ts_event=self._clock.timestamp_ns(),
-        )
-        self._log.debug("Generated _generate_order_submitted")
+        self._queue_place_orders(command, command.list.orders)
 
+    def _queue_place_orders(self, command: TradingCommand, orders: List[Order]) -> None:
         instrument = self._cache.instrument(command.instrument_id)
         PyCondition.not_none(instrument, "instrument")
-        client_order_id = command.order.client_order_id
 
-        place_order = order_submit_to_betfair(command=command, instrument=instrument)
+        key = (instrument.market_id, command.strategy_id)
+        pending = self._pending_place_orders.get(key)
+        if pending is not None:
+            # A placeOrders request for this market is in flight, the orders
+            # will be sent together in the next request
+            pending.append((command, orders))
+            return
+
+        self._pending_place_orders[key] = []
+        self.create_task(self._place_orders(key, [(command, orders)]))
+
+    async def _place_orders(self, key: Tuple[str, StrategyId], items: List) -> None:
         try:
-            result = await self._client.place_orders(**place_order)
+            while items:
+                await self._submit_orders(
+                    [(command, order) for command, orders in items for order in orders]
+                )
+                items = self._pending_place_orders[key]
+                self._pending_place_orders[key] = []
         except Exception as exc:
-            if isinstance(exc, BetfairAPIError):
-                await self.on_api_exception(exc=exc)
-            self._log.warning(f"Submit failed: {exc}")
-            self.generate_order_rejected(
+            self._log.exception(f"Submit failed: {exc}")
+            # Reject the failed batch and any orders queued behind it (which
+            # would otherwise never be sent)
+            for command, orders in items + self._pending_place_orders[key]:
+                for order in orders:
+                    self.generate_order_rejected(
+                        strategy_id=command.strategy_id,
+                        instrument_id=order.instrument_id,
+                        client_order_id=order.client_order_id,
+                        reason="client error",  # type: ignore
+                        ts_event=self._clock.timestamp_ns(),
+                    )
+        finally:
+            del self._pending_place_orders[key]
+
+    async def _submit_orders(self, submits: List[Tuple[TradingCommand, Order]]) -> None:
+        self._log.debug(f"Received submit_orders for {len(submits)} order(s)")
+
+        for command, order in submits:
+            self.generate_order_submitted(
+                instrument_id=order.instrument_id,
                 strategy_id=command.strategy_id,
-                instrument_id=command.instrument_id,
-                client_order_id=client_order_id,
-                reason="client error",  # type: ignore
+                client_order_id=order.client_order_id,
                 ts_event=self._clock.timestamp_ns(),
             )
-            return
+        self._log.debug("Generated _generate_order_submitted")
+
+        for i, batch in enumerate(chunk(submits, BETFAIR_MAX_PLACE_INSTRUCTIONS)):
+            place_orders = orders_submit_to_betfair(
+                submits=[
+                    (command, order, self._cache.instrument(order.instrument_id))
+                    for command, order in batch
+                ],
+                chunk_index=i,
+            )
+            try:
+                result = await self._client.place_orders(**place_orders)
+            except Exception as exc:
+                if isinstance(exc, BetfairAPIError):
+                    await self.on_api_exception(exc=exc)
+                self._log.warning(f"Submit failed: {exc}")
+                for command, order in batch:
+                    self.generate_order_rejected(
+                        strategy_id=command.strategy_id,
+                        instrument_id=order.instrument_id,
+                        client_order_id=order.client_order_id,
+                        reason="client error",  # type: ignore
+                        ts_event=self._clock.timestamp_ns(),
+                    )
+                continue
+
+            self._log.debug(f"result={result}")
+            reports = result.get("instructionReports") or []
+            for i, (command, order) in enumerate(batch):
+                # Instruction reports are returned in the order the instructions were sent
+                report = reports[i] if i < len(reports) else {}
+                if result["status"] == "FAILURE" or report.get("status") == "FAILURE":
+                    reason = f"{result.get('errorCode', 'Error')}: {report.get('errorCode')}"
+                    self._log.warning(f"Submit failed - {reason}")
+                    self.generate_order_rejected(
+                        strategy_id=command.strategy_id,
+                        instrument_id=order.instrument_id,
+                        client_order_id=order.client_order_id,
+                        reason=reason,  # type: ignore
+                        ts_event=self._clock.timestamp_ns(),
+                    )
+                    self._log.debug("Generated _generate_order_rejected")
+                    continue
 
-        self._log.debug(f"result={result}")
-        for report in result["instructionReports"]:
-            if result["status"] == "FAILURE":
-                reason = f"{result['errorCode']}: {report['errorCode']}"
-                self._log.warning(f"Submit failed - {reason}")
-                self.generate_order_rejected(
-                    strategy_id=command.strategy_id,
-                    instrument_id=command.instrument_id,
-                    client_order_id=client_order_id,
-                    reason=reason,  # type: ignore
-                    ts_event=self._clock.timestamp_ns(),
-                )
-                self._log.debug("Generated _generate_order_rejected")
-                return
-            else:
                 venue_order_id = VenueOrderId(report["betId"])
                 self._log.debug(
-                    f"Matching venue_order_id: {venue_order_id} to client_order_id: {client_order_id}"
+                    f"Matching venue_order_id: {venue_order_id} to client_order_id: {order.client_order_id}"
                 )
-                self.venue_order_id_to_client_order_id[venue_order_id] = client_order_id  # type: ignore
                 self.generate_order_accepted(
                     strategy_id=command.strategy_id,
-                    instrument_id=command.instrument_id,
-                    client_order_id=client_order_id,
+                    instrument_id=order.instrument_id,
+                    client_order_id=order.client_order_id,
                     venue_order_id=venue_order_id,  # type: ignore
                     ts_event=self._clock.timestamp_ns(),
                 )
                 self._log.debug("Generated _generate_order_accepted")
-
-    def submit_order_list(self, command: SubmitOrderList):
-        """Abstract method (implement in subclass)."""
-        raise NotImplementedError("method must be implemented in the subclass")  # pragma: no cover
+                self._register_venue_order_id(venue_order_id, order.client_order_id)
 
     def modify_order(self, command: ModifyOrder) -> None:
         PyCondition.not_none(command, "command")
@@ -386,7 +452,6 @@ class BetfairExecutionClient(LiveExecutionClient):
 
             update_instruction = report["placeInstructionReport"]
             venue_order_id = VenueOrderId(update_instruction["betId"])
-            self.venue_order_id_to_client_order_id[venue_order_id] = client_order_id
             self.generate_order_updated(
                 strategy_id=command.strategy_id,
                 instrument_id=command.instrument_id,
@@ -402,6 +467,7 @@ class BetfairExecutionClient(LiveExecutionClient):
                 ts_event=self._clock.timestamp_ns(),
                 venue_order_id_modified=True,
             )
+            self._register_venue_order_id(venue_order_id, client_order_id)
 
     def cancel_order(self, command: CancelOrder) -> None:
         PyCondition.not_none(command, "command")
@@ -409,77 +475,113 @@ class BetfairExecutionClient(LiveExecutionClient):
         self.create_task(self._cancel_order(command))
 
     async def _cancel_order(self, command: CancelOrder) -> None:
-        self._log.debug(f"Received cancel order: {command}")
-        self.generate_order_pending_cancel(
-            strategy_id=command.strategy_id,
-            instrument_id=command.instrument_id,
-            client_order_id=command.client_order_id,
-            venue_order_id=command.venue_order_id,
-            ts_event=self._clock.timestamp_ns(),
-        )
+        await self._cancel_orders([command])
 
-        instrument = self._cache.instrument(command.instrument_id)
-        PyCondition.not_none(instrument, "instrument")
-
-        # Format
-        cancel_order = order_cancel_to_betfair(command=command, instrument=instrument)  # type: ignore
-        self._log.debug(f"cancel_order {cancel_order}")
+    async def _cancel_orders(self, commands: List[CancelOrder]) -> None:
+        """
+        Cancel the orders with as few cancelOrders requests as possible, all
+        commands must be for the same instrument.
+        """
+        self._log.debug(f"Received cancel orders: {commands}")
+        commands_with_venue_order_id = []
+        for command in commands:
+            if command.venue_order_id is None:
+                self._log.warning(f"Cannot cancel order with no venue order ID: {command}")
+                self.generate_order_cancel_rejected(
+                    strategy_id=command.strategy_id,
+                    instrument_id=command.instrument_id,
+                    client_order_id=command.client_order_id,
+                    venue_order_id=None,
+                    reason="ORDER MISSING VENUE_ORDER_ID",
+                    ts_event=self._clock.timestamp_ns(),
+                )
+            else:
+                commands_with_venue_order_id.append(command)
+        commands = commands_with_venue_order_id
+        if not commands:
+            return
 
-        # Send to client
-        try:
-            result = await self._client.cancel_orders(**cancel_order)
-        except Exception as exc:
-            if isinstance(exc, BetfairAPIError):
-                await self.on_api_exception(exc=exc)
-            self._log.warning(f"Cancel failed: {exc}")
-            self.generate_order_cancel_rejected(
+        for command in commands:
+            self.generate_order_pending_cancel(
                 strategy_id=command.strategy_id,
                 instrument_id=command.instrument_id,
                 client_order_id=command.client_order_id,
                 venue_order_id=command.venue_order_id,
-                reason="client error",
                 ts_event=self._clock.timestamp_ns(),
             )
-            return
-        self._log.debug(f"result={result}")
 
-        # Parse response
-        for report in result["instructionReports"]:
-            venue_order_id = VenueOrderId(report["instruction"]["betId"])
-            if report["status"] == "FAILURE":
-                reason = f"{result.get('errorCode', 'Error')}: {report['errorCode']}"
-                self._log.warning(f"cancel failed - {reason}")
-                self.generate_order_cancel_rejected(
+        instrument = self._cache.instrument(commands[0].instrument_id)
+        PyCondition.not_none(instrument, "instrument")
+
+        for i, batch in enumerate(chunk(commands, BETFAIR_MAX_CANCEL_INSTRUCTIONS)):
+            # Format
+            cancel_orders = orders_cancel_to_betfair(
+                commands=batch,  # type: ignore
+                instrument=instrument,
+                chunk_index=i,
+            )
+            self._log.debug(f"cancel_orders {cancel_orders}")
+
+            # Send to client
+            try:
+                result = await self._client.cancel_orders(**cancel_orders)
+            except Exception as exc:
+                if isinstance(exc, BetfairAPIError):
+                    await self.on_api_exception(exc=exc)
+                self._log.warning(f"Cancel failed: {exc}")
+                for command in batch:
+                    self.generate_order_cancel_rejected(
+                        strategy_id=command.strategy_id,
+                        instrument_id=command.instrument_id,
+                        client_order_id=command.client_order_id,
+                        venue_order_id=command.venue_order_id,
+                        reason="client error",
+                        ts_event=self._clock.timestamp_ns(),
+                    )
+                continue
+            self._log.debug(f"result={result}")
+
+            # Parse response
+            commands_by_bet_id = {command.venue_order_id.value: command for command in batch}
+            for report in result["instructionReports"]:
+                venue_order_id = VenueOrderId(report["instruction"]["betId"])
+                command = commands_by_bet_id[venue_order_id.value]
+                if report["status"] == "FAILURE":
+                    reason = f"{result.get('errorCode', 'Error')}: {report['errorCode']}"
+                    self._log.warning(f"cancel failed - {reason}")
+                    self.generate_order_cancel_rejected(
+                        strategy_id=command.strategy_id,
+                        instrument_id=command.instrument_id,
+                        client_order_id=command.client_order_id,
+                        venue_order_id=venue_order_id,
+                        reason=reason,
+                        ts_event=self._clock.timestamp_ns(),
+                    )
+                    continue
+
+                self._log.debug(
+                    f"Matching venue_order_id: {venue_order_id} to client_order_id: {command.client_order_id}"
+                )
+                self._register_venue_order_id(venue_order_id, command.client_order_id)
+                self.generate_order_canceled(
                     strategy_id=command.strategy_id,
                     instrument_id=command.instrument_id,
                     client_order_id=command.client_order_id,
-                    venue_order_id=venue_order_id,
-                    reason=reason,
+                    venue_order_id=venue_order_id,  # type: ignore
                     ts_event=self._clock.timestamp_ns(),
                 )
-                return
-
-            self._log.debug(
-                f"Matching venue_order_id: {venue_order_id} to client_order_id: {command.client_order_id}"
-            )
-            self.venue_order_id_to_client_order_id[venue_order_id] = command.client_order_id  # type: ignore
-            self.generate_order_canceled(
-                strategy_id=command.strategy_id,
-                instrument_id=command.instrument_id,
-                client_order_id=command.client_order_id,
-                venue_order_id=venue_order_id,  # type: ignore
-                ts_event=self._clock.timestamp_ns(),
-            )
-            self._log.debug("Sent order cancel")
+                self._log.debug("Sent order cancel")
 
     def cancel_all_orders(self, command: CancelAllOrders) -> None:
         PyCondition.not_none(command, "command")
 
         working_orders = self._cache.working_orders(instrument_id=command.instrument_id)
+        if not working_orders:
+            return
 
-        # TODO(cs): Temporary solution generating individual cancels for all working orders
-        for order in working_orders:
-            command = CancelOrder(
+        # Cancel the working orders by betId in bulk, rather than the whole market
+        commands = [
+            CancelOrder(
                 trader_id=command.trader_id,
                 strategy_id=command.strategy_id,
                 instrument_id=command.instrument_id,
@@ -488,92 +590,9 @@ class BetfairExecutionClient(LiveExecutionClient):
                 command_id=self._uuid_factory.generate(),
                 ts_init=self._clock.timestamp_ns(),
             )
-
-            self.cancel_order(command)
-
-        # TODO(cs): Relates to below _cancel_all_orders
-        # Format
-        # cancel_orders = order_cancel_all_to_betfair(instrument=instrument)  # type: ignore
-        # self._log.debug(f"cancel_orders {cancel_orders}")
-        #
-        # self.create_task(self._cancel_order(command))
-
-    # TODO(cs): Currently not in use as old behavior restored to cancel orders individually
-    async def _cancel_all_orders(self, command: CancelAllOrders) -> None:
-        # TODO(cs): I've had to duplicate the logic as couldn't refactor and tease
-        #  apart the cancel rejects and execution report. This will possibly fail
-        #  badly if there are any API errors...
-        self._log.debug(f"Received cancel all orders: {command}")
-
-        instrument = self._cache.instrument(command.instrument_id)
-        PyCondition.not_none(instrument, "instrument")
-
-        # Format
-        cancel_orders = order_cancel_all_to_betfair(instrument=instrument)  # type: ignore
-        self._log.debug(f"cancel_orders {cancel_orders}")
-
-        # Send to client
-        try:
-            result = await self._client.cancel_orders(**cancel_orders)
-        except Exception as exc:
-            if isinstance(exc, BetfairAPIError):
-                await self.on_api_exception(exc=exc)
-            self._log.error(f"Cancel failed: {exc}")
-            # TODO(cs): Will probably just need to recover the client order ID
-            #  and order ID from the execution report?
-            # self.generate_order_cancel_rejected(
-            #     strategy_id=command.strategy_id,
-            #     instrument_id=command.instrument_id,
-            #     client_order_id=command.client_order_id,
-            #     venue_order_id=command.venue_order_id,
-            #     reason="client error",
-            #     ts_event=self._clock.timestamp_ns(),
-            # )
-            return
-        self._log.debug(f"result={result}")
-
-        # Parse response
-        for report in result["instructionReports"]:
-            venue_order_id = VenueOrderId(report["instruction"]["betId"])
-            if report["status"] == "FAILURE":
-                reason = f"{result.get('errorCode', 'Error')}: {report['errorCode']}"
-                self._log.error(f"cancel failed - {reason}")
-                # TODO(cs): Will probably just need to recover the client order ID
-                #  and order ID from the execution report?
-                # self.generate_order_cancel_rejected(
-                #     strategy_id=command.strategy_id,
-                #     instrument_id=command.instrument_id,
-                #     client_order_id=command.client_order_id,
-                #     venue_order_id=venue_order_id,
-                #     reason=reason,
-                #     ts_event=self._clock.timestamp_ns(),
-                # )
-                # return
-
-            self._log.debug(
-                f"Matching venue_order_id: {venue_order_id} to client_order_id: {command.client_order_id}"
-            )
-            self.venue_order_id_to_client_order_id[venue_order_id] = command.client_order_id  # type: ignore
-            self.generate_order_canceled(
-                strategy_id=command.strategy_id,
-                instrument_id=command.instrument_id,
-                client_order_id=command.client_order_id,
-                venue_order_id=venue_order_id,  # type: ignore
-                ts_event=self._clock.timestamp_ns(),
-            )
-            self._log.debug("Sent order cancel")
-
-    # cpdef void bulk_submit_order(self, list commands):
-    # betfair allows up to 200 inserts per request
-    #     raise NotImplementedError
-
-    # cpdef void bulk_submit_update(self, list commands):
-    # betfair allows up to 60 updates per request
-    #     raise NotImplementedError
-
-    # cpdef void bulk_submit_delete(self, list commands):
-    # betfair allows up to 60 cancels per request
-    #     raise NotImplementedError
+            for order in working_orders
+        ]
+        self.create_task(self._cancel_orders(commands))
 
     # -- ACCOUNT -----------------------------------------------------------------------------------
 
@@ -619,31 +638,78 @@ class BetfairExecutionClient(LiveExecutionClient):
                     # TODO (bm) - need to replace orders for this selection - probably via a recon
                     self._log.debug("Received full order image")
                 for order_update in selection.get("uo", []):
-                    await self._check_order_update(order_update)
-                    if order_update["status"] == "E":
-                        self._handle_stream_executable_order_update(update=order_update)
-                    elif order_update["status"] == "EC":
-                        self._handle_stream_execution_complete_order_update(update=order_update)
+                    venue_order_id = VenueOrderId(str(order_update["id"]))
+                    if venue_order_id in self._pending_order_updates:
+                        # Queue behind earlier updates still waiting on this betId
+                        self._pending_order_updates[venue_order_id].append(order_update)
+                    elif venue_order_id in self.venue_order_id_to_client_order_id:
+                        self._handle_order_update(order_update)
                     else:
-                        self._log.warning(f"Unknown order state: {order_update}")
+                        self._buffer_order_update(venue_order_id, order_update)
+
+    def _handle_order_update(self, update: Dict):
+        self._check_order_update(update)
+        if update["status"] == "E":
+            self._handle_stream_executable_order_update(update=update)
+        elif update["status"] == "EC":
+            self._handle_stream_execution_complete_order_update(update=update)
+        else:
+            self._log.warning(f"Unknown order state: {update}")
 
-    async def _check_order_update(self, update: Dict):
+    def _check_order_update(self, update: Dict):
         """
         Ensure we have a client_order_id, instrument and order for this venue order update
         """
         venue_order_id = VenueOrderId(str(update["id"]))
-        client_order_id = await self.wait_for_order(
-            venue_order_id=venue_order_id, timeout_seconds=10.0
-        )
-        if client_order_id is None:
-            self._log.warning(f"Can't find client_order_id for {update}")
-            return
+        client_order_id = self.venue_order_id_to_client_order_id[venue_order_id]
         PyCondition.type(client_order_id, ClientOrderId, "client_order_id")
         order = self._cache.order(client_order_id)
         PyCondition.not_none(order, "order")
         instrument = self._cache.instrument(order.instrument_id)
         PyCondition.not_none(instrument, "instrument")
 
+    def _buffer_order_update(self, venue_order_id: VenueOrderId, update: Dict):
+        self._log.debug(f"Buffering update for unknown venue_order_id={venue_order_id}")
+        self._pending_order_updates[venue_order_id] = [update]
+        self._pending_order_timers[venue_order_id] = self._loop.call_later(
+            self._order_update_timeout_secs,
+            self._expire_order_updates,
+            venue_order_id,
+        )
+
+    def _expire_order_updates(self, venue_order_id: VenueOrderId):
+        self._pending_order_timers.pop(venue_order_id, None)
+        updates = self._pending_order_updates.pop(venue_order_id, [])
+        self._log.warning(
+            f"Failed to find venue_order_id: {venue_order_id} "
+            f"after {self._order_update_timeout_secs} seconds, "
+            f"dropping {len(updates)} order update(s): {updates}"
+        )
+
+    def _register_venue_order_id(
+        self,
+        venue_order_id: VenueOrderId,
+        client_order_id: ClientOrderId,
+    ):
+        """
+        Register the betId for the order, then wake any waiters and replay any
+        order stream updates which arrived ahead of it.
+        """
+        self.venue_order_id_to_client_order_id[venue_order_id] = client_order_id
+
+        for waiter in self._venue_order_id_waiters.pop(venue_order_id, []):
+            if not waiter.done():
+                waiter.set_result(client_order_id)
+
+        timer = self._pending_order_timers.pop(venue_order_id, None)
+        if timer is not None:
+            timer.cancel()
+        for update in self._pending_order_updates.pop(venue_order_id, []):
+            try:
+                self._handle_order_update(update)
+            except Exception as e:
+                self._log.exception(f"Unhandled exception: {e}")
+
     def _handle_stream_executable_order_update(self, update: Dict) -> None:
         """
         Handle update containing "E" (executable) order update
@@ -799,30 +865,30 @@ class BetfairExecutionClient(LiveExecutionClient):
         We may get an order update from the socket before our submit_order
         response has come back (with our betId).
 
-        As a precaution, wait up to `timeout_seconds` for the betId to be added
-        to `self.order_id_to_client_order_id`.
+        Wait up to `timeout_seconds` for the betId to be registered in
+        `self.venue_order_id_to_client_order_id`.
         """
         assert isinstance(venue_order_id, VenueOrderId)
-        start = self._clock.timestamp_ns()
-        now = start
-        while (now - start) < secs_to_nanos(timeout_seconds):
-            # self._log.debug(
-            #     f"checking venue_order_id={venue_order_id} in {self.venue_order_id_to_client_order_id}"
-            # )
-            if venue_order_id in self.venue_order_id_to_client_order_id:
-                client_order_id = self.venue_order_id_to_client_order_id[venue_order_id]
-                self._log.debug(
-                    f"Found order in {nanos_to_secs(now - start)} sec: {client_order_id}"
-                )
-                return client_order_id
-            now = self._clock.timestamp_ns()
-            await asyncio.sleep(0.1)
-        self._log.warning(
-            f"Failed to find venue_order_id: {venue_order_id} "
-            f"after {timeout_seconds} seconds"
-            f"\nexisting: {self.venue_order_id_to_client_order_id})"
-        )
-        return None
+        client_order_id = self.venue_order_id_to_client_order_id.get(venue_order_id)
+        if client_order_id is not None:
+            return client_order_id
+
+        waiter = self._loop.create_future()
+        self._venue_order_id_waiters[venue_order_id].append(waiter)
+        try:
+            return await asyncio.wait_for(waiter, timeout=timeout_seconds)
+        except asyncio.TimeoutError:
+            self._log.warning(
+                f"Failed to find venue_order_id: {venue_order_id} "
+                f"after {timeout_seconds} seconds"
+            )
+            return None
+        finally:
+            waiters = self._venue_order_id_waiters.get(venue_order_id)
+            if waiters and waiter in waiters:
+                waiters.remove(waiter)
+                if not waiters:
+                    del self._venue_order_id_waiters[venue_order_id]
 
     # -- RECONCILIATION -------------------------------------------------------------------------------
 
@@ -830,6 +896,13 @@ class BetfairExecutionClient(LiveExecutionClient):
         self._log.debug(f"generate_order_status_report: {order}")
         return await generate_order_status_report(self, order)
 
+    async def generate_order_status_reports(
+        self,
+        active_orders: List[Order],
+    ) -> Optional[Dict[VenueOrderId, OrderStatusReport]]:
+        self._log.debug(f"generate_order_status_reports: {len(active_orders)} orders")
+        return await generate_order_status_reports(self, active_orders)
+
     async def generate_exec_reports(
         self,
         venue_order_id: VenueOrderId,
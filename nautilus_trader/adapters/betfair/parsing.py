@@ -18,7 +18,7 @@ import hashlib
 import itertools
 from collections import defaultdict
 from functools import lru_cache
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import orjson
 import pandas as pd
@@ -27,6 +27,7 @@ from nautilus_trader.adapters.betfair.common import B2N_MARKET_STREAM_SIDE
 from nautilus_trader.adapters.betfair.common import B_ASK_KINDS
 from nautilus_trader.adapters.betfair.common import B_BID_KINDS
 from nautilus_trader.adapters.betfair.common import B_SIDE_KINDS
+from nautilus_trader.adapters.betfair.common import BETFAIR_MAX_CUSTOMER_REF_LENGTH
 from nautilus_trader.adapters.betfair.common import BETFAIR_TICK_SCHEME
 from nautilus_trader.adapters.betfair.common import BETFAIR_VENUE
 from nautilus_trader.adapters.betfair.common import MAX_BET_PROB
@@ -40,11 +41,13 @@ from nautilus_trader.adapters.betfair.data_types import BSPOrderBookDelta
 from nautilus_trader.adapters.betfair.util import hash_json
 from nautilus_trader.adapters.betfair.util import one
 from nautilus_trader.common.uuid import UUIDFactory
+from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.execution.messages import ExecutionReport
 from nautilus_trader.execution.messages import OrderStatusReport
 from nautilus_trader.model.commands.trading import CancelOrder
 from nautilus_trader.model.commands.trading import ModifyOrder
 from nautilus_trader.model.commands.trading import SubmitOrder
+from nautilus_trader.model.commands.trading import TradingCommand
 from nautilus_trader.model.currency import Currency
 from nautilus_trader.model.data.tick import TradeTick
 from nautilus_trader.model.data.venue import InstrumentClosePrice
@@ -61,7 +64,6 @@ from nautilus_trader.model.enums import OrderStatus
 from nautilus_trader.model.enums import TimeInForce
 from nautilus_trader.model.events.account import AccountState
 from nautilus_trader.model.identifiers import AccountId
-from nautilus_trader.model.identifiers import ClientOrderId
 from nautilus_trader.model.identifiers import ExecutionId
 from nautilus_trader.model.identifiers import Symbol
 from nautilus_trader.model.identifiers import VenueOrderId
@@ -86,6 +88,20 @@ def make_custom_order_ref(client_order_id, strategy_id):
     return client_order_id.value.rsplit("-" + strategy_id.get_tag(), maxsplit=1)[0]
 
 
+def make_customer_ref(command_id: UUID4, chunk_index: int = 0) -> str:
+    """
+    Return the customer_ref for a request, unique per chunk of instructions.
+
+    Betfair de-dupes requests on customerRef for 60 seconds, so each chunk of a
+    command split over several requests needs its own reference.
+    """
+    customer_ref = command_id.value.replace("-", "")
+    if chunk_index == 0:
+        return customer_ref
+    suffix = f"-{chunk_index}"
+    return customer_ref[: BETFAIR_MAX_CUSTOMER_REF_LENGTH - len(suffix)] + suffix
+
+
 def determine_order_price(order: Union[LimitOrder, MarketOrder]):
     """
     Determine the correct price to send for a given order. Betfair doesn't support market orders, so if this order is a
@@ -188,26 +204,41 @@ def order_submit_to_betfair(command: SubmitOrder, instrument: BettingInstrument)
     """
     Convert a SubmitOrder command into the data required by BetfairClient.
     """
-    order = make_order(command.order)
+    return orders_submit_to_betfair(submits=[(command, command.order, instrument)])
+
 
+def orders_submit_to_betfair(
+    submits: List[Tuple[TradingCommand, Union[LimitOrder, MarketOrder], BettingInstrument]],
+    chunk_index: int = 0,
+) -> Dict:
+    """
+    Convert orders for a single market and strategy into the data required by
+    BetfairClient to place them with one request.
+
+    The instructions are in the same order as `submits`, which Betfair
+    preserves in the `instructionReports` of the response. The `chunk_index`
+    is the index of this request among those sent for the same command.
+    """
+    command = submits[0][0]
     place_order = {
-        "market_id": instrument.market_id,
+        "market_id": submits[0][2].market_id,
         # Used to de-dupe orders on betfair server side
-        "customer_ref": command.id.value.replace("-", ""),
+        "customer_ref": make_customer_ref(command.id, chunk_index),
         "customer_strategy_ref": command.strategy_id.value[:15],
         "instructions": [
             {
-                **order,
+                **make_order(order),
                 "selectionId": instrument.selection_id,
-                "side": N2B_SIDE[command.order.side],
+                "side": N2B_SIDE[order.side],
                 "handicap": instrument.selection_handicap,
                 # Remove the strategy name from customer_order_ref; it has a limited size and we don't control what
                 # length the strategy might be or what characters users might append
                 "customerOrderRef": make_custom_order_ref(
-                    client_order_id=command.order.client_order_id,
+                    client_order_id=order.client_order_id,
                     strategy_id=command.strategy_id,
                 ),
             }
+            for _, order, instrument in submits
         ],
     }
     return place_order
@@ -224,7 +255,7 @@ def order_update_to_betfair(
     """
     return {
         "market_id": instrument.market_id,
-        "customer_ref": command.id.value.replace("-", ""),
+        "customer_ref": make_customer_ref(command.id),
         "instructions": [
             {
                 "betId": venue_order_id.value,
@@ -238,10 +269,25 @@ def order_cancel_to_betfair(command: CancelOrder, instrument: BettingInstrument)
     """
     Convert a CancelOrder command into the data required by BetfairClient.
     """
+    return orders_cancel_to_betfair(commands=[command], instrument=instrument)
+
+
+def orders_cancel_to_betfair(
+    commands: List[CancelOrder],
+    instrument: BettingInstrument,
+    chunk_index: int = 0,
+):
+    """
+    Convert CancelOrder commands for a single market into the data required by
+    BetfairClient to cancel them with one request.
+
+    The `chunk_index` is the index of this request among those sent for the
+    same commands.
+    """
     return {
         "market_id": instrument.market_id,
-        "customer_ref": command.id.value.replace("-", ""),
-        "instructions": [{"betId": command.venue_order_id.value}],
+        "customer_ref": make_customer_ref(commands[0].id, chunk_index),
+        "instructions": [{"betId": command.venue_order_id.value} for command in commands],
     }
 
 
@@ -692,29 +738,64 @@ def on_market_update(instrument_provider, update: dict):
     return []
 
 
+def parse_current_order_status(order: Dict) -> OrderStatus:
+    if order["status"] == "EXECUTABLE":
+        if order["sizeMatched"] > 0:
+            return OrderStatus.PARTIALLY_FILLED
+        return OrderStatus.ACCEPTED
+    # EXECUTION_COMPLETE
+    if order["sizeCancelled"] == 0 and order["sizeLapsed"] == 0 and order["sizeVoided"] == 0:
+        return OrderStatus.FILLED
+    return OrderStatus.CANCELED
+
+
+def parse_current_order(self, order: Dict, ts_init: int) -> Optional[OrderStatusReport]:
+    venue_order_id = VenueOrderId(order["betId"])
+    client_order_id = self.venue_order_id_to_client_order_id.get(venue_order_id)
+    if client_order_id is None:
+        client_order_id = self._cache.client_order_id(venue_order_id)
+        if client_order_id is None:
+            self._log.warning(f"Found no client order ID for {venue_order_id}")
+            return None
+    return OrderStatusReport(
+        client_order_id=client_order_id,
+        venue_order_id=venue_order_id,
+        order_status=parse_current_order_status(order),
+        filled_qty=Quantity.from_str(str(order["sizeMatched"])),
+        ts_init=ts_init,
+    )
+
+
 async def generate_order_status_report(self, order) -> Optional[OrderStatusReport]:
-    return [
-        OrderStatusReport(
-            client_order_id=ClientOrderId(),
-            venue_order_id=VenueOrderId(),
-            order_status=OrderStatus(),
-            filled_qty=Quantity.zero(),
-            ts_init=int(pd.Timestamp(order["timestamp"]).to_datetime64()),
-        )
-        for order in self.client().betting.list_current_orders()["currentOrders"]
-    ]
+    current_orders = await self._client.list_current_orders(bet_ids=[order.venue_order_id.value])
+    if not current_orders:
+        self._log.warn(f"Found no existing order for {order.venue_order_id}")
+        return None
+    return parse_current_order(self, current_orders[0], ts_init=self._clock.timestamp_ns())
+
+
+async def generate_order_status_reports(self, orders) -> Dict[VenueOrderId, OrderStatusReport]:
+    # A single (paginated) request for all current orders
+    current_orders = await self._client.list_current_orders()
+    ts_init = self._clock.timestamp_ns()
+    reports = {}
+    for order in current_orders:
+        report = parse_current_order(self, order, ts_init=ts_init)
+        if report is not None:
+            reports[report.venue_order_id] = report
+    return reports
 
 
 async def generate_trades_list(
     self, venue_order_id: VenueOrderId, symbol: Symbol, since: datetime = None  # type: ignore
 ) -> List[ExecutionReport]:
-    filled = self.client().betting.list_cleared_orders(
-        bet_ids=[venue_order_id],
+    filled = await self._client.list_cleared_orders(
+        bet_ids=[venue_order_id.value],
     )
-    if not filled["clearedOrders"]:
+    if not filled:
         self._log.warn(f"Found no existing order for {venue_order_id}")
         return []
-    fill = filled["clearedOrders"][0]
+    fill = filled[0]
     ts_event = int(pd.Timestamp(fill["lastMatchedDate"]).to_datetime64())
     return [
         ExecutionReport(
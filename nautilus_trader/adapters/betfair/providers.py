@@ -14,7 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 import time
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 
@@ -59,9 +59,12 @@ class BetfairInstrumentProvider(InstrumentProvider):
         self.venue = BETFAIR_VENUE
         self._client = client
         self._log = LoggerAdapter("BetfairInstrumentProvider", logger)
-        self._cache: Dict[InstrumentId, BettingInstrument] = {}
         self._account_currency = None
-        self._missing_instruments: Set[BettingInstrument] = set()
+        self._missing_instruments: Set[Tuple[str, str, str]] = set()
+
+        # Indexes maintained on `add` for fast lookup from the streaming API
+        self._runner_index: Dict[Tuple[str, str, str], BettingInstrument] = {}
+        self._market_index: Dict[str, Dict[InstrumentId, BettingInstrument]] = {}
 
     @classmethod
     def from_instruments(cls, instruments, logger=None):
@@ -70,6 +73,23 @@ class BetfairInstrumentProvider(InstrumentProvider):
         instance.add_bulk(instruments)
         return instance
 
+    def add(self, instrument: BettingInstrument):
+        """
+        Add the given instrument to the provider, updating the lookup indexes.
+
+        Parameters
+        ----------
+        instrument : BettingInstrument
+            The instrument to add.
+
+        """
+        super().add(instrument)
+
+        key = (instrument.market_id, instrument.selection_id, instrument.selection_handicap)
+        self._runner_index[key] = instrument
+        self._market_index.setdefault(instrument.market_id, {})[instrument.id] = instrument
+        self._missing_instruments.discard(key)
+
     async def load_all_async(self, market_filter=None):
         """
         Load all instruments for the venue.
@@ -100,7 +120,11 @@ class BetfairInstrumentProvider(InstrumentProvider):
 
     def search_instruments(self, instrument_filter=None):
         """Search for instruments within the cache. Useful for debugging / interactive use"""
-        instruments = self.list_all()
+        if instrument_filter and isinstance(instrument_filter.get("market_id"), str):
+            # Narrow the scan to the runners of a single market using the index
+            instruments = self.list_market_instruments(instrument_filter["market_id"])
+        else:
+            instruments = self.list_all()
         if instrument_filter:
             instruments = [
                 ins
@@ -109,31 +133,38 @@ class BetfairInstrumentProvider(InstrumentProvider):
             ]
         return instruments
 
+    def list_market_instruments(self, market_id: str) -> List[BettingInstrument]:
+        """
+        Return all instruments (runners) for the given market.
+
+        Parameters
+        ----------
+        market_id : str
+            The Betfair market ID.
+
+        Returns
+        -------
+        list[BettingInstrument]
+
+        """
+        return list(self._market_index.get(market_id, {}).values())
+
     def get_betting_instrument(
         self,
         market_id: str,
         selection_id: str,
         handicap: str,
-    ) -> BettingInstrument:
+    ) -> Optional[BettingInstrument]:
         """Return a betting instrument with performance friendly lookup."""
-        key = (market_id, selection_id, handicap)
-        if key not in self._cache:
-            instrument_filter = {
-                "market_id": market_id,
-                "selection_id": selection_id,
-                "selection_handicap": parse_handicap(handicap),
-            }
-            instruments = self.search_instruments(instrument_filter=instrument_filter)
-            count = len(instruments)
-            if count < 1:
-                key = (market_id, selection_id, parse_handicap(handicap))
-                if key not in self._missing_instruments:
-                    self._log.warning(f"Found 0 instrument for filter: {instrument_filter}")
-                    self._missing_instruments.add(key)
-                return
-            # assert count == 1, f"Wrong number of instruments: {len(instruments)} for filter: {instrument_filter}"
-            self._cache[key] = instruments[0]
-        return self._cache[key]
+        key = (market_id, selection_id, parse_handicap(handicap))
+        instrument = self._runner_index.get(key)
+        if instrument is None and key not in self._missing_instruments:
+            self._log.warning(
+                f"Found 0 instrument for market_id={market_id}, "
+                f"selection_id={selection_id}, handicap={key[2]}"
+            )
+            self._missing_instruments.add(key)
+        return instrument
 
     async def get_account_currency(self) -> str:
         if self._account_currency is None:
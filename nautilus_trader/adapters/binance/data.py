@@ -16,44 +16,34 @@
 import asyncio
 from typing import Any, Dict, List, Optional
 
-import orjson
 import pandas as pd
 
 from nautilus_trader.adapters.binance.common import BINANCE_VENUE
 from nautilus_trader.adapters.binance.data_types import BinanceBar
-from nautilus_trader.adapters.binance.data_types import BinanceTicker
+from nautilus_trader.adapters.binance.decoding import BinanceStreamDecoder
 from nautilus_trader.adapters.binance.http.api.spot_market import BinanceSpotMarketHttpAPI
 from nautilus_trader.adapters.binance.http.client import BinanceHttpClient
 from nautilus_trader.adapters.binance.http.error import BinanceError
 from nautilus_trader.adapters.binance.parsing import parse_bar
-from nautilus_trader.adapters.binance.parsing import parse_bar_ws
-from nautilus_trader.adapters.binance.parsing import parse_book_snapshot_ws
-from nautilus_trader.adapters.binance.parsing import parse_diff_depth_stream_ws
-from nautilus_trader.adapters.binance.parsing import parse_quote_tick_ws
-from nautilus_trader.adapters.binance.parsing import parse_ticker_ws
 from nautilus_trader.adapters.binance.parsing import parse_trade_tick
-from nautilus_trader.adapters.binance.parsing import parse_trade_tick_ws
 from nautilus_trader.adapters.binance.providers import BinanceInstrumentProvider
 from nautilus_trader.adapters.binance.websocket.spot import BinanceSpotWebSocket
 from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.logging import Logger
 from nautilus_trader.core.correctness import PyCondition
-from nautilus_trader.core.datetime import millis_to_nanos
+from nautilus_trader.core.data import Data
 from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.live.data_client import LiveMarketDataClient
 from nautilus_trader.model.c_enums.bar_aggregation import BarAggregationParser
 from nautilus_trader.model.data.bar import BarType
-from nautilus_trader.model.data.tick import QuoteTick
 from nautilus_trader.model.data.tick import TradeTick
 from nautilus_trader.model.enums import BarAggregation
 from nautilus_trader.model.enums import BookType
 from nautilus_trader.model.enums import PriceType
 from nautilus_trader.model.identifiers import ClientId
 from nautilus_trader.model.identifiers import InstrumentId
-from nautilus_trader.model.identifiers import Symbol
 from nautilus_trader.model.orderbook.data import OrderBookData
-from nautilus_trader.model.orderbook.data import OrderBookDeltas
 from nautilus_trader.model.orderbook.data import OrderBookSnapshot
 from nautilus_trader.msgbus.bus import MessageBus
 
@@ -117,6 +107,7 @@ class BinanceDataClient(LiveMarketDataClient):
             handler=self._handle_spot_ws_message,
         )
 
+        self._decoder = BinanceStreamDecoder()
         self._book_buffer: Dict[InstrumentId, List[OrderBookData]] = {}
 
     def connect(self):
@@ -146,18 +137,12 @@ class BinanceDataClient(LiveMarketDataClient):
         self._send_all_instruments_to_data_engine()
         self._update_instruments_task = self._loop.create_task(self._update_instruments())
 
-        # Connect WebSocket clients
-        self._loop.create_task(self._connect_websockets())
+        # Connect WebSocket clients (connections open as streams are subscribed)
+        await self._ws_spot.connect()
 
         self._set_connected(True)
         self._log.info("Connected.")
 
-    async def _connect_websockets(self):
-        self._log.info("Awaiting subscriptions...")
-        await asyncio.sleep(2)
-        if self._ws_spot.has_subscriptions:
-            await self._ws_spot.connect()
-
     async def _update_instruments(self):
         while True:
             self._log.debug(
@@ -336,6 +321,13 @@ class BinanceDataClient(LiveMarketDataClient):
             )
             return
 
+        self._ws_spot.subscribe_bars(
+            symbol=bar_type.instrument_id.symbol.value,
+            interval=self._kline_interval(bar_type),
+        )
+        self._add_subscription_bars(bar_type)
+
+    def _kline_interval(self, bar_type: BarType) -> str:
         if bar_type.spec.aggregation == BarAggregation.MINUTE:
             resolution = "m"
         elif bar_type.spec.aggregation == BarAggregation.HOUR:
@@ -347,12 +339,7 @@ class BinanceDataClient(LiveMarketDataClient):
                 f"invalid aggregation period, "
                 f"was {BarAggregationParser.from_str(bar_type.spec.aggregation)}",
             )
-
-        self._ws_spot.subscribe_bars(
-            symbol=bar_type.instrument_id.symbol.value,
-            interval=f"{bar_type.spec.step}{resolution}",
-        )
-        self._add_subscription_bars(bar_type)
+        return f"{bar_type.spec.step}{resolution}"
 
     def subscribe_instrument_status_updates(self, instrument_id: InstrumentId):
         self._log.warning(
@@ -387,21 +374,31 @@ class BinanceDataClient(LiveMarketDataClient):
         self._remove_subscription_instrument(instrument_id)
 
     def unsubscribe_order_book_deltas(self, instrument_id: InstrumentId):
+        self._ws_spot.unsubscribe_book_depth(instrument_id.symbol.value)
         self._remove_subscription_order_book_deltas(instrument_id)
 
     def unsubscribe_order_book_snapshots(self, instrument_id: InstrumentId):
+        self._ws_spot.unsubscribe_book_depth(instrument_id.symbol.value)
         self._remove_subscription_order_book_snapshots(instrument_id)
 
     def unsubscribe_ticker(self, instrument_id: InstrumentId):
+        self._ws_spot.unsubscribe_ticker(instrument_id.symbol.value)
         self._remove_subscription_ticker(instrument_id)
 
     def unsubscribe_quote_ticks(self, instrument_id: InstrumentId):
+        self._ws_spot.unsubscribe_book_ticker(instrument_id.symbol.value)
         self._remove_subscription_quote_ticks(instrument_id)
 
     def unsubscribe_trade_ticks(self, instrument_id: InstrumentId):
+        self._ws_spot.unsubscribe_trades(instrument_id.symbol.value)
         self._remove_subscription_trade_ticks(instrument_id)
 
     def unsubscribe_bars(self, bar_type: BarType):
+        if bar_type.spec.is_time_aggregated() and bar_type.spec.aggregation != BarAggregation.SECOND:
+            self._ws_spot.unsubscribe_bars(
+                symbol=bar_type.instrument_id.symbol.value,
+                interval=self._kline_interval(bar_type),
+            )
         self._remove_subscription_bars(bar_type)
 
     def unsubscribe_instrument_status_updates(self, instrument_id: InstrumentId):
@@ -555,121 +552,17 @@ class BinanceDataClient(LiveMarketDataClient):
             self._cache.add_currency(currency)
 
     def _handle_spot_ws_message(self, raw: bytes):
-        msg: Dict[str, Any] = orjson.loads(raw)
-        data: Dict[str, Any] = msg.get("data")
-
-        msg_type: str = data.get("e")
-        if msg_type is None:
-            self._handle_market_update(msg, data)
-        elif msg_type == "depthUpdate":
-            self._handle_depth_update(data)
-        elif msg_type == "24hrTicker":
-            self._handle_24hr_ticker(data)
-        elif msg_type == "trade":
-            self._handle_trade(data)
-        elif msg_type == "kline":
-            self._handle_kline(data)
-        else:
-            self._log.error(f"Unrecognized websocket message type, was {msg_type}")
-            return
-
-    def _handle_market_update(self, msg: Dict[str, Any], data: Dict[str, Any]):
-        last_update_id: int = data.get("lastUpdateId")
-        if last_update_id is not None:
-            self._handle_book_snapshot(
-                data=data,
-                last_update_id=last_update_id,
-                symbol=msg["stream"].partition("@")[0].upper(),
-            )
-        else:
-            self._handle_quote_tick(data)
-
-    def _handle_book_snapshot(
-        self,
-        data: Dict[str, Any],
-        symbol: str,
-        last_update_id: int,
-    ):
-        instrument_id = InstrumentId(
-            symbol=Symbol(symbol),
-            venue=BINANCE_VENUE,
-        )
-        book_snapshot: OrderBookSnapshot = parse_book_snapshot_ws(
-            instrument_id=instrument_id,
-            msg=data,
-            update_id=last_update_id,
-            ts_init=self._clock.timestamp_ns(),
-        )
-        book_buffer: List[OrderBookData] = self._book_buffer.get(instrument_id)
-        if book_buffer is not None:
-            book_buffer.append(book_snapshot)
-            return
-        self._handle_data(book_snapshot)
-
-    def _handle_quote_tick(self, data: Dict[str, Any]):
-        instrument_id = InstrumentId(
-            symbol=Symbol(data["s"]),
-            venue=BINANCE_VENUE,
-        )
-        quote_tick: QuoteTick = parse_quote_tick_ws(
-            instrument_id=instrument_id,
-            msg=data,
-            ts_init=self._clock.timestamp_ns(),
-        )
-        self._handle_data(quote_tick)
-
-    def _handle_depth_update(self, data: Dict[str, Any]):
-        instrument_id = InstrumentId(
-            symbol=Symbol(data["s"]),
-            venue=BINANCE_VENUE,
-        )
-        book_deltas: OrderBookDeltas = parse_diff_depth_stream_ws(
-            instrument_id=instrument_id,
-            msg=data,
-            ts_init=self._clock.timestamp_ns(),
-        )
-        book_buffer: List[OrderBookData] = self._book_buffer.get(instrument_id)
-        if book_buffer is not None:
-            book_buffer.append(book_deltas)
+        try:
+            data: Optional[Data] = self._decoder.decode(raw, ts_init=self._clock.timestamp_ns())
+        except ValueError as ex:
+            self._log.error(f"Cannot decode websocket message: {ex}.")
             return
-        self._handle_data(book_deltas)
 
-    def _handle_24hr_ticker(self, data: Dict[str, Any]):
-        instrument_id = InstrumentId(
-            symbol=Symbol(data["s"]),
-            venue=BINANCE_VENUE,
-        )
-        ticker: BinanceTicker = parse_ticker_ws(
-            instrument_id=instrument_id,
-            msg=data,
-            ts_init=self._clock.timestamp_ns(),
-        )
-        self._handle_data(ticker)
-
-    def _handle_trade(self, data: Dict[str, Any]):
-        instrument_id = InstrumentId(
-            symbol=Symbol(data["s"]),
-            venue=BINANCE_VENUE,
-        )
-        trade_tick: TradeTick = parse_trade_tick_ws(
-            instrument_id=instrument_id,
-            msg=data,
-            ts_init=self._clock.timestamp_ns(),
-        )
-        self._handle_data(trade_tick)
-
-    def _handle_kline(self, data: Dict[str, Any]):
-        kline = data["k"]
-        if data["E"] < kline["T"]:
-            return  # Bar has not closed yet
-        instrument_id = InstrumentId(
-            symbol=Symbol(kline["s"]),
-            venue=BINANCE_VENUE,
-        )
-        bar: BinanceBar = parse_bar_ws(
-            instrument_id=instrument_id,
-            kline=kline,
-            ts_event=millis_to_nanos(data["E"]),
-            ts_init=self._clock.timestamp_ns(),
-        )
-        self._handle_data(bar)
+        if data is None:
+            return  # No data for message
+        if isinstance(data, OrderBookData):
+            book_buffer: List[OrderBookData] = self._book_buffer.get(data.instrument_id)
+            if book_buffer is not None:
+                book_buffer.append(data)
+                return
+        self._handle_data(data)
@@ -0,0 +1,278 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional
+
+import orjson
+
+from nautilus_trader.adapters.binance.common import BINANCE_VENUE
+from nautilus_trader.adapters.binance.data_types import BinanceBar
+from nautilus_trader.adapters.binance.data_types import BinanceTicker
+from nautilus_trader.core.data import Data
+from nautilus_trader.core.datetime import millis_to_nanos
+from nautilus_trader.model.data.bar import BarSpecification
+from nautilus_trader.model.data.bar import BarType
+from nautilus_trader.model.data.tick import QuoteTick
+from nautilus_trader.model.data.tick import TradeTick
+from nautilus_trader.model.enums import AggregationSource
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.enums import BarAggregation
+from nautilus_trader.model.enums import BookAction
+from nautilus_trader.model.enums import BookType
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import PriceType
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.identifiers import Symbol
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.orderbook.data import Order
+from nautilus_trader.model.orderbook.data import OrderBookDelta
+from nautilus_trader.model.orderbook.data import OrderBookDeltas
+from nautilus_trader.model.orderbook.data import OrderBookSnapshot
+
+
+StreamDecoder = Callable[[Dict, int], Optional[Data]]
+
+_KLINE_AGGREGATIONS = {
+    "m": BarAggregation.MINUTE,
+    "h": BarAggregation.HOUR,
+    "d": BarAggregation.DAY,
+}
+
+
+class BinanceStreamDecoder:
+    """
+    Provides a decoder for `Binance` combined stream messages.
+
+    Each stream name is compiled once into a decoder with its instrument ID and
+    message schema bound (such as the bar type for a kline stream), so that
+    each message is decoded with a single JSON parse and direct field access,
+    without dispatching on the event type or rebuilding identifiers.
+    """
+
+    def __init__(self):
+        self._decoders: Dict[str, StreamDecoder] = {}
+
+    def decode(self, raw: bytes, ts_init: int) -> Optional[Data]:
+        """
+        Decode the given raw combined stream message.
+
+        Parameters
+        ----------
+        raw : bytes
+            The raw message.
+        ts_init : int64
+            The UNIX timestamp (nanoseconds) when the data object was initialized.
+
+        Returns
+        -------
+        Data or ``None``
+            ``None`` if the message does not produce data (such as an open kline).
+
+        Raises
+        ------
+        ValueError
+            If the message stream is not supported.
+
+        """
+        msg: Dict = orjson.loads(raw)
+        stream: str = msg["stream"]
+        decoder: Optional[StreamDecoder] = self._decoders.get(stream)
+        if decoder is None:
+            decoder = compile_stream_decoder(stream)
+            self._decoders[stream] = decoder
+        return decoder(msg["data"], ts_init)
+
+
+def compile_stream_decoder(stream: str) -> StreamDecoder:
+    """
+    Return a decoder for messages from the given stream.
+
+    Parameters
+    ----------
+    stream : str
+        The combined stream name, such as 'ethusdt@trade'.
+
+    Returns
+    -------
+    Callable[[dict, int], Data or ``None``]
+
+    Raises
+    ------
+    ValueError
+        If the `stream` is not supported.
+
+    """
+    symbol, _, kind = stream.partition("@")
+    instrument_id = InstrumentId(Symbol(symbol.upper()), BINANCE_VENUE)
+    if kind == "trade":
+        return _trade_decoder(instrument_id)
+    elif kind == "bookTicker":
+        return _quote_decoder(instrument_id)
+    elif kind == "ticker":
+        return _ticker_decoder(instrument_id)
+    elif kind in ("depth", "depth@100ms", "depth@1000ms"):
+        return _diff_depth_decoder(instrument_id)
+    elif kind.startswith("depth"):
+        return _partial_depth_decoder(instrument_id)
+    elif kind.startswith("kline_"):
+        return _kline_decoder(instrument_id, interval=kind[6:])
+    raise ValueError(f"unsupported stream, was {stream}")
+
+
+def _trade_decoder(instrument_id: InstrumentId) -> StreamDecoder:
+    def decode(data: Dict, ts_init: int) -> TradeTick:
+        return TradeTick(
+            instrument_id=instrument_id,
+            price=Price.from_str(data["p"]),
+            size=Quantity.from_str(data["q"]),
+            aggressor_side=AggressorSide.SELL if data["m"] else AggressorSide.BUY,
+            trade_id=str(data["t"]),
+            ts_event=millis_to_nanos(data["T"]),
+            ts_init=ts_init,
+        )
+
+    return decode
+
+
+def _quote_decoder(instrument_id: InstrumentId) -> StreamDecoder:
+    def decode(data: Dict, ts_init: int) -> QuoteTick:
+        return QuoteTick(
+            instrument_id=instrument_id,
+            bid=Price.from_str(data["b"]),
+            ask=Price.from_str(data["a"]),
+            bid_size=Quantity.from_str(data["B"]),
+            ask_size=Quantity.from_str(data["A"]),
+            ts_event=ts_init,
+            ts_init=ts_init,
+        )
+
+    return decode
+
+
+def _ticker_decoder(instrument_id: InstrumentId) -> StreamDecoder:
+    def decode(data: Dict, ts_init: int) -> BinanceTicker:
+        return BinanceTicker(
+            instrument_id=instrument_id,
+            price_change=Decimal(data["p"]),
+            price_change_percent=Decimal(data["P"]),
+            weighted_avg_price=Decimal(data["w"]),
+            prev_close_price=Decimal(data["x"]),
+            last_price=Decimal(data["c"]),
+            last_qty=Decimal(data["Q"]),
+            bid_price=Decimal(data["b"]),
+            ask_price=Decimal(data["a"]),
+            open_price=Decimal(data["o"]),
+            high_price=Decimal(data["h"]),
+            low_price=Decimal(data["l"]),
+            volume=Decimal(data["v"]),
+            quote_volume=Decimal(data["q"]),
+            open_time_ms=data["O"],
+            close_time_ms=data["C"],
+            first_id=data["F"],
+            last_id=data["L"],
+            count=data["n"],
+            ts_event=millis_to_nanos(data["E"]),
+            ts_init=ts_init,
+        )
+
+    return decode
+
+
+def _levels(levels: List[List[str]], side: OrderSide) -> List[Order]:
+    # The price string is given as the order ID (L2 books key levels by price),
+    # which avoids generating a UUID for every level.
+    return [Order(float(level[0]), float(level[1]), side, level[0]) for level in levels]
+
+
+def _partial_depth_decoder(instrument_id: InstrumentId) -> StreamDecoder:
+    def decode(data: Dict, ts_init: int) -> OrderBookSnapshot:
+        return OrderBookSnapshot(
+            instrument_id=instrument_id,
+            book_type=BookType.L2_MBP,
+            bids=[[float(level[0]), float(level[1])] for level in data["bids"]],
+            asks=[[float(level[0]), float(level[1])] for level in data["asks"]],
+            ts_event=ts_init,
+            ts_init=ts_init,
+            update_id=data["lastUpdateId"],
+        )
+
+    return decode
+
+
+def _diff_depth_decoder(instrument_id: InstrumentId) -> StreamDecoder:
+    book_type = BookType.L2_MBP
+    update = BookAction.UPDATE
+    delete = BookAction.DELETE
+
+    def decode(data: Dict, ts_init: int) -> OrderBookDeltas:
+        ts_event: int = millis_to_nanos(data["E"])
+        update_id: int = data["U"]
+        deltas: List[OrderBookDelta] = [
+            OrderBookDelta(
+                instrument_id,
+                book_type,
+                update if order.size > 0.0 else delete,
+                order,
+                ts_event,
+                ts_init,
+                update_id,
+            )
+            for order in _levels(data["b"], OrderSide.BUY) + _levels(data["a"], OrderSide.SELL)
+        ]
+        return OrderBookDeltas(
+            instrument_id=instrument_id,
+            book_type=book_type,
+            deltas=deltas,
+            ts_event=ts_event,
+            ts_init=ts_init,
+            update_id=update_id,
+        )
+
+    return decode
+
+
+def _kline_decoder(instrument_id: InstrumentId, interval: str) -> StreamDecoder:
+    bar_type = BarType(
+        instrument_id=instrument_id,
+        bar_spec=BarSpecification(
+            step=int(interval[:-1]),
+            aggregation=_KLINE_AGGREGATIONS[interval[-1]],
+            price_type=PriceType.LAST,
+        ),
+        aggregation_source=AggregationSource.EXTERNAL,
+    )
+
+    def decode(data: Dict, ts_init: int) -> Optional[BinanceBar]:
+        kline: Dict = data["k"]
+        if data["E"] < kline["T"]:
+            return None  # Bar has not closed yet
+        return BinanceBar(
+            bar_type=bar_type,
+            open=Price.from_str(kline["o"]),
+            high=Price.from_str(kline["h"]),
+            low=Price.from_str(kline["l"]),
+            close=Price.from_str(kline["c"]),
+            volume=Quantity.from_str(kline["v"]),
+            quote_volume=Quantity.from_str(kline["q"]),
+            count=kline["n"],
+            taker_buy_base_volume=Quantity.from_str(kline["V"]),
+            taker_buy_quote_volume=Quantity.from_str(kline["Q"]),
+            ts_event=millis_to_nanos(data["E"]),
+            ts_init=ts_init,
+        )
+
+    return decode
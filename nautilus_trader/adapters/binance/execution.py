@@ -29,6 +29,8 @@ from nautilus_trader.adapters.binance.http.error import BinanceError
 from nautilus_trader.adapters.binance.parsing import binance_order_type
 from nautilus_trader.adapters.binance.parsing import parse_account_balances
 from nautilus_trader.adapters.binance.parsing import parse_account_balances_ws
+from nautilus_trader.adapters.binance.parsing import parse_exec_report
+from nautilus_trader.adapters.binance.parsing import parse_order_status_report
 from nautilus_trader.adapters.binance.parsing import parse_order_type
 from nautilus_trader.adapters.binance.providers import BinanceInstrumentProvider
 from nautilus_trader.adapters.binance.websocket.user import BinanceUserDataWebSocket
@@ -121,7 +123,10 @@ class BinanceSpotExecutionClient(LiveExecutionClient):
             cache=cache,
             clock=clock,
             logger=logger,
-            config={"name": "BinanceExecClient"},
+            config={
+                "name": "BinanceExecClient",
+                "reconciliation_concurrency": 5,  # Within 1200 request weight per minute
+            },
         )
 
         self._client = client
@@ -347,10 +352,13 @@ class BinanceSpotExecutionClient(LiveExecutionClient):
         )
 
     async def _submit_order_list(self, command: SubmitOrderList) -> None:
-        for order in command.list:
+        for order in command.list.orders:
             if order.contingency_ids:  # TODO(cs): Implement
                 self._log.warning(f"Cannot yet handle contingency orders, {order}.")
-            await self._submit_order(order)
+
+        # Binance spot has no batch order endpoint, so send the orders concurrently
+        # (request weight is accounted for by the shared rate limiter).
+        await asyncio.gather(*[self._submit_order(order) for order in command.list.orders])
 
     async def _cancel_order(self, command: CancelOrder) -> None:
         self._log.debug(f"Canceling order {command.client_order_id.value}.")
@@ -375,7 +383,7 @@ class BinanceSpotExecutionClient(LiveExecutionClient):
 
     # -- RECONCILIATION ----------------------------------------------------------------------------
 
-    async def generate_order_status_report(self, order: Order) -> OrderStatusReport:  # type: ignore
+    async def generate_order_status_report(self, order: Order) -> Optional[OrderStatusReport]:
         """
         Generate an order status report for the given order.
 
@@ -391,16 +399,56 @@ class BinanceSpotExecutionClient(LiveExecutionClient):
         OrderStatusReport or ``None``
 
         """
-        self._log.error(  # pragma: no cover
-            "Cannot generate order status report: not yet implemented.",
-        )
+        try:
+            response: Dict[str, Any] = await self._account_spot.get_order(
+                symbol=order.instrument_id.symbol.value,
+                orig_client_order_id=order.client_order_id.value,
+            )
+        except BinanceError as ex:
+            self._log.error(ex.message)  # type: ignore  # TODO(cs): Improve errors
+            return None
+
+        return parse_order_status_report(response, ts_init=self._clock.timestamp_ns())
+
+    async def generate_order_status_reports(
+        self,
+        active_orders: List[Order],
+    ) -> Optional[Dict[VenueOrderId, OrderStatusReport]]:
+        """
+        Generate order status reports for all open orders with a single request.
+
+        Orders which are no longer open will not have a report returned.
+
+        Parameters
+        ----------
+        active_orders : list[Order]
+            The orders which currently have an 'active' status.
+
+        Returns
+        -------
+        dict[VenueOrderId, OrderStatusReport] or ``None``
+
+        """
+        try:
+            response: List[Dict[str, Any]] = await self._account_spot.get_open_orders()
+        except BinanceError as ex:
+            self._log.error(ex.message)  # type: ignore  # TODO(cs): Improve errors
+            return None
+
+        ts_init: int = self._clock.timestamp_ns()
+        reports: Dict[VenueOrderId, OrderStatusReport] = {}
+        for msg in response:
+            report: OrderStatusReport = parse_order_status_report(msg, ts_init=ts_init)
+            reports[report.venue_order_id] = report
+
+        return reports
 
     async def generate_exec_reports(
         self,
         venue_order_id: VenueOrderId,
         symbol: Symbol,
         since: datetime = None,
-    ) -> List[ExecutionReport]:  # type: ignore
+    ) -> List[ExecutionReport]:
         """
         Generate a list of execution reports.
 
@@ -420,11 +468,26 @@ class BinanceSpotExecutionClient(LiveExecutionClient):
         list[ExecutionReport]
 
         """
-        self._log.error(  # pragma: no cover
-            "Cannot generate execution report: not yet implemented.",
-        )
+        client_order_id: Optional[ClientOrderId] = self._cache.client_order_id(venue_order_id)
+        if client_order_id is None:
+            self._log.error(
+                f"Cannot generate execution reports: "
+                f"no client order ID found for {repr(venue_order_id)}.",
+            )
+            return []
+
+        try:
+            # Binance only allows the order ID to be combined with the symbol
+            response: List[Dict[str, Any]] = await self._account_spot.my_trades(
+                symbol=symbol.value,
+                order_id=venue_order_id.value,
+            )
+        except BinanceError as ex:
+            self._log.error(ex.message)  # type: ignore  # TODO(cs): Improve errors
+            return []
 
-        return []
+        ts_init: int = self._clock.timestamp_ns()
+        return [parse_exec_report(client_order_id, msg, ts_init=ts_init) for msg in response]
 
     def _handle_user_ws_message(self, raw: bytes):
         msg: Dict[str, Any] = orjson.loads(raw)
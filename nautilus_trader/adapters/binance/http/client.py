@@ -19,7 +19,7 @@
 import asyncio
 import hashlib
 import hmac
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import orjson
 from aiohttp import ClientResponse
@@ -31,10 +31,27 @@ from nautilus_trader.adapters.binance.http.error import BinanceServerError
 from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.logging import Logger
 from nautilus_trader.network.http import HttpClient
+from nautilus_trader.network.http import get_rate_limiter
 
 
 NAUTILUS_VERSION = nautilus_trader.__version__
 
+# The IP request weight limit (per minute) shared by all clients for a host
+BINANCE_WEIGHT_LIMIT = 1200
+
+# The request weights for endpoints, where these differ from the default of 1
+# (https://binance-docs.github.io/apidocs/spot/en/#limits)
+BINANCE_ENDPOINT_WEIGHTS: Dict[str, int] = {
+    "/api/v3/exchangeInfo": 10,
+    "/api/v3/historicalTrades": 5,
+    "/api/v3/allOrders": 10,
+    "/api/v3/allOrderList": 10,
+    "/api/v3/openOrderList": 3,
+    "/api/v3/account": 10,
+    "/api/v3/myTrades": 10,
+    "/api/v3/rateLimit/order": 20,
+}
+
 
 class BinanceHttpClient(HttpClient):
     """
@@ -54,14 +71,20 @@ class BinanceHttpClient(HttpClient):
         timeout=None,
         show_limit_usage=False,
     ):
+        base_url = base_url or self.BASE_URL
         super().__init__(
             loop=loop,
             logger=logger,
+            rate_limiter=get_rate_limiter(
+                key=f"binance:{base_url}",
+                capacity=BINANCE_WEIGHT_LIMIT,
+                interval_secs=60,
+            ),
         )
         self._clock = clock
         self._key = key
         self._secret = secret
-        self._base_url = base_url or self.BASE_URL
+        self._base_url = base_url
         self._show_limit_usage = show_limit_usage
         self._proxies = None
         self._headers: Dict[str, str] = {
@@ -73,8 +96,6 @@ class BinanceHttpClient(HttpClient):
         if timeout is not None:
             self._headers["timeout"] = timeout
 
-        # TODO(cs): Implement limit usage
-
     @property
     def api_key(self) -> str:
         return self._key
@@ -150,12 +171,17 @@ class BinanceHttpClient(HttpClient):
                 method=http_method,
                 url=self._base_url + url_path,
                 headers=self._headers,
+                weight=self._request_weight(http_method, url_path, payload),
                 params=self._prepare_params(payload),
             )
         except ClientResponseError as ex:
             await self._handle_exception(ex)
             return
 
+        used_weight: Optional[str] = resp.headers.get("x-mbx-used-weight-1m")
+        if used_weight is not None:
+            self.rate_limiter.update_used(float(used_weight))
+
         if self._show_limit_usage:
             limit_usage = {}
             for key in resp.headers.keys():
@@ -166,12 +192,39 @@ class BinanceHttpClient(HttpClient):
                     or key.startswith("x-sapi-used")
                 ):
                     limit_usage[key] = resp.headers[key]
+            self._log.info(f"Limit usage: {limit_usage}.")
 
         try:
             return orjson.loads(resp.data)
         except orjson.JSONDecodeError:
             self._log.error(f"Could not decode data to JSON: {resp.data}.")
 
+    def _request_weight(self, http_method: str, url_path: str, payload: Dict[str, str]) -> int:
+        url_path = url_path.partition("?")[0]
+        weight: Optional[int] = BINANCE_ENDPOINT_WEIGHTS.get(url_path)
+        if weight is not None:
+            return weight
+        if url_path == "/api/v3/depth":
+            limit = int(payload.get("limit", 100))
+            if limit <= 100:
+                return 1
+            elif limit <= 500:
+                return 5
+            elif limit <= 1000:
+                return 10
+            return 50
+        if url_path == "/api/v3/openOrders" and http_method == "GET":
+            return 3 if "symbol" in payload else 40
+        if url_path == "/api/v3/ticker/24hr":
+            return 1 if "symbol" in payload else 40
+        if url_path in ("/api/v3/ticker/price", "/api/v3/ticker/bookTicker"):
+            return 1 if "symbol" in payload else 2
+        if url_path == "/api/v3/order" and http_method == "GET":
+            return 2
+        if url_path == "/api/v3/orderList" and http_method == "GET":
+            return 2
+        return 1
+
     def _prepare_params(self, params: Dict[str, str]) -> str:
         return "&".join([k + "=" + v for k, v in params.items()])
 
@@ -17,140 +17,29 @@ from decimal import Decimal
 from typing import Dict, List, Tuple
 
 from nautilus_trader.adapters.binance.data_types import BinanceBar
-from nautilus_trader.adapters.binance.data_types import BinanceTicker
 from nautilus_trader.core.datetime import millis_to_nanos
+from nautilus_trader.execution.messages import ExecutionReport
+from nautilus_trader.execution.messages import OrderStatusReport
 from nautilus_trader.model.c_enums.order_type import OrderTypeParser
 from nautilus_trader.model.currency import Currency
-from nautilus_trader.model.data.bar import BarSpecification
 from nautilus_trader.model.data.bar import BarType
-from nautilus_trader.model.data.tick import QuoteTick
 from nautilus_trader.model.data.tick import TradeTick
-from nautilus_trader.model.enums import AggregationSource
 from nautilus_trader.model.enums import AggressorSide
-from nautilus_trader.model.enums import BarAggregation
-from nautilus_trader.model.enums import BookAction
-from nautilus_trader.model.enums import BookType
+from nautilus_trader.model.enums import LiquiditySide
 from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import OrderStatus
 from nautilus_trader.model.enums import OrderType
-from nautilus_trader.model.enums import PriceType
+from nautilus_trader.model.identifiers import ClientOrderId
+from nautilus_trader.model.identifiers import ExecutionId
 from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.identifiers import VenueOrderId
 from nautilus_trader.model.objects import AccountBalance
 from nautilus_trader.model.objects import Money
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
-from nautilus_trader.model.orderbook.data import OrderBookDelta
-from nautilus_trader.model.orderbook.data import OrderBookDeltas
-from nautilus_trader.model.orderbook.data import OrderBookSnapshot
 from nautilus_trader.model.orders.base import Order
 
 
-def parse_book_snapshot_ws(
-    instrument_id: InstrumentId, msg: Dict, update_id: int, ts_init: int
-) -> OrderBookSnapshot:
-    ts_event: int = ts_init
-
-    return OrderBookSnapshot(
-        instrument_id=instrument_id,
-        book_type=BookType.L2_MBP,
-        bids=[[float(o[0]), float(o[1])] for o in msg.get("bids")],
-        asks=[[float(o[0]), float(o[1])] for o in msg.get("asks")],
-        ts_event=ts_event,
-        ts_init=ts_init,
-        update_id=update_id,
-    )
-
-
-def parse_diff_depth_stream_ws(
-    instrument_id: InstrumentId, msg: Dict, ts_init: int
-) -> OrderBookDeltas:
-    ts_event: int = millis_to_nanos(msg["E"])
-    update_id: int = msg["U"]
-
-    bid_deltas = [
-        parse_book_delta_ws(instrument_id, OrderSide.BUY, d, ts_event, ts_init, update_id)
-        for d in msg.get("b")
-    ]
-    ask_deltas = [
-        parse_book_delta_ws(instrument_id, OrderSide.SELL, d, ts_event, ts_init, update_id)
-        for d in msg.get("a")
-    ]
-
-    return OrderBookDeltas(
-        instrument_id=instrument_id,
-        book_type=BookType.L2_MBP,
-        deltas=bid_deltas + ask_deltas,
-        ts_event=ts_event,
-        ts_init=ts_init,
-        update_id=update_id,
-    )
-
-
-def parse_book_delta_ws(
-    instrument_id: InstrumentId,
-    side: OrderSide,
-    delta: Tuple[str, str],
-    ts_event: int,
-    ts_init: int,
-    update_id: int,
-) -> OrderBookDelta:
-    price = float(delta[0])
-    size = float(delta[1])
-
-    order = Order(
-        price=price,
-        size=size,
-        side=side,
-    )
-
-    return OrderBookDelta(
-        instrument_id=instrument_id,
-        book_type=BookType.L2_MBP,
-        action=BookAction.UPDATE if size > 0.0 else BookAction.DELETE,
-        order=order,
-        ts_event=ts_event,
-        ts_init=ts_init,
-        update_id=update_id,
-    )
-
-
-def parse_ticker_ws(instrument_id: InstrumentId, msg: Dict, ts_init: int) -> BinanceTicker:
-    return BinanceTicker(
-        instrument_id=instrument_id,
-        price_change=Decimal(msg["p"]),
-        price_change_percent=Decimal(msg["P"]),
-        weighted_avg_price=Decimal(msg["w"]),
-        prev_close_price=Decimal(msg["x"]),
-        last_price=Decimal(msg["c"]),
-        last_qty=Decimal(msg["Q"]),
-        bid_price=Decimal(msg["b"]),
-        ask_price=Decimal(msg["a"]),
-        open_price=Decimal(msg["o"]),
-        high_price=Decimal(msg["h"]),
-        low_price=Decimal(msg["l"]),
-        volume=Decimal(msg["v"]),
-        quote_volume=Decimal(msg["q"]),
-        open_time_ms=msg["O"],
-        close_time_ms=msg["C"],
-        first_id=msg["F"],
-        last_id=msg["L"],
-        count=msg["n"],
-        ts_event=millis_to_nanos(msg["E"]),
-        ts_init=ts_init,
-    )
-
-
-def parse_quote_tick_ws(instrument_id: InstrumentId, msg: Dict, ts_init: int) -> QuoteTick:
-    return QuoteTick(
-        instrument_id=instrument_id,
-        bid=Price.from_str(msg["b"]),
-        ask=Price.from_str(msg["a"]),
-        bid_size=Quantity.from_str(msg["B"]),
-        ask_size=Quantity.from_str(msg["B"]),
-        ts_event=ts_init,
-        ts_init=ts_init,
-    )
-
-
 def parse_trade_tick(instrument_id: InstrumentId, msg: Dict, ts_init: int) -> TradeTick:
     return TradeTick(
         instrument_id=instrument_id,
@@ -163,18 +52,6 @@ def parse_trade_tick(instrument_id: InstrumentId, msg: Dict, ts_init: int) -> Tr
     )
 
 
-def parse_trade_tick_ws(instrument_id: InstrumentId, msg: Dict, ts_init: int) -> TradeTick:
-    return TradeTick(
-        instrument_id=instrument_id,
-        price=Price.from_str(msg["p"]),
-        size=Quantity.from_str(msg["q"]),
-        aggressor_side=AggressorSide.SELL if msg["m"] else AggressorSide.BUY,
-        trade_id=str(msg["t"]),
-        ts_event=millis_to_nanos(msg["T"]),
-        ts_init=ts_init,
-    )
-
-
 def parse_bar(bar_type: BarType, values: List, ts_init: int) -> BinanceBar:
     return BinanceBar(
         bar_type=bar_type,
@@ -192,51 +69,6 @@ def parse_bar(bar_type: BarType, values: List, ts_init: int) -> BinanceBar:
     )
 
 
-def parse_bar_ws(
-    instrument_id: InstrumentId,
-    kline: Dict,
-    ts_event: int,
-    ts_init: int,
-) -> BinanceBar:
-    interval = kline["i"]
-    resolution = interval[1]
-    if resolution == "m":
-        aggregation = BarAggregation.MINUTE
-    elif resolution == "h":
-        aggregation = BarAggregation.HOUR
-    elif resolution == "d":
-        aggregation = BarAggregation.DAY
-    else:  # pragma: no cover (design-time error)
-        raise RuntimeError(f"unsupported time aggregation resolution, was {resolution}")
-
-    bar_spec = BarSpecification(
-        step=int(interval[0]),
-        aggregation=aggregation,
-        price_type=PriceType.LAST,
-    )
-
-    bar_type = BarType(
-        instrument_id=instrument_id,
-        bar_spec=bar_spec,
-        aggregation_source=AggregationSource.EXTERNAL,
-    )
-
-    return BinanceBar(
-        bar_type=bar_type,
-        open=Price.from_str(kline["o"]),
-        high=Price.from_str(kline["h"]),
-        low=Price.from_str(kline["l"]),
-        close=Price.from_str(kline["c"]),
-        volume=Quantity.from_str(kline["v"]),
-        quote_volume=Quantity.from_str(kline["q"]),
-        count=kline["n"],
-        taker_buy_base_volume=Quantity.from_str(kline["V"]),
-        taker_buy_quote_volume=Quantity.from_str(kline["Q"]),
-        ts_event=ts_event,
-        ts_init=ts_init,
-    )
-
-
 def parse_account_balances(raw_balances: List[Dict[str, str]]) -> List[AccountBalance]:
     return _parse_balances(raw_balances, "asset", "free", "locked")
 
@@ -287,6 +119,52 @@ def parse_order_type(order_type: str) -> OrderType:
         return OrderTypeParser.from_str_py(order_type)
 
 
+def parse_order_status(status: str) -> OrderStatus:
+    if status == "NEW" or status == "PENDING_CANCEL":
+        return OrderStatus.ACCEPTED
+    elif status == "PARTIALLY_FILLED":
+        return OrderStatus.PARTIALLY_FILLED
+    elif status == "FILLED":
+        return OrderStatus.FILLED
+    elif status == "CANCELED":
+        return OrderStatus.CANCELED
+    elif status == "REJECTED":
+        return OrderStatus.REJECTED
+    elif status == "EXPIRED":
+        return OrderStatus.EXPIRED
+    else:  # pragma: no cover (design-time error)
+        raise RuntimeError(f"unrecognized order status, was {status}")
+
+
+def parse_order_status_report(msg: Dict, ts_init: int) -> OrderStatusReport:
+    return OrderStatusReport(
+        client_order_id=ClientOrderId(msg["clientOrderId"]),
+        venue_order_id=VenueOrderId(str(msg["orderId"])),
+        order_status=parse_order_status(msg["status"]),
+        filled_qty=Quantity.from_str(msg["executedQty"]),
+        ts_init=ts_init,
+    )
+
+
+def parse_exec_report(
+    client_order_id: ClientOrderId,
+    msg: Dict,
+    ts_init: int,
+) -> ExecutionReport:
+    return ExecutionReport(
+        client_order_id=client_order_id,
+        venue_order_id=VenueOrderId(str(msg["orderId"])),
+        venue_position_id=None,  # NETTING accounts
+        execution_id=ExecutionId(str(msg["id"])),  # Trade ID
+        last_qty=Quantity.from_str(msg["qty"]),
+        last_px=Price.from_str(msg["price"]),
+        commission=Money.from_str(f"{msg['commission']} {msg['commissionAsset']}"),
+        liquidity_side=LiquiditySide.MAKER if msg["isMaker"] else LiquiditySide.TAKER,
+        ts_event=millis_to_nanos(msg["time"]),
+        ts_init=ts_init,
+    )
+
+
 def binance_order_type(order: Order, market_price: Decimal = None) -> str:  # noqa
     if order.type == OrderType.LIMIT:
         if order.is_post_only:
@@ -17,55 +17,218 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
-from typing import Callable, List
+from typing import Callable, Dict, List, Optional, Tuple
+
+import orjson
 
 from nautilus_trader.common.clock import LiveClock
 from nautilus_trader.common.logging import Logger
+from nautilus_trader.common.logging import LoggerAdapter
 from nautilus_trader.network.websocket import WebSocketClient
 
 
-class BinanceWebSocketClient(WebSocketClient):
+# Binance limits incoming messages to 5 per second per connection
+BINANCE_WS_MESSAGE_INTERVAL_SECS = 0.25
+
+
+class BinanceWebSocketShard(WebSocketClient):
     """
-    Provides a `Binance` streaming WebSocket client.
+    Provides a single `Binance` combined stream WebSocket connection, where
+    streams are live subscribed with the `SUBSCRIBE` and `UNSUBSCRIBE` methods.
+
+    On reconnection all current streams are resubscribed.
     """
 
     def __init__(
         self,
         loop: asyncio.AbstractEventLoop,
-        clock: LiveClock,
         logger: Logger,
         handler: Callable[[bytes], None],
-        base_url: str,
     ):
         super().__init__(
             loop=loop,
             logger=logger,
-            handler=handler,
+            handler=self._handle_raw,
         )
 
-        self._base_url = base_url
+        self._stream_handler = handler
+        self._subscribing = False
+        self._pending: List[Tuple[str, str]] = []  # (method, stream)
+        self._flush_task: Optional[asyncio.Task] = None
+        self._request_id = 0
+        self.streams: List[str] = []
+
+    async def post_connect(self):
+        # Resubscribe all streams (on initial connection or after reconnecting)
+        self._subscribing = True
+        self._pending.clear()
+        if self.streams:
+            await self._send_method("SUBSCRIBE", self.streams.copy())
+
+    def subscribe(self, stream: str):
+        self.streams.append(stream)
+        if self._subscribing:
+            self._schedule("SUBSCRIBE", stream)
+
+    def unsubscribe(self, stream: str):
+        self.streams.remove(stream)
+        if self._subscribing:
+            self._schedule("UNSUBSCRIBE", stream)
+
+    def _schedule(self, method: str, stream: str):
+        self._pending.append((method, stream))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = self._loop.create_task(self._flush())
+
+    async def _flush(self):
+        await asyncio.sleep(0)  # Batch all changes made in this loop cycle
+        try:
+            while self._pending:
+                method: str = self._pending[0][0]
+                streams: List[str] = []
+                while self._pending and self._pending[0][0] == method:
+                    streams.append(self._pending.pop(0)[1])
+                await self._send_method(method, streams)
+                await asyncio.sleep(BINANCE_WS_MESSAGE_INTERVAL_SECS)
+        except Exception as ex:
+            # Any lost changes are resubscribed by `post_connect` on reconnection
+            self._log.exception(ex)
+
+    async def _send_method(self, method: str, streams: List[str]):
+        self._request_id += 1
+        await self.send(
+            orjson.dumps({"method": method, "params": streams, "id": self._request_id}),
+        )
+
+    def _handle_raw(self, raw: bytes):
+        if raw.startswith(b'{"result"'):
+            return  # Response to a method request
+        elif raw.startswith(b'{"error"'):
+            self._log.error(f"Error response: {raw.decode()}.")
+            return
+        self._stream_handler(raw)
+
+
+class BinanceWebSocketClient:
+    """
+    Provides a `Binance` streaming WebSocket client.
+
+    Streams are sharded across a pool of connections, with each connection
+    carrying up to `max_streams_per_connection` streams. Streams can be added
+    and removed while connected, and each connection reconnects independently.
+    Connections are opened lazily, so the client can be connected before any
+    streams are subscribed.
+
+    Parameters
+    ----------
+    loop : asyncio.AbstractEventLoop
+        The event loop for the client.
+    clock : LiveClock
+        The clock for the client.
+    logger : Logger
+        The logger for the client.
+    handler : Callable[[bytes], None]
+        The handler for receiving raw data.
+    base_url : str
+        The base URL for the WebSocket connections.
+    max_streams_per_connection : int, default 200
+        The maximum number of streams for each connection (Binance allows up
+        to 1024).
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        clock: LiveClock,
+        logger: Logger,
+        handler: Callable[[bytes], None],
+        base_url: str,
+        max_streams_per_connection: int = 200,
+    ):
+        if max_streams_per_connection <= 0:
+            raise ValueError(
+                f"`max_streams_per_connection` not positive, was {max_streams_per_connection}",
+            )
+
+        self._loop = loop
         self._clock = clock
-        self._streams: List[str] = []
+        self._logger = logger
+        self._log = LoggerAdapter(component_name=type(self).__name__, logger=logger)
+        self._handler = handler
+        self._base_url = base_url
+        self._max_streams_per_connection = max_streams_per_connection
+        self._ws_kwargs: Dict = {}
+        self._connected = False
+
+        self._shards: List[BinanceWebSocketShard] = []
+        self._stream_shards: Dict[str, BinanceWebSocketShard] = {}
 
     @property
     def subscriptions(self):
-        return self._streams.copy()
+        return list(self._stream_shards.keys())
 
     @property
     def has_subscriptions(self):
-        if self._streams:
+        if self._stream_shards:
             return True
         else:
             return False
 
+    @property
+    def shard_count(self):
+        return len(self._shards)
+
+    @property
+    def is_connected(self):
+        return self._connected and all(shard.is_connected for shard in self._shards)
+
     async def connect(self, start: bool = True, **ws_kwargs) -> None:
-        if not self._streams:
-            raise RuntimeError("No subscriptions for connection.")
+        # Any shard added after this point is connected when created
+        self._ws_kwargs = ws_kwargs
+        self._connected = True
+        await asyncio.gather(
+            *[self._connect_shard(shard, start) for shard in self._shards],
+        )
+
+    async def disconnect(self) -> None:
+        self._connected = False
+        await asyncio.gather(
+            *[shard.disconnect() for shard in self._shards if shard.is_connected],
+        )
 
+    async def close(self) -> None:
+        for shard in self._shards:
+            await shard.close()
+
+    async def _connect_shard(self, shard: BinanceWebSocketShard, start: bool = True) -> None:
         # Always connecting combined streams for consistency
-        ws_url = self._base_url + "/stream?streams=" + "/".join(self._streams)
-        await super().connect(ws_url=ws_url, start=start, **ws_kwargs)
+        await shard.connect(ws_url=self._base_url + "/stream", start=start, **self._ws_kwargs)
 
     def _add_stream(self, stream: str):
-        if stream not in self._streams:
-            self._streams.append(stream)
+        if stream in self._stream_shards:
+            return
+
+        shard: Optional[BinanceWebSocketShard] = None
+        for existing in self._shards:
+            if len(existing.streams) < self._max_streams_per_connection:
+                shard = existing
+                break
+
+        if shard is None:
+            shard = BinanceWebSocketShard(
+                loop=self._loop,
+                logger=self._logger,
+                handler=self._handler,
+            )
+            self._shards.append(shard)
+            self._log.debug(f"Added connection shard {len(self._shards)}.")
+            if self._connected:
+                self._loop.create_task(self._connect_shard(shard))
+
+        shard.subscribe(stream)
+        self._stream_shards[stream] = shard
+
+    def _remove_stream(self, stream: str):
+        shard: Optional[BinanceWebSocketShard] = self._stream_shards.pop(stream, None)
+        if shard is not None:
+            shard.unsubscribe(stream)
@@ -36,6 +36,7 @@ class BinanceSpotWebSocket(BinanceWebSocketClient):
         clock: LiveClock,
         logger: Logger,
         handler: Callable[[bytes], None],
+        max_streams_per_connection: int = 200,
     ):
         super().__init__(
             loop=loop,
@@ -43,6 +44,7 @@ class BinanceSpotWebSocket(BinanceWebSocketClient):
             logger=logger,
             handler=handler,
             base_url="wss://stream.binance.com:9443",
+            max_streams_per_connection=max_streams_per_connection,
         )
 
     def subscribe_agg_trades(self, symbol: str):
@@ -163,3 +165,42 @@ class BinanceSpotWebSocket(BinanceWebSocketClient):
 
         """
         self._add_stream(f"{format_symbol(symbol)}@depth@{speed}ms")
+
+    def unsubscribe_trades(self, symbol: str):
+        """
+        Unsubscribe from the trade stream for the given symbol.
+        """
+        self._remove_stream(f"{format_symbol(symbol)}@trade")
+
+    def unsubscribe_bars(self, symbol: str, interval: str):
+        """
+        Unsubscribe from the bar (kline/candlestick) stream for the given symbol.
+        """
+        self._remove_stream(f"{format_symbol(symbol)}@kline_{interval}")
+
+    def unsubscribe_ticker(self, symbol: str = None):
+        """
+        Unsubscribe from the individual symbol or all symbols ticker.
+        """
+        if symbol is None:
+            self._remove_stream("!ticker@arr")
+        else:
+            self._remove_stream(f"{format_symbol(symbol)}@ticker")
+
+    def unsubscribe_book_ticker(self, symbol: str = None):
+        """
+        Unsubscribe from the individual symbol or all book ticker.
+        """
+        if symbol is None:
+            self._remove_stream("!bookTicker")
+        else:
+            self._remove_stream(f"{format_symbol(symbol)}@bookTicker")
+
+    def unsubscribe_book_depth(self, symbol: str):
+        """
+        Unsubscribe from all partial and diff book depth streams for the given symbol.
+        """
+        prefix = f"{format_symbol(symbol)}@depth"
+        for stream in self.subscriptions:
+            if stream.startswith(prefix):
+                self._remove_stream(stream)
@@ -33,13 +33,18 @@ class PerformanceAnalyzer:
     """
     Provides a performance analyzer for tracking and generating performance
     metrics and statistics.
+
+    Trade and return data is accumulated in plain containers as it is added,
+    with the pandas series built once (and cached) when first queried.
     """
 
     def __init__(self):
         self._account_balances_starting = {}  # type: dict[Currency, Money]
         self._account_balances = {}  # type: dict[Currency, Money]
-        self._realized_pnls = {}  # type: dict[Currency, pd.Series]
-        self._returns = pd.Series(dtype=float64)
+        self._realized_pnls = {}  # type: dict[Currency, dict[str, float]]
+        self._realized_pnls_series = {}  # type: dict[Currency, pd.Series]
+        self._returns = {}  # type: dict[datetime, float]
+        self._returns_series = None  # type: Optional[pd.Series]
 
     @property
     def currencies(self):
@@ -68,10 +73,11 @@ class PerformanceAnalyzer:
         self._account_balances_starting = account.starting_balances()
         self._account_balances = account.balances_total()
         self._realized_pnls = {}
-        self._returns = pd.Series(dtype=float64)
+        self._realized_pnls_series = {}
+        self._returns = {}
+        self._returns_series = None
 
         self.add_positions(positions)
-        self._returns.sort_index()
 
     def add_positions(self, positions: List[Position]) -> None:
         """
@@ -100,9 +106,12 @@ class PerformanceAnalyzer:
 
         """
         currency = realized_pnl.currency
-        realized_pnls = self._realized_pnls.get(currency, pd.Series())
-        realized_pnls.loc[position_id.value] = realized_pnl.as_double()
-        self._realized_pnls[currency] = realized_pnls
+        realized_pnls = self._realized_pnls.get(currency)
+        if realized_pnls is None:
+            realized_pnls = {}
+            self._realized_pnls[currency] = realized_pnls
+        realized_pnls[position_id.value] = realized_pnl.as_double()
+        self._realized_pnls_series.pop(currency, None)
 
     def add_return(self, timestamp: datetime, value: float) -> None:
         """
@@ -116,9 +125,8 @@ class PerformanceAnalyzer:
             The return value to add.
 
         """
-        if timestamp not in self._returns:
-            self._returns.loc[timestamp] = 0.0
-        self._returns.loc[timestamp] += float(value)
+        self._returns[timestamp] = self._returns.get(timestamp, 0.0) + float(value)
+        self._returns_series = None
 
     def reset(self) -> None:
         """
@@ -129,7 +137,9 @@ class PerformanceAnalyzer:
         self._account_balances_starting = {}
         self._account_balances = {}
         self._realized_pnls = {}
-        self._returns = pd.DataFrame(dtype=float64)
+        self._realized_pnls_series = {}
+        self._returns = {}
+        self._returns_series = None
 
     def realized_pnls(self, currency: Currency = None) -> Optional[pd.Series]:
         """
@@ -160,7 +170,26 @@ class PerformanceAnalyzer:
             ), "currency was None for multi-currency portfolio"
             currency = next(iter(self._account_balances.keys()))
 
-        return self._realized_pnls.get(currency)
+        realized_pnls = self._realized_pnls_series.get(currency)
+        if realized_pnls is None:
+            pnls = self._realized_pnls.get(currency)
+            if pnls is None:
+                return None
+            realized_pnls = pd.Series(
+                data=np.fromiter(pnls.values(), dtype=float64, count=len(pnls)),
+                index=list(pnls.keys()),
+                dtype=float64,
+            )
+            self._realized_pnls_series[currency] = realized_pnls
+
+        return realized_pnls
+
+    def _realized_pnls_array(self, currency: Optional[Currency]) -> np.ndarray:
+        realized_pnls = self.realized_pnls(currency)
+        if realized_pnls is None:
+            return np.empty(0, dtype=float64)
+
+        return realized_pnls.to_numpy()
 
     def total_pnl(self, currency: Currency = None) -> float:
         """
@@ -264,11 +293,11 @@ class PerformanceAnalyzer:
         float
 
         """
-        realized_pnls = self.realized_pnls(currency)
-        if realized_pnls is None or realized_pnls.empty:
+        pnls = self._realized_pnls_array(currency)
+        if len(pnls) == 0:
             return 0.0
 
-        return max(realized_pnls)
+        return pnls.max()
 
     def max_loser(self, currency: Currency = None) -> float:
         """
@@ -284,15 +313,12 @@ class PerformanceAnalyzer:
         float
 
         """
-        realized_pnls = self.realized_pnls(currency)
-        if realized_pnls is None or realized_pnls.empty:
-            return 0.0
-
-        losers = [x for x in realized_pnls if x < 0.0]
-        if realized_pnls is None or not losers:
+        pnls = self._realized_pnls_array(currency)
+        losers = pnls[pnls < 0.0]
+        if len(losers) == 0:
             return 0.0
 
-        return min(np.asarray(losers, dtype=np.float64))
+        return losers.min()
 
     def min_winner(self, currency: Currency = None) -> float:
         """
@@ -308,15 +334,12 @@ class PerformanceAnalyzer:
         float
 
         """
-        realized_pnls = self.realized_pnls(currency)
-        if realized_pnls is None or realized_pnls.empty:
-            return 0.0
-
-        winners = [x for x in realized_pnls if x > 0.0]
-        if realized_pnls is None or not winners:
+        pnls = self._realized_pnls_array(currency)
+        winners = pnls[pnls > 0.0]
+        if len(winners) == 0:
             return 0.0
 
-        return min(np.asarray(winners, dtype=np.float64))
+        return winners.min()
 
     def min_loser(self, currency: Currency = None) -> float:
         """
@@ -332,15 +355,12 @@ class PerformanceAnalyzer:
         float
 
         """
-        realized_pnls = self.realized_pnls(currency)
-        if realized_pnls is None or realized_pnls.empty:
-            return 0.0
-
-        losers = [x for x in realized_pnls if x <= 0.0]
-        if not losers:
+        pnls = self._realized_pnls_array(currency)
+        losers = pnls[pnls <= 0.0]
+        if len(losers) == 0:
             return 0.0
 
-        return max(np.asarray(losers, dtype=np.float64))  # max is least loser
+        return losers.max()  # max is least loser
 
     def avg_winner(self, currency: Currency = None) -> float:
         """
@@ -356,11 +376,7 @@ class PerformanceAnalyzer:
         float
 
         """
-        realized_pnls = self.realized_pnls(currency)
-        if realized_pnls is None or realized_pnls.empty:
-            return 0.0
-
-        pnls = realized_pnls.to_numpy()
+        pnls = self._realized_pnls_array(currency)
         winners = pnls[pnls > 0.0]
         if len(winners) == 0:
             return 0.0
@@ -381,11 +397,7 @@ class PerformanceAnalyzer:
         float
 
         """
-        realized_pnls = self.realized_pnls(currency)
-        if realized_pnls is None or realized_pnls.empty:
-            return 0.0
-
-        pnls = realized_pnls.to_numpy()
+        pnls = self._realized_pnls_array(currency)
         losers = pnls[pnls <= 0.0]
         if len(losers) == 0:
             return 0.0
@@ -406,14 +418,11 @@ class PerformanceAnalyzer:
         float
 
         """
-        realized_pnls = self.realized_pnls(currency)
-        if realized_pnls is None or realized_pnls.empty:
+        pnls = self._realized_pnls_array(currency)
+        if len(pnls) == 0:
             return 0.0
 
-        winners = [x for x in realized_pnls if x > 0.0]
-        losers = [x for x in realized_pnls if x <= 0.0]
-
-        return len(winners) / float(max(1, (len(winners) + len(losers))))
+        return np.count_nonzero(pnls > 0.0) / float(len(pnls))
 
     def expectancy(self, currency: Currency = None) -> float:
         """
@@ -429,8 +438,7 @@ class PerformanceAnalyzer:
         float
 
         """
-        realized_pnls = self.realized_pnls(currency)
-        if realized_pnls is None or realized_pnls.empty:
+        if len(self._realized_pnls_array(currency)) == 0:
             return 0.0
 
         win_rate = self.win_rate(currency)
@@ -447,7 +455,13 @@ class PerformanceAnalyzer:
         pd.Series
 
         """
-        return self._returns
+        if self._returns_series is None:
+            if self._returns:
+                self._returns_series = pd.Series(self._returns, dtype=float64).sort_index()
+            else:
+                self._returns_series = pd.Series(dtype=float64)
+
+        return self._returns_series
 
     def returns_avg(self) -> float:
         """
@@ -458,7 +472,7 @@ class PerformanceAnalyzer:
         float
 
         """
-        return quantstats.stats.avg_return(returns=self._returns)
+        return quantstats.stats.avg_return(returns=self.returns())
 
     def returns_avg_win(self) -> float:
         """
@@ -469,7 +483,7 @@ class PerformanceAnalyzer:
         float
 
         """
-        return quantstats.stats.avg_win(returns=self._returns)
+        return quantstats.stats.avg_win(returns=self.returns())
 
     def returns_avg_loss(self) -> float:
         """
@@ -480,7 +494,7 @@ class PerformanceAnalyzer:
         float
 
         """
-        return quantstats.stats.avg_loss(returns=self._returns)
+        return quantstats.stats.avg_loss(returns=self.returns())
 
     def returns_annual_volatility(self) -> float:
         """
@@ -495,7 +509,7 @@ class PerformanceAnalyzer:
         This is equivalent to the compound annual growth rate.
 
         """
-        return quantstats.stats.volatility(returns=self._returns)
+        return quantstats.stats.volatility(returns=self.returns())
 
     def sharpe_ratio(self) -> float:
         """
@@ -506,7 +520,7 @@ class PerformanceAnalyzer:
         float
 
         """
-        return quantstats.stats.sharpe(returns=self._returns)
+        return quantstats.stats.sharpe(returns=self.returns())
 
     def sortino_ratio(self) -> float:
         """
@@ -517,7 +531,7 @@ class PerformanceAnalyzer:
         float
 
         """
-        return quantstats.stats.sortino(returns=self._returns)
+        return quantstats.stats.sortino(returns=self.returns())
 
     def profit_factor(self) -> float:
         """
@@ -528,7 +542,7 @@ class PerformanceAnalyzer:
         float
 
         """
-        return quantstats.stats.profit_factor(returns=self._returns)
+        return quantstats.stats.profit_factor(returns=self.returns())
 
     def profit_ratio(self) -> float:
         """
@@ -539,7 +553,7 @@ class PerformanceAnalyzer:
         float
 
         """
-        return quantstats.stats.profit_ratio(returns=self._returns)
+        return quantstats.stats.profit_ratio(returns=self.returns())
 
     def risk_return_ratio(self) -> float:
         """
@@ -550,7 +564,7 @@ class PerformanceAnalyzer:
         float
 
         """
-        return quantstats.stats.risk_return_ratio(returns=self._returns)
+        return quantstats.stats.risk_return_ratio(returns=self.returns())
 
     def get_performance_stats_pnls(self, currency: Currency = None) -> Dict[str, float]:
         """
@@ -13,22 +13,38 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from typing import List
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from nautilus_trader.accounting.accounts.base import Account
 from nautilus_trader.core.datetime import unix_nanos_to_dt
+from nautilus_trader.model.c_enums.contingency_type import ContingencyTypeParser
+from nautilus_trader.model.c_enums.liquidity_side import LiquiditySideParser
+from nautilus_trader.model.c_enums.order_side import OrderSideParser
 from nautilus_trader.model.c_enums.order_status import OrderStatus
+from nautilus_trader.model.c_enums.order_status import OrderStatusParser
+from nautilus_trader.model.c_enums.order_type import OrderTypeParser
+from nautilus_trader.model.c_enums.position_side import PositionSideParser
+from nautilus_trader.model.c_enums.time_in_force import TimeInForceParser
 from nautilus_trader.model.events.account import AccountState
 from nautilus_trader.model.orders.base import Order
+from nautilus_trader.model.orders.base import PassiveOrder
 from nautilus_trader.model.position import Position
 
 
 class ReportProvider:
     """
     Provides various trading reports.
+
+    Order and position reports are built column by column directly from the
+    objects, with prices, quantities and PnLs as ``float64`` columns. The same
+    columns are available as Arrow tables for writing large reports to Parquet
+    without intermediate pandas object columns.
     """
 
     @staticmethod
@@ -49,9 +65,9 @@ class ReportProvider:
         if not orders:
             return pd.DataFrame()
 
-        orders_all = [o.to_dict() for o in orders]
+        columns = _order_columns(orders)
 
-        return pd.DataFrame(data=orders_all).set_index("client_order_id").sort_index()
+        return pd.DataFrame(data=columns).set_index("client_order_id").sort_index()
 
     @staticmethod
     def generate_order_fills_report(orders: List[Order]) -> pd.DataFrame:
@@ -71,15 +87,15 @@ class ReportProvider:
         if not orders:
             return pd.DataFrame()
 
-        filled_orders = [o.to_dict() for o in orders if o.status == OrderStatus.FILLED]
+        filled_orders = [o for o in orders if o.status == OrderStatus.FILLED]
         if not filled_orders:
             return pd.DataFrame()
 
-        report = pd.DataFrame(data=filled_orders).set_index("client_order_id").sort_index()
-        report["ts_last"] = [unix_nanos_to_dt(ts_last) for ts_last in report["ts_last"]]
-        report["ts_init"] = [unix_nanos_to_dt(ts_init) for ts_init in report["ts_init"]]
+        columns = _order_columns(filled_orders)
+        for name in _ORDER_FILLS_TIMESTAMP_COLUMNS:
+            columns[name] = pd.to_datetime(columns[name], unit="ns", utc=True)
 
-        return report
+        return pd.DataFrame(data=columns).set_index("client_order_id").sort_index()
 
     @staticmethod
     def generate_positions_report(positions: List[Position]) -> pd.DataFrame:
@@ -99,21 +115,84 @@ class ReportProvider:
         if not positions:
             return pd.DataFrame()
 
-        trades = [p.to_dict() for p in positions if p.is_closed]
+        trades = [p for p in positions if p.is_closed]
         if not trades:
             return pd.DataFrame()
 
+        columns = _position_columns(trades)
+        for name in _POSITIONS_TIMESTAMP_COLUMNS:
+            columns[name] = pd.to_datetime(columns[name], unit="ns", utc=True)
+
         sort = ["ts_opened", "ts_closed", "position_id"]
-        report = pd.DataFrame(data=trades).set_index("position_id").sort_values(sort)
-        del report["net_qty"]
-        del report["quantity"]
-        del report["quote_currency"]
-        del report["base_currency"]
-        del report["cost_currency"]
-        report["ts_opened"] = [unix_nanos_to_dt(ts_opened) for ts_opened in report["ts_opened"]]
-        report["ts_closed"] = [unix_nanos_to_dt(ts_closed) for ts_closed in report["ts_closed"]]
+        return pd.DataFrame(data=columns).sort_values(sort).set_index("position_id")
 
-        return report
+    @staticmethod
+    def generate_orders_table(orders: List[Order]) -> pa.Table:
+        """
+        Return an orders report Arrow table.
+
+        Parameters
+        ----------
+        orders : list[Order]
+            The orders for the report.
+
+        Returns
+        -------
+        pa.Table
+
+        """
+        return _to_table(_order_columns(orders), ())
+
+    @staticmethod
+    def generate_order_fills_table(orders: List[Order]) -> pa.Table:
+        """
+        Return an order fills report Arrow table.
+
+        Parameters
+        ----------
+        orders : list[Order]
+            The orders for the report.
+
+        Returns
+        -------
+        pa.Table
+
+        """
+        filled_orders = [o for o in orders if o.status == OrderStatus.FILLED]
+        return _to_table(_order_columns(filled_orders), _ORDER_FILLS_TIMESTAMP_COLUMNS)
+
+    @staticmethod
+    def generate_positions_table(positions: List[Position]) -> pa.Table:
+        """
+        Return a positions report Arrow table.
+
+        Parameters
+        ----------
+        positions : list[Position]
+            The positions for the report.
+
+        Returns
+        -------
+        pa.Table
+
+        """
+        trades = [p for p in positions if p.is_closed]
+        return _to_table(_position_columns(trades), _POSITIONS_TIMESTAMP_COLUMNS)
+
+    @staticmethod
+    def write_parquet(table: pa.Table, path: str) -> None:
+        """
+        Write the given report table to a Parquet file.
+
+        Parameters
+        ----------
+        table : pa.Table
+            The report table to write.
+        path : str
+            The file path to write to.
+
+        """
+        pq.write_table(table, path)
 
     @staticmethod
     def generate_account_report(account: Account) -> pd.DataFrame:
@@ -152,3 +231,99 @@ class ReportProvider:
         del report["event_id"]
 
         return report
+
+
+_ORDER_FILLS_TIMESTAMP_COLUMNS = ("ts_last", "ts_init")
+_POSITIONS_TIMESTAMP_COLUMNS = ("ts_opened", "ts_closed")
+
+
+def _floats(values: Iterable[Optional[Any]]) -> np.ndarray:
+    return np.fromiter(
+        (np.nan if v is None else float(v) for v in values),
+        dtype=np.float64,
+    )
+
+
+def _int64s(values: Iterable[int]) -> np.ndarray:
+    return np.fromiter(values, dtype=np.int64)
+
+
+def _value(identifier) -> Optional[str]:
+    return identifier.value if identifier is not None else None
+
+
+def _values(identifiers: Optional[List]) -> Optional[str]:
+    return ",".join([i.value for i in identifiers]) if identifiers is not None else None
+
+
+def _order_columns(orders: List[Order]) -> Dict[str, Any]:
+    passive = [o if isinstance(o, PassiveOrder) else None for o in orders]
+    return {
+        "client_order_id": [o.client_order_id.value for o in orders],
+        "trader_id": [o.trader_id.value for o in orders],
+        "strategy_id": [o.strategy_id.value for o in orders],
+        "instrument_id": [o.instrument_id.value for o in orders],
+        "venue_order_id": [_value(o.venue_order_id) for o in orders],
+        "position_id": [_value(o.position_id) for o in orders],
+        "account_id": [_value(o.account_id) for o in orders],
+        "execution_id": [_value(o.execution_id) for o in orders],
+        "type": [OrderTypeParser.to_str_py(o.type) for o in orders],
+        "side": [OrderSideParser.to_str_py(o.side) for o in orders],
+        "quantity": _floats(o.quantity for o in orders),
+        "price": _floats(p.price if p is not None else None for p in passive),
+        "trigger": _floats(getattr(o, "trigger", None) for o in orders),
+        "liquidity_side": [
+            LiquiditySideParser.to_str_py(p.liquidity_side) if p is not None else None
+            for p in passive
+        ],
+        "time_in_force": [TimeInForceParser.to_str_py(o.time_in_force) for o in orders],
+        "expire_time_ns": _int64s(p.expire_time_ns if p is not None else 0 for p in passive),
+        "filled_qty": _floats(o.filled_qty for o in orders),
+        "avg_px": _floats(o.avg_px for o in orders),
+        "slippage": _floats(o.slippage for o in orders),
+        "status": [OrderStatusParser.to_str_py(o.status) for o in orders],
+        "is_post_only": [getattr(o, "is_post_only", False) for o in orders],
+        "is_reduce_only": [o.is_reduce_only for o in orders],
+        "display_qty": _floats(getattr(o, "display_qty", None) for o in orders),
+        "order_list_id": [_value(o.order_list_id) for o in orders],
+        "parent_order_id": [_value(o.parent_order_id) for o in orders],
+        "child_order_ids": [_values(o.child_order_ids) for o in orders],
+        "contingency": [ContingencyTypeParser.to_str_py(o.contingency) for o in orders],
+        "contingency_ids": [_values(o.contingency_ids) for o in orders],
+        "tags": [o.tags for o in orders],
+        "ts_last": _int64s(o.ts_last for o in orders),
+        "ts_init": _int64s(o.ts_init for o in orders),
+    }
+
+
+def _position_columns(positions: List[Position]) -> Dict[str, Any]:
+    return {
+        "position_id": [p.id.value for p in positions],
+        "account_id": [p.account_id.value for p in positions],
+        "from_order": [p.from_order.value for p in positions],
+        "strategy_id": [p.strategy_id.value for p in positions],
+        "instrument_id": [p.instrument_id.value for p in positions],
+        "entry": [OrderSideParser.to_str_py(p.entry) for p in positions],
+        "side": [PositionSideParser.to_str_py(p.side) for p in positions],
+        "peak_qty": _floats(p.peak_qty for p in positions),
+        "ts_opened": _int64s(p.ts_opened for p in positions),
+        "ts_closed": _int64s(p.ts_closed for p in positions),
+        "duration_ns": _int64s(p.duration_ns for p in positions),
+        "avg_px_open": _floats(p.avg_px_open for p in positions),
+        "avg_px_close": _floats(p.avg_px_close for p in positions),
+        "realized_points": _floats(p.realized_points for p in positions),
+        "realized_return": _floats(p.realized_return for p in positions),
+        "realized_pnl": _floats(p.realized_pnl for p in positions),
+        "currency": [p.cost_currency.code for p in positions],
+        "commissions": [str([c.to_str() for c in p.commissions()]) for p in positions],
+    }
+
+
+def _to_table(columns: Dict[str, Any], timestamp_columns: Tuple[str, ...]) -> pa.Table:
+    arrays = {}
+    for name, column in columns.items():
+        if name in timestamp_columns:
+            arrays[name] = pa.array(column, type=pa.timestamp("ns", tz="UTC"))
+        else:
+            arrays[name] = pa.array(column)
+    return pa.table(arrays)
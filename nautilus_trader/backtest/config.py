@@ -138,6 +138,7 @@ class BacktestDataConfig(Partialable):
     end_time: Optional[Union[datetime, str, int]] = None
     filter_expr: Optional[str] = None
     client_id: Optional[str] = None
+    catalog_query_cache_max_bytes: int = 100_000_000
 
     @property
     def data_type(self):
@@ -175,6 +176,7 @@ class BacktestDataConfig(Partialable):
             path=self.catalog_path,
             fs_protocol=self.catalog_fs_protocol,
             fs_storage_options=self.catalog_fs_storage_options,
+            query_cache_max_bytes=self.catalog_query_cache_max_bytes,
         )
 
     def load(self, start_time=None, end_time=None):
@@ -13,7 +13,9 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
 from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
 
 from nautilus_trader.model.data.bar cimport Bar
 from nautilus_trader.model.data.bar cimport BarType
@@ -22,21 +24,32 @@ from nautilus_trader.model.data.tick cimport TradeTick
 from nautilus_trader.model.instruments.base cimport Instrument
 
 
+cpdef np.ndarray prepare_event_timestamps(index)
+cpdef np.ndarray prepare_values(data, list columns, int precision)
+
+
 cdef class QuoteTickDataWrangler:
     cdef readonly Instrument instrument
 
-    cpdef QuoteTick _build_tick(self, double[:] values, int64_t ts_event, int64_t ts_init_delta)
+    cdef list _build_ticks(self, double[:, :] values, int64_t[:] ts_events, int64_t ts_init_delta)
 
 
 cdef class TradeTickDataWrangler:
     cdef readonly Instrument instrument
-    cdef readonly processed_data
 
-    cpdef TradeTick _build_tick(self, str[:] values, int64_t ts_event, int64_t ts_init_delta)
+    cdef list _build_ticks(
+        self,
+        double[:] prices,
+        double[:] sizes,
+        uint8_t[:] sides,
+        np.ndarray trade_ids,
+        int64_t[:] ts_events,
+        int64_t ts_init_delta,
+    )
 
 
 cdef class BarDataWrangler:
     cdef readonly BarType bar_type
     cdef readonly Instrument instrument
 
-    cpdef Bar _build_bar(self, double[:] values, int64_t ts_event, int64_t ts_init_delta)
+    cdef list _build_bars(self, double[:, :] prices, double[:] volumes, int64_t[:] ts_events, int64_t ts_init_delta)
@@ -13,27 +13,82 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from copy import copy
-
-import numpy as np
-from libc.stdint cimport int64_t
-
 import random
 
+import numpy as np
 import pandas as pd
 
+cimport numpy as np
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.datetime cimport as_utc_index
-from nautilus_trader.core.datetime cimport secs_to_nanos
-from nautilus_trader.model.c_enums.aggressor_side cimport AggressorSideParser
+from nautilus_trader.model.c_enums.aggressor_side cimport AggressorSide
 from nautilus_trader.model.data.bar cimport Bar
 from nautilus_trader.model.data.bar cimport BarType
 from nautilus_trader.model.data.tick cimport QuoteTick
+from nautilus_trader.model.data.tick cimport TradeTick
+from nautilus_trader.model.identifiers cimport InstrumentId
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.objects cimport Quantity
 
 
+cdef dict _AGGRESSOR_SIDE_CODES = {
+    "UNKNOWN": AggressorSide.UNKNOWN,
+    "BUY": AggressorSide.BUY,
+    "SELL": AggressorSide.SELL,
+}
+
+
+cpdef np.ndarray prepare_event_timestamps(index):
+    """
+    Return the UNIX nanosecond timestamps for the given UTC datetime index.
+
+    The conversion is a zero-copy view of the underlying `datetime64[ns]`
+    values, rather than a per-element conversion through Python floats.
+
+    Parameters
+    ----------
+    index : pd.DatetimeIndex
+        The tz-aware UTC datetime index.
+
+    Returns
+    -------
+    np.ndarray[int64]
+
+    """
+    Condition.type(index, pd.DatetimeIndex, "index")
+
+    return np.ascontiguousarray(index.view(np.int64), dtype=np.int64)
+
+
+cpdef np.ndarray prepare_values(data, list columns, int precision):
+    """
+    Return the given columns as a contiguous 2D `float64` array rounded to
+    the given precision.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The data to prepare.
+    columns : list[str]
+        The columns (in order) to extract.
+    precision : int
+        The decimal precision to round the values to.
+
+    Returns
+    -------
+    np.ndarray[float64]
+
+    """
+    return np.ascontiguousarray(
+        np.round(data[columns].to_numpy(dtype=np.float64), precision),
+        dtype=np.float64,
+    )
+
+
 cdef class QuoteTickDataWrangler:
     """
     Provides a means of building lists of Nautilus `QuoteTick` objects.
@@ -78,23 +133,23 @@ cdef class QuoteTickDataWrangler:
         """
         Condition.false(data.empty, "data.empty")
         Condition.not_none(default_volume, "default_volume")
+        Condition.not_negative_int(ts_init_delta, "ts_init_delta")
 
-        as_utc_index(data)
+        data = as_utc_index(data)
 
         if "bid_size" not in data.columns:
             data["bid_size"] = float(default_volume)
         if "ask_size" not in data.columns:
             data["ask_size"] = float(default_volume)
 
-        cdef int64_t[:] ts_events = np.ascontiguousarray([secs_to_nanos(dt.timestamp()) for dt in data.index], dtype=np.int64)  # noqa
-        cdef int64_t[:] ts_inits = np.ascontiguousarray([ts_event + ts_init_delta for ts_event in ts_events], dtype=np.int64)  # noqa
+        cdef np.ndarray prices = prepare_values(data, ["bid", "ask"], self.instrument.price_precision)
+        cdef np.ndarray sizes = prepare_values(data, ["bid_size", "ask_size"], self.instrument.size_precision)
 
-        return list(map(
-            self._build_tick,
-            data.values,
-            ts_events,
-            ts_inits,
-        ))
+        return self._build_ticks(
+            np.ascontiguousarray(np.hstack((prices, sizes)), dtype=np.float64),
+            prepare_event_timestamps(data.index),
+            ts_init_delta,
+        )
 
     def process_bar_data(
         self,
@@ -132,6 +187,7 @@ cdef class QuoteTickDataWrangler:
         Condition.false(bid_data.empty, "bid_data.empty")
         Condition.false(ask_data.empty, "ask_data.empty")
         Condition.not_none(default_volume, "default_volume")
+        Condition.not_negative_int(ts_init_delta, "ts_init_delta")
         if random_seed is not None:
             Condition.type(random_seed, int, "random_seed")
 
@@ -145,83 +201,85 @@ cdef class QuoteTickDataWrangler:
         if "volume" not in ask_data:
             ask_data["volume"] = float(default_volume * 4)
 
-        cdef dict data_open = {
-            "bid": bid_data["open"],
-            "ask": ask_data["open"],
-            "bid_size": bid_data["volume"] / 4,
-            "ask_size": ask_data["volume"] / 4,
-        }
-
-        cdef dict data_high = {
-            "bid": bid_data["high"],
-            "ask": ask_data["high"],
-            "bid_size": bid_data["volume"] / 4,
-            "ask_size": ask_data["volume"] / 4,
-        }
-
-        cdef dict data_low = {
-            "bid": bid_data["low"],
-            "ask": ask_data["low"],
-            "bid_size": bid_data["volume"] / 4,
-            "ask_size": ask_data["volume"] / 4,
-        }
-
-        cdef dict data_close = {
-            "bid": bid_data["close"],
-            "ask": ask_data["close"],
-            "bid_size": bid_data["volume"] / 4,
-            "ask_size": ask_data["volume"] / 4,
-        }
-
-        df_ticks_o = pd.DataFrame(data=data_open)
-        df_ticks_h = pd.DataFrame(data=data_high)
-        df_ticks_l = pd.DataFrame(data=data_low)
-        df_ticks_c = pd.DataFrame(data=data_close)
-
-        # Latency offsets
-        df_ticks_o.index = df_ticks_o.index.shift(periods=-300, freq="ms")
-        df_ticks_h.index = df_ticks_h.index.shift(periods=-200, freq="ms")
-        df_ticks_l.index = df_ticks_l.index.shift(periods=-100, freq="ms")
-
-        # Merge tick data
-        df_ticks_final = pd.concat([df_ticks_o, df_ticks_h, df_ticks_l, df_ticks_c])
-        df_ticks_final.sort_index(axis=0, kind="mergesort", inplace=True)
-
-        cdef int i
+        # Pair the bid and ask bars by timestamp (not by position)
+        bid_data, ask_data = bid_data.align(ask_data, join="outer", axis=0)
+
+        cdef list ohlc = ["open", "high", "low", "close"]
+        cdef int price_precision = self.instrument.price_precision
+        cdef int size_precision = self.instrument.size_precision
+        cdef np.ndarray bids = prepare_values(bid_data, ohlc, price_precision)
+        cdef np.ndarray asks = prepare_values(ask_data, ohlc, price_precision)
+        cdef np.ndarray bid_sizes = np.round(bid_data["volume"].to_numpy(dtype=np.float64) / 4, size_precision)
+        cdef np.ndarray ask_sizes = np.round(ask_data["volume"].to_numpy(dtype=np.float64) / 4, size_precision)
+
+        # Stack the open, high, low and close ticks in blocks (in that order)
+        # as columns [bid, ask, bid_size, ask_size]
+        cdef np.ndarray values = np.column_stack((
+            bids.T.ravel(),
+            asks.T.ravel(),
+            np.tile(bid_sizes, 4),
+            np.tile(ask_sizes, 4),
+        ))
+
+        # Latency offsets for open, high and low ticks
+        cdef np.ndarray ts_bars = prepare_event_timestamps(bid_data.index)
+        cdef np.ndarray ts_events = np.concatenate((
+            ts_bars - 300_000_000,
+            ts_bars - 200_000_000,
+            ts_bars - 100_000_000,
+            ts_bars,
+        ))
+
+        # Merge tick data (stable sort preserves block order for equal timestamps)
+        cdef np.ndarray order = np.argsort(ts_events, kind="stable")
+        values = values[order]
+        ts_events = ts_events[order]
+
+        cdef np.ndarray high_rows
+        cdef np.ndarray low_rows
         # Randomly shift high low prices
         if random_seed is not None:
             random.seed(random_seed)
-            for i in range(0, len(df_ticks_final), 4):
-                if random.getrandbits(1):
-                    high = copy(df_ticks_final.iloc[i + 1])
-                    low = copy(df_ticks_final.iloc[i + 2])
-                    df_ticks_final.iloc[i + 1] = low
-                    df_ticks_final.iloc[i + 2] = high
-
-        cdef int64_t[:] ts_events = np.ascontiguousarray([secs_to_nanos(dt.timestamp()) for dt in df_ticks_final.index], dtype=np.int64)  # noqa
-        cdef int64_t[:] ts_inits = np.ascontiguousarray([ts_event + ts_init_delta for ts_event in ts_events], dtype=np.int64)  # noqa
-
-        return list(map(
-            self._build_tick,
-            df_ticks_final.values,
-            ts_events,
-            ts_inits,
-        ))
-
-    # cpdef method for Python wrap() (called with map)
-    cpdef QuoteTick _build_tick(self, double[:] values, int64_t ts_event, int64_t ts_init):
-        # Build a quote tick from the given values. The function expects the values to
-        # be an ndarray with 4 elements [bid, ask, bid_size, ask_size] of type double.
-        return QuoteTick(
-            instrument_id=self.instrument.id,
-            bid=Price(values[0], self.instrument.price_precision),
-            ask=Price(values[1], self.instrument.price_precision),
-            bid_size=Quantity(values[2], self.instrument.size_precision),
-            ask_size=Quantity(values[3], self.instrument.size_precision),
-            ts_event=ts_event,
-            ts_init=ts_init,
+            high_rows = np.asarray(
+                [i + 1 for i in range(0, len(values), 4) if random.getrandbits(1)],
+                dtype=np.int64,
+            )
+            low_rows = high_rows + 1
+            values[np.concatenate((high_rows, low_rows))] = values[np.concatenate((low_rows, high_rows))]
+
+        return self._build_ticks(
+            np.ascontiguousarray(values, dtype=np.float64),
+            np.ascontiguousarray(ts_events, dtype=np.int64),
+            ts_init_delta,
         )
 
+    cdef list _build_ticks(
+        self,
+        double[:, :] values,
+        int64_t[:] ts_events,
+        int64_t ts_init_delta,
+    ):
+        # Build quote ticks from the given values. The function expects the values
+        # to be a 2D array with columns [bid, ask, bid_size, ask_size] of type double.
+        cdef InstrumentId instrument_id = self.instrument.id
+        cdef uint8_t price_precision = self.instrument.price_precision
+        cdef uint8_t size_precision = self.instrument.size_precision
+        cdef Py_ssize_t count = values.shape[0]
+        cdef list ticks = [None] * count
+        cdef Py_ssize_t i
+        for i in range(count):
+            ticks[i] = QuoteTick(
+                instrument_id=instrument_id,
+                bid=Price(values[i, 0], price_precision),
+                ask=Price(values[i, 1], price_precision),
+                bid_size=Quantity(values[i, 2], size_precision),
+                ask_size=Quantity(values[i, 3], size_precision),
+                ts_event=ts_events[i],
+                ts_init=ts_events[i] + ts_init_delta,
+            )
+
+        return ticks
+
 
 cdef class TradeTickDataWrangler:
     """
@@ -257,44 +315,64 @@ cdef class TradeTickDataWrangler:
         """
         Condition.not_none(data, "data")
         Condition.false(data.empty, "data.empty")
+        Condition.not_negative_int(ts_init_delta, "ts_init_delta")
 
         data = as_utc_index(data)
 
-        processed = pd.DataFrame(index=data.index)
-        processed["price"] = data["price"].apply(lambda x: f'{x:.{self.instrument.price_precision}f}')
-        processed["quantity"] = data["quantity"].apply(lambda x: f'{x:.{self.instrument.size_precision}f}')
-        processed["aggressor_side"] = self._create_side_if_not_exist(data)
-        processed["trade_id"] = data["trade_id"].apply(str)
-
-        cdef int64_t[:] ts_events = np.ascontiguousarray([secs_to_nanos(dt.timestamp()) for dt in data.index], dtype=np.int64)  # noqa
-        cdef int64_t[:] ts_inits = np.ascontiguousarray([ts_event + ts_init_delta for ts_event in ts_events], dtype=np.int64)  # noqa
-
-        return list(map(
-            self._build_tick,
-            processed.values,
-            ts_events,
-            ts_inits,
-        ))
+        return self._build_ticks(
+            prepare_values(data, ["price"], self.instrument.price_precision).ravel(),
+            prepare_values(data, ["quantity"], self.instrument.size_precision).ravel(),
+            self._create_side_if_not_exist(data),
+            data["trade_id"].astype(str).to_numpy(dtype=object),
+            prepare_event_timestamps(data.index),
+            ts_init_delta,
+        )
 
     def _create_side_if_not_exist(self, data):
+        cdef np.ndarray sides
         if "side" in data.columns:
-            return data["side"]
+            sides = data["side"].map(_AGGRESSOR_SIDE_CODES).to_numpy()
+            if pd.isnull(sides).any():
+                raise ValueError(
+                    f"invalid aggressor side values, "
+                    f"were {set(data['side'][pd.isnull(sides)])}",
+                )
         else:
-            return data["buyer_maker"].apply(lambda x: "SELL" if x is True else "BUY")
-
-    # cpdef method for Python wrap() (called with map)
-    cpdef TradeTick _build_tick(self, str[:] values, int64_t ts_event, int64_t ts_init):
-        # Build a quote tick from the given values. The function expects the values to
-        # be an ndarray with 4 elements [bid, ask, bid_size, ask_size] of type double.
-        return TradeTick(
-            instrument_id=self.instrument.id,
-            price=Price(values[0], self.instrument.price_precision),
-            size=Quantity(values[1], self.instrument.size_precision),
-            aggressor_side=AggressorSideParser.from_str(values[2]),
-            trade_id=values[3],
-            ts_event=ts_event,
-            ts_init=ts_init,
-        )
+            sides = np.where(
+                data["buyer_maker"].to_numpy(dtype=bool),
+                AggressorSide.SELL,
+                AggressorSide.BUY,
+            )
+        return np.ascontiguousarray(sides, dtype=np.uint8)
+
+    cdef list _build_ticks(
+        self,
+        double[:] prices,
+        double[:] sizes,
+        uint8_t[:] sides,
+        np.ndarray trade_ids,
+        int64_t[:] ts_events,
+        int64_t ts_init_delta,
+    ):
+        # Build trade ticks from the given column arrays
+        cdef InstrumentId instrument_id = self.instrument.id
+        cdef uint8_t price_precision = self.instrument.price_precision
+        cdef uint8_t size_precision = self.instrument.size_precision
+        cdef Py_ssize_t count = prices.shape[0]
+        cdef list ticks = [None] * count
+        cdef Py_ssize_t i
+        for i in range(count):
+            ticks[i] = TradeTick(
+                instrument_id=instrument_id,
+                price=Price(prices[i], price_precision),
+                size=Quantity(sizes[i], size_precision),
+                aggressor_side=<AggressorSide>sides[i],
+                trade_id=trade_ids[i],
+                ts_event=ts_events[i],
+                ts_init=ts_events[i] + ts_init_delta,
+            )
+
+        return ticks
 
 
 cdef class BarDataWrangler:
@@ -356,33 +434,45 @@ cdef class BarDataWrangler:
         Condition.not_none(data, "data")
         Condition.false(data.empty, "data.empty")
         Condition.not_none(default_volume, "default_volume")
+        Condition.not_negative_int(ts_init_delta, "ts_init_delta")
 
         data = as_utc_index(data)
 
         if "volume" not in data:
             data["volume"] = float(default_volume)
 
-        cdef int64_t[:] ts_events = np.ascontiguousarray([secs_to_nanos(dt.timestamp()) for dt in data.index], dtype=np.int64)  # noqa
-        cdef int64_t[:] ts_inits = np.ascontiguousarray([ts_event + ts_init_delta for ts_event in ts_events], dtype=np.int64)  # noqa
-
-        return list(map(
-            self._build_bar,
-            data.values,
-            ts_events,
-            ts_inits
-        ))
-
-    # cpdef method for Python wrap() (called with map)
-    cpdef Bar _build_bar(self, double[:] values, int64_t ts_event, int64_t ts_init):
-        # Build a bar from the given index and values. The function expects the
-        # values to be an ndarray with 5 elements [open, high, low, close, volume].
-        return Bar(
-            bar_type=self.bar_type,
-            open=Price(values[0], self.instrument.price_precision),
-            high=Price(values[1], self.instrument.price_precision),
-            low=Price(values[2], self.instrument.price_precision),
-            close=Price(values[3], self.instrument.price_precision),
-            volume=Quantity(values[4], self.instrument.size_precision),
-            ts_event=ts_event,
-            ts_init=ts_init,
+        return self._build_bars(
+            prepare_values(data, ["open", "high", "low", "close"], self.instrument.price_precision),
+            prepare_values(data, ["volume"], self.instrument.size_precision).ravel(),
+            prepare_event_timestamps(data.index),
+            ts_init_delta,
         )
+
+    cdef list _build_bars(
+        self,
+        double[:, :] prices,
+        double[:] volumes,
+        int64_t[:] ts_events,
+        int64_t ts_init_delta,
+    ):
+        # Build bars from the given values. The function expects the prices
+        # to be a 2D array with columns [open, high, low, close].
+        cdef BarType bar_type = self.bar_type
+        cdef uint8_t price_precision = self.instrument.price_precision
+        cdef uint8_t size_precision = self.instrument.size_precision
+        cdef Py_ssize_t count = prices.shape[0]
+        cdef list bars = [None] * count
+        cdef Py_ssize_t i
+        for i in range(count):
+            bars[i] = Bar(
+                bar_type=bar_type,
+                open=Price(prices[i, 0], price_precision),
+                high=Price(prices[i, 1], price_precision),
+                low=Price(prices[i, 2], price_precision),
+                close=Price(prices[i, 3], price_precision),
+                volume=Quantity(volumes[i], size_precision),
+                ts_event=ts_events[i],
+                ts_init=ts_events[i] + ts_init_delta,
+            )
+
+        return bars
@@ -23,6 +23,7 @@ from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.common.uuid cimport UUIDFactory
 from nautilus_trader.core.data cimport Data
+from nautilus_trader.core.dispatch cimport TypeDispatcher
 from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.data.engine cimport DataEngine
 from nautilus_trader.execution.engine cimport ExecutionEngine
@@ -51,6 +52,7 @@ cdef class BacktestEngine:
 
     cdef dict _exchanges
     cdef list _data
+    cdef TypeDispatcher _data_dispatcher
     cdef int64_t _data_len
     cdef int64_t _index
 
@@ -43,6 +43,7 @@ from nautilus_trader.common.timer cimport TimeEventHandler
 from nautilus_trader.common.uuid cimport UUIDFactory
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.data cimport Data
+from nautilus_trader.core.dispatch cimport TypeDispatcher
 from nautilus_trader.core.datetime cimport unix_nanos_to_dt
 from nautilus_trader.execution.engine cimport ExecutionEngine
 from nautilus_trader.infrastructure.cache cimport RedisCacheDatabase
@@ -71,6 +72,12 @@ from nautilus_trader.backtest.config import BacktestEngineConfig
 from nautilus_trader.backtest.results import BacktestResult
 
 
+cdef enum ExchangeData:
+    OTHER_DATA = 0
+    ORDER_BOOK_DATA = 1
+    TICK_DATA = 2
+
+
 cdef class BacktestEngine:
     """
     Provides a backtest engine to run a portfolio of strategies over historical
@@ -109,6 +116,9 @@ cdef class BacktestEngine:
         # Data
         self._data = []
         self._data_len = 0
+        self._data_dispatcher = TypeDispatcher(default=ExchangeData.OTHER_DATA)
+        self._data_dispatcher.register(OrderBookData, ExchangeData.ORDER_BOOK_DATA)
+        self._data_dispatcher.register(Tick, ExchangeData.TICK_DATA)
         self._index = 0
 
         # Run IDs
@@ -903,15 +913,17 @@ cdef class BacktestEngine:
 
         # -- MAIN BACKTEST LOOP -----------------------------------------------#
         cdef Data data = self._next()
+        cdef int data_kind
         while data is not None:
             if data.ts_init > end_ns:
                 break
             self._advance_time(data.ts_init)
             self._data_engine.process(data)
-            if isinstance(data, OrderBookData):
-                self._exchanges[data.instrument_id.venue].process_order_book(data)
-            elif isinstance(data, Tick):
+            data_kind = self._data_dispatcher.code_for(data)
+            if data_kind == ExchangeData.TICK_DATA:
                 self._exchanges[data.instrument_id.venue].process_tick(data)
+            elif data_kind == ExchangeData.ORDER_BOOK_DATA:
+                self._exchanges[data.instrument_id.venue].process_order_book(data)
             for exchange in self._exchanges.values():
                 exchange.process(data.ts_init)
             self.iteration += 1
@@ -22,8 +22,9 @@ from nautilus_trader.backtest.models cimport LatencyModel
 from nautilus_trader.cache.cache cimport Cache
 from nautilus_trader.common.clock cimport Clock
 from nautilus_trader.common.logging cimport LoggerAdapter
-from nautilus_trader.common.queue cimport Queue
+from nautilus_trader.common.queue cimport RingBuffer
 from nautilus_trader.common.uuid cimport UUIDFactory
+from nautilus_trader.core.dispatch cimport TypeDispatcher
 from nautilus_trader.model.c_enums.account_type cimport AccountType
 from nautilus_trader.model.c_enums.book_type cimport BookType
 from nautilus_trader.model.c_enums.liquidity_side cimport LiquiditySide
@@ -112,9 +113,10 @@ cdef class SimulatedExchange:
     cdef dict _symbol_pos_count
     cdef dict _symbol_ord_count
     cdef int _executions_count
-    cdef Queue _message_queue
+    cdef RingBuffer _message_queue
     cdef list _inflight_queue
     cdef dict _inflight_counter
+    cdef TypeDispatcher _command_dispatcher
 
     cpdef Price best_bid_price(self, InstrumentId instrument_id)
     cpdef Price best_ask_price(self, InstrumentId instrument_id)
@@ -29,9 +29,11 @@ from nautilus_trader.backtest.modules cimport SimulationModule
 from nautilus_trader.cache.base cimport CacheFacade
 from nautilus_trader.common.clock cimport TestClock
 from nautilus_trader.common.logging cimport Logger
-from nautilus_trader.common.queue cimport Queue
+from nautilus_trader.common.queue cimport RingBuffer
 from nautilus_trader.common.uuid cimport UUIDFactory
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.dispatch cimport TypeDispatcher
+from nautilus_trader.core.handlers cimport CommandHandler
 from nautilus_trader.model.c_enums.account_type cimport AccountType
 from nautilus_trader.model.c_enums.account_type cimport AccountTypeParser
 from nautilus_trader.model.c_enums.book_type cimport BookType
@@ -223,10 +225,18 @@ cdef class SimulatedExchange:
         self._symbol_pos_count = {}  # type: dict[InstrumentId, int]
         self._symbol_ord_count = {}  # type: dict[InstrumentId, int]
         self._executions_count = 0
-        self._message_queue = Queue()
+        self._message_queue = RingBuffer(auto_grow=True)
         self._inflight_queue = []
         self._inflight_counter = {}
 
+        # Per-type dispatch table for commands
+        self._command_dispatcher = TypeDispatcher(default=CommandHandler.UNKNOWN_COMMAND)
+        self._command_dispatcher.register(SubmitOrder, CommandHandler.SUBMIT_ORDER_COMMAND)
+        self._command_dispatcher.register(SubmitOrderList, CommandHandler.SUBMIT_ORDER_LIST_COMMAND)
+        self._command_dispatcher.register(ModifyOrder, CommandHandler.MODIFY_ORDER_COMMAND)
+        self._command_dispatcher.register(CancelOrder, CommandHandler.CANCEL_ORDER_COMMAND)
+        self._command_dispatcher.register(CancelAllOrders, CommandHandler.CANCEL_ALL_ORDERS_COMMAND)
+
     def __repr__(self) -> str:
         return (
             f"{type(self).__name__}("
@@ -515,17 +525,18 @@ cdef class SimulatedExchange:
         Condition.not_none(command, "command")
 
         if self.latency_model is None:
-            self._message_queue.put_nowait(command)
+            self._message_queue.push(command)
         else:
             heappush(self._inflight_queue, self.generate_inflight_command(command))
 
     cdef tuple generate_inflight_command(self, TradingCommand command):
         cdef int64_t ts
-        if isinstance(command, (SubmitOrder, SubmitOrderList)):
+        cdef int handler = self._command_dispatcher.code_for(command)
+        if handler == CommandHandler.SUBMIT_ORDER_COMMAND or handler == CommandHandler.SUBMIT_ORDER_LIST_COMMAND:
             ts = command.ts_init + self.latency_model.insert_latency_nanos
-        elif isinstance(command, ModifyOrder):
+        elif handler == CommandHandler.MODIFY_ORDER_COMMAND:
             ts = command.ts_init + self.latency_model.update_latency_nanos
-        elif isinstance(command, (CancelOrder, CancelAllOrders)):
+        elif handler == CommandHandler.CANCEL_ORDER_COMMAND or handler == CommandHandler.CANCEL_ALL_ORDERS_COMMAND:
             ts = command.ts_init + self.latency_model.cancel_latency_nanos
         else:  # pragma: no cover (design-time error)
             raise ValueError(f"invalid command, was {command}")
@@ -636,7 +647,7 @@ cdef class SimulatedExchange:
             ts = self._inflight_queue[0][0][0]
             if ts <= now_ns:
                 # Place message on queue to be processed
-                self._message_queue.put_nowait(self._inflight_queue.pop(0)[1])
+                self._message_queue.push(self._inflight_queue.pop(0)[1])
                 self._inflight_counter.pop(ts, None)
             else:
                 break
@@ -645,14 +656,16 @@ cdef class SimulatedExchange:
             TradingCommand command
             Order order
             list orders
-        while self._message_queue.count > 0:
-            command = self._message_queue.get_nowait()
-            if isinstance(command, SubmitOrder):
+            int handler
+        while not self._message_queue.empty():
+            command = self._message_queue.pop()
+            handler = self._command_dispatcher.code_for(command)
+            if handler == CommandHandler.SUBMIT_ORDER_COMMAND:
                 self._process_order(command.order)
-            elif isinstance(command, SubmitOrderList):
+            elif handler == CommandHandler.SUBMIT_ORDER_LIST_COMMAND:
                 for order in command.list.orders:
                     self._process_order(order)
-            elif isinstance(command, ModifyOrder):
+            elif handler == CommandHandler.MODIFY_ORDER_COMMAND:
                 order = self._order_index.get(command.client_order_id)
                 if order is None:
                     self._generate_order_modify_rejected(
@@ -670,7 +683,7 @@ cdef class SimulatedExchange:
                     command.price,
                     command.trigger,
                 )
-            elif isinstance(command, CancelOrder):
+            elif handler == CommandHandler.CANCEL_ORDER_COMMAND:
                 order = self._order_index.pop(command.client_order_id, None)
                 if order is None:
                     self._generate_order_cancel_rejected(
@@ -684,7 +697,7 @@ cdef class SimulatedExchange:
                 if order.is_active_c():
                     self._generate_order_pending_cancel(order)
                     self._cancel_order(order)
-            elif isinstance(command, CancelAllOrders):
+            elif handler == CommandHandler.CANCEL_ALL_ORDERS_COMMAND:
                 orders = (
                     self._orders_bid.get(command.instrument_id, [])
                     + self._orders_ask.get(command.instrument_id, [])
@@ -725,7 +738,7 @@ cdef class SimulatedExchange:
         self._symbol_pos_count.clear()
         self._symbol_ord_count.clear()
         self._executions_count = 0
-        self._message_queue = Queue()
+        self._message_queue.clear()
         self._inflight_queue.clear()
         self._inflight_counter.clear()
 
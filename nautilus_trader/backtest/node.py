@@ -185,6 +185,7 @@ class BacktestNode:
                 fs_protocol=persistence.fs_protocol,
                 flush_interval=persistence.flush_interval,
                 replace=persistence.replace_existing,
+                batch_size=persistence.batch_size,
             )
             engine.trader.subscribe("*", writer.write)
             # Manually write instruments
@@ -962,9 +962,8 @@ cdef class Cache(CacheFacade):
             self._log.debug("Cache already contains ticks.")
             return
 
-        cdef QuoteTick tick
-        for tick in ticks:
-            cached_ticks.appendleft(tick)
+        # Only the most recent data within capacity is retained
+        cached_ticks.extendleft(ticks[-self.tick_capacity:])
 
     cpdef void add_trade_ticks(self, list ticks) except *:
         """
@@ -999,9 +998,8 @@ cdef class Cache(CacheFacade):
             self._log.debug("Cache already contains ticks.")
             return
 
-        cdef TradeTick tick
-        for tick in ticks:
-            cached_ticks.appendleft(tick)
+        # Only the most recent data within capacity is retained
+        cached_ticks.extendleft(ticks[-self.tick_capacity:])
 
     cpdef void add_bars(self, list bars) except *:
         """
@@ -1036,9 +1034,8 @@ cdef class Cache(CacheFacade):
             self._log.debug("Cache already contains bars.")
             return
 
-        cdef Bar bar
-        for bar in bars:
-            cached_bars.appendleft(bar)
+        # Only the most recent data within capacity is retained
+        cached_bars.extendleft(bars[-self.bar_capacity:])
 
     cpdef void add_currency(self, Currency currency) except *:
         """
@@ -70,6 +70,7 @@ cdef class Actor(Component):
     cpdef void on_quote_tick(self, QuoteTick tick) except *
     cpdef void on_trade_tick(self, TradeTick tick) except *
     cpdef void on_bar(self, Bar bar) except *
+    cpdef void on_historical_bars(self, list bars) except *
     cpdef void on_data(self, Data data) except *
     cpdef void on_venue_status_update(self, VenueStatusUpdate update) except *
     cpdef void on_instrument_status_update(self, InstrumentStatusUpdate update) except *
@@ -172,6 +173,9 @@ cdef class Actor(Component):
     cpdef void _handle_quote_ticks_response(self, DataResponse response) except *
     cpdef void _handle_trade_ticks_response(self, DataResponse response) except *
     cpdef void _handle_bars_response(self, DataResponse response) except *
+    cpdef void _handle_historical_quote_ticks(self, list ticks) except *
+    cpdef void _handle_historical_trade_ticks(self, list ticks) except *
+    cpdef void _handle_historical_bars(self, list bars) except *
 
 # -- EGRESS ----------------------------------------------------------------------------------------
 
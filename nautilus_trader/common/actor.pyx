@@ -27,8 +27,6 @@ attempts to operate without a managing `Trader` instance.
 import warnings
 from typing import Optional
 
-import cython
-
 from cpython.datetime cimport datetime
 
 from nautilus_trader.cache.base cimport CacheFacade
@@ -333,6 +331,25 @@ cdef class Actor(Component):
         """
         pass  # Optionally override in subclass
 
+    cpdef void on_historical_bars(self, list bars) except *:
+        """
+        Actions to be performed when receives historical bars.
+
+        The bars are received in a single batch (sorted by `ts_init`) rather
+        than being passed to `on_bar` individually.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The historical bars received.
+
+        Warnings
+        --------
+        System method (not intended to be called by user code).
+
+        """
+        pass  # Optionally override in subclass
+
     cpdef void on_venue_status_update(self, VenueStatusUpdate update) except *:
         """
         Actions to be performed when running and receives a venue status update.
@@ -1523,11 +1540,9 @@ cdef class Actor(Component):
                 self._log.exception(ex)
                 raise
 
-    @cython.boundscheck(False)
-    @cython.wraparound(False)
     cpdef void handle_quote_ticks(self, list ticks) except *:
         """
-        Handle the given tick data by handling each tick individually.
+        Handle the given historical tick data as a batch.
 
         Parameters
         ----------
@@ -1549,9 +1564,9 @@ cdef class Actor(Component):
             self._log.info(f"Received <QuoteTick[{length}]> data for {instrument_id}.")
         else:
             self._log.warning("Received <QuoteTick[]> data with no ticks.")
+            return
 
-        for i in range(length):
-            self.handle_quote_tick(ticks[i], is_historical=True)
+        self._handle_historical_quote_ticks(ticks)
 
     cpdef void handle_trade_tick(self, TradeTick tick, bint is_historical=False) except *:
         """
@@ -1583,11 +1598,9 @@ cdef class Actor(Component):
                 self._log.exception(ex)
                 raise
 
-    @cython.boundscheck(False)
-    @cython.wraparound(False)
     cpdef void handle_trade_ticks(self, list ticks) except *:
         """
-        Handle the given tick data by handling each tick individually.
+        Handle the given historical tick data as a batch.
 
         Parameters
         ----------
@@ -1609,9 +1622,9 @@ cdef class Actor(Component):
             self._log.info(f"Received <TradeTick[{length}]> data for {instrument_id}.")
         else:
             self._log.warning("Received <TradeTick[]> data with no ticks.")
+            return
 
-        for i in range(length):
-            self.handle_trade_tick(ticks[i], is_historical=True)
+        self._handle_historical_trade_ticks(ticks)
 
     cpdef void handle_bar(self, Bar bar, bint is_historical=False) except *:
         """
@@ -1643,11 +1656,11 @@ cdef class Actor(Component):
                 self._log.exception(ex)
                 raise
 
-    @cython.boundscheck(False)
-    @cython.wraparound(False)
     cpdef void handle_bars(self, list bars) except *:
         """
-        Handle the given bar data by handling each bar individually.
+        Handle the given historical bar data as a batch.
+
+        Calls `on_historical_bars` with all of the bars if state is ``RUNNING``.
 
         Parameters
         ----------
@@ -1674,8 +1687,7 @@ cdef class Actor(Component):
         if length > 0 and first.ts_init > last.ts_init:
             raise RuntimeError(f"cannot handle <Bar[{length}]> data: incorrectly sorted")
 
-        for i in range(length):
-            self.handle_bar(bars[i], is_historical=True)
+        self._handle_historical_bars(bars)
 
     cpdef void handle_venue_status_update(self, VenueStatusUpdate update) except *:
         """
@@ -1814,6 +1826,20 @@ cdef class Actor(Component):
     cpdef void _handle_bars_response(self, DataResponse response) except *:
         self.handle_bars(response.data)
 
+    cpdef void _handle_historical_quote_ticks(self, list ticks) except *:
+        pass  # Historical ticks are not passed to `on_quote_tick`
+
+    cpdef void _handle_historical_trade_ticks(self, list ticks) except *:
+        pass  # Historical ticks are not passed to `on_trade_tick`
+
+    cpdef void _handle_historical_bars(self, list bars) except *:
+        if self.is_running_c():
+            try:
+                self.on_historical_bars(bars)
+            except Exception as ex:
+                self._log.exception(ex)
+                raise
+
 # -- EGRESS ----------------------------------------------------------------------------------------
 
     cdef void _send_data_cmd(self, DataCommand command) except *:
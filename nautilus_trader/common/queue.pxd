@@ -13,12 +13,18 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from cpython.ref cimport PyObject
+from libc.stdint cimport int64_t
+
 
 cdef class Queue:
     cdef object _queue
+    cdef object _overflow
 
     cdef readonly int maxsize
     """The maximum capacity of the queue before blocking.\n\n:returns: `int`"""
+    cdef readonly int overflow_maxsize
+    """The maximum count of deferred items (unbounded if <= 0).\n\n:returns: `int`"""
     cdef readonly int count
     """The current count of items on the queue.\n\n:returns: `int`"""
 
@@ -26,6 +32,8 @@ cdef class Queue:
     cpdef bint empty(self) except *
     cpdef bint full(self) except *
     cpdef void put_nowait(self, item) except *
+    cpdef bint put_deferred(self, item) except *
+    cpdef int overflow_qsize(self) except *
     cpdef object get_nowait(self)
     cpdef object peek_back(self)
     cpdef object peek_front(self)
@@ -37,3 +45,53 @@ cdef class Queue:
     cdef bint _full(self) except *
     cdef void _put_nowait(self, item) except *
     cdef object _get_nowait(self)
+
+
+cdef class QueueDrainMetrics:
+    cdef readonly int64_t drains
+    """The count of drains performed.\n\n:returns: `int`"""
+    cdef readonly int64_t items
+    """The total count of items drained.\n\n:returns: `int`"""
+    cdef readonly int max_batch_size
+    """The maximum count of items drained in a single pass.\n\n:returns: `int`"""
+    cdef readonly int64_t total_ns
+    """The total nanoseconds spent draining.\n\n:returns: `int`"""
+    cdef readonly int64_t max_ns
+    """The maximum nanoseconds spent in a single drain.\n\n:returns: `int`"""
+
+    cpdef double avg_batch_size(self) except *
+    cpdef double avg_ns(self) except *
+
+    cdef void record(self, int batch_size, int64_t elapsed_ns) except *
+
+
+cdef class RingBuffer:
+    cdef PyObject **_slots
+    cdef int64_t _head
+    cdef int64_t _tail
+    cdef int64_t _mask
+    cdef bint _auto_grow
+
+    cdef readonly int capacity
+    """The current capacity of the buffer.\n\n:returns: `int`"""
+
+    cpdef bint empty(self) except *
+    cpdef bint full(self) except *
+    cpdef bint push(self, item) except *
+    cpdef object pop(self)
+    cpdef object peek(self)
+    cpdef list drain(self, int limit=*)
+    cpdef void clear(self) except *
+
+    cdef int64_t _count(self) except *
+    cdef object _take(self)
+    cdef void _grow(self) except *
+    cdef PyObject **_allocate(self, int size) except NULL
+
+
+cdef class SPSCRingBuffer(RingBuffer):
+    cdef object _handler
+    cdef object _loop
+    cdef bint _wakeup_pending
+
+    cpdef void _wakeup(self) except *
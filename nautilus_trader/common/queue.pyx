@@ -16,6 +16,16 @@
 import asyncio
 import collections
 import types
+from typing import Callable
+
+from cpython.mem cimport PyMem_Free
+from cpython.mem cimport PyMem_Malloc
+from cpython.ref cimport Py_INCREF
+from cpython.ref cimport Py_XDECREF
+from cpython.ref cimport PyObject
+from libc.stdint cimport int64_t
+
+from nautilus_trader.core.correctness cimport Condition
 
 
 cdef class Queue:
@@ -35,6 +45,9 @@ cdef class Queue:
     ----------
     maxsize : int
         The maximum capacity of the queue before blocking.
+    overflow_maxsize : int
+        The maximum count of items deferred by `put_deferred` once the queue is
+        full (if less than or equal to zero, the overflow is unbounded).
 
     Warnings
     --------
@@ -42,15 +55,17 @@ cdef class Queue:
     event loop.
     """
 
-    def __init__(self, int maxsize=0):
+    def __init__(self, int maxsize=0, int overflow_maxsize=0):
         self.maxsize = maxsize
+        self.overflow_maxsize = overflow_maxsize
         self.count = 0
 
         self._queue = collections.deque()
+        self._overflow = collections.deque()
 
     cpdef int qsize(self) except *:
         """
-        Return the number of items in the queue.
+        Return the number of items in the queue (including deferred items).
 
         Returns
         -------
@@ -120,6 +135,51 @@ cdef class Queue:
         """
         self._put_nowait(item)
 
+    cpdef bint put_deferred(self, item) except *:
+        """
+        Put an item into the queue, or defer it to the overflow buffer if the
+        queue is full (or items are already deferred).
+
+        Deferred items are moved onto the queue in order as items are removed,
+        so the ordering of all items put is preserved without blocking the
+        caller or scheduling a task per item. Deferred items are included in
+        `qsize`, `peek_back`, `peek_index` and `to_list`.
+
+        Parameters
+        ----------
+        item : object
+            The item to add to the queue.
+
+        Returns
+        -------
+        bool
+            True if the item was deferred, else False.
+
+        Raises
+        ------
+        QueueFull
+            If the queue and the overflow buffer are both full.
+
+        """
+        if self._overflow or self._full():
+            if 0 < self.overflow_maxsize <= len(self._overflow):
+                raise asyncio.QueueFull()
+            self._overflow.appendleft(item)
+            return True
+        self._put_nowait(item)
+        return False
+
+    cpdef int overflow_qsize(self) except *:
+        """
+        Return the number of items deferred to the overflow buffer.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self._overflow)
+
     async def get(self):
         """
         Remove and return the next item from the queue.
@@ -159,6 +219,8 @@ cdef class Queue:
         object or ``None``
 
         """
+        if self._overflow:
+            return self._overflow[0]
         if self.count == 0:
             return None
         return self._queue[0]
@@ -190,17 +252,29 @@ cdef class Queue:
             If `index` is out of range.
 
         """
-        return self._queue[index]
+        # Deferred items are behind all items on the queue
+        cdef int overflow_count = len(self._overflow)
+        if overflow_count == 0:
+            return self._queue[index]
+        if index >= 0:
+            if index < overflow_count:
+                return self._overflow[index]
+            return self._queue[index - overflow_count]
+        if -index <= self.count:
+            return self._queue[index]
+        return self._overflow[index + self.count]
 
     cpdef list to_list(self):
         """
-        Return a copy of the items in the queue.
+        Return a copy of the items in the queue (including deferred items).
 
         Returns
         -------
         list[Any]
 
         """
+        if self._overflow:
+            return list(self._overflow) + list(self._queue)
         return list(self._queue)
 
     @types.coroutine
@@ -215,7 +289,7 @@ cdef class Queue:
         yield
 
     cdef int _qsize(self) except *:
-        return self.count
+        return self.count + len(self._overflow)
 
     cdef bint _empty(self) except *:
         return self.count == 0
@@ -237,4 +311,373 @@ cdef class Queue:
             raise asyncio.QueueEmpty()
         item = self._queue.pop()
         self.count -= 1
+        if self._overflow:
+            self._queue.appendleft(self._overflow.pop())
+            self.count += 1
         return item
+
+
+cdef class QueueDrainMetrics:
+    """
+    Provides metrics for the batches of items drained from a queue in a single
+    pass by an engine run loop.
+    """
+
+    def __init__(self):
+        self.drains = 0
+        self.items = 0
+        self.max_batch_size = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"drains={self.drains}, "
+            f"items={self.items}, "
+            f"max_batch_size={self.max_batch_size}, "
+            f"total_ns={self.total_ns}, "
+            f"max_ns={self.max_ns})"
+        )
+
+    cpdef double avg_batch_size(self) except *:
+        """
+        Return the average number of items per drain.
+
+        Returns
+        -------
+        double
+
+        """
+        if self.drains == 0:
+            return 0.0
+        return <double>self.items / self.drains
+
+    cpdef double avg_ns(self) except *:
+        """
+        Return the average nanoseconds spent per drain.
+
+        Returns
+        -------
+        double
+
+        """
+        if self.drains == 0:
+            return 0.0
+        return <double>self.total_ns / self.drains
+
+    cdef void record(self, int batch_size, int64_t elapsed_ns) except *:
+        self.drains += 1
+        self.items += batch_size
+        self.total_ns += elapsed_ns
+        if batch_size > self.max_batch_size:
+            self.max_batch_size = batch_size
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+
+cdef class RingBuffer:
+    """
+    Provides a fixed-capacity FIFO ring buffer of object references.
+
+    Items are held in a preallocated C array whose capacity is rounded up to
+    the next power of two, so pushing and popping never allocate and slot
+    indices are resolved with a bit mask.
+
+    The producer only ever advances the tail index and the consumer only ever
+    advances the head index, with each slot written before the index which
+    publishes it. While the GIL is held this makes the buffer safe for exactly
+    one producer thread and one consumer thread without taking a lock.
+
+    Parameters
+    ----------
+    capacity : int
+        The initial capacity of the buffer.
+    auto_grow : bool
+        If the buffer should double its capacity when full, rather than
+        rejecting the pushed item.
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    Warnings
+    --------
+    Growing the buffer is not thread-safe, so `auto_grow` must only be enabled
+    when the producer and consumer share a thread.
+    """
+
+    def __init__(self, int capacity=1024, bint auto_grow=False):
+        Condition.positive_int(capacity, "capacity")
+
+        cdef int size = 1
+        while size < capacity:
+            size <<= 1
+
+        self._slots = self._allocate(size)
+        self._head = 0
+        self._tail = 0
+        self._mask = size - 1
+        self._auto_grow = auto_grow
+
+        self.capacity = size
+
+    def __dealloc__(self):
+        if self._slots == NULL:
+            return
+        while self._head < self._tail:
+            Py_XDECREF(self._slots[self._head & self._mask])
+            self._head += 1
+        PyMem_Free(self._slots)
+        self._slots = NULL
+
+    def __len__(self) -> int:
+        return self._count()
+
+    @property
+    def count(self):
+        """
+        The current count of items in the buffer.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._count()
+
+    cpdef bint empty(self) except *:
+        """
+        Return a value indicating whether the buffer is empty.
+
+        Returns
+        -------
+        bool
+            True if the buffer is empty, False otherwise.
+
+        """
+        return self._head == self._tail
+
+    cpdef bint full(self) except *:
+        """
+        Return a value indicating whether the buffer is full.
+
+        Returns
+        -------
+        bool
+            True if the buffer is full, False otherwise.
+
+        """
+        return self._count() >= self.capacity
+
+    cpdef bint push(self, item) except *:
+        """
+        Push the given item onto the back of the buffer.
+
+        Parameters
+        ----------
+        item : object
+            The item to push.
+
+        Returns
+        -------
+        bool
+            True if the item was pushed, False if the buffer was full.
+
+        """
+        if self._count() >= self.capacity:
+            if not self._auto_grow:
+                return False
+            self._grow()
+
+        Py_INCREF(item)
+        self._slots[self._tail & self._mask] = <PyObject *>item
+        self._tail += 1  # Publish the slot to the consumer
+        return True
+
+    cpdef object pop(self):
+        """
+        Pop the item at the front of the buffer.
+
+        Returns
+        -------
+        object
+
+        Raises
+        ------
+        IndexError
+            If the buffer is empty.
+
+        """
+        if self._head == self._tail:
+            raise IndexError("cannot pop from an empty ring buffer")
+
+        return self._take()
+
+    cpdef object peek(self):
+        """
+        Return the item at the front of the buffer without popping (if not empty).
+
+        Returns
+        -------
+        object or ``None``
+
+        """
+        if self._head == self._tail:
+            return None
+        return <object>self._slots[self._head & self._mask]
+
+    cpdef list drain(self, int limit=0):
+        """
+        Pop up to the given limit of items from the front of the buffer.
+
+        Only the items pushed before the call are drained, any items pushed
+        while the returned batch is being handled wait for the next drain.
+
+        Parameters
+        ----------
+        limit : int, optional
+            The maximum count of items to pop (if <= 0 then all items).
+
+        Returns
+        -------
+        list[Any]
+            The items in the order they were pushed.
+
+        """
+        cdef int64_t available = self._tail - self._head
+        if 0 < limit < available:
+            available = limit
+
+        cdef list items = []
+        cdef int64_t i
+        for i in range(available):
+            items.append(self._take())
+
+        return items
+
+    cpdef void clear(self) except *:
+        """
+        Clear all items from the buffer.
+        """
+        while self._head < self._tail:
+            self._take()
+
+    cdef int64_t _count(self) except *:
+        return self._tail - self._head
+
+    cdef object _take(self):
+        cdef int64_t index = self._head & self._mask
+        cdef PyObject *ptr = self._slots[index]
+        self._slots[index] = NULL
+        cdef object item = <object>ptr  # Takes a new reference
+        Py_XDECREF(ptr)                 # Releases the buffer's reference
+        self._head += 1  # Release the slot to the producer
+        return item
+
+    cdef void _grow(self) except *:
+        cdef int size = self.capacity << 1
+        cdef PyObject **slots = self._allocate(size)
+        cdef int64_t count = self._count()
+
+        cdef int64_t i
+        for i in range(count):
+            slots[i] = self._slots[(self._head + i) & self._mask]
+
+        PyMem_Free(self._slots)
+        self._slots = slots
+        self._head = 0
+        self._tail = count
+        self._mask = size - 1
+
+        self.capacity = size
+
+    cdef PyObject **_allocate(self, int size) except NULL:
+        cdef PyObject **slots = <PyObject **>PyMem_Malloc(size * sizeof(PyObject *))
+        if slots == NULL:
+            raise MemoryError(f"cannot allocate ring buffer of capacity {size}")
+
+        cdef int i
+        for i in range(size):
+            slots[i] = NULL
+
+        return slots
+
+
+cdef class SPSCRingBuffer(RingBuffer):
+    """
+    Provides a fixed-capacity ring buffer for handing items from a single
+    producer thread (such as an adapter client thread) to an event loop.
+
+    Pushes from the producer thread never block and never take a lock. The
+    first push after each drain schedules a wakeup on the event loop, which
+    drains all available items and passes them to the handler as one batch.
+
+    Parameters
+    ----------
+    capacity : int
+        The fixed capacity of the buffer.
+    handler : Callable[[list], None]
+        The handler for each batch of drained items, called on the event loop.
+    loop : asyncio.AbstractEventLoop
+        The event loop to wake up on push.
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+    ValueError
+        If `handler` is not of type `Callable`.
+
+    Warnings
+    --------
+    Only one thread may push and only the event loop may drain the buffer.
+    """
+
+    def __init__(
+        self,
+        int capacity,
+        handler not None: Callable[[list], None],
+        loop not None: asyncio.AbstractEventLoop,
+    ):
+        Condition.callable(handler, "handler")
+        super().__init__(capacity=capacity, auto_grow=False)
+
+        self._handler = handler
+        self._loop = loop
+        self._wakeup_pending = False
+
+    cpdef bint push(self, item) except *:
+        """
+        Push the given item onto the back of the buffer from the producer thread.
+
+        Parameters
+        ----------
+        item : object
+            The item to push.
+
+        Returns
+        -------
+        bool
+            True if the item was pushed, False if the buffer was full (the
+            producer decides whether to retry, drop or back off).
+
+        """
+        if not RingBuffer.push(self, item):
+            return False
+
+        # The consumer clears the flag before draining, so an item pushed after
+        # the drain has read the tail always schedules another wakeup.
+        if not self._wakeup_pending:
+            self._wakeup_pending = True
+            self._loop.call_soon_threadsafe(self._wakeup)
+
+        return True
+
+    cpdef void _wakeup(self) except *:
+        self._wakeup_pending = False
+
+        cdef list items = self.drain()
+        if items:
+            self._handler(items)
@@ -20,7 +20,7 @@ from libc.stdint cimport int64_t
 
 from nautilus_trader.common.clock cimport Clock
 from nautilus_trader.common.logging cimport LoggerAdapter
-from nautilus_trader.common.queue cimport Queue
+from nautilus_trader.common.queue cimport RingBuffer
 from nautilus_trader.common.timer cimport TimeEvent
 
 
@@ -28,7 +28,7 @@ cdef class Throttler:
     cdef Clock _clock
     cdef LoggerAdapter _log
     cdef int64_t _interval_ns
-    cdef Queue _buffer
+    cdef RingBuffer _buffer
     cdef str _timer_name
     cdef object _timestamps
     cdef object _output_send
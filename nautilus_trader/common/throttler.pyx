@@ -22,7 +22,7 @@ from collections import deque
 
 from nautilus_trader.common.clock cimport Clock
 from nautilus_trader.common.logging cimport Logger
-from nautilus_trader.common.queue cimport Queue
+from nautilus_trader.common.queue cimport RingBuffer
 from nautilus_trader.common.timer cimport TimeEvent
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.datetime cimport secs_to_nanos
@@ -97,7 +97,7 @@ cdef class Throttler:
         self._clock = clock
         self._log = LoggerAdapter(component_name=f"Throttler-{name}", logger=logger)
         self._interval_ns = secs_to_nanos(interval.total_seconds())
-        self._buffer = Queue()
+        self._buffer = RingBuffer(auto_grow=True)
         self._timer_name = f"{name}-DEQUE"
         self._timestamps = deque(maxlen=limit)
         self._output_send = output_send
@@ -123,7 +123,7 @@ cdef class Throttler:
         int
 
         """
-        return self._buffer.qsize()
+        return self._buffer.count
 
     cpdef double used(self) except *:
         """
@@ -185,7 +185,7 @@ cdef class Throttler:
     cdef void _limit_msg(self, msg) except *:
         if self._output_drop is None:
             # Buffer
-            self._buffer.put_nowait(msg)
+            self._buffer.push(msg)
             timer_target = self._process
             self._log.warning(f"Buffering {msg}.")
         else:
@@ -207,15 +207,14 @@ cdef class Throttler:
 
     cpdef void _process(self, TimeEvent event) except *:
         # Send next msg on buffer
-        msg = self._buffer.get_nowait()
-        self._send_msg(msg)
+        self._send_msg(self._buffer.pop())
 
         # Send remaining messages if within rate
         cdef int64_t delta_next
         while not self._buffer.empty():
             delta_next = self._delta_next()
             if delta_next <= 0:
-                self._send_msg(msg)
+                self._send_msg(self._buffer.pop())
             else:
                 self._set_timer(self._process)
                 return
@@ -0,0 +1,94 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.core.correctness cimport Condition
+
+
+cdef class TypeDispatcher:
+    """
+    Provides a per-type dispatch table which maps the concrete type of an
+    object to an integer code for the caller to switch on.
+
+    Concrete types are resolved against the registered base types (in
+    registration order) the first time they are seen, and then cached so
+    that each subsequent lookup is a single dictionary access.
+
+    Parameters
+    ----------
+    default : int, default=0
+        The code for types with no registered base.
+    """
+
+    def __init__(self, int default=0):
+        self._codes = {}  # type: dict[type, int]
+        self._bases = []  # type: list[tuple[type, int]]
+
+        self.default = default
+
+    cpdef void register(self, type cls, int code) except *:
+        """
+        Register the given type (and its subclasses) with the given code.
+
+        Parameters
+        ----------
+        cls : type
+            The type to register.
+        code : int
+            The code for the type.
+
+        Raises
+        ------
+        ValueError
+            If `code` is equal to the default code.
+
+        """
+        Condition.not_none(cls, "cls")
+        Condition.not_equal(code, self.default, "code", "default")
+
+        self._bases.append((cls, code))
+
+        # Clear any previously resolved subclasses
+        self._codes = {base: base_code for base, base_code in reversed(self._bases)}
+
+    cpdef int code_for(self, obj) except *:
+        """
+        Return the code for the type of the given object.
+
+        Parameters
+        ----------
+        obj : object
+            The object to dispatch.
+
+        Returns
+        -------
+        int
+
+        """
+        cdef type cls = type(obj)
+        code = self._codes.get(cls)
+        if code is not None:
+            return code
+
+        # First time this concrete type is seen
+        cdef int resolved = self.default
+        cdef type base
+        cdef int base_code
+        for base, base_code in self._bases:
+            if issubclass(cls, base):
+                resolved = base_code
+                break
+
+        self._codes[cls] = resolved
+        return resolved
@@ -0,0 +1,27 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+"""
+Defines the dispatch codes shared by the components which handle trading commands.
+"""
+
+
+cdef enum CommandHandler:
+    UNKNOWN_COMMAND = 0
+    SUBMIT_ORDER_COMMAND = 1
+    SUBMIT_ORDER_LIST_COMMAND = 2
+    MODIFY_ORDER_COMMAND = 3
+    CANCEL_ORDER_COMMAND = 4
+    CANCEL_ALL_ORDERS_COMMAND = 5
@@ -17,6 +17,7 @@ from nautilus_trader.cache.cache cimport Cache
 from nautilus_trader.common.component cimport Component
 from nautilus_trader.common.timer cimport TimeEvent
 from nautilus_trader.core.data cimport Data
+from nautilus_trader.core.dispatch cimport TypeDispatcher
 from nautilus_trader.data.aggregation cimport TimeBarAggregator
 from nautilus_trader.data.client cimport DataClient
 from nautilus_trader.data.client cimport MarketDataClient
@@ -45,6 +46,7 @@ cdef class DataEngine(Component):
     cdef dict _clients
     cdef dict _order_book_intervals
     cdef dict _bar_aggregators
+    cdef TypeDispatcher _data_dispatcher
 
     cdef readonly int command_count
     """The total count of data commands received by the engine.\n\n:returns: `int`"""
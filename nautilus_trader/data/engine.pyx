@@ -75,6 +75,19 @@ from nautilus_trader.msgbus.bus cimport MessageBus
 from nautilus_trader.data.config import DataEngineConfig
 
 
+cdef enum DataHandler:
+    UNKNOWN_DATA = 0
+    ORDER_BOOK_DATA = 1
+    TICKER_DATA = 2
+    QUOTE_TICK_DATA = 3
+    TRADE_TICK_DATA = 4
+    BAR_DATA = 5
+    INSTRUMENT_DATA = 6
+    STATUS_UPDATE_DATA = 7
+    CLOSE_PRICE_DATA = 8
+    GENERIC_DATA = 9
+
+
 cdef class DataEngine(Component):
     """
     Provides a high-performance data engine for managing many `DataClient`
@@ -118,6 +131,18 @@ cdef class DataEngine(Component):
         self._order_book_intervals = {}  # type: dict[(InstrumentId, int), list[Callable[[Bar], None]]]
         self._bar_aggregators = {}       # type: dict[BarType, BarAggregator]
 
+        # Per-type dispatch table for data
+        self._data_dispatcher = TypeDispatcher(default=DataHandler.UNKNOWN_DATA)
+        self._data_dispatcher.register(OrderBookData, DataHandler.ORDER_BOOK_DATA)
+        self._data_dispatcher.register(Ticker, DataHandler.TICKER_DATA)
+        self._data_dispatcher.register(QuoteTick, DataHandler.QUOTE_TICK_DATA)
+        self._data_dispatcher.register(TradeTick, DataHandler.TRADE_TICK_DATA)
+        self._data_dispatcher.register(Bar, DataHandler.BAR_DATA)
+        self._data_dispatcher.register(Instrument, DataHandler.INSTRUMENT_DATA)
+        self._data_dispatcher.register(StatusUpdate, DataHandler.STATUS_UPDATE_DATA)
+        self._data_dispatcher.register(InstrumentClosePrice, DataHandler.CLOSE_PRICE_DATA)
+        self._data_dispatcher.register(GenericData, DataHandler.GENERIC_DATA)
+
         # Counters
         self.command_count = 0
         self.data_count = 0
@@ -957,23 +982,24 @@ cdef class DataEngine(Component):
     cdef void _handle_data(self, Data data) except *:
         self.data_count += 1
 
-        if isinstance(data, OrderBookData):
-            self._handle_order_book_data(data)
-        elif isinstance(data, Ticker):
-            self._handle_ticker(data)
-        elif isinstance(data, QuoteTick):
+        cdef int handler = self._data_dispatcher.code_for(data)
+        if handler == DataHandler.QUOTE_TICK_DATA:
             self._handle_quote_tick(data)
-        elif isinstance(data, TradeTick):
+        elif handler == DataHandler.TRADE_TICK_DATA:
             self._handle_trade_tick(data)
-        elif isinstance(data, Bar):
+        elif handler == DataHandler.ORDER_BOOK_DATA:
+            self._handle_order_book_data(data)
+        elif handler == DataHandler.BAR_DATA:
             self._handle_bar(data)
-        elif isinstance(data, Instrument):
+        elif handler == DataHandler.TICKER_DATA:
+            self._handle_ticker(data)
+        elif handler == DataHandler.INSTRUMENT_DATA:
             self._handle_instrument(data)
-        elif isinstance(data, StatusUpdate):
+        elif handler == DataHandler.STATUS_UPDATE_DATA:
             self._handle_status_update(data)
-        elif isinstance(data, InstrumentClosePrice):
+        elif handler == DataHandler.CLOSE_PRICE_DATA:
             self._handle_close_price(data)
-        elif isinstance(data, GenericData):
+        elif handler == DataHandler.GENERIC_DATA:
             self._handle_generic_data(data)
         else:
             self._log.error(f"Cannot handle data: unrecognized type {type(data)} {data}.")
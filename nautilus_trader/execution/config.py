@@ -19,6 +19,13 @@ import pydantic
 class ExecEngineConfig(pydantic.BaseModel):
     """
     Configuration for ``ExecutionEngine`` instances.
+
+    Parameters
+    ----------
+    retain_position_events : bool
+        If positions should retain all applied order fill events. If False then
+        positions only hold their last order fill event, which bounds the memory
+        of long-lived (netting) positions.
     """
 
-    pass  # No configuration currently
+    retain_position_events: bool = True
@@ -16,6 +16,7 @@
 from nautilus_trader.cache.cache cimport Cache
 from nautilus_trader.common.component cimport Component
 from nautilus_trader.common.generators cimport PositionIdGenerator
+from nautilus_trader.core.dispatch cimport TypeDispatcher
 from nautilus_trader.execution.client cimport ExecutionClient
 from nautilus_trader.model.c_enums.oms_type cimport OMSType
 from nautilus_trader.model.commands.trading cimport CancelAllOrders
@@ -39,6 +40,8 @@ cdef class ExecutionEngine(Component):
     cdef dict _clients
     cdef dict _routing_map
     cdef dict _oms_types
+    cdef TypeDispatcher _command_dispatcher
+    cdef bint _retain_position_events
 
     cdef readonly int command_count
     """The total count of commands received by the engine.\n\n:returns: `int`"""
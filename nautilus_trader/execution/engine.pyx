@@ -44,7 +44,9 @@ from nautilus_trader.common.logging cimport RECV
 from nautilus_trader.common.logging cimport LogColor
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.dispatch cimport TypeDispatcher
 from nautilus_trader.core.fsm cimport InvalidStateTrigger
+from nautilus_trader.core.handlers cimport CommandHandler
 from nautilus_trader.core.time cimport unix_timestamp_ms
 from nautilus_trader.execution.client cimport ExecutionClient
 from nautilus_trader.model.c_enums.oms_type cimport OMSType
@@ -123,12 +125,21 @@ cdef class ExecutionEngine(Component):
         )
 
         self._cache = cache
+        self._retain_position_events = config.retain_position_events
 
         self._clients = {}           # type: dict[ClientId, ExecutionClient]
         self._routing_map = {}       # type: dict[Venue, ExecutionClient]
         self._oms_types = {}         # type: dict[StrategyId, OMSType]
         self._default_client = None  # type: Optional[ExecutionClient]
 
+        # Per-type dispatch table for commands
+        self._command_dispatcher = TypeDispatcher(default=CommandHandler.UNKNOWN_COMMAND)
+        self._command_dispatcher.register(SubmitOrder, CommandHandler.SUBMIT_ORDER_COMMAND)
+        self._command_dispatcher.register(SubmitOrderList, CommandHandler.SUBMIT_ORDER_LIST_COMMAND)
+        self._command_dispatcher.register(ModifyOrder, CommandHandler.MODIFY_ORDER_COMMAND)
+        self._command_dispatcher.register(CancelOrder, CommandHandler.CANCEL_ORDER_COMMAND)
+        self._command_dispatcher.register(CancelAllOrders, CommandHandler.CANCEL_ALL_ORDERS_COMMAND)
+
         self._pos_id_generator = PositionIdGenerator(
             trader_id=msgbus.trader_id,
             clock=clock,
@@ -511,15 +522,16 @@ cdef class ExecutionEngine(Component):
             )
             return  # No client to handle command
 
-        if isinstance(command, SubmitOrder):
+        cdef int handler = self._command_dispatcher.code_for(command)
+        if handler == CommandHandler.SUBMIT_ORDER_COMMAND:
             self._handle_submit_order(client, command)
-        elif isinstance(command, SubmitOrderList):
+        elif handler == CommandHandler.SUBMIT_ORDER_LIST_COMMAND:
             self._handle_submit_order_list(client, command)
-        elif isinstance(command, ModifyOrder):
+        elif handler == CommandHandler.MODIFY_ORDER_COMMAND:
             self._handle_modify_order(client, command)
-        elif isinstance(command, CancelOrder):
+        elif handler == CommandHandler.CANCEL_ORDER_COMMAND:
             self._handle_cancel_order(client, command)
-        elif isinstance(command, CancelAllOrders):
+        elif handler == CommandHandler.CANCEL_ALL_ORDERS_COMMAND:
             self._handle_cancel_all_orders(client, command)
         else:
             self._log.error(f"Cannot handle command: unrecognized {command}.")
@@ -592,8 +604,9 @@ cdef class ExecutionEngine(Component):
             )
 
         cdef OMSType oms_type = self._oms_types.get(event.strategy_id, OMSType.HEDGING)
+        cdef bint is_fill = isinstance(event, OrderFilled)
 
-        if isinstance(event, OrderFilled):
+        if is_fill:
             self._confirm_position_id(event, oms_type)
 
         try:
@@ -616,7 +629,7 @@ cdef class ExecutionEngine(Component):
             msg=event,
         )
 
-        if isinstance(event, OrderFilled):
+        if is_fill:
             self._handle_order_fill(event, oms_type)
 
     cdef void _confirm_position_id(self, OrderFilled fill, OMSType oms_type) except *:
@@ -661,7 +674,11 @@ cdef class ExecutionEngine(Component):
             )
             return
 
-        cdef Position position = Position(instrument, fill)
+        cdef Position position = Position(
+            instrument=instrument,
+            fill=fill,
+            retain_events=self._retain_position_events,
+        )
         self._cache.add_position(position, oms_type)
 
         cdef PositionOpened event = PositionOpened.create_c(
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+
 from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
 from nautilus_trader.indicators.average.ma_factory import MovingAverageType
 
@@ -78,6 +80,46 @@ cdef class AverageTrueRange(Indicator):
 
         self.update_raw(bar.high.as_double(), bar.low.as_double(), bar.close.as_double())
 
+    cpdef void handle_bars(self, list bars) except *:
+        """
+        Update the indicator with the given bars in order.
+
+        The true ranges are passed to the inner moving average as a single batch.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The bars to update with.
+
+        """
+        cdef int count = len(bars)
+        if count == 0:
+            return
+
+        cdef double[:] true_ranges = np.empty(count, dtype=np.float64)
+        cdef int i
+        cdef Bar bar
+        cdef double high
+        cdef double low
+        cdef double close
+        for i in range(count):
+            bar = bars[i]
+            high = bar.high.as_double()
+            low = bar.low.as_double()
+            close = bar.close.as_double()
+            if self._use_previous:
+                if i == 0 and not self.has_inputs:
+                    self._previous_close = close
+                true_ranges[i] = max(self._previous_close, high) - min(low, self._previous_close)
+                self._previous_close = close
+            else:
+                true_ranges[i] = high - low
+
+        self._ma.update_raws(true_ranges)
+
+        self._floor_value()
+        self._check_initialized()
+
     cpdef void update_raw(
         self,
         double high,
@@ -104,3 +104,26 @@ cdef class ExponentialMovingAverage(MovingAverage):
 
         self.value = self.alpha * value + ((1.0 - self.alpha) * self.value)
         self._increment_count()
+
+    cpdef void update_raws(self, double[:] values) except *:
+        """
+        Update the indicator with the given raw values in order.
+
+        Parameters
+        ----------
+        values : np.ndarray[float64]
+            The update values.
+
+        """
+        cdef int count = values.shape[0]
+        if count == 0:
+            return
+
+        # Check if this is the initial input
+        cdef double value = values[0] if not self.has_inputs else self.value
+        cdef int i
+        for i in range(count):
+            value = self.alpha * values[i] + ((1.0 - self.alpha) * value)
+
+        self.value = value
+        self._increment_count_by(count)
@@ -28,5 +28,7 @@ cdef class MovingAverage(Indicator):
     """The current output value.\n\n:returns: `double`"""
 
     cpdef void update_raw(self, double value) except *
+    cpdef void update_raws(self, double[:] values) except *
     cpdef void _increment_count(self) except *
+    cdef void _increment_count_by(self, int count) except *
     cpdef void _reset_ma(self) except *
@@ -16,9 +16,14 @@
 from enum import Enum
 from enum import unique
 
+import numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
 from nautilus_trader.model.c_enums.price_type cimport PriceType
+from nautilus_trader.model.data.bar cimport Bar
+from nautilus_trader.model.data.tick cimport QuoteTick
+from nautilus_trader.model.data.tick cimport TradeTick
 
 
 @unique
@@ -77,8 +82,85 @@ cdef class MovingAverage(Indicator):
         """
         raise NotImplementedError("method must be implemented in the subclass")  # pragma: no cover
 
+    cpdef void update_raws(self, double[:] values) except *:
+        """
+        Update the indicator with the given raw values in order.
+
+        Parameters
+        ----------
+        values : np.ndarray[float64]
+            The update values.
+
+        """
+        cdef int i
+        for i in range(values.shape[0]):
+            self.update_raw(values[i])
+
+    cpdef void handle_quote_ticks(self, list ticks) except *:
+        """
+        Update the indicator with the given quote ticks in order.
+
+        Parameters
+        ----------
+        ticks : list[QuoteTick]
+            The ticks to update with.
+
+        """
+        cdef int count = len(ticks)
+        cdef double[:] values = np.empty(count, dtype=np.float64)
+        cdef int i
+        cdef QuoteTick tick
+        for i in range(count):
+            tick = ticks[i]
+            values[i] = tick.extract_price(self.price_type).as_double()
+
+        self.update_raws(values)
+
+    cpdef void handle_trade_ticks(self, list ticks) except *:
+        """
+        Update the indicator with the given trade ticks in order.
+
+        Parameters
+        ----------
+        ticks : list[TradeTick]
+            The ticks to update with.
+
+        """
+        cdef int count = len(ticks)
+        cdef double[:] values = np.empty(count, dtype=np.float64)
+        cdef int i
+        cdef TradeTick tick
+        for i in range(count):
+            tick = ticks[i]
+            values[i] = tick.price.as_double()
+
+        self.update_raws(values)
+
+    cpdef void handle_bars(self, list bars) except *:
+        """
+        Update the indicator with the given bars in order.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The bars to update with.
+
+        """
+        cdef int count = len(bars)
+        cdef double[:] values = np.empty(count, dtype=np.float64)
+        cdef int i
+        cdef Bar bar
+        for i in range(count):
+            bar = bars[i]
+            values[i] = bar.close.as_double()
+
+        self.update_raws(values)
+
     cpdef void _increment_count(self) except *:
-        self.count += 1
+        self._increment_count_by(1)
+
+    cdef void _increment_count_by(self, int count) except *:
+        self.count += count
 
         # Initialization logic
         if not self.initialized:
@@ -107,5 +107,26 @@ cdef class SimpleMovingAverage(MovingAverage):
         self.value = fast_mean(np.asarray(self._inputs, dtype=np.float64))
         self._increment_count()
 
+    cpdef void update_raws(self, double[:] values) except *:
+        """
+        Update the indicator with the given raw values in order.
+
+        Only the final window of values is kept, so the mean is calculated once.
+
+        Parameters
+        ----------
+        values : np.ndarray[float64]
+            The update values.
+
+        """
+        cdef int count = values.shape[0]
+        if count == 0:
+            return
+
+        self._inputs.extend(np.asarray(values[max(0, count - self.period):]))
+
+        self.value = fast_mean(np.asarray(self._inputs, dtype=np.float64))
+        self._increment_count_by(count)
+
     cpdef void _reset_ma(self) except *:
         self._inputs.clear()
@@ -131,5 +131,31 @@ cdef class WeightedMovingAverage(MovingAverage):
 
         self._increment_count()
 
+    cpdef void update_raws(self, double[:] values) except *:
+        """
+        Update the indicator with the given raw values in order.
+
+        Only the final window of values is kept, so the average is calculated once.
+
+        Parameters
+        ----------
+        values : np.ndarray[float64]
+            The update values.
+
+        """
+        cdef int count = values.shape[0]
+        if count == 0:
+            return
+
+        self._inputs.extend(np.asarray(values[max(0, count - self.period):]))
+
+        if self.weights is None:
+            self.value = np.average(self._inputs, axis=0)
+        else:
+            # All the weights apply once the window is full
+            self.value = np.average(self._inputs, weights=self.weights[-len(self._inputs):], axis=0)
+
+        self._increment_count_by(count)
+
     cpdef void _reset_ma(self) except *:
         self._inputs.clear()
@@ -33,6 +33,9 @@ cdef class Indicator:
     cpdef void handle_quote_tick(self, QuoteTick tick) except *
     cpdef void handle_trade_tick(self, TradeTick tick) except *
     cpdef void handle_bar(self, Bar bar) except *
+    cpdef void handle_quote_ticks(self, list ticks) except *
+    cpdef void handle_trade_ticks(self, list ticks) except *
+    cpdef void handle_bars(self, list bars) except *
     cpdef void reset(self) except *
 
     cpdef void _set_has_inputs(self, bint setting) except *
@@ -57,6 +57,48 @@ cdef class Indicator:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError(f"Cannot handle {repr(bar)}: method not implemented in subclass")  # pragma: no cover
 
+    cpdef void handle_quote_ticks(self, list ticks) except *:
+        """
+        Update the indicator with the given quote ticks in order.
+
+        Parameters
+        ----------
+        ticks : list[QuoteTick]
+            The ticks to update with.
+
+        """
+        cdef QuoteTick tick
+        for tick in ticks:
+            self.handle_quote_tick(tick)
+
+    cpdef void handle_trade_ticks(self, list ticks) except *:
+        """
+        Update the indicator with the given trade ticks in order.
+
+        Parameters
+        ----------
+        ticks : list[TradeTick]
+            The ticks to update with.
+
+        """
+        cdef TradeTick tick
+        for tick in ticks:
+            self.handle_trade_tick(tick)
+
+    cpdef void handle_bars(self, list bars) except *:
+        """
+        Update the indicator with the given bars in order.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The bars to update with.
+
+        """
+        cdef Bar bar
+        for bar in bars:
+            self.handle_bar(bar)
+
     cpdef void reset(self) except *:
         """
         Reset the indicator.
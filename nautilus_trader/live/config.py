@@ -13,7 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import pydantic
 from pydantic import PositiveFloat
@@ -30,25 +30,69 @@ from nautilus_trader.risk.config import RiskEngineConfig
 class LiveDataEngineConfig(DataEngineConfig):
     """
     Configuration for ``LiveDataEngine`` instances.
+
+    Parameters
+    ----------
+    qsize : PositiveInt, default=10000
+        The capacity of the internal queue(s) before further items are deferred.
+    overflow_qsize : PositiveInt, default=10000
+        The capacity for deferred data items, beyond which further data is
+        dropped (with a warning) rather than growing memory without bound.
+        Commands, requests and responses are never dropped.
+    drain_batch_size : PositiveInt, default=1000
+        The maximum number of queued items processed in a single pass before
+        yielding to the event loop.
+    conflate : list[str], optional
+        The data types to conflate while queued, only the latest queued item
+        per instrument is processed. Valid types are 'QuoteTick', 'Ticker' and
+        'OrderBookSnapshot'. All other data is always processed in order.
     """
 
     qsize: PositiveInt = 10000
+    overflow_qsize: PositiveInt = 10000
+    drain_batch_size: PositiveInt = 1000
+    conflate: List[str] = []
+
+    @pydantic.validator("conflate")
+    def _check_conflate(cls, value: List[str]):
+        invalid = set(value) - {"QuoteTick", "Ticker", "OrderBookSnapshot"}
+        if invalid:
+            raise ValueError(f"cannot conflate data types {sorted(invalid)}")
+        return value
 
 
 class LiveRiskEngineConfig(RiskEngineConfig):
     """
     Configuration for ``LiveRiskEngine`` instances.
+
+    Parameters
+    ----------
+    qsize : PositiveInt, default=10000
+        The capacity of the internal queue(s) before further items are deferred.
+    drain_batch_size : PositiveInt, default=1000
+        The maximum number of queued items processed in a single pass before
+        yielding to the event loop.
     """
 
     qsize: PositiveInt = 10000
+    drain_batch_size: PositiveInt = 1000
 
 
 class LiveExecEngineConfig(ExecEngineConfig):
     """
     Configuration for ``LiveExecEngine`` instances.
+
+    Parameters
+    ----------
+    qsize : PositiveInt, default=10000
+        The capacity of the internal queue(s) before further items are deferred.
+    drain_batch_size : PositiveInt, default=1000
+        The maximum number of queued items processed in a single pass before
+        yielding to the event loop.
     """
 
     qsize: PositiveInt = 10000
+    drain_batch_size: PositiveInt = 1000
 
 
 class TradingNodeConfig(pydantic.BaseModel):
@@ -14,6 +14,9 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.common.queue cimport Queue
+from nautilus_trader.common.queue cimport QueueDrainMetrics
+from nautilus_trader.core.data cimport Data
+from nautilus_trader.core.message cimport Message
 from nautilus_trader.data.engine cimport DataEngine
 
 
@@ -22,12 +25,27 @@ cdef class LiveDataEngine(DataEngine):
     cdef object _run_queues_task
     cdef Queue _data_queue
     cdef Queue _message_queue
+    cdef int _drain_batch_size
+    cdef tuple _conflate_types
+    cdef dict _conflated
+    cdef dict _conflated_closed
 
     cdef readonly bint is_running
     """If the data engine is running.\n\n:returns: `bool`"""
+    cdef readonly QueueDrainMetrics data_drain_metrics
+    """The metrics for the batches drained from the data queue.\n\n:returns: `QueueDrainMetrics`"""
+    cdef readonly QueueDrainMetrics message_drain_metrics
+    """The metrics for the batches drained from the message queue.\n\n:returns: `QueueDrainMetrics`"""
+    cdef readonly int conflated_count
+    """The count of queued data items replaced by conflation.\n\n:returns: `int`"""
+    cdef readonly int dropped_count
+    """The count of data items dropped as the data queue overflow was full.\n\n:returns: `int`"""
 
     cpdef int data_qsize(self) except *
     cpdef int message_qsize(self) except *
 
     cpdef void kill(self) except *
+    cdef void _close_conflation(self, instrument_id) except *
+    cdef Data _take_conflated(self, Data data)
+    cdef void _enqueue_message(self, Message message) except *
     cdef void _enqueue_sentinels(self) except *
@@ -16,10 +16,13 @@
 import asyncio
 from typing import Optional
 
+from libc.stdint cimport int64_t
+
 from nautilus_trader.cache.cache cimport Cache
 from nautilus_trader.common.clock cimport LiveClock
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.queue cimport Queue
+from nautilus_trader.common.queue cimport QueueDrainMetrics
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.message cimport Message
@@ -28,11 +31,22 @@ from nautilus_trader.data.engine cimport DataEngine
 from nautilus_trader.data.messages cimport DataCommand
 from nautilus_trader.data.messages cimport DataRequest
 from nautilus_trader.data.messages cimport DataResponse
+from nautilus_trader.model.data.bar cimport Bar
+from nautilus_trader.model.data.tick cimport QuoteTick
+from nautilus_trader.model.data.ticker cimport Ticker
+from nautilus_trader.model.orderbook.data cimport OrderBookSnapshot
 from nautilus_trader.msgbus.bus cimport MessageBus
 
 from nautilus_trader.live.config import LiveDataEngineConfig
 
 
+cdef dict _CONFLATABLE_TYPES = {
+    "QuoteTick": QuoteTick,
+    "Ticker": Ticker,
+    "OrderBookSnapshot": OrderBookSnapshot,
+}
+
+
 cdef class LiveDataEngine(DataEngine):
     """
     Provides a high-performance asynchronous live data engine.
@@ -80,11 +94,19 @@ cdef class LiveDataEngine(DataEngine):
         )
 
         self._loop = loop
-        self._data_queue = Queue(maxsize=config.qsize)
+        self._data_queue = Queue(maxsize=config.qsize, overflow_maxsize=config.overflow_qsize)
         self._message_queue = Queue(maxsize=config.qsize)
+        self._drain_batch_size = config.drain_batch_size
+        self._conflate_types = tuple(_CONFLATABLE_TYPES[name] for name in config.conflate)
+        self._conflated = {}         # type: dict[tuple, list]
+        self._conflated_closed = {}  # type: dict[int, Data]
 
         self._run_queues_task = None
         self.is_running = False
+        self.data_drain_metrics = QueueDrainMetrics()
+        self.message_drain_metrics = QueueDrainMetrics()
+        self.conflated_count = 0
+        self.dropped_count = 0
 
     def connect(self):
         """
@@ -160,8 +182,8 @@ cdef class LiveDataEngine(DataEngine):
         """
         Execute the given data command.
 
-        If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        If the internal queue is already full then will log a warning and defer
+        the item (in order) until queue size reduces.
 
         Parameters
         ----------
@@ -177,21 +199,22 @@ cdef class LiveDataEngine(DataEngine):
         Condition.not_none(command, "command")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._message_queue.put_nowait(command)
-        except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_message_queue.put` as message_queue full at "
-                f"{self._message_queue.qsize()} items.",
-            )
-            self._loop.create_task(self._message_queue.put(command))  # Blocking until qsize reduces
+        self._enqueue_message(command)
 
     cpdef void process(self, Data data) except *:
         """
         Process the given data.
 
-        If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        If the internal queue is already full then will log a warning and defer
+        the item (in order) until queue size reduces. Once the deferred
+        items reach `overflow_qsize` then further data is dropped with a
+        warning (and counted by `dropped_count`).
+
+        If the data type is configured for conflation and an item for the same
+        instrument is already queued, then the queued item is replaced with
+        `data` (the latest value is processed in the position of the first).
+        Any other data for the instrument closes the conflation, so later items
+        are never processed ahead of it.
 
         Parameters
         ----------
@@ -207,21 +230,44 @@ cdef class LiveDataEngine(DataEngine):
         Condition.not_none(data, "data")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
+        cdef tuple key = None
+        cdef list slot
+        if self._conflate_types:
+            if isinstance(data, self._conflate_types):
+                key = (type(data), (<object>data).instrument_id)
+                slot = self._conflated.get(key)
+                if slot is not None:
+                    # Replace the queued item (keeps its position in the queue)
+                    slot[1] = data
+                    self.conflated_count += 1
+                    return
+            elif self._conflated:
+                if isinstance(data, Bar):
+                    self._close_conflation((<Bar>data).type.instrument_id)
+                else:
+                    self._close_conflation(getattr(data, "instrument_id", None))
+
         try:
-            self._data_queue.put_nowait(data)
+            if self._data_queue.put_deferred(data) and self._data_queue.overflow_qsize() == 1:
+                self._log.warning(
+                    f"Deferring data as data_queue full at {self._data_queue.qsize()} items.",
+                )
         except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_data_queue.put` as data_queue full at "
-                f"{self._data_queue.qsize()} items.",
-            )
-            self._loop.create_task(self._data_queue.put(data))  # Blocking until qsize reduces
+            # Never raise into the data client callback which produced the data
+            self.dropped_count += 1
+            self._log.warning(f"Dropped {data} as data_queue and overflow full.")
+            return
+
+        if key is not None:
+            # Only open the slot once the item is queued
+            self._conflated[key] = [data, data]  # [queued, latest]
 
     cpdef void request(self, DataRequest request) except *:
         """
         Handle the given request.
 
-        If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        If the internal queue is already full then will log a warning and defer
+        the item (in order) until queue size reduces.
 
         Parameters
         ----------
@@ -237,21 +283,14 @@ cdef class LiveDataEngine(DataEngine):
         Condition.not_none(request, "request")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._message_queue.put_nowait(request)
-        except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_message_queue.put` as message_queue full at "
-                f"{self._message_queue.qsize()} items.",
-            )
-            self._loop.create_task(self._message_queue.put(request))  # Blocking until qsize reduces
+        self._enqueue_message(request)
 
     cpdef void response(self, DataResponse response) except *:
         """
         Handle the given response.
 
-        If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        If the internal queue is already full then will log a warning and defer
+        the item (in order) until queue size reduces.
 
         Parameters
         ----------
@@ -266,14 +305,7 @@ cdef class LiveDataEngine(DataEngine):
         """
         Condition.not_none(response, "response")
 
-        try:
-            self._message_queue.put_nowait(response)
-        except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_message_queue.put` as message_queue full at "
-                f"{self._message_queue.qsize()} items.",
-            )
-            self._loop.create_task(self._message_queue.put(response))  # Blocking until qsize reduces
+        self._enqueue_message(response)
 
     cpdef void _on_start(self) except *:
         if not self._loop.is_running():
@@ -297,12 +329,27 @@ cdef class LiveDataEngine(DataEngine):
     async def _run_data_queue(self):
         self._log.debug(f"Data queue processing starting (qsize={self.data_qsize()})...")
         cdef Data data
+        cdef int count
+        cdef int64_t ts_start
         try:
             while self.is_running:
                 data = await self._data_queue.get()
-                if data is None:  # Sentinel message (fast C-level check)
-                    continue      # Returns to the top to check `self.is_running`
-                self._handle_data(data)
+                # Drain all data currently available (up to the batch size)
+                ts_start = self._clock.timestamp_ns()
+                count = 0
+                while data is not None:  # None is the sentinel message (fast C-level check)
+                    if self._conflate_types and isinstance(data, self._conflate_types):
+                        data = self._take_conflated(data)
+                    self._handle_data(data)
+                    count += 1
+                    if count >= self._drain_batch_size or self._data_queue._empty():
+                        break
+                    data = self._data_queue._get_nowait()
+                if count == 0:
+                    continue  # Returns to the top to check `self.is_running`
+                self.data_drain_metrics.record(count, self._clock.timestamp_ns() - ts_start)
+                if count >= self._drain_batch_size:
+                    await asyncio.sleep(0)  # Yield to the event loop between full batches
         except asyncio.CancelledError:
             if not self._data_queue.empty():
                 self._log.warning(
@@ -318,19 +365,32 @@ cdef class LiveDataEngine(DataEngine):
             f"Message queue processing starting (qsize={self.message_qsize()})...",
         )
         cdef Message message
+        cdef int count
+        cdef int64_t ts_start
         try:
             while self.is_running:
                 message = await self._message_queue.get()
-                if message is None:  # Sentinel message (fast C-level check)
-                    continue         # Returns to the top to check `self.is_running`
-                if message.category == MessageCategory.COMMAND:
-                    self._execute_command(message)
-                elif message.category == MessageCategory.REQUEST:
-                    self._handle_request(message)
-                elif message.category == MessageCategory.RESPONSE:
-                    self._handle_response(message)
-                else:
-                    self._log.error(f"Cannot handle message: unrecognized {message}.")
+                # Drain all messages currently available (up to the batch size)
+                ts_start = self._clock.timestamp_ns()
+                count = 0
+                while message is not None:  # None is the sentinel message (fast C-level check)
+                    if message.category == MessageCategory.COMMAND:
+                        self._execute_command(message)
+                    elif message.category == MessageCategory.REQUEST:
+                        self._handle_request(message)
+                    elif message.category == MessageCategory.RESPONSE:
+                        self._handle_response(message)
+                    else:
+                        self._log.error(f"Cannot handle message: unrecognized {message}.")
+                    count += 1
+                    if count >= self._drain_batch_size or self._message_queue._empty():
+                        break
+                    message = self._message_queue._get_nowait()
+                if count == 0:
+                    continue  # Returns to the top to check `self.is_running`
+                self.message_drain_metrics.record(count, self._clock.timestamp_ns() - ts_start)
+                if count >= self._drain_batch_size:
+                    await asyncio.sleep(0)  # Yield to the event loop between full batches
         except asyncio.CancelledError:
             if not self._message_queue.empty():
                 self._log.warning(
@@ -341,8 +401,41 @@ cdef class LiveDataEngine(DataEngine):
                     f"Message queue processing stopped (qsize={self.message_qsize()}).",
                 )
 
+    cdef void _close_conflation(self, instrument_id) except *:
+        # Stop later items for the instrument replacing those already queued
+        if instrument_id is None:
+            return
+        cdef list slot
+        for data_type in self._conflate_types:
+            slot = self._conflated.pop((data_type, instrument_id), None)
+            if slot is not None and slot[1] is not slot[0]:
+                # The queued item is still identified by the object on the queue
+                self._conflated_closed[id(slot[0])] = slot[1]
+
+    cdef Data _take_conflated(self, Data data):
+        # Return the latest value for the queued conflatable item
+        if self._conflated_closed and id(data) in self._conflated_closed:
+            return self._conflated_closed.pop(id(data))
+
+        cdef tuple key = (type(data), (<object>data).instrument_id)
+        cdef list slot = self._conflated.get(key)
+        if slot is not None and slot[0] is data:
+            del self._conflated[key]
+            return slot[1]
+        return data
+
+    cdef void _enqueue_message(self, Message message) except *:
+        if self._message_queue.put_deferred(message) and self._message_queue.overflow_qsize() == 1:
+            self._log.warning(
+                f"Deferring messages as message_queue full at "
+                f"{self._message_queue.qsize()} items.",
+            )
+
     cdef void _enqueue_sentinels(self) except *:
-        self._data_queue.put_nowait(self._sentinel)
-        self._message_queue.put_nowait(self._sentinel)
+        try:
+            self._data_queue.put_deferred(self._sentinel)
+        except asyncio.QueueFull:
+            pass  # Queue is not empty so the run loop will wake and stop
+        self._message_queue.put_deferred(self._sentinel)
         self._log.debug(f"Sentinel message placed on data queue.")
         self._log.debug(f"Sentinel message placed on message queue.")
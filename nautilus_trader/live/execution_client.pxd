@@ -20,3 +20,6 @@ from nautilus_trader.execution.client cimport ExecutionClient
 cdef class LiveExecutionClient(ExecutionClient):
     cdef readonly object _loop
     cdef readonly InstrumentProvider _instrument_provider
+
+    cdef readonly int reconciliation_concurrency
+    """The maximum number of concurrent requests during state reconciliation.\n\n:returns: `int`"""
@@ -77,7 +77,10 @@ cdef class LiveExecutionClient(ExecutionClient):
     logger : Logger
         The logger for the client.
     config : dict[str, object], optional
-        The configuration for the instance.
+        The configuration for the instance. The 'reconciliation_concurrency' key
+        caps the number of concurrent report requests made during state
+        reconciliation (default 10), and should be set within the venues
+        request rate limits.
 
     Warnings
     --------
@@ -115,6 +118,9 @@ cdef class LiveExecutionClient(ExecutionClient):
         self._loop = loop
         self._instrument_provider = instrument_provider
 
+        self.reconciliation_concurrency = self._config.get("reconciliation_concurrency", 10)
+        Condition.positive_int(self.reconciliation_concurrency, "reconciliation_concurrency")
+
     def connect(self):
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method must be implemented in the subclass")  # pragma: no cover
@@ -183,11 +189,35 @@ cdef class LiveExecutionClient(ExecutionClient):
         """
         raise NotImplementedError("method must be implemented in the subclass")  # pragma: no cover
 
+    async def generate_order_status_reports(self, list active_orders):
+        """
+        Generate order status reports for the given active orders in bulk.
+
+        Venues which offer a bulk open orders endpoint should override this
+        method, any active orders without a returned report will then have
+        their status requested individually.
+
+        Parameters
+        ----------
+        active_orders : list[Order]
+            The orders which currently have an 'active' status.
+
+        Returns
+        -------
+        dict[VenueOrderId, OrderStatusReport] or ``None``
+            ``None`` if the venue does not support bulk order status requests.
+
+        """
+        return None  # Bulk requests not supported by default
+
     async def generate_mass_status(self, list active_orders):
         """
         Generate an execution state report based on the given list of active
         orders.
 
+        Order status and execution reports are requested concurrently, with
+        the number of in-flight requests capped at `reconciliation_concurrency`.
+
         Parameters
         ----------
         active_orders : list[Order]
@@ -212,21 +242,50 @@ cdef class LiveExecutionClient(ExecutionClient):
             # Nothing to reconcile
             return mass_status
 
-        cdef Order order
-        cdef OrderStatusReport order_report
-        cdef list exec_reports
-        for order in active_orders:
-            order_report = await self.generate_order_status_report(order)
-            if order_report:
-                mass_status.add_order_report(order_report)
-
-            if order_report.order_status in (OrderStatus.PARTIALLY_FILLED, OrderStatus.FILLED):
-                exec_reports = await self.generate_exec_reports(
+        semaphore = asyncio.Semaphore(self.reconciliation_concurrency)
+
+        async def order_status_report(Order order):
+            async with semaphore:
+                return await self.generate_order_status_report(order)
+
+        async def exec_reports(Order order):
+            async with semaphore:
+                return await self.generate_exec_reports(
                     venue_order_id=order.venue_order_id,
                     symbol=order.instrument_id.symbol,
                     since=pd.Timestamp(order.ts_init, tz="UTC"),
                 )
-                mass_status.add_exec_reports(order.venue_order_id, exec_reports)
+
+        # Request order status reports (in bulk where supported)
+        cdef dict bulk_reports = await self.generate_order_status_reports(active_orders) or {}
+        cdef list reports = [bulk_reports.get(order.venue_order_id) for order in active_orders]
+        cdef list missing = [
+            order for order, report in zip(active_orders, reports) if report is None
+        ]
+        cdef list missing_reports = await asyncio.gather(
+            *[order_status_report(order) for order in missing],
+        )
+        cdef dict missing_map = dict(zip([id(order) for order in missing], missing_reports))
+
+        cdef Order order
+        cdef OrderStatusReport report
+        cdef list filled_orders = []
+        for order, report in zip(active_orders, reports):
+            if report is None:
+                report = missing_map[id(order)]
+                if report is None:
+                    continue
+            mass_status.add_order_report(report)
+            if report.order_status in (OrderStatus.PARTIALLY_FILLED, OrderStatus.FILLED):
+                filled_orders.append(order)
+
+        # Request execution reports for any (partially) filled orders
+        cdef list order_exec_reports = await asyncio.gather(
+            *[exec_reports(order) for order in filled_orders],
+        )
+        cdef list order_reports
+        for order, order_reports in zip(filled_orders, order_exec_reports):
+            mass_status.add_exec_reports(order.venue_order_id, order_reports)
 
         return mass_status
 
@@ -334,7 +393,7 @@ cdef class LiveExecutionClient(ExecutionClient):
         cdef ExecutionReport exec_report
         cdef Instrument instrument
         for exec_report in exec_reports:
-            if exec_report.id in order.execution_ids_c():
+            if order.has_execution_id_c(exec_report.id):
                 continue  # Trade already applied
             self._log.info(
                 f"Generating OrderFilled event for {repr(exec_report.id)}...",
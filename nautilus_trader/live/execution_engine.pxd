@@ -14,18 +14,31 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.common.queue cimport Queue
+from nautilus_trader.common.queue cimport QueueDrainMetrics
+from nautilus_trader.core.message cimport Message
 from nautilus_trader.execution.engine cimport ExecutionEngine
+from nautilus_trader.execution.messages cimport OrderStatusReport
+from nautilus_trader.model.events.order cimport OrderEvent
+from nautilus_trader.model.orders.base cimport Order
 
 
 cdef class LiveExecutionEngine(ExecutionEngine):
     cdef object _loop
     cdef object _run_queue_task
     cdef Queue _queue
+    cdef int _drain_batch_size
+    cdef dict _reconciliation_reports
+    cdef object _reconciled
 
     cdef readonly bint is_running
     """If the execution engine is running.\n\n:returns: `bool`"""
+    cdef readonly QueueDrainMetrics drain_metrics
+    """The metrics for the batches drained from the message queue.\n\n:returns: `QueueDrainMetrics`"""
 
     cpdef int qsize(self) except *
 
     cpdef void kill(self) except *
+    cdef void _enqueue(self, Message message) except *
     cdef void _enqueue_sentinel(self) except *
+    cdef bint _is_reconciled(self, Order order, OrderStatusReport report) except *
+    cdef void _check_reconciled(self, OrderEvent event) except *
@@ -18,14 +18,14 @@ from typing import Optional
 
 from pydantic import PositiveInt
 
-from cpython.datetime cimport datetime
-from cpython.datetime cimport timedelta
+from libc.stdint cimport int64_t
 
 from nautilus_trader.cache.cache cimport Cache
 from nautilus_trader.common.clock cimport LiveClock
 from nautilus_trader.common.logging cimport LogColor
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.queue cimport Queue
+from nautilus_trader.common.queue cimport QueueDrainMetrics
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.message cimport Message
 from nautilus_trader.core.message cimport MessageCategory
@@ -92,9 +92,13 @@ cdef class LiveExecutionEngine(ExecutionEngine):
 
         self._loop = loop
         self._queue = Queue(maxsize=config.qsize)
+        self._drain_batch_size = config.drain_batch_size
 
         self._run_queue_task = None
+        self._reconciliation_reports = {}  # type: dict[ClientOrderId, OrderStatusReport]
+        self._reconciled = None
         self.is_running = False
+        self.drain_metrics = QueueDrainMetrics()
 
     def connect(self):
         """
@@ -144,6 +148,10 @@ cdef class LiveExecutionEngine(ExecutionEngine):
         the missing events will be generated. If there is not enough information
         to reconcile a state then errors will be logged.
 
+        The clients generate their state reports concurrently, and the method
+        completes as soon as the generated events have been handled on the
+        queue (the engine must be running).
+
         Parameters
         ----------
         timeout_secs : double
@@ -192,19 +200,21 @@ cdef class LiveExecutionEngine(ExecutionEngine):
                 continue
             client_orders[client.id].append(order)
 
-        cdef dict client_mass_status = {}  # type: dict[ClientId, ExecutionMassStatus]
-
-        # Generate state report for each client
-        for name, client in self._clients.items():
-            client_mass_status[name] = await client.generate_mass_status(client_orders[name])
+        # Generate state report for each client concurrently
+        cdef list names = list(self._clients.keys())
+        cdef list mass_statuses = await asyncio.gather(
+            *[self._clients[name].generate_mass_status(client_orders[name]) for name in names],
+        )
 
         # Reconcile order status
+        cdef dict pending = {}  # type: dict[ClientOrderId, OrderStatusReport]
         cdef ExecutionMassStatus mass_status
         cdef OrderStatusReport order_status_report
-        for name, mass_status in client_mass_status.items():
+        for name, mass_status in zip(names, mass_statuses):
             order_reports = mass_status.order_reports()
             if not order_reports:
                 continue
+            exec_reports = mass_status.exec_reports()
             for order_status_report in order_reports.values():
                 order = active_orders.get(order_status_report.client_order_id)
                 if order is None:
@@ -213,41 +223,55 @@ cdef class LiveExecutionEngine(ExecutionEngine):
                         f"No order found for {repr(order_status_report.client_order_id)}."
                     )
                     continue
-                exec_reports = mass_status.exec_reports().get(order.venue_order_id, [])
-                await self._clients[name].reconcile_state(order_status_report, order, exec_reports)
-
-        # Wait for state resolution until timeout...
-        cdef datetime timeout = self._clock.utc_now() + timedelta(seconds=timeout_secs)
-        cdef OrderStatusReport report
-        while True:
-            reconciled = True
-            for order in active_orders.values():
-                client = self._routing_map.get(order.instrument_id.venue)
-                if client is None:
-                    self._log.error(
-                        f"Cannot reconcile state: "
-                        f"No client found for {order.instrument_id.venue}."
-                    )
-                    return False  # Will never reconcile
-                mass_status = client_mass_status.get(client.id)
-                if mass_status is None:
-                    return False  # Will never reconcile
-                report = mass_status.order_reports().get(order.venue_order_id)
-                if report is None:
-                    return False  # Will never reconcile
-                if order.status_c() != report.order_status:
-                    reconciled = False  # Incorrect state on this loop
-                if report.order_status in (OrderStatus.FILLED, OrderStatus.PARTIALLY_FILLED):
-                    if order.filled_qty != report.filled_qty:
-                        reconciled = False  # Incorrect filled quantity on this loop
-            if reconciled:
-                break
-            if self._clock.utc_now() >= timeout:
-                return False
-            await asyncio.sleep(0)  # Sleep for one event loop cycle
+                pending[order.client_order_id] = order_status_report
+                await self._clients[name].reconcile_state(
+                    order_status_report,
+                    order,
+                    exec_reports.get(order.venue_order_id, []),
+                )
+
+        if len(pending) != len(active_orders):
+            return False  # Will never reconcile (no client or report for an active order)
+
+        # Wait for state resolution until timeout, the resolving events are
+        # checked off as they are handled on the queue.
+        for order in active_orders.values():
+            if self._is_reconciled(order, pending[order.client_order_id]):
+                pending.pop(order.client_order_id)
+        if not pending:
+            return True  # Execution states reconciled
+
+        self._reconciliation_reports = pending
+        self._reconciled = asyncio.Event()
+        try:
+            await asyncio.wait_for(self._reconciled.wait(), timeout=timeout_secs)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._reconciliation_reports = {}
+            self._reconciled = None
 
         return True  # Execution states reconciled
 
+    cdef bint _is_reconciled(self, Order order, OrderStatusReport report) except *:
+        if order.status_c() != report.order_status:
+            return False  # Incorrect state
+        if report.order_status in (OrderStatus.FILLED, OrderStatus.PARTIALLY_FILLED):
+            if order.filled_qty != report.filled_qty:
+                return False  # Incorrect filled quantity
+        return True
+
+    cdef void _check_reconciled(self, OrderEvent event) except *:
+        cdef OrderStatusReport report = self._reconciliation_reports.get(event.client_order_id)
+        if report is None:
+            return  # Not an order pending reconciliation
+        cdef Order order = self._cache.order(event.client_order_id)
+        if order is None or not self._is_reconciled(order, report):
+            return
+        self._reconciliation_reports.pop(event.client_order_id)
+        if not self._reconciliation_reports:
+            self._reconciled.set()
+
     cpdef void kill(self) except *:
         """
         Kill the engine by abruptly cancelling the queue task and calling stop.
@@ -264,8 +288,8 @@ cdef class LiveExecutionEngine(ExecutionEngine):
         """
         Execute the given command.
 
-        If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        If the internal queue is already full then will log a warning and defer
+        the message (in order) until queue size reduces.
 
         Parameters
         ----------
@@ -281,21 +305,14 @@ cdef class LiveExecutionEngine(ExecutionEngine):
         Condition.not_none(command, "command")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._queue.put_nowait(command)
-        except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_queue.put` as queue full "
-                f"at {self._queue.qsize()} items.",
-            )
-            self._loop.create_task(self._queue.put(command))  # Blocking until qsize reduces
+        self._enqueue(command)
 
     cpdef void process(self, OrderEvent event) except *:
         """
         Process the given event.
 
-        If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        If the internal queue is already full then will log a warning and defer
+        the message (in order) until queue size reduces.
 
         Parameters
         ----------
@@ -310,14 +327,7 @@ cdef class LiveExecutionEngine(ExecutionEngine):
         """
         Condition.not_none(event, "event")
 
-        try:
-            self._queue.put_nowait(event)
-        except asyncio.QueueFull:
-            self._log.warning(
-                f"Blocking on `_queue.put` as queue full "
-                f"at {self._queue.qsize()} items.",
-            )
-            self._loop.create_task(self._queue.put(event))  # Blocking until qsize reduces
+        self._enqueue(event)
 
     cpdef void _on_start(self) except *:
         if not self._loop.is_running():
@@ -338,17 +348,32 @@ cdef class LiveExecutionEngine(ExecutionEngine):
             f"Message queue processing starting (qsize={self.qsize()})...",
         )
         cdef Message message
+        cdef int count
+        cdef int64_t ts_start
         try:
             while self.is_running:
                 message = await self._queue.get()
-                if message is None:  # Sentinel message (fast C-level check)
-                    continue         # Returns to the top to check `self.is_running`
-                if message.category == MessageCategory.EVENT:
-                    self._handle_event(message)
-                elif message.category == MessageCategory.COMMAND:
-                    self._execute_command(message)
-                else:
-                    self._log.error(f"Cannot handle message: unrecognized {message}.")
+                # Drain all messages currently available (up to the batch size)
+                ts_start = self._clock.timestamp_ns()
+                count = 0
+                while message is not None:  # None is the sentinel message (fast C-level check)
+                    if message.category == MessageCategory.EVENT:
+                        self._handle_event(message)
+                        if self._reconciliation_reports:
+                            self._check_reconciled(message)
+                    elif message.category == MessageCategory.COMMAND:
+                        self._execute_command(message)
+                    else:
+                        self._log.error(f"Cannot handle message: unrecognized {message}.")
+                    count += 1
+                    if count >= self._drain_batch_size or self._queue._empty():
+                        break
+                    message = self._queue._get_nowait()
+                if count == 0:
+                    continue  # Returns to the top to check `self.is_running`
+                self.drain_metrics.record(count, self._clock.timestamp_ns() - ts_start)
+                if count >= self._drain_batch_size:
+                    await asyncio.sleep(0)  # Yield to the event loop between full batches
         except asyncio.CancelledError:
             if not self._queue.empty():
                 self._log.warning(
@@ -359,6 +384,12 @@ cdef class LiveExecutionEngine(ExecutionEngine):
                     f"Message queue processing stopped (qsize={self.qsize()}).",
                 )
 
+    cdef void _enqueue(self, Message message) except *:
+        if self._queue.put_deferred(message) and self._queue.overflow_qsize() == 1:
+            self._log.warning(
+                f"Deferring messages as queue full at {self._queue.qsize()} items.",
+            )
+
     cdef void _enqueue_sentinel(self) except *:
-        self._queue.put_nowait(self._sentinel)
+        self._queue.put_deferred(self._sentinel)
         self._log.debug(f"Sentinel message placed on message queue.")
@@ -473,7 +473,10 @@ class TradingNode:
         # Setup persistence
         path = f"{config.catalog_path}/live/{self.instance_id}.feather"
         writer = FeatherWriter(
-            path=path, fs_protocol=config.fs_protocol, flush_interval=config.flush_interval
+            path=path,
+            fs_protocol=config.fs_protocol,
+            flush_interval=config.flush_interval,
+            batch_size=config.batch_size,
         )
         self.persistence_writers.append(writer)
         self.trader.subscribe("*", writer.write)
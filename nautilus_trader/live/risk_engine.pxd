@@ -13,19 +13,26 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from nautilus_trader.common.queue cimport Queue
+from nautilus_trader.common.queue cimport QueueDrainMetrics
+from nautilus_trader.core.message cimport Message
 from nautilus_trader.risk.engine cimport RiskEngine
 
 
 cdef class LiveRiskEngine(RiskEngine):
     cdef object _loop
-    cdef object _queue
+    cdef Queue _queue
     cdef object _run_queue_task
+    cdef int _drain_batch_size
 
     cdef readonly bint is_running
     """If the risk engine is running.\n\n:returns: `bool`"""
+    cdef readonly QueueDrainMetrics drain_metrics
+    """The metrics for the batches drained from the message queue.\n\n:returns: `QueueDrainMetrics`"""
 
     cpdef object get_event_loop(self)
     cpdef object get_run_queue_task(self)
     cpdef int qsize(self) except *
 
     cpdef void kill(self) except *
+    cdef void _enqueue(self, Message message) except *
@@ -16,10 +16,13 @@
 import asyncio
 from typing import Optional
 
+from libc.stdint cimport int64_t
+
 from nautilus_trader.cache.base cimport CacheFacade
 from nautilus_trader.common.clock cimport LiveClock
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.queue cimport Queue
+from nautilus_trader.common.queue cimport QueueDrainMetrics
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.message cimport Command
 from nautilus_trader.core.message cimport Event
@@ -108,9 +111,11 @@ cdef class LiveRiskEngine(RiskEngine):
 
         self._loop = loop
         self._queue = Queue(maxsize=config.qsize)
+        self._drain_batch_size = config.drain_batch_size
 
         self._run_queue_task = None
         self.is_running = False
+        self.drain_metrics = QueueDrainMetrics()
 
     cpdef object get_event_loop(self):
         """
@@ -163,8 +168,8 @@ cdef class LiveRiskEngine(RiskEngine):
         """
         Execute the given command.
 
-        If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        If the internal queue is already full then will log a warning and defer
+        the message (in order) until queue size reduces.
 
         Parameters
         ----------
@@ -180,18 +185,14 @@ cdef class LiveRiskEngine(RiskEngine):
         Condition.not_none(command, "command")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._queue.put_nowait(command)
-        except asyncio.QueueFull:
-            self._log.warning(f"Blocking on `_queue.put` as queue full at {self._queue.qsize()} items.")
-            self._loop.create_task(self._queue.put(command))
+        self._enqueue(command)
 
     cpdef void process(self, Event event) except *:
         """
         Process the given event.
 
-        If the internal queue is already full then will log a warning and block
-        until queue size reduces.
+        If the internal queue is already full then will log a warning and defer
+        the message (in order) until queue size reduces.
 
         Parameters
         ----------
@@ -207,11 +208,7 @@ cdef class LiveRiskEngine(RiskEngine):
         Condition.not_none(event, "event")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
-        try:
-            self._queue.put_nowait(event)
-        except asyncio.QueueFull:
-            self._log.warning(f"Blocking on `_queue.put` as queue full at {self._queue.qsize()} items.")
-            self._queue.put(event)  # Block until qsize reduces below maxsize
+        self._enqueue(event)
 
 # -- INTERNAL --------------------------------------------------------------------------------------
 
@@ -227,26 +224,43 @@ cdef class LiveRiskEngine(RiskEngine):
     cpdef void _on_stop(self) except *:
         if self.is_running:
             self.is_running = False
-            self._queue.put_nowait(None)  # Sentinel message pattern
+            self._queue.put_deferred(None)  # Sentinel message pattern
             self._log.debug(f"Sentinel message placed on message queue.")
 
     async def _run(self):
         self._log.debug(f"Message queue processing starting (qsize={self.qsize()})...")
         cdef Message message
+        cdef int count
+        cdef int64_t ts_start
         try:
             while self.is_running:
                 message = await self._queue.get()
-                if message is None:  # Sentinel message (fast C-level check)
-                    continue         # Returns to the top to check `self.is_running`
-                if message.category == MessageCategory.EVENT:
-                    self._handle_event(message)
-                elif message.category == MessageCategory.COMMAND:
-                    self._execute_command(message)
-                else:
-                    self._log.error(f"Cannot handle message: unrecognized {message}.")
+                # Drain all messages currently available (up to the batch size)
+                ts_start = self._clock.timestamp_ns()
+                count = 0
+                while message is not None:  # None is the sentinel message (fast C-level check)
+                    if message.category == MessageCategory.EVENT:
+                        self._handle_event(message)
+                    elif message.category == MessageCategory.COMMAND:
+                        self._execute_command(message)
+                    else:
+                        self._log.error(f"Cannot handle message: unrecognized {message}.")
+                    count += 1
+                    if count >= self._drain_batch_size or self._queue._empty():
+                        break
+                    message = self._queue._get_nowait()
+                if count == 0:
+                    continue  # Returns to the top to check `self.is_running`
+                self.drain_metrics.record(count, self._clock.timestamp_ns() - ts_start)
+                if count >= self._drain_batch_size:
+                    await asyncio.sleep(0)  # Yield to the event loop between full batches
         except asyncio.CancelledError:
             if self.qsize() > 0:
                 self._log.warning(f"Running canceled "
                                   f"with {self.qsize()} message(s) on queue.")
             else:
                 self._log.debug(f"Message queue processing stopped (qsize={self.qsize()}).")
+
+    cdef void _enqueue(self, Message message) except *:
+        if self._queue.put_deferred(message) and self._queue.overflow_qsize() == 1:
+            self._log.warning(f"Deferring messages as queue full at {self._queue.qsize()} items.")
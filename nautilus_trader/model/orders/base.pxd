@@ -53,6 +53,7 @@ cdef class Order:
     cdef list _events
     cdef list _venue_order_ids
     cdef list _execution_ids
+    cdef set _execution_ids_set
     cdef FiniteStateMachine _fsm
     cdef OrderStatus _rollback_status
 
@@ -117,6 +118,7 @@ cdef class Order:
     cdef OrderEvent last_event_c(self)
     cdef list events_c(self)
     cdef list execution_ids_c(self)
+    cdef bint has_execution_id_c(self, ExecutionId execution_id) except *
     cdef int event_count_c(self) except *
     cdef str status_string_c(self)
     cdef str type_string_c(self)
@@ -117,9 +117,10 @@ cdef class Order:
     """
 
     def __init__(self, OrderInitialized init not None):
-        self._events = [init]       # type: list[OrderEvent]
-        self._venue_order_ids = []  # type: list[VenueOrderId]
-        self._execution_ids = []    # type: list[ExecutionId]
+        self._events = [init]            # type: list[OrderEvent]
+        self._venue_order_ids = []       # type: list[VenueOrderId]
+        self._execution_ids = []         # type: list[ExecutionId]
+        self._execution_ids_set = set()  # type: set[ExecutionId]
         self._fsm = FiniteStateMachine(
             state_transition_table=_ORDER_STATE_TABLE,
             initial_state=OrderStatus.INITIALIZED,
@@ -210,10 +211,15 @@ cdef class Order:
         return self._events[-1]  # Guaranteed to contain the initialized event
 
     cdef list events_c(self):
-        return self._events.copy()
+        # Returns the internal append-only list (callers must not mutate)
+        return self._events
 
     cdef list execution_ids_c(self):
-        return self._execution_ids.copy()
+        # Returns the internal append-only list (callers must not mutate)
+        return self._execution_ids
+
+    cdef bint has_execution_id_c(self, ExecutionId execution_id) except *:
+        return execution_id in self._execution_ids_set
 
     cdef int event_count_c(self) except *:
         return len(self._events)
@@ -363,7 +369,7 @@ cdef class Order:
         list[OrderEvent]
 
         """
-        return self.events_c()
+        return self.events_c().copy()
 
     @property
     def execution_ids(self):
@@ -375,7 +381,7 @@ cdef class Order:
         list[ExecutionId]
 
         """
-        return self.execution_ids_c()
+        return self.execution_ids_c().copy()
 
     @property
     def event_count(self):
@@ -712,7 +718,7 @@ cdef class Order:
             if self.venue_order_id is None:
                 self.venue_order_id = event.venue_order_id
             else:
-                Condition.not_in(event.execution_id, self._execution_ids, "event.execution_id", "self._execution_ids")
+                Condition.not_in(event.execution_id, self._execution_ids_set, "event.execution_id", "self._execution_ids")
             # Fill order
             if self.filled_qty + event.last_qty < self.quantity:
                 self._fsm.trigger(OrderStatus.PARTIALLY_FILLED)
@@ -902,6 +908,7 @@ cdef class PassiveOrder(Order):
         self.position_id = fill.position_id
         self.strategy_id = fill.strategy_id
         self._execution_ids.append(fill.execution_id)
+        self._execution_ids_set.add(fill.execution_id)
         self.execution_id = fill.execution_id
         self.liquidity_side = fill.liquidity_side
         filled_qty: Decimal = self.filled_qty.as_decimal() + fill.last_qty.as_decimal()
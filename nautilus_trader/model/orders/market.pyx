@@ -245,6 +245,7 @@ cdef class MarketOrder(Order):
         self.position_id = fill.position_id
         self.strategy_id = fill.strategy_id
         self._execution_ids.append(fill.execution_id)
+        self._execution_ids_set.add(fill.execution_id)
         self.execution_id = fill.execution_id
         filled_qty: Decimal = self.filled_qty.as_decimal() + fill.last_qty.as_decimal()
         self.filled_qty = Quantity(filled_qty, fill.last_qty.precision)
@@ -36,7 +36,11 @@ from nautilus_trader.model.objects cimport Quantity
 
 cdef class Position:
     cdef list _events
+    cdef int _event_count
     cdef list _execution_ids
+    cdef set _execution_ids_set
+    cdef set _client_order_ids
+    cdef set _venue_order_ids
     cdef object _buy_qty
     cdef object _sell_qty
     cdef dict _commissions
@@ -53,6 +57,8 @@ cdef class Position:
     """The account ID associated with the position.\n\n:returns: `AccountId`"""
     cdef readonly ClientOrderId from_order
     """The client order ID for the order which initially opened the position.\n\n:returns: `ClientOrderId`"""
+    cdef readonly bint retain_events
+    """If all applied order fill events are retained by the position.\n\n:returns: `bool`"""
     cdef readonly OrderSide entry
     """The position entry order side.\n\n:returns: `OrderSide`"""
     cdef readonly PositionSide side
@@ -40,6 +40,11 @@ cdef class Position:
         The trading instrument for the position.
     fill : OrderFilled
         The order fill event which opened the position.
+    retain_events : bool, default True
+        If all applied order fill events should be retained. If False then
+        only the last order fill event is held (the execution IDs are still
+        tracked to guard against duplicate fills), which bounds the memory of
+        long-lived positions.
 
     Raises
     ------
@@ -53,12 +58,17 @@ cdef class Position:
         self,
         Instrument instrument not None,
         OrderFilled fill not None,
+        bint retain_events=True,
     ):
         Condition.equal(instrument.id, fill.instrument_id, "instrument.id", "fill.instrument_id")
         Condition.not_none(fill.position_id, "fill.position_id")
 
-        self._events = []         # type: list[OrderFilled]
-        self._execution_ids = []  # type: list[ExecutionId]
+        self._events = []                # type: list[OrderFilled]
+        self._event_count = 0
+        self._execution_ids = []         # type: list[ExecutionId]
+        self._execution_ids_set = set()  # type: set[ExecutionId]
+        self._client_order_ids = set()   # type: set[ClientOrderId]
+        self._venue_order_ids = set()    # type: set[VenueOrderId]
         self._buy_qty = Decimal(0)
         self._sell_qty = Decimal(0)
         self._commissions = {}
@@ -70,6 +80,7 @@ cdef class Position:
         self.id = fill.position_id
         self.account_id = fill.account_id
         self.from_order = fill.client_order_id
+        self.retain_events = retain_events
 
         # Properties
         self.entry = fill.order_side
@@ -154,28 +165,27 @@ cdef class Position:
         }
 
     cdef list client_order_ids_c(self):
-        # Note the inner set {}
-        return sorted(list({fill.client_order_id for fill in self._events}))
+        return sorted(self._client_order_ids)
 
     cdef list venue_order_ids_c(self):
-        # Note the inner set {}
-        return sorted(list({fill.venue_order_id for fill in self._events}))
+        return sorted(self._venue_order_ids)
 
     cdef list execution_ids_c(self):
-        # Checked for duplicate before appending to events
-        return [fill.execution_id for fill in self._events]
+        # Returns the internal append-only list (callers must not mutate)
+        return self._execution_ids
 
     cdef list events_c(self):
-        return self._events.copy()
+        # Returns the internal append-only list (callers must not mutate)
+        return self._events
 
     cdef OrderFilled last_event_c(self):
         return self._events[-1]
 
     cdef ExecutionId last_execution_id_c(self):
-        return self._events[-1].execution_id
+        return self._execution_ids[-1]
 
     cdef int event_count_c(self) except *:
-        return len(self._events)
+        return self._event_count
 
     cdef bint is_open_c(self) except *:
         return self.side != PositionSide.FLAT
@@ -255,19 +265,22 @@ cdef class Position:
         list[ExecutionId]
 
         """
-        return self.execution_ids_c()
+        return self.execution_ids_c().copy()
 
     @property
     def events(self):
         """
         The order fill events of the position.
 
+        If the position does not retain events then only the last order fill
+        event is returned.
+
         Returns
         -------
         list[Event]
 
         """
-        return self.events_c()
+        return self.events_c().copy()
 
     @property
     def last_event(self):
@@ -412,10 +425,17 @@ cdef class Position:
 
         """
         Condition.not_none(fill, "fill")
-        Condition.not_in(fill.execution_id, self._execution_ids, "fill.execution_id", "self._execution_ids")
+        Condition.not_in(fill.execution_id, self._execution_ids_set, "fill.execution_id", "self._execution_ids")
 
-        self._events.append(fill)
+        if self.retain_events or not self._events:
+            self._events.append(fill)
+        else:
+            self._events[0] = fill
+        self._event_count += 1
         self._execution_ids.append(fill.execution_id)
+        self._execution_ids_set.add(fill.execution_id)
+        self._client_order_ids.add(fill.client_order_id)
+        self._venue_order_ids.add(fill.venue_order_id)
 
         # Calculate cumulative commission
         cdef Currency currency = fill.commission.currency
@@ -16,6 +16,27 @@
 from nautilus_trader.common.logging cimport LoggerAdapter
 
 
+cdef class RateLimiter:
+    cdef double _rate
+    cdef double _tokens
+    cdef double _ts_last
+    cdef double _ts_resume
+    cdef object _locks
+
+    cdef readonly double capacity
+    """The maximum request weight per interval.\n\n:returns: `double`"""
+    cdef readonly double interval_secs
+    """The interval (seconds) over which the full capacity refills.\n\n:returns: `double`"""
+
+    cdef void _refill(self) except *
+    cpdef double available(self) except *
+    cpdef void update_used(self, double used) except *
+    cpdef void pause(self, double secs) except *
+
+
+cpdef RateLimiter get_rate_limiter(str key, double capacity, double interval_secs)
+
+
 cdef class HttpClient:
     cdef readonly object _loop
     cdef readonly LoggerAdapter _log
@@ -28,5 +49,9 @@ cdef class HttpClient:
     cdef list _sessions
     cdef int _sessions_idx
     cdef int _sessions_len
+    cdef dict _inflight
+
+    cdef readonly RateLimiter rate_limiter
+    """The rate limiter for the client.\n\n:returns: `RateLimiter` or ``None``"""
 
     cdef object _get_session(self)
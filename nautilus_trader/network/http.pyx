@@ -15,12 +15,15 @@
 
 import asyncio
 import socket
+import time
+import weakref
 from ssl import SSLContext
 from typing import Dict, List, Optional, Union
 
 import aiohttp
 import cython
 from aiohttp import ClientResponse
+from aiohttp import ClientResponseError
 from aiohttp import ClientSession
 from aiohttp import Fingerprint
 
@@ -30,6 +33,154 @@ from nautilus_trader.core.correctness cimport Condition
 
 
 cdef int ONE_DAY = 86_400
+cdef tuple RATE_LIMITED_STATUSES = (418, 429)
+cdef double DEFAULT_RETRY_AFTER_SECS = 60.0
+
+cdef dict _RATE_LIMITERS = {}  # type: dict[str, RateLimiter]
+
+
+cdef class RateLimiter:
+    """
+    Provides a token bucket rate limiter for weighted requests.
+
+    The bucket holds up to `capacity` weight and refills continuously at the
+    rate of `capacity` per `interval_secs`. Waiting requests acquire weight in
+    FIFO order (per event loop, as the limiter may be shared across loops).
+
+    Parameters
+    ----------
+    capacity : double
+        The maximum request weight per interval.
+    interval_secs : double
+        The interval (seconds) over which the full capacity refills.
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+    ValueError
+        If `interval_secs` is not positive (> 0).
+    """
+
+    def __init__(self, double capacity, double interval_secs):
+        Condition.positive(capacity, "capacity")
+        Condition.positive(interval_secs, "interval_secs")
+
+        self.capacity = capacity
+        self.interval_secs = interval_secs
+        self._rate = capacity / interval_secs
+        self._tokens = capacity
+        self._ts_last = time.monotonic()
+        self._ts_resume = 0.0
+        self._locks = weakref.WeakKeyDictionary()  # type: dict[asyncio.AbstractEventLoop, asyncio.Lock]
+
+    cdef void _refill(self) except *:
+        cdef double now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._ts_last) * self._rate)
+        self._ts_last = now
+
+    cpdef double available(self) except *:
+        """
+        Return the request weight currently available.
+
+        Returns
+        -------
+        double
+
+        """
+        self._refill()
+        return self._tokens
+
+    cpdef void update_used(self, double used) except *:
+        """
+        Update the limiter with the weight used in the current interval, as
+        reported by the server.
+
+        The available weight is only ever reduced, as requests may already be
+        in flight which the server has not yet counted.
+
+        Parameters
+        ----------
+        used : double
+            The request weight used in the current interval.
+
+        """
+        self._refill()
+        self._tokens = min(self._tokens, self.capacity - used)
+
+    cpdef void pause(self, double secs) except *:
+        """
+        Pause all requests for the given seconds (such as on a HTTP 429
+        'Retry-After').
+
+        Parameters
+        ----------
+        secs : double
+            The seconds to pause for.
+
+        """
+        self._tokens = 0.0
+        self._ts_last = time.monotonic()
+        self._ts_resume = max(self._ts_resume, self._ts_last + secs)
+
+    async def acquire(self, double weight=1.0):
+        """
+        Acquire the given request weight, waiting until it is available.
+
+        Parameters
+        ----------
+        weight : double, default 1.0
+            The request weight to acquire (capped at `capacity`).
+
+        """
+        weight = min(weight, self.capacity)
+        # An asyncio lock is bound to the loop it is first used on
+        loop = asyncio.get_running_loop()
+        lock = self._locks.get(loop)
+        if lock is None:
+            lock = self._locks[loop] = asyncio.Lock()
+        cdef double now
+        async with lock:
+            while True:
+                self._refill()
+                now = time.monotonic()
+                if now < self._ts_resume:
+                    await asyncio.sleep(self._ts_resume - now)
+                    continue
+                if self._tokens >= weight:
+                    self._tokens -= weight
+                    return
+                await asyncio.sleep((weight - self._tokens) / self._rate)
+
+
+cpdef RateLimiter get_rate_limiter(str key, double capacity, double interval_secs):
+    """
+    Return the rate limiter shared by all clients for the given key.
+
+    The limiter is created on first request for the key (subsequent calls
+    return the existing limiter, whatever the given limits).
+
+    Parameters
+    ----------
+    key : str
+        The key for the rate limiter (such as the venue and API host).
+    capacity : double
+        The maximum request weight per interval.
+    interval_secs : double
+        The interval (seconds) over which the full capacity refills.
+
+    Returns
+    -------
+    RateLimiter
+
+    """
+    Condition.valid_string(key, "key")
+
+    cdef RateLimiter limiter = _RATE_LIMITERS.get(key)
+    if limiter is None:
+        limiter = RateLimiter(capacity, interval_secs)
+        _RATE_LIMITERS[key] = limiter
+    return limiter
 
 
 cdef class HttpClient:
@@ -48,6 +199,8 @@ cdef class HttpClient:
         The ssl context to use for HTTPS.
     connector_kwargs : dict, optional
         The connector key word arguments.
+    rate_limiter : RateLimiter, optional
+        The rate limiter for requests (can be shared between clients).
 
     Raises
     ------
@@ -64,6 +217,7 @@ cdef class HttpClient:
         int ttl_dns_cache=ONE_DAY,
         ssl: Union[None, bool, Fingerprint, SSLContext]=False,
         dict connector_kwargs=None,
+        RateLimiter rate_limiter=None,
     ):
         Condition.positive(ttl_dns_cache, "ttl_dns_cache")
 
@@ -80,6 +234,9 @@ cdef class HttpClient:
         self._sessions: List[ClientSession] = []
         self._sessions_idx = 0
         self._sessions_len = 0
+        self._inflight = {}  # type: dict[tuple, asyncio.Task]
+
+        self.rate_limiter = rate_limiter
 
     @property
     def connected(self) -> bool:
@@ -134,22 +291,98 @@ cdef class HttpClient:
         url: str,
         headers: Optional[Dict[str, str]]=None,
         json: Optional[Dict[str, str]]=None,
+        double weight=1.0,
         **kwargs,
     ) -> ClientResponse:
+        """
+        Make a HTTP request.
+
+        Identical GET requests (same URL, headers and arguments) which are in
+        flight are coalesced into a single request (all callers receive the
+        same response). The shared request runs as its own task, so cancelling
+        any one caller does not cancel the others. If the client has a
+        rate limiter then `weight` is acquired before the request is sent.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method.
+        url : str
+            The URL for the request.
+        headers : dict[str, str], optional
+            The headers for the request.
+        json : dict[str, str], optional
+            The JSON body for the request.
+        weight : double, default 1.0
+            The rate limit weight of the request.
+        kwargs : dict
+            The additional request arguments.
+
+        Returns
+        -------
+        ClientResponse
+
+        """
+        if method != "GET" or json is not None:
+            return await self._request(method, url, headers, json, weight, kwargs)
+
+        # Headers can carry authentication, so requests only coalesce when equal
+        cdef tuple key = (
+            url,
+            repr(sorted(headers.items())) if headers else None,
+            repr(sorted(kwargs.items())) if kwargs else None,
+        )
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._loop.create_task(
+                self._request(method, url, headers, json, weight, kwargs),
+            )
+            self._inflight[key] = task
+
+            def _on_done(done, key=key):
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+                if not done.cancelled():
+                    done.exception()  # Mark retrieved (every caller may have been cancelled)
+
+            task.add_done_callback(_on_done)
+
+        return await asyncio.shield(task)
+
+    async def _request(
+        self,
+        str method,
+        str url,
+        headers,
+        json,
+        double weight,
+        dict kwargs,
+    ) -> ClientResponse:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(weight)
         session: ClientSession = self._get_session()
         if session.closed:
             self._log.warning("Session closed: reconnecting.")
             await self.connect()
-        async with session.request(
-            method=method,
-            url=url,
-            headers=headers,
-            json=json,
-            **kwargs
-        ) as resp:
-            resp.raise_for_status()
-            resp.data = await resp.read()
-            return resp
+        try:
+            async with session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                json=json,
+                **kwargs
+            ) as resp:
+                resp.raise_for_status()
+                resp.data = await resp.read()
+                return resp
+        except ClientResponseError as ex:
+            if self.rate_limiter is not None and ex.status in RATE_LIMITED_STATUSES:
+                retry_after = ex.headers.get("Retry-After") if ex.headers else None
+                self.rate_limiter.pause(
+                    float(retry_after) if retry_after else DEFAULT_RETRY_AFTER_SECS,
+                )
+                self._log.warning(f"Rate limited (HTTP {ex.status}): pausing requests.")
+            raise
 
     async def get(
         self,
@@ -20,14 +20,18 @@ cdef class SocketClient:
     cdef readonly object _loop
     cdef readonly LoggerAdapter _log
 
-    cdef object _reader
-    cdef object _writer
+    cdef object _transport
     cdef object _handler
     cdef bytes _crlf
     cdef str _encoding
     cdef bint _running
-    cdef bint _stopped
-    cdef int _incomplete_read_count
+    cdef bytearray _buffer
+    cdef object _view
+    cdef Py_ssize_t _buffer_end
+    cdef Py_ssize_t _scan_pos
+    cdef bint _write_paused
+    cdef object _drain_waiter
+    cdef object _closed
 
     cdef readonly object host  # TODO(cs): Temporary `object` typing
     """The host for the socket client.\n\n:returns: `str`"""
@@ -37,3 +41,9 @@ cdef class SocketClient:
     """If the socket client is using SSL.\n\n:returns: `bool`"""
     cdef readonly bint is_connected
     """If the socket is connected.\n\n:returns: `bool`"""
+
+    cdef object _get_buffer(self, Py_ssize_t sizehint)
+    cdef void _buffer_updated(self, Py_ssize_t nbytes) except *
+    cdef void _connection_lost(self, exc) except *
+    cdef void _pause_writing(self) except *
+    cdef void _resume_writing(self) except *
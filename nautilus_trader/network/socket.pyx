@@ -26,6 +26,12 @@ cdef class SocketClient:
     """
     Provides a low-level generic socket base client.
 
+    Incoming data is read directly into a reusable receive buffer and split
+    into frames on `crlf`; every complete frame in the buffer is passed to the
+    `handler` as a `memoryview` (without the delimiter) in the same read
+    callback. The view is only valid for the duration of the handler call, as
+    the buffer is reused for later reads; copy it with `bytes(raw)` if needed.
+
     Parameters
     ----------
     loop : asyncio.AbstractEventLoop
@@ -36,14 +42,16 @@ cdef class SocketClient:
         The host for the client.
     port : int
         The port for the client.
-    handler : Callable
-        The handler to process the raw bytes read.
+    handler : Callable[[memoryview], None]
+        The handler to process each raw frame read.
     ssl : bool
         If SSL should be used for socket connection.
     crlf : bytes, optional
         The carriage return, line feed delimiter on which to split messages.
     encoding : str, optional
         The encoding to use when sending messages.
+    buffer_size : int, optional
+        The initial size of the receive buffer (grows for larger frames).
 
     Raises
     ------
@@ -51,6 +59,8 @@ cdef class SocketClient:
         If `host` is not a valid string.
     ValueError
         If `port` is not positive (> 0).
+    ValueError
+        If `buffer_size` is not positive (> 0).
     """
 
     def __init__(
@@ -63,9 +73,11 @@ cdef class SocketClient:
         bint ssl=True,
         bytes crlf=None,
         str encoding="utf-8",
+        int buffer_size=65536,
     ):
         Condition.valid_string(host, "host")
         Condition.positive_int(port, "port")
+        Condition.positive_int(buffer_size, "buffer_size")
 
         self.host = host
         self.port = port
@@ -75,38 +87,43 @@ cdef class SocketClient:
             component_name=type(self).__name__,
             logger=logger,
         )
-        self._reader: Optional[asyncio.StreamReader] = None
-        self._writer: Optional[asyncio.StreamWriter] = None
+        self._transport: Optional[asyncio.Transport] = None
         self._handler = handler
 
         self._crlf = crlf or b"\r\n"
         self._encoding = encoding
         self._running = False
-        self._stopped = False
-        self._incomplete_read_count = 0
+
+        self._buffer = bytearray(buffer_size)
+        self._view = memoryview(self._buffer)
+        self._buffer_end = 0
+        self._scan_pos = 0
+        self._write_paused = False
+        self._drain_waiter: Optional[asyncio.Future] = None
+        self._closed: Optional[asyncio.Future] = None
         self.is_connected = False
 
     async def connect(self):
         if not self.is_connected:
-            self._reader, self._writer = await asyncio.open_connection(
+            self._buffer_end = 0
+            self._scan_pos = 0
+            self._closed = self._loop.create_future()
+            self._transport, _ = await self._loop.create_connection(
+                lambda: _SocketProtocol(self),
                 host=self.host,
                 port=self.port,
-                loop=self._loop,
                 ssl=self.ssl,
             )
-            await self.post_connection()
-            self._loop.create_task(self.start())
             self._running = True
             self.is_connected = True
+            await self.post_connection()
 
     async def disconnect(self):
         self.stop()
-        while not self._stopped:
-            await asyncio.sleep(0.01)
-        self._writer.close()
-        await self._writer.wait_closed()
-        self._reader = None
-        self._writer = None
+        if self._transport is not None:
+            self._transport.close()
+            await self._closed
+        self._transport = None
         self.is_connected = False
 
     def stop(self):
@@ -124,37 +141,79 @@ cdef class SocketClient:
 
     async def send(self, bytes raw):
         self._log.debug("[SEND] " + raw.decode())
-        self._writer.write(raw + self._crlf)
-        await self._writer.drain()
+        # Vectored write avoids concatenating the message with the delimiter
+        self._transport.writelines((raw, self._crlf))
+        if self._write_paused:
+            self._drain_waiter = self._loop.create_future()
+            await self._drain_waiter
 
     async def start(self):
-        self._log.debug("Starting recv loop")
-
-        cdef:
-            bytes partial = b""
-            bytes raw = b""
-        while self._running:
-            try:
-                raw = await self._reader.readuntil(separator=self._crlf)
-                if partial:
-                    raw += partial
-                    partial = b""
-                self._log.debug("[RECV] " + raw.decode())
-                self._handler(raw.rstrip(self._crlf))
-                self._incomplete_read_count = 0
-                await self._sleep0()
-            except asyncio.IncompleteReadError as ex:
-                partial = ex.partial
-                self._log.warning(str(ex))
-                self._incomplete_read_count += 1
-                if self._incomplete_read_count > 100:
-                    # Something probably wrong; disconnect and let upstream client handle reconnection logic
-                    await self.disconnect()
-                await self._sleep0()
-                continue
-            except ConnectionResetError:
-                await self.connect()
-        self._stopped = True
+        """
+        Wait until the connection is closed.
+
+        Frames are read and handled by the protocol callbacks as data arrives,
+        so there is no receive loop to run.
+        """
+        if self._closed is not None:
+            await asyncio.shield(self._closed)
+
+    cdef object _get_buffer(self, Py_ssize_t sizehint):
+        cdef Py_ssize_t capacity = len(self._buffer)
+        cdef bytearray buffer
+        if capacity - self._buffer_end < capacity // 4:
+            # Buffer is mostly taken by a single partial frame; grow into a new
+            # buffer (the existing one can't be resized while views are exported)
+            buffer = bytearray(max(capacity * 2, self._buffer_end + sizehint))
+            buffer[:self._buffer_end] = self._view[:self._buffer_end]
+            self._buffer = buffer
+            self._view = memoryview(buffer)
+        return self._view[self._buffer_end:]
+
+    cdef void _buffer_updated(self, Py_ssize_t nbytes) except *:
+        self._buffer_end += nbytes
+
+        cdef bytearray buffer = self._buffer
+        cdef bytes crlf = self._crlf
+        cdef Py_ssize_t crlf_len = len(crlf)
+        cdef Py_ssize_t start = 0
+        cdef Py_ssize_t end = buffer.find(crlf, self._scan_pos, self._buffer_end)
+        while end != -1:
+            if self._running:
+                try:
+                    self._handler(self._view[start:end])
+                except Exception as ex:
+                    self._log.exception(ex)
+            start = end + crlf_len
+            end = buffer.find(crlf, start, self._buffer_end)
+
+        cdef Py_ssize_t remaining = self._buffer_end - start
+        if start > 0:
+            # Move the trailing partial frame (if any) to the front of the buffer
+            if remaining > 0:
+                buffer[:remaining] = buffer[start:self._buffer_end]
+            self._buffer_end = remaining
+        # Resume the delimiter search where a split delimiter could begin
+        self._scan_pos = max(0, remaining - crlf_len + 1)
+
+    cdef void _connection_lost(self, exc) except *:
+        self.is_connected = False
+        if self._drain_waiter is not None and not self._drain_waiter.done():
+            self._drain_waiter.set_result(None)
+        if self._closed is not None and not self._closed.done():
+            self._closed.set_result(None)
+        if self._running:
+            # Connection dropped without a disconnect; reconnect and let
+            # upstream client handle any resubscription in `post_connection`
+            self._log.warning(f"Connection lost ({exc}), reconnecting")
+            self._loop.create_task(self.connect())
+
+    cdef void _pause_writing(self) except *:
+        self._write_paused = True
+
+    cdef void _resume_writing(self) except *:
+        self._write_paused = False
+        if self._drain_waiter is not None and not self._drain_waiter.done():
+            self._drain_waiter.set_result(None)
 
     @types.coroutine
     def _sleep0(self):
@@ -166,3 +225,30 @@ cdef class SocketClient:
         # Uses a bare 'yield' expression (which Task.__step knows how to handle)
         # instead of creating a Future object.
         yield
+
+
+class _SocketProtocol(asyncio.BufferedProtocol):
+    """
+    Forwards the buffered protocol callbacks to the `SocketClient`.
+    """
+
+    def __init__(self, SocketClient client not None):
+        self._client = client
+
+    def get_buffer(self, sizehint):
+        return (<SocketClient>self._client)._get_buffer(sizehint)
+
+    def buffer_updated(self, nbytes):
+        (<SocketClient>self._client)._buffer_updated(nbytes)
+
+    def eof_received(self):
+        return False  # Close the transport
+
+    def connection_lost(self, exc):
+        (<SocketClient>self._client)._connection_lost(exc)
+
+    def pause_writing(self):
+        (<SocketClient>self._client)._pause_writing()
+
+    def resume_writing(self):
+        (<SocketClient>self._client)._resume_writing()
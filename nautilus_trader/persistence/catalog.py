@@ -15,7 +15,8 @@
 
 import os
 import pathlib
-from typing import Dict, List, Optional, Union
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Union
 
 import fsspec
 import pandas as pd
@@ -58,6 +59,9 @@ class DataCatalog(metaclass=Singleton):
         The file system protocol to use.
     fs_storage_options : Dict, optional
         The fs storage options.
+    query_cache_max_bytes : int, default 100_000_000
+        The maximum total size in bytes of decoded query results to cache (LRU),
+        zero disables caching. The cache is cleared by the catalog write paths.
     """
 
     def __init__(
@@ -65,6 +69,7 @@ class DataCatalog(metaclass=Singleton):
         path: str,
         fs_protocol: str = "file",
         fs_storage_options: Optional[Dict] = None,
+        query_cache_max_bytes: int = 100_000_000,
     ):
         self.path = pathlib.Path(path)
         self.fs_protocol = fs_protocol
@@ -72,6 +77,9 @@ class DataCatalog(metaclass=Singleton):
         self.fs: fsspec.AbstractFileSystem = fsspec.filesystem(
             self.fs_protocol, **self.fs_storage_options
         )
+        self.query_cache_max_bytes = query_cache_max_bytes
+        self._query_cache: OrderedDict = OrderedDict()
+        self._query_cache_bytes = 0
 
     @classmethod
     def from_env(cls):
@@ -84,6 +92,36 @@ class DataCatalog(metaclass=Singleton):
         protocol, path = uri.split("://")
         return cls(path=path, fs_protocol=protocol)
 
+    # ---- QUERY CACHE ------------------------------------------------------------------------------------ #
+
+    def clear_cache(self):
+        """
+        Clear the cached query results.
+        """
+        self._query_cache.clear()
+        self._query_cache_bytes = 0
+
+    def _cache_get(self, key: Optional[Hashable]):
+        if key is None or key not in self._query_cache:
+            return None
+        self._query_cache.move_to_end(key)
+        return _copy_result(self._query_cache[key][0])
+
+    def _cache_put(self, key: Optional[Hashable], result, nbytes: int):
+        # Return the result for the caller, which is a copy if the result was
+        # cached (so each query copies the result only once)
+        if key is None or not 0 < nbytes <= self.query_cache_max_bytes:
+            return result
+        previous = self._query_cache.pop(key, None)
+        if previous is not None:
+            self._query_cache_bytes -= previous[1]
+        self._query_cache[key] = (result, nbytes)
+        self._query_cache_bytes += nbytes
+        while self._query_cache_bytes > self.query_cache_max_bytes:
+            _, (_, evicted_bytes) = self._query_cache.popitem(last=False)
+            self._query_cache_bytes -= evicted_bytes
+        return _copy_result(result)
+
     # ---- QUERIES ---------------------------------------------------------------------------------------- #
 
     def _query(
@@ -101,6 +139,24 @@ class DataCatalog(metaclass=Singleton):
         as_dataframe=True,
         **kwargs,
     ):
+        key = _make_query_key(
+            cls,
+            filter_expr,
+            instrument_ids,
+            start,
+            end,
+            ts_column,
+            raise_on_empty,
+            instrument_id_column,
+            table_kwargs,
+            clean_instrument_keys,
+            as_dataframe,
+            kwargs,
+        )
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         filters = [filter_expr] if filter_expr is not None else []
         if instrument_ids is not None:
             if not isinstance(instrument_ids, list):
@@ -124,11 +180,12 @@ class DataCatalog(metaclass=Singleton):
         table = dataset.to_table(filter=combine_filters(*filters), **(table_kwargs or {}))
         mappings = self.load_inverse_mappings(path=full_path)
         if as_dataframe:
-            return self._handle_table_dataframe(
+            result = self._handle_table_dataframe(
                 table=table, mappings=mappings, raise_on_empty=raise_on_empty, **kwargs
             )
         else:
-            return self._handle_table_nautilus(table=table, cls=cls, mappings=mappings)
+            result = self._handle_table_nautilus(table=table, cls=cls, mappings=mappings)
+        return self._cache_put(key, result, nbytes=_result_nbytes(result, table))
 
     def load_inverse_mappings(self, path):
         mappings = load_mappings(fs=self.fs, path=path)
@@ -265,7 +322,7 @@ class DataCatalog(metaclass=Singleton):
         else:
             base_cls = Instrument
 
-        return self._query_subclasses(
+        result = self._query_subclasses(
             base_cls=base_cls,
             instrument_ids=instrument_ids,
             filter_expr=filter_expr,
@@ -275,6 +332,13 @@ class DataCatalog(metaclass=Singleton):
             **kwargs,
         )
 
+        # Instruments are stored append-only, so keep the latest row written for each `id`
+        if as_nautilus:
+            return list({instrument.id: instrument for instrument in result}.values())
+        elif "id" in result.columns:
+            return result.drop_duplicates(subset=["id"], keep="last")
+        return result
+
     def instrument_status_updates(
         self, instrument_ids=None, filter_expr=None, as_nautilus=False, **kwargs
     ):
@@ -389,6 +453,43 @@ class DataCatalog(metaclass=Singleton):
         return self._read_feather(kind="backtest", run_id=backtest_run_id, **kwargs)
 
 
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    elif isinstance(value, (list, tuple)):
+        return tuple(map(_freeze, value))
+    elif isinstance(value, (set, frozenset)):
+        return tuple(sorted(map(_freeze, value), key=str))
+    elif isinstance(value, ds.Expression):
+        return str(value)
+    return value
+
+
+def _make_query_key(*args) -> Optional[Hashable]:
+    key = tuple(_freeze(arg) for arg in args)
+    try:
+        hash(key)
+    except TypeError:  # Unhashable arguments, do not cache
+        return None
+    return key
+
+
+def _result_nbytes(result, table: pa.Table) -> int:
+    if isinstance(result, pd.DataFrame):
+        return int(result.memory_usage(index=True, deep=True).sum())
+    # Decoded objects are sized from the arrow table they were decoded from
+    return table.nbytes
+
+
+def _copy_result(result):
+    # Cached results are handed out as copies so callers can't mutate the cache
+    if isinstance(result, pd.DataFrame):
+        return result.copy()
+    elif isinstance(result, list):
+        return list(result)
+    return result
+
+
 def combine_filters(*filters):
     filters = tuple(x for x in filters if x is not None)
     if len(filters) == 0:
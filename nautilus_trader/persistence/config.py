@@ -34,6 +34,8 @@ class PersistenceConfig(pydantic.BaseModel):
         Persist log file to catalog
     flush_interval : int
         How often to write chunks, in milliseconds
+    batch_size : int
+        The number of rows per table to buffer before writing a record batch
     """
 
     catalog_path: str
@@ -42,6 +44,7 @@ class PersistenceConfig(pydantic.BaseModel):
     fs_storage_options: Optional[Dict] = None
     persist_logs: bool = False
     flush_interval: Optional[int] = None
+    batch_size: int = 1000
     replace_existing: bool = False
 
     @classmethod
@@ -15,6 +15,7 @@
 
 import pathlib
 import re
+import time
 from itertools import groupby
 from typing import Dict, List, Optional, Tuple, Union
 
@@ -34,7 +35,9 @@ from tqdm import tqdm
 from nautilus_trader.model.data.base import GenericData
 from nautilus_trader.model.instruments.base import Instrument
 from nautilus_trader.persistence.catalog import DataCatalog
+from nautilus_trader.persistence.external.metadata import load_primary_key_index
 from nautilus_trader.persistence.external.metadata import write_partition_column_mappings
+from nautilus_trader.persistence.external.metadata import write_primary_key_index
 from nautilus_trader.persistence.external.readers import Reader
 from nautilus_trader.persistence.external.synchronization import named_lock
 from nautilus_trader.serialization.arrow.serializer import ParquetSerializer
@@ -196,21 +199,122 @@ def determine_partition_cols(cls: type, instrument_id: str = None) -> Union[List
     return None
 
 
-def merge_existing_data(catalog: DataCatalog, cls: type, df: pd.DataFrame) -> pd.DataFrame:
+def is_instrument_class(cls: type) -> bool:
     """
-    Handle existing data for instrument subclasses.
+    Return a value indicating whether `cls` is stored in an (append-only) instruments dataset.
+    """
+    return cls in Instrument.__subclasses__()
+
+
+# Instruments are often rebuilt with the current time, so the timestamps are
+# excluded from the primary key hash of the instrument definition.
+_INSTRUMENT_HASH_EXCLUDED_COLUMNS = ("ts_event", "ts_init")
+
+
+def _instrument_hashes(df: pd.DataFrame, columns: List[str]) -> List[str]:
+    columns = [
+        c for c in columns if c in df.columns and c not in _INSTRUMENT_HASH_EXCLUDED_COLUMNS
+    ]
+    hashes = pd.util.hash_pandas_object(df[columns], index=False)
+    return [format(h, "x") for h in hashes.to_numpy()]
+
+
+_LAST_BASENAME_NS = 0
+
+
+def _timestamped_basename_template() -> str:
+    # Matches the `{start}-{end}-{i}` naming of data files, so instrument files
+    # sort (and are therefore read) in the order they were written.
+    global _LAST_BASENAME_NS
+    now = max(time.time_ns(), _LAST_BASENAME_NS + 1)
+    _LAST_BASENAME_NS = now
+    return f"{now}-{now}" + "-{i}.parquet"
+
+
+def write_instruments(
+    fs: fsspec.AbstractFileSystem,
+    path: str,
+    df: pd.DataFrame,
+    schema: pa.Schema,
+    **kwargs,
+) -> int:
+    """
+    Append any new or changed instruments in `df` to the instruments dataset at `path`.
+
+    Instruments are keyed on `id`. A primary key index of hashes of each
+    instrument definition (excluding the `ts_event` and `ts_init` timestamps) is
+    stored alongside the dataset, so unchanged instruments are skipped without
+    reading any existing instrument data. Superseded rows are left in place until the
+    dataset is compacted with `compact_instruments`.
+
+    Returns
+    -------
+    int
+        The number of rows appended.
 
-    Instruments all live in a single file, so merge with existing data.
-    For all other classes, simply return data unchanged.
     """
-    if cls not in Instrument.__subclasses__():
-        return df
-    else:
-        try:
-            existing = catalog.instruments(instrument_type=cls)
-            return existing.append(df.drop(["type"], axis=1)).drop_duplicates()
-        except pa.lib.ArrowInvalid:
-            return df
+    df = df.drop(["type"], axis=1, errors="ignore").drop_duplicates(subset=["id"], keep="last")
+    index = load_primary_key_index(fs=fs, path=path)
+    hashes = _instrument_hashes(df, columns=schema.names)
+    changed = [index.get(instrument_id) != h for instrument_id, h in zip(df["id"], hashes)]
+    if not any(changed):
+        return 0
+
+    new = df.loc[changed]
+    kwargs["basename_template"] = _timestamped_basename_template()
+    write_parquet(fs=fs, path=path, df=new, partition_cols=None, schema=schema, **kwargs)
+    index.update(
+        {instrument_id: h for instrument_id, h, c in zip(df["id"], hashes, changed) if c}
+    )
+    write_primary_key_index(fs=fs, path=path, index=index)
+    return len(new)
+
+
+def compact_instruments(catalog: DataCatalog, instrument_type: Optional[type] = None):
+    """
+    Compact the append-only instruments datasets in the catalog.
+
+    Each dataset is rewritten as a single file containing only the latest row
+    for each instrument `id`, and the primary key index is rebuilt.
+
+    Parameters
+    ----------
+    catalog : DataCatalog
+        The catalog to compact.
+    instrument_type : type, optional
+        The instrument class to compact. If ``None`` then compacts all instrument classes.
+
+    """
+    classes = [instrument_type] if instrument_type is not None else Instrument.__subclasses__()
+    fs = catalog.fs
+    for cls in classes:
+        name = f"{class_to_filename(cls)}.parquet"
+        path = f"{catalog.path}/data/{name}"
+        if not fs.exists(path):
+            continue
+        with named_lock(name):
+            dataset = ds.dataset(path, filesystem=fs)
+            filenames = sorted(dataset.files)
+            if not filenames:
+                continue
+            table = ds.dataset(filenames, filesystem=fs).to_table()
+            df = table.to_pandas().drop_duplicates(subset=["id"], keep="last")
+
+            write_parquet(
+                fs=fs,
+                path=path,
+                df=df,
+                partition_cols=None,
+                schema=get_schema(cls),
+                basename_template=_timestamped_basename_template(),
+            )
+            for fn in filenames:
+                fs.rm(fn)
+
+            index = dict(zip(df["id"], _instrument_hashes(df, columns=get_schema(cls).names)))
+            write_primary_key_index(fs=fs, path=path, index=index)
+
+    catalog.clear_cache()
 
 
 def write_tables(catalog: DataCatalog, tables: Dict[type, Dict[str, pd.DataFrame]], **kwargs):
@@ -234,18 +338,22 @@ def write_tables(catalog: DataCatalog, tables: Dict[type, Dict[str, pd.DataFrame
         partition_cols = determine_partition_cols(cls=cls, instrument_id=instrument_id)
         name = f"{class_to_filename(cls)}.parquet"
         path = f"{catalog.path}/data/{name}"
-        merged = merge_existing_data(catalog=catalog, cls=cls, df=df)
         with named_lock(name):
-            write_parquet(
-                fs=catalog.fs,
-                path=path,
-                df=merged,
-                partition_cols=partition_cols,
-                schema=schema,
-                **kwargs,
-            )
+            if is_instrument_class(cls):
+                write_instruments(fs=catalog.fs, path=path, df=df, schema=schema, **kwargs)
+            else:
+                write_parquet(
+                    fs=catalog.fs,
+                    path=path,
+                    df=df,
+                    partition_cols=partition_cols,
+                    schema=schema,
+                    **kwargs,
+                )
         rows_written += len(df)
 
+    catalog.clear_cache()
+
     return rows_written
 
 
@@ -370,8 +478,14 @@ def _validate_dataset(catalog: DataCatalog, path: str, new_partition_format="%Y%
         for fn in filenames:
             fs.rm(fn)
 
+    catalog.clear_cache()
+
 
 def validate_data_catalog(catalog: DataCatalog, **kwargs):
+    instrument_classes = {class_to_filename(cls): cls for cls in Instrument.__subclasses__()}
     for cls in catalog.list_data_types():
+        if cls in instrument_classes:
+            compact_instruments(catalog=catalog, instrument_type=instrument_classes[cls])
+            continue
         path = f"{catalog.path}/data/{cls}.parquet"
         _validate_dataset(catalog=catalog, path=path, **kwargs)
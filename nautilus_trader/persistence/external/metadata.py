@@ -21,6 +21,7 @@ from fsspec.utils import infer_storage_options
 
 
 PARTITION_MAPPINGS_FN = "_partition_mappings.json"
+PRIMARY_KEY_INDEX_FN = "_primary_key_index.json"
 
 
 def load_mappings(fs, path) -> Dict:
@@ -35,6 +36,18 @@ def write_partition_column_mappings(fs, path, mappings) -> None:
         f.write(orjson.dumps(mappings))
 
 
+def load_primary_key_index(fs, path) -> Dict[str, str]:
+    if not fs.exists(f"{path}/{PRIMARY_KEY_INDEX_FN}"):
+        return {}
+    with fs.open(f"{path}/{PRIMARY_KEY_INDEX_FN}", "rb") as f:
+        return orjson.loads(f.read())
+
+
+def write_primary_key_index(fs, path, index: Dict[str, str]) -> None:
+    with fs.open(f"{path}/{PRIMARY_KEY_INDEX_FN}", "wb") as f:
+        f.write(orjson.dumps(index))
+
+
 def _glob_path_to_fs(glob_path):
     inferred = infer_storage_options(glob_path)
     inferred.pop("path", None)
@@ -15,7 +15,10 @@
 
 import datetime
 import pathlib
-from typing import BinaryIO, Dict
+import queue
+import threading
+import time
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
 
 import fsspec
 import pyarrow as pa
@@ -33,12 +36,51 @@ from nautilus_trader.serialization.arrow.serializer import list_schemas
 from nautilus_trader.serialization.arrow.util import list_dicts_to_dict_lists
 
 
+_FLUSH = object()
+_STOP = object()
+
+
 class FeatherWriter:
     """
     Provides a stream writer of Nautilus objects into feather files.
+
+    Objects are serialized on the calling thread and buffered per table. Once a
+    table buffer reaches `batch_size` rows (or the buffers are older than
+    `flush_interval`), the rows are handed to a background thread which encodes
+    them as a single record batch and performs the file IO. At most
+    `max_queued_batches` batches are queued for the background thread, beyond
+    which `write` blocks until the thread catches up (so a slow disk cannot grow
+    memory without bound). The first error raised on the background thread is
+    re-raised from the next call to `write`, `check_flush`, `flush` or `close`.
+
+    Parameters
+    ----------
+    path : str
+        The directory path for the feather files.
+    fs_protocol : str, default "file"
+        The fsspec filesystem protocol.
+    flush_interval : int or timedelta, optional
+        The maximum age of buffered rows before being written, if an `int` then
+        milliseconds. If ``None`` then defaults to 1000ms.
+    replace : bool, default False
+        If any existing feather files at `path` should be replaced.
+    batch_size : int, default 1000
+        The number of rows per table to accumulate before emitting a record batch.
+    max_queued_batches : int, default 16
+        The maximum number of record batches queued for the background thread.
     """
 
-    def __init__(self, path: str, fs_protocol: str = "file", flush_interval=None, replace=False):
+    def __init__(
+        self,
+        path: str,
+        fs_protocol: str = "file",
+        flush_interval: Optional[Union[int, datetime.timedelta]] = None,
+        replace: bool = False,
+        batch_size: int = 1000,
+        max_queued_batches: int = 16,
+    ):
+        assert batch_size > 0, "`batch_size` must be positive"
+        assert max_queued_batches > 0, "`max_queued_batches` must be positive"
         self.fs: fsspec.AbstractFileSystem = fsspec.filesystem(fs_protocol)
         self.path = str(self._check_path(path))
         if self.fs.exists(self.path) and replace:
@@ -55,10 +97,27 @@ class FeatherWriter:
             }
         )
         self._files: Dict[type, BinaryIO] = {}
-        self._writers: Dict[type, RecordBatchStreamWriter] = {}
+        self._writers: Dict[str, RecordBatchStreamWriter] = {}
+        self._table_schemas: Dict[str, pa.Schema] = {}
         self._create_writers()
+        if isinstance(flush_interval, int):
+            flush_interval = datetime.timedelta(milliseconds=flush_interval)
         self.flush_interval = flush_interval or datetime.timedelta(milliseconds=1000)
-        self._last_flush = datetime.datetime(1970, 1, 1)
+        self.batch_size = batch_size
+
+        # Buffers are swapped out under the lock, all IO happens on the flush thread
+        self._buffers: Dict[str, List[Dict]] = {}
+        self._lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queued_batches)
+        self._error: Optional[Exception] = None
+        self._last_flush = time.monotonic()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"FeatherWriter-{pathlib.Path(self.path).name}",
+            daemon=True,
+        )
+        self._thread.start()
 
     def _check_path(self, p):
         path = pathlib.Path(p)
@@ -79,9 +138,12 @@ class FeatherWriter:
             f = self.fs.open(str(full_path), "wb")
             self._files[cls] = f
             self._writers[table_name] = pa.ipc.new_stream(f, schema)
+            self._table_schemas[table_name] = schema
 
     def write(self, obj: object):
         assert obj is not None
+        assert not self._closed, "Writer is closed"
+        self._raise_error()
         cls = obj.__class__
         if isinstance(obj, GenericData):
             cls = obj.data_type.type
@@ -89,33 +151,111 @@ class FeatherWriter:
         if table not in self._writers:
             print(f"Can't find writer for cls: {cls}")
             return
-        writer = self._writers[table]
         serialized = ParquetSerializer.serialize(obj)
-        if isinstance(serialized, dict):
-            serialized = [serialized]
-        data = list_dicts_to_dict_lists(
-            serialized,
-            keys=self._schemas[cls].names,
-        )
-        data = list(data.values())
-        batch = pa.record_batch(data, schema=self._schemas[cls])
-        writer.write_batch(batch)
-        self.check_flush()
+        with self._lock:
+            rows = self._buffers.get(table)
+            if rows is None:
+                rows = self._buffers[table] = []
+            if isinstance(serialized, dict):
+                rows.append(serialized)
+            else:
+                rows.extend(serialized)
+            if len(rows) < self.batch_size:
+                return
+            self._buffers[table] = []
+        # Enqueue outside the lock, as a full queue blocks until the flush
+        # thread (which also takes the lock) has caught up
+        self._queue.put((table, rows))
 
     def check_flush(self):
-        now = datetime.datetime.now()
-        if now - self._last_flush > self.flush_interval:
+        """
+        Flush if the flush interval has elapsed since the last flush.
+
+        The flush thread also flushes on the interval, so calling this is only
+        required to bound the age of written rows while the writer is busy.
+        """
+        self._raise_error()
+        if time.monotonic() - self._last_flush > self.flush_interval.total_seconds():
             self.flush()
-            self._last_flush = now
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise self._error
 
     def flush(self):
-        for cls in self._files:
-            self._files[cls].flush()
+        """
+        Write all buffered rows and flush the underlying files.
+
+        Blocks until the flush thread has completed the writes.
+        """
+        if self._closed:
+            return
+        done = threading.Event()
+        self._queue.put((_FLUSH, done))
+        done.wait()
+        self._raise_error()
 
     def close(self):
-        self.flush()
-        for cls in self._writers:
-            self._writers[cls].close()
+        """
+        Flush all buffered rows, then stop the flush thread and close the writers.
+
+        The flush thread is stopped and the writers closed even if the flush raises.
+        """
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+            self._queue.put((_STOP, None))
+            self._thread.join()
+            for table in self._writers:
+                self._writers[table].close()
+
+    def _swap_buffers(self) -> List[Tuple[str, List[Dict]]]:
+        with self._lock:
+            pending = [(table, rows) for table, rows in self._buffers.items() if rows]
+            self._buffers = {}
+        return pending
+
+    def _run(self):
+        interval = self.flush_interval.total_seconds()
+        while True:
+            try:
+                table, payload = self._queue.get(timeout=interval)
+            except queue.Empty:
+                table, payload = _FLUSH, None
+            try:
+                if table is _STOP:
+                    return
+                elif table is _FLUSH:
+                    for pending_table, rows in self._swap_buffers():
+                        self._write_rows(pending_table, rows)
+                    self._flush_files()
+                    self._last_flush = time.monotonic()
+                else:
+                    self._write_rows(table, payload)
+                    if time.monotonic() - self._last_flush > interval:
+                        for pending_table, rows in self._swap_buffers():
+                            self._write_rows(pending_table, rows)
+                        self._flush_files()
+                        self._last_flush = time.monotonic()
+            except Exception as e:
+                if self._error is None:  # Keep the first error
+                    self._error = e
+            finally:
+                if table is _FLUSH and payload is not None:
+                    payload.set()
+
+    def _write_rows(self, table: str, rows: List[Dict]):
+        schema = self._table_schemas[table]
+        data = list_dicts_to_dict_lists(rows, keys=schema.names)
+        batch = pa.record_batch(list(data.values()), schema=schema)
+        self._writers[table].write_batch(batch)
+
+    def _flush_files(self):
+        for cls in self._files:
+            self._files[cls].flush()
 
 
 def read_feather(path: str, fs: fsspec.AbstractFileSystem = None):
@@ -40,8 +40,23 @@ class Singleton(type):
     def __init__(cls, name, bases, dict_like):
         super(Singleton, cls).__init__(name, bases, dict_like)
         cls._instances = {}
+        cls._instances_by_call = {}
 
     def __call__(cls, *args, **kw):
+        # Fast path: the exact call arguments have been seen before (avoids
+        # resolving the full signature on every construction).
+        try:
+            call_key = (
+                tuple(check_value(v) for v in args),
+                tuple(sorted((k, check_value(v)) for k, v in kw.items())),
+            )
+            instance = cls._instances_by_call.get(call_key)
+        except TypeError:  # Unhashable arguments
+            call_key = None
+            instance = None
+        if instance is not None:
+            return instance
+
         full_kwargs = resolve_kwargs(cls.__init__, None, *args, **kw)
         if full_kwargs == {"self": None, "args": (), "kwargs": {}}:
             full_kwargs = {}
@@ -49,9 +64,12 @@ class Singleton(type):
         key = tuple(full_kwargs.items())
         if key not in cls._instances:
             cls._instances[key] = super(Singleton, cls).__call__(*args, **kw)
+        if call_key is not None:
+            cls._instances_by_call[call_key] = cls._instances[key]
         return cls._instances[key]
 
 
 def clear_singleton_instances(cls: type):
     assert isinstance(cls, Singleton)
     cls._instances = {}
+    cls._instances_by_call = {}
@@ -20,15 +20,16 @@ from nautilus_trader.common.clock cimport Clock
 from nautilus_trader.common.logging cimport LoggerAdapter
 from nautilus_trader.common.uuid cimport UUIDFactory
 from nautilus_trader.model.c_enums.order_side cimport OrderSide
+from nautilus_trader.model.c_enums.position_side cimport PositionSide
 from nautilus_trader.model.data.tick cimport QuoteTick
 from nautilus_trader.model.events.account cimport AccountState
 from nautilus_trader.model.events.order cimport OrderEvent
 from nautilus_trader.model.events.position cimport PositionEvent
 from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.identifiers cimport PositionId
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.objects cimport Money
-from nautilus_trader.model.objects cimport Price
-from nautilus_trader.model.position cimport Position
+from nautilus_trader.model.objects cimport Quantity
 from nautilus_trader.msgbus.bus cimport MessageBus
 from nautilus_trader.portfolio.base cimport PortfolioFacade
 
@@ -44,6 +45,9 @@ cdef class Portfolio(PortfolioFacade):
     cdef dict _unrealized_pnls
     cdef dict _net_positions
     cdef set _pending_calcs
+    cdef dict _xrates
+    cdef dict _position_contributions
+    cdef dict _position_aggregates
 
 # -- COMMANDS --------------------------------------------------------------------------------------
 
@@ -58,7 +62,10 @@ cdef class Portfolio(PortfolioFacade):
 # -- INTERNAL --------------------------------------------------------------------------------------
 
     cdef object _net_position(self, InstrumentId instrument_id)
-    cdef void _update_net_position(self, InstrumentId instrument_id, list positions_open) except *
+    cdef void _update_position_aggregate(self, InstrumentId instrument_id, PositionId position_id, PositionSide side, Quantity quantity, avg_px_open) except *
+    cdef void _log_net_position(self, InstrumentId instrument_id) except *
     cdef Money _calculate_unrealized_pnl(self, InstrumentId instrument_id)
+    cdef void _log_insufficient_xrate_data(self, Account account, Instrument instrument) except *
+    cdef object _calculate_net_exposure(self, Account account, Instrument instrument, list aggregate, tuple prices)
     cdef object _calculate_xrate_to_base(self, Account account, Instrument instrument, OrderSide side)
-    cdef Price _get_last_price(self, Position position)
+    cdef tuple _get_last_prices(self, InstrumentId instrument_id)
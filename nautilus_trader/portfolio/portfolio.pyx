@@ -25,6 +25,7 @@ total risk exposures and total net positions.
 """
 
 from decimal import Decimal
+from typing import Optional
 
 from nautilus_trader.accounting.accounts.base cimport Account
 from nautilus_trader.accounting.factory cimport AccountFactory
@@ -47,14 +48,17 @@ from nautilus_trader.model.events.account cimport AccountState
 from nautilus_trader.model.events.order cimport OrderAccepted
 from nautilus_trader.model.events.order cimport OrderCanceled
 from nautilus_trader.model.events.order cimport OrderEvent
+from nautilus_trader.model.events.order cimport OrderExpired
 from nautilus_trader.model.events.order cimport OrderFilled
 from nautilus_trader.model.events.order cimport OrderRejected
 from nautilus_trader.model.events.order cimport OrderUpdated
 from nautilus_trader.model.events.position cimport PositionEvent
 from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.identifiers cimport PositionId
 from nautilus_trader.model.identifiers cimport Venue
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.objects cimport Money
+from nautilus_trader.model.objects cimport Quantity
 from nautilus_trader.model.orders.base cimport Order
 from nautilus_trader.model.position cimport Position
 from nautilus_trader.msgbus.bus cimport MessageBus
@@ -64,12 +68,17 @@ from nautilus_trader.portfolio.base cimport PortfolioFacade
 cdef tuple _UPDATE_ORDER_EVENTS = (
     OrderAccepted,
     OrderCanceled,
+    OrderExpired,
     OrderRejected,
     OrderUpdated,
     OrderFilled,
 )
 
 
+cdef inline bint _has_open_quantity(list aggregate) except *:
+    return aggregate[0] != 0 or aggregate[3] != 0
+
+
 cdef class Portfolio(PortfolioFacade):
     """
     Provides a trading portfolio.
@@ -110,6 +119,11 @@ cdef class Portfolio(PortfolioFacade):
         self._unrealized_pnls = {}   # type: dict[InstrumentId, Money]
         self._net_positions = {}     # type: dict[InstrumentId, Decimal]
         self._pending_calcs = set()  # type: set[InstrumentId]
+        self._xrates = {}            # type: dict[tuple, Decimal]
+
+        # Open position aggregates maintained from position events
+        self._position_contributions = {}  # type: dict[InstrumentId, dict[PositionId, tuple]]
+        self._position_aggregates = {}     # type: dict[InstrumentId, list]
 
         # Register endpoints
         self._msgbus.register(endpoint="Portfolio.update_account", handler=self.update_account)
@@ -189,24 +203,27 @@ cdef class Portfolio(PortfolioFacade):
         """
         # Clean slate
         self._unrealized_pnls.clear()
+        self._position_contributions.clear()
+        self._position_aggregates.clear()
 
         cdef list all_positions_open = self._cache.positions_open()
 
         cdef set instruments = set()
+        cdef Position position
         for position in all_positions_open:
             instruments.add(position.instrument_id)
+            self._update_position_aggregate(
+                instrument_id=position.instrument_id,
+                position_id=position.id,
+                side=position.side,
+                quantity=position.quantity,
+                avg_px_open=position.avg_px_open,
+            )
 
         # Update maintenance (position) margins to initialize portfolio
         initialized = True
         for instrument_id in instruments:
-            positions_open = self._cache.positions_open(
-                venue=None,  # Faster query filtering
-                instrument_id=instrument_id,
-            )
-            self._update_net_position(
-                instrument_id=instrument_id,
-                positions_open=positions_open,
-            )
+            self._log_net_position(instrument_id)
 
             self._unrealized_pnls[instrument_id] = self._calculate_unrealized_pnl(instrument_id)
 
@@ -268,6 +285,7 @@ cdef class Portfolio(PortfolioFacade):
         Condition.not_none(tick, "tick")
 
         self._unrealized_pnls.pop(tick.instrument_id, None)
+        self._xrates.clear()
 
         if self.initialized:
             return
@@ -409,17 +427,11 @@ cdef class Portfolio(PortfolioFacade):
                 fill=event,
             )
 
-        cdef list orders_working = self._cache.orders_working(
-            venue=None,  # Faster query filtering
-            instrument_id=event.instrument_id,
-        )
-
-        cdef:
-            Order o
-        account_state = self._accounts.update_orders(
+        # Incrementally update for this orders contribution only
+        account_state = self._accounts.update_order(
             account=account,
             instrument=instrument,
-            passive_orders_working=[o for o in orders_working if o.is_passive_c()],
+            order=order,
             ts_event=event.ts_event,
         )
 
@@ -446,14 +458,14 @@ cdef class Portfolio(PortfolioFacade):
         """
         Condition.not_none(event, "event")
 
-        cdef list positions_open = self._cache.positions_open(
-            venue=None,  # Faster query filtering
-            instrument_id=event.instrument_id,
-        )
-        self._update_net_position(
+        self._update_position_aggregate(
             instrument_id=event.instrument_id,
-            positions_open=positions_open
+            position_id=event.position_id,
+            side=event.side,
+            quantity=event.quantity,
+            avg_px_open=event.avg_px_open,
         )
+        self._log_net_position(event.instrument_id)
 
         self._unrealized_pnls[event.instrument_id] = self._calculate_unrealized_pnl(
             instrument_id=event.instrument_id,
@@ -478,10 +490,11 @@ cdef class Portfolio(PortfolioFacade):
             )
             return  # No instrument found
 
-        cdef AccountState account_state = self._accounts.update_positions(
+        # Incrementally update for this positions contribution only
+        cdef AccountState account_state = self._accounts.update_position(
             account=account,
             instrument=instrument,
-            positions_open=positions_open,
+            event=event,
             ts_event=event.ts_event,
         )
 
@@ -507,6 +520,10 @@ cdef class Portfolio(PortfolioFacade):
         self._net_positions.clear()
         self._unrealized_pnls.clear()
         self._pending_calcs.clear()
+        self._xrates.clear()
+        self._position_contributions.clear()
+        self._position_aggregates.clear()
+        self._accounts.reset()
         self.initialized = False
 
         self._log.info("Reset.")
@@ -640,26 +657,21 @@ cdef class Portfolio(PortfolioFacade):
         """
         Condition.not_none(venue, "venue")
 
-        cdef list positions_open = self._cache.positions_open(venue)
-        if not positions_open:
-            return {}  # Nothing to calculate
-
-        cdef set instrument_ids = {p.instrument_id for p in positions_open}
-
         cdef dict unrealized_pnls = {}  # type: dict[Currency, Decimal]
 
         cdef InstrumentId instrument_id
+        cdef list aggregate
         cdef Money pnl
-        for instrument_id in instrument_ids:
+        for instrument_id, aggregate in self._position_aggregates.items():
+            if instrument_id.venue != venue or not _has_open_quantity(aggregate):
+                continue  # Nothing to calculate
             pnl = self._unrealized_pnls.get(instrument_id)
-            if pnl is not None:
-                # PnL already calculated
-                unrealized_pnls[pnl.currency] = unrealized_pnls.get(pnl.currency, Decimal(0)) + pnl
-                continue  # To next instrument_id
-            # Calculate PnL
-            pnl = self._calculate_unrealized_pnl(instrument_id)
             if pnl is None:
-                continue  # Error logged in `_calculate_unrealized_pnl`
+                # Calculate PnL
+                pnl = self._calculate_unrealized_pnl(instrument_id)
+                if pnl is None:
+                    continue  # Error logged in `_calculate_unrealized_pnl`
+                self._unrealized_pnls[instrument_id] = pnl
             unrealized_pnls[pnl.currency] = unrealized_pnls.get(pnl.currency, Decimal(0)) + pnl
 
         return {k: Money(v, k) for k, v in unrealized_pnls.items()}
@@ -688,55 +700,47 @@ cdef class Portfolio(PortfolioFacade):
             )
             return None  # Cannot calculate
 
-        cdef list positions_open = self._cache.positions_open(venue)
-        if not positions_open:
-            return {}  # Nothing to calculate
-
         cdef dict net_exposures = {}  # type: dict[Currency, Decimal]
 
-        cdef Position position
+        cdef InstrumentId instrument_id
+        cdef list aggregate
         cdef Instrument instrument
-        cdef Price last
-        for position in positions_open:
-            instrument = self._cache.instrument(position.instrument_id)
+        cdef Currency currency
+        cdef tuple prices
+        for instrument_id, aggregate in self._position_aggregates.items():
+            if instrument_id.venue != venue or not _has_open_quantity(aggregate):
+                continue  # Nothing to calculate
+
+            instrument = self._cache.instrument(instrument_id)
             if instrument is None:
                 self._log.error(
                     f"Cannot calculate net exposures: "
-                    f"no instrument for {position.instrument_id}."
+                    f"no instrument for {instrument_id}."
                 )
                 return None  # Cannot calculate
 
-            last = self._get_last_price(position)
-            if last is None:
+            prices = self._get_last_prices(instrument_id)
+            if prices is None:
                 self._log.error(
                     f"Cannot calculate net exposures: "
-                    f"no prices for {position.instrument_id}."
+                    f"no prices for {instrument_id}."
                 )
                 continue  # Cannot calculate
 
-            xrate: Decimal = self._calculate_xrate_to_base(
-                instrument=instrument,
+            net_exposure: Optional[Decimal] = self._calculate_net_exposure(
                 account=account,
-                side=position.entry,
+                instrument=instrument,
+                aggregate=aggregate,
+                prices=prices,
             )
-
-            if xrate == 0:
-                self._log.error(
-                    f"Cannot calculate net exposures: "
-                    f"insufficient data for {instrument.get_cost_currency()}/{account.base_currency}."
-                )
+            if net_exposure is None:
                 return None  # Cannot calculate
 
-            net_exposure: Decimal = net_exposures.get(instrument.get_cost_currency(), Decimal(0))
-            net_exposure += instrument.notional_value(
-                position.quantity,
-                last,
-            ) * xrate
-
             if account.base_currency is not None:
-                net_exposures[account.base_currency] = net_exposure
+                currency = account.base_currency
             else:
-                net_exposures[instrument.get_cost_currency()] = net_exposure
+                currency = instrument.get_cost_currency()
+            net_exposures[currency] = net_exposures.get(currency, Decimal(0)) + net_exposure
 
         return {k: Money(v, k) for k, v in net_exposures.items()}
 
@@ -797,44 +801,28 @@ cdef class Portfolio(PortfolioFacade):
             )
             return None  # Cannot calculate
 
-        cdef list positions_open = self._cache.positions_open(
-            venue=None,  # Faster query filtering
-            instrument_id=instrument_id,
-        )
-        if not positions_open:
+        cdef list aggregate = self._position_aggregates.get(instrument_id)
+        if aggregate is None or not _has_open_quantity(aggregate):
             return Money(0, instrument.get_cost_currency())
 
-        net_exposure = Decimal(0)
-
-        cdef Position position
-        cdef Price last
-        for position in positions_open:
-            last = self._get_last_price(position)
-            if last is None:
-                self._log.error(
-                    f"Cannot calculate net exposure: "
-                    f"no prices for {position.instrument_id}."
-                )
-                continue  # Cannot calculate
+        net_exposure: Optional[Decimal] = Decimal(0)
 
-            xrate: Decimal = self._calculate_xrate_to_base(
-                instrument=instrument,
+        cdef tuple prices = self._get_last_prices(instrument_id)
+        if prices is None:
+            self._log.error(
+                f"Cannot calculate net exposure: "
+                f"no prices for {instrument_id}."
+            )
+        else:
+            net_exposure = self._calculate_net_exposure(
                 account=account,
-                side=position.entry,
+                instrument=instrument,
+                aggregate=aggregate,
+                prices=prices,
             )
-
-            if xrate == 0:
-                self._log.error(
-                    f"Cannot calculate net exposure: "
-                    f"insufficient data for {instrument.get_cost_currency()}/{account.base_currency}."
-                )
+            if net_exposure is None:
                 return None  # Cannot calculate
 
-            net_exposure += instrument.notional_value(
-                position.quantity,
-                last,
-            ) * xrate
-
         if account.base_currency is not None:
             return Money(net_exposure, account.base_currency)
         else:
@@ -940,15 +928,60 @@ cdef class Portfolio(PortfolioFacade):
     cdef object _net_position(self, InstrumentId instrument_id):
         return self._net_positions.get(instrument_id, Decimal(0))
 
-    cdef void _update_net_position(self, InstrumentId instrument_id, list positions_open) except *:
-        net_position = Decimal(0)
+    cdef void _update_position_aggregate(
+        self,
+        InstrumentId instrument_id,
+        PositionId position_id,
+        PositionSide side,
+        Quantity quantity,
+        avg_px_open: Decimal,
+    ) except *:
+        # Replace the positions previous contribution to the open position
+        # aggregate for the instrument (a flat position contributes nothing).
+        # The aggregate holds the long and short quantity, cost (sum of
+        # quantity * avg_px_open) and inverse cost (sum of quantity / avg_px_open).
+        cdef dict contributions = self._position_contributions.get(instrument_id)
+        cdef list aggregate
+        if contributions is None:
+            contributions = {}
+            aggregate = [Decimal(0)] * 6
+            self._position_contributions[instrument_id] = contributions
+            self._position_aggregates[instrument_id] = aggregate
+        else:
+            aggregate = self._position_aggregates[instrument_id]
+
+        cdef int i
+        cdef tuple previous = contributions.pop(position_id, None)
+        if previous is not None:
+            for i in range(6):
+                aggregate[i] -= previous[i]
 
-        cdef Position position
-        for position in positions_open:
-            net_position += position.net_qty
+        if side == PositionSide.FLAT:
+            self._net_positions[instrument_id] = aggregate[0] - aggregate[3]
+            return
 
-        self._net_positions[instrument_id] = net_position
-        cdef str net_position_str = f"{net_position:,}".replace(",", "_")
+        qty: Decimal = quantity.as_decimal()
+        cost: Decimal = qty * avg_px_open
+        inv_cost: Decimal = qty / avg_px_open if avg_px_open else Decimal(0)
+
+        cdef tuple contribution
+        if side == PositionSide.LONG:
+            contribution = (qty, cost, inv_cost, Decimal(0), Decimal(0), Decimal(0))
+        elif side == PositionSide.SHORT:
+            contribution = (Decimal(0), Decimal(0), Decimal(0), qty, cost, inv_cost)
+        else:  # pragma: no cover (design-time error)
+            raise RuntimeError(
+                f"invalid PositionSide, was {PositionSideParser.to_str(side)}",
+            )
+
+        for i in range(6):
+            aggregate[i] += contribution[i]
+        contributions[position_id] = contribution
+
+        self._net_positions[instrument_id] = aggregate[0] - aggregate[3]
+
+    cdef void _log_net_position(self, InstrumentId instrument_id) except *:
+        cdef str net_position_str = f"{self._net_position(instrument_id):,}".replace(",", "_")
         self._log.info(f"{instrument_id} net_position={net_position_str}")
 
     cdef Money _calculate_unrealized_pnl(self, InstrumentId instrument_id):
@@ -974,77 +1007,138 @@ cdef class Portfolio(PortfolioFacade):
         else:
             currency = instrument.get_cost_currency()
 
-        cdef list positions_open = self._cache.positions_open(
-            venue=None,  # Faster query filtering
-            instrument_id=instrument_id,
-        )
-        if not positions_open:
-            if account.base_currency is not None:
-                return Money(0, account.base_currency)
-            else:
-                return Money(0, instrument.get_cost_currency())
+        cdef list aggregate = self._position_aggregates.get(instrument_id)
+        if aggregate is None or not _has_open_quantity(aggregate):
+            return Money(0, currency)
 
-        total_pnl: Decimal = Decimal(0)
+        cdef tuple prices = self._get_last_prices(instrument_id)
+        if prices is None:
+            self._log.debug(
+                f"Cannot calculate unrealized PnL: no prices for {instrument_id}."
+            )
+            self._pending_calcs.add(instrument.id)
+            return None  # Cannot calculate
 
-        cdef Position position
-        cdef Price last
-        for position in positions_open:
-            if position.instrument_id != instrument_id:
-                continue  # Nothing to calculate
+        long_qty: Decimal = aggregate[0]
+        short_qty: Decimal = aggregate[3]
+        bid: Decimal = prices[0]
+        ask: Decimal = prices[1]
+        multiplier: Decimal = instrument.multiplier.as_decimal()
+
+        # Longs are marked to the bid and shorts to the ask
+        pnl_long: Decimal = Decimal(0)
+        pnl_short: Decimal = Decimal(0)
+        if instrument.is_inverse:
+            # In base currency
+            if long_qty:
+                pnl_long = (aggregate[2] - long_qty / bid) * multiplier
+            if short_qty:
+                pnl_short = (short_qty / ask - aggregate[5]) * multiplier
+        else:
+            # In quote currency
+            if long_qty:
+                pnl_long = (long_qty * bid - aggregate[1]) * multiplier
+            if short_qty:
+                pnl_short = (aggregate[4] - short_qty * ask) * multiplier
 
-            last = self._get_last_price(position)
-            if last is None:
-                self._log.debug(
-                    f"Cannot calculate unrealized PnL: no prices for {instrument_id}."
-                )
-                self._pending_calcs.add(instrument.id)
-                return None  # Cannot calculate
+        if account.base_currency is not None:
+            if long_qty:
+                xrate_long: Decimal = self._calculate_xrate_to_base(account, instrument, OrderSide.BUY)
+                if xrate_long == 0:
+                    self._log_insufficient_xrate_data(account, instrument)
+                    return None  # Cannot calculate
+                pnl_long *= xrate_long
+            if short_qty:
+                xrate_short: Decimal = self._calculate_xrate_to_base(account, instrument, OrderSide.SELL)
+                if xrate_short == 0:
+                    self._log_insufficient_xrate_data(account, instrument)
+                    return None  # Cannot calculate
+                pnl_short *= xrate_short
 
-            pnl = position.unrealized_pnl(last)
+        return Money(pnl_long + pnl_short, currency)
 
-            if account.base_currency is not None:
-                xrate: Decimal = self._calculate_xrate_to_base(
-                    instrument=instrument,
-                    account=account,
-                    side=position.entry,
-                )
+    cdef void _log_insufficient_xrate_data(self, Account account, Instrument instrument) except *:
+        self._log.debug(
+            f"Cannot calculate unrealized PnL: "
+            f"insufficient data for {instrument.get_cost_currency()}/{account.base_currency}."
+        )
+        self._pending_calcs.add(instrument.id)
+
+    cdef object _calculate_net_exposure(
+        self,
+        Account account,
+        Instrument instrument,
+        list aggregate,
+        tuple prices,
+    ):
+        long_qty: Decimal = aggregate[0]
+        short_qty: Decimal = aggregate[3]
+        bid: Decimal = prices[0]
+        ask: Decimal = prices[1]
+        multiplier: Decimal = instrument.multiplier.as_decimal()
+
+        exposure_long: Decimal = Decimal(0)
+        exposure_short: Decimal = Decimal(0)
+        if instrument.is_inverse:
+            if long_qty:
+                exposure_long = long_qty * multiplier / bid
+            if short_qty:
+                exposure_short = short_qty * multiplier / ask
+        else:
+            exposure_long = long_qty * multiplier * bid
+            exposure_short = short_qty * multiplier * ask
 
-                if xrate == 0:
-                    self._log.debug(
-                        f"Cannot calculate unrealized PnL: "
+        if account.base_currency is not None:
+            if long_qty:
+                xrate_long: Decimal = self._calculate_xrate_to_base(account, instrument, OrderSide.BUY)
+                if xrate_long == 0:
+                    self._log.error(
+                        f"Cannot calculate net exposure: "
+                        f"insufficient data for {instrument.get_cost_currency()}/{account.base_currency}."
+                    )
+                    return None  # Cannot calculate
+                exposure_long *= xrate_long
+            if short_qty:
+                xrate_short: Decimal = self._calculate_xrate_to_base(account, instrument, OrderSide.SELL)
+                if xrate_short == 0:
+                    self._log.error(
+                        f"Cannot calculate net exposure: "
                         f"insufficient data for {instrument.get_cost_currency()}/{account.base_currency}."
                     )
-                    self._pending_calcs.add(instrument.id)
                     return None  # Cannot calculate
+                exposure_short *= xrate_short
 
-                pnl *= xrate
+        return exposure_long + exposure_short
 
-            total_pnl += pnl
+    cdef object _calculate_xrate_to_base(self, Account account, Instrument instrument, OrderSide side):
+        if account.base_currency is None:
+            return Decimal(1)  # No conversion needed
 
-        return Money(total_pnl, currency)
+        cdef PriceType price_type = PriceType.BID if side == OrderSide.BUY else PriceType.ASK
+        cdef tuple key = (instrument.id.venue, instrument.get_cost_currency(), price_type)
 
-    cdef object _calculate_xrate_to_base(self, Account account, Instrument instrument, OrderSide side):
-        if account.base_currency is not None:
-            return self._cache.get_xrate(
+        # Exchange rates are cached until the next quote tick
+        xrate: Optional[Decimal] = self._xrates.get(key)
+        if xrate is None:
+            xrate = self._cache.get_xrate(
                 venue=instrument.id.venue,
                 from_currency=instrument.get_cost_currency(),
                 to_currency=account.base_currency,
-                price_type=PriceType.BID if side == OrderSide.BUY else PriceType.ASK,
+                price_type=price_type,
             )
+            self._xrates[key] = xrate
 
-        return Decimal(1)  # No conversion needed
+        return xrate
 
-    cdef Price _get_last_price(self, Position position):
-        cdef QuoteTick quote_tick = self._cache.quote_tick(position.instrument_id)
+    cdef tuple _get_last_prices(self, InstrumentId instrument_id):
+        # Return the prices to mark long and short positions to respectively
+        cdef QuoteTick quote_tick = self._cache.quote_tick(instrument_id)
         if quote_tick is not None:
-            if position.side == PositionSide.LONG:
-                return quote_tick.bid
-            elif position.side == PositionSide.SHORT:
-                return quote_tick.ask
-            else:  # pragma: no cover (design-time error)
-                raise RuntimeError(
-                    f"invalid PositionSide, was {PositionSideParser.to_str(position.side)}",
-                )
+            return quote_tick.bid.as_decimal(), quote_tick.ask.as_decimal()
+
+        cdef TradeTick trade_tick = self._cache.trade_tick(instrument_id)
+        if trade_tick is not None:
+            return trade_tick.price.as_decimal(), trade_tick.price.as_decimal()
+
+        return None
 
-        cdef TradeTick trade_tick = self._cache.trade_tick(position.instrument_id)
-        return trade_tick.price if trade_tick is not None else None
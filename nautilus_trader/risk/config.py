@@ -13,10 +13,11 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from typing import Dict
+from typing import Dict, Optional
 
 import pydantic
 from pydantic import ConstrainedStr
+from pydantic import PositiveInt
 
 
 class RiskEngineConfig(pydantic.BaseModel):
@@ -32,8 +33,35 @@ class RiskEngineConfig(pydantic.BaseModel):
     max_notional_per_order : Dict[str, str]
         The maximum notional value of an order per instrument ID.
         The value should be a valid decimal format.
+    max_open_orders_per_strategy : int, optional
+        The maximum number of open orders per strategy.
+    max_position_size : Dict[str, str]
+        The maximum absolute net position quantity per instrument ID, including
+        working orders on the same side. The value should be a valid decimal format.
+    max_gross_exposure_per_strategy : Dict[str, str]
+        The maximum gross exposure (notional value of open positions and working
+        orders) per strategy ID. The value should be a valid decimal format.
+    max_net_exposure_per_strategy : Dict[str, str]
+        The maximum absolute net exposure (long less short notional value of open
+        positions and working orders) per strategy ID. The value should be a valid decimal format.
+    max_gross_exposure_per_venue : Dict[str, str]
+        The maximum gross exposure per venue. The value should be a valid decimal format.
+    max_net_exposure_per_venue : Dict[str, str]
+        The maximum absolute net exposure per venue. The value should be a valid decimal format.
+
+    Notes
+    -----
+    Exposures are the sums of notional values without any currency conversion,
+    and so should only be limited for strategies and venues which trade
+    instruments with a common settlement currency.
     """
 
     bypass: bool = False
     max_order_rate: ConstrainedStr = ConstrainedStr("100/00:00:01")
     max_notional_per_order: Dict[str, str] = {}
+    max_open_orders_per_strategy: Optional[PositiveInt] = None
+    max_position_size: Dict[str, str] = {}
+    max_gross_exposure_per_strategy: Dict[str, str] = {}
+    max_net_exposure_per_strategy: Dict[str, str] = {}
+    max_gross_exposure_per_venue: Dict[str, str] = {}
+    max_net_exposure_per_venue: Dict[str, str] = {}
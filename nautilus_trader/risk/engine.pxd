@@ -18,6 +18,7 @@ from decimal import Decimal
 from nautilus_trader.cache.base cimport CacheFacade
 from nautilus_trader.common.component cimport Component
 from nautilus_trader.common.throttler cimport Throttler
+from nautilus_trader.core.dispatch cimport TypeDispatcher
 from nautilus_trader.core.message cimport Command
 from nautilus_trader.core.message cimport Event
 from nautilus_trader.model.c_enums.trading_state cimport TradingState
@@ -27,7 +28,12 @@ from nautilus_trader.model.commands.trading cimport ModifyOrder
 from nautilus_trader.model.commands.trading cimport SubmitOrder
 from nautilus_trader.model.commands.trading cimport SubmitOrderList
 from nautilus_trader.model.commands.trading cimport TradingCommand
+from nautilus_trader.model.events.order cimport OrderEvent
+from nautilus_trader.model.events.position cimport PositionEvent
+from nautilus_trader.model.identifiers cimport ClientOrderId
 from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.identifiers cimport StrategyId
+from nautilus_trader.model.identifiers cimport Venue
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.objects cimport Quantity
@@ -36,11 +42,66 @@ from nautilus_trader.model.orders.list cimport OrderList
 from nautilus_trader.portfolio.base cimport PortfolioFacade
 
 
+cdef class InstrumentRiskLimits:
+    cdef readonly Instrument instrument
+    """The instrument the limits were computed from.\n\n:returns: `Instrument`"""
+    cdef readonly int price_precision
+    """The instruments price precision.\n\n:returns: `int`"""
+    cdef readonly int size_precision
+    """The instruments size precision.\n\n:returns: `int`"""
+    cdef readonly double max_quantity
+    """The maximum order quantity (zero for no limit).\n\n:returns: `double`"""
+    cdef readonly double min_quantity
+    """The minimum order quantity (zero for no limit).\n\n:returns: `double`"""
+    cdef readonly double multiplier
+    """The instruments contract multiplier.\n\n:returns: `double`"""
+    cdef readonly bint is_inverse
+    """If the instrument costing is inverse.\n\n:returns: `bool`"""
+    cdef readonly bint check_price_positive
+    """If prices must be positive (not an option instrument).\n\n:returns: `bool`"""
+    cdef readonly object max_notional
+    """The maximum notional value per order.\n\n:returns: `Decimal` or ``None``"""
+    cdef readonly double max_notional_double
+    """The maximum notional value per order (zero for no limit).\n\n:returns: `double`"""
+    cdef readonly object max_position_size
+    """The maximum absolute net position quantity.\n\n:returns: `Decimal` or ``None``"""
+    cdef readonly double max_position_size_double
+    """The maximum absolute net position quantity (zero for no limit).\n\n:returns: `double`"""
+
+
+cdef class ExposureCounter:
+    cdef readonly double long_value
+    """The long side value.\n\n:returns: `double`"""
+    cdef readonly double short_value
+    """The short side value.\n\n:returns: `double`"""
+
+    cpdef double gross(self) except *
+    cpdef double net(self) except *
+    cdef void update(self, bint is_long, double delta) except *
+
+
 cdef class RiskEngine(Component):
     cdef PortfolioFacade _portfolio
     cdef CacheFacade _cache
     cdef dict _max_notional_per_order
+    cdef dict _instrument_limits
+    cdef int _max_open_orders_per_strategy
+    cdef dict _max_position_size
+    cdef dict _max_gross_exposure_per_strategy
+    cdef dict _max_net_exposure_per_strategy
+    cdef dict _max_gross_exposure_per_venue
+    cdef dict _max_net_exposure_per_venue
+    cdef bint _track_exposures
+    cdef dict _order_exposures
+    cdef dict _position_exposures
+    cdef dict _open_order_counts
+    cdef dict _strategy_exposures
+    cdef dict _venue_exposures
+    cdef dict _working_quantities
+    cdef dict _position_quantities
     cdef Throttler _order_throttler
+    cdef TypeDispatcher _command_dispatcher
+    cdef TypeDispatcher _event_dispatcher
 
     cdef readonly TradingState trading_state
     """The current trading state for the engine.\n\n:returns: `TradingState`"""
@@ -64,6 +125,9 @@ cdef class RiskEngine(Component):
     cpdef tuple max_order_rate(self)
     cpdef dict max_notionals_per_order(self)
     cpdef object max_notional_per_order(self, InstrumentId instrument_id)
+    cpdef int open_order_count(self, StrategyId strategy_id) except *
+    cpdef ExposureCounter strategy_exposure(self, StrategyId strategy_id)
+    cpdef ExposureCounter venue_exposure(self, Venue venue)
 
 # -- ABSTRACT METHODS ------------------------------------------------------------------------------
 
@@ -81,13 +145,20 @@ cdef class RiskEngine(Component):
 
 # -- PRE-TRADE CHECKS ------------------------------------------------------------------------------
 
+    cdef InstrumentRiskLimits _get_limits(self, Instrument instrument)
     cdef bint _check_order_id(self, Order order) except *
     cdef bint _check_order(self, Instrument instrument, Order order) except *
-    cdef bint _check_order_quantity(self, Instrument instrument, Order order) except *
-    cdef bint _check_order_price(self, Instrument instrument, Order order) except *
-    cdef bint _check_order_risk(self, Instrument instrument, Order order) except *
-    cdef str _check_price(self, Instrument instrument, Price price)
-    cdef str _check_quantity(self, Instrument instrument, Quantity quantity)
+    cdef bint _check_order_quantity(self, InstrumentRiskLimits limits, Order order) except *
+    cdef bint _check_order_price(self, InstrumentRiskLimits limits, Order order) except *
+    cdef bint _check_order_risk(self, InstrumentRiskLimits limits, Order order) except *
+    cdef str _check_notional(self, InstrumentRiskLimits limits, Quantity quantity, Price price)
+    cdef str _check_price(self, InstrumentRiskLimits limits, Price price)
+    cdef str _check_quantity(self, InstrumentRiskLimits limits, Quantity quantity)
+    cdef bint _check_portfolio_risk(self, Instrument instrument, TradingCommand command, list orders) except *
+    cdef bint _check_modify_risk(self, InstrumentRiskLimits limits, Order order, ModifyOrder command, Quantity quantity, Price price) except *
+    cdef str _check_position_size(self, InstrumentRiskLimits limits, Order order, double quantity)
+    cdef str _check_exposure(self, ExposureCounter exposure, max_gross, max_net, bint is_long, double notional, str name)
+    cdef double _unit_notional(self, InstrumentRiskLimits limits, Order order) except *
 
 # -- DENIALS ---------------------------------------------------------------------------------------
 
@@ -104,3 +175,13 @@ cdef class RiskEngine(Component):
 # -- EVENT HANDLERS --------------------------------------------------------------------------------
 
     cpdef void _handle_event(self, Event event) except *
+
+# -- EXPOSURES -------------------------------------------------------------------------------------
+
+    cdef void _initialize_exposures(self) except *
+    cdef void _update_order_exposure(self, OrderEvent event) except *
+    cdef void _update_position_exposure(self, PositionEvent event) except *
+    cdef void _register_order(self, Order order, double unit_notional) except *
+    cdef void _unregister_order(self, ClientOrderId client_order_id, tuple entry) except *
+    cdef void _apply_order_exposure(self, StrategyId strategy_id, InstrumentId instrument_id, bint is_long, double unit_notional, double quantity) except *
+    cdef void _apply_position_exposure(self, StrategyId strategy_id, InstrumentId instrument_id, bint is_long, double quantity, double notional) except *
@@ -31,12 +31,15 @@ from nautilus_trader.common.logging cimport LogColor
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.throttler cimport Throttler
 from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.dispatch cimport TypeDispatcher
+from nautilus_trader.core.handlers cimport CommandHandler
 from nautilus_trader.core.message cimport Command
 from nautilus_trader.core.message cimport Event
 from nautilus_trader.model.c_enums.asset_type cimport AssetType
 from nautilus_trader.model.c_enums.order_side cimport OrderSide
 from nautilus_trader.model.c_enums.order_status cimport OrderStatus
 from nautilus_trader.model.c_enums.order_type cimport OrderType
+from nautilus_trader.model.c_enums.position_side cimport PositionSide
 from nautilus_trader.model.c_enums.trading_state cimport TradingState
 from nautilus_trader.model.c_enums.trading_state cimport TradingStateParser
 from nautilus_trader.model.commands.trading cimport CancelAllOrders
@@ -45,9 +48,16 @@ from nautilus_trader.model.commands.trading cimport ModifyOrder
 from nautilus_trader.model.commands.trading cimport SubmitOrder
 from nautilus_trader.model.commands.trading cimport SubmitOrderList
 from nautilus_trader.model.commands.trading cimport TradingCommand
+from nautilus_trader.model.data.tick cimport QuoteTick
 from nautilus_trader.model.events.order cimport OrderDenied
+from nautilus_trader.model.events.order cimport OrderEvent
+from nautilus_trader.model.events.order cimport OrderUpdated
+from nautilus_trader.model.events.position cimport PositionEvent
+from nautilus_trader.model.identifiers cimport ClientOrderId
 from nautilus_trader.model.identifiers cimport ComponentId
 from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.identifiers cimport StrategyId
+from nautilus_trader.model.identifiers cimport Venue
 from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.objects cimport Quantity
@@ -60,6 +70,116 @@ from nautilus_trader.portfolio.base cimport PortfolioFacade
 from nautilus_trader.risk.config import RiskEngineConfig
 
 
+cdef enum EventHandler:
+    UNKNOWN_EVENT = 0
+    ORDER_EVENT = 1
+    POSITION_EVENT = 2
+
+
+cdef class InstrumentRiskLimits:
+    """
+    Represents the pre-trade check limits for an instrument, precomputed as
+    primitive values so that orders can be checked without `Decimal` arithmetic.
+
+    Parameters
+    ----------
+    instrument : Instrument
+        The instrument for the limits.
+    max_notional : Decimal, optional
+        The maximum notional value per order for the instrument.
+    max_position_size : Decimal, optional
+        The maximum absolute net position quantity for the instrument.
+    """
+
+    def __init__(self, Instrument instrument not None, max_notional=None, max_position_size=None):
+        self.instrument = instrument
+        self.price_precision = instrument.price_precision
+        self.size_precision = instrument.size_precision
+        self.max_quantity = instrument.max_quantity.as_double() if instrument.max_quantity is not None else 0
+        self.min_quantity = instrument.min_quantity.as_double() if instrument.min_quantity is not None else 0
+        self.multiplier = instrument.multiplier.as_double()
+        self.is_inverse = instrument.is_inverse
+        self.check_price_positive = instrument.asset_type != AssetType.OPTION
+        self.max_notional = max_notional
+        self.max_notional_double = float(max_notional) if max_notional is not None else 0
+        self.max_position_size = max_position_size
+        self.max_position_size_double = float(max_position_size) if max_position_size is not None else 0
+
+
+cdef class ExposureCounter:
+    """
+    Represents the incrementally maintained long and short values of an exposure.
+    """
+
+    def __init__(self):
+        self.long_value = 0
+        self.short_value = 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(long={self.long_value}, short={self.short_value})"
+
+    cpdef double gross(self) except *:
+        """
+        Return the gross value (long plus short).
+
+        Returns
+        -------
+        double
+
+        """
+        return self.long_value + self.short_value
+
+    cpdef double net(self) except *:
+        """
+        Return the net value (long less short).
+
+        Returns
+        -------
+        double
+
+        """
+        return self.long_value - self.short_value
+
+    cdef void update(self, bint is_long, double delta) except *:
+        if is_long:
+            self.long_value += delta
+        else:
+            self.short_value += delta
+
+
+cdef inline double _price_notional(InstrumentRiskLimits limits, double price) except *:
+    # Return the notional value per unit of quantity at the given price
+    if price <= 0:
+        return 0
+    elif limits.is_inverse:
+        return limits.multiplier / price
+    else:
+        return limits.multiplier * price
+
+
+cdef inline ExposureCounter _get_counter(dict counters, key):
+    cdef ExposureCounter counter = counters.get(key)
+    if counter is None:
+        counter = ExposureCounter()
+        counters[key] = counter
+    return counter
+
+
+cdef inline double _position_notional(InstrumentRiskLimits limits, double quantity, double avg_px_open) except *:
+    if avg_px_open <= 0:
+        return 0
+    elif limits.is_inverse:
+        return quantity * limits.multiplier / avg_px_open
+    else:
+        return quantity * limits.multiplier * avg_px_open
+
+
+cdef inline object _positive_decimal(value):
+    value = Decimal(value)
+    Condition.positive(value, "value")
+    return value
+
+
 cdef class RiskEngine(Component):
     """
     Provides a high-performance risk engine.
@@ -146,7 +266,35 @@ cdef class RiskEngine(Component):
         )
 
         # Risk settings
-        self._max_notional_per_order = {}
+        self._max_notional_per_order = {}  # type: dict[InstrumentId, Decimal]
+        self._instrument_limits = {}       # type: dict[InstrumentId, InstrumentRiskLimits]
+        self._max_open_orders_per_strategy = 0  # No limit
+        self._max_position_size = {}                # type: dict[InstrumentId, Decimal]
+        self._max_gross_exposure_per_strategy = {}  # type: dict[StrategyId, Decimal]
+        self._max_net_exposure_per_strategy = {}    # type: dict[StrategyId, Decimal]
+        self._max_gross_exposure_per_venue = {}     # type: dict[Venue, Decimal]
+        self._max_net_exposure_per_venue = {}       # type: dict[Venue, Decimal]
+
+        # Exposures (maintained from order and position events)
+        self._order_exposures = {}       # type: dict[ClientOrderId, tuple]
+        self._position_exposures = {}    # type: dict[PositionId, tuple]
+        self._open_order_counts = {}     # type: dict[StrategyId, int]
+        self._strategy_exposures = {}    # type: dict[StrategyId, ExposureCounter]
+        self._venue_exposures = {}       # type: dict[Venue, ExposureCounter]
+        self._working_quantities = {}    # type: dict[InstrumentId, ExposureCounter]
+        self._position_quantities = {}   # type: dict[InstrumentId, ExposureCounter]
+
+        # Per-type dispatch tables
+        self._command_dispatcher = TypeDispatcher(default=CommandHandler.UNKNOWN_COMMAND)
+        self._command_dispatcher.register(SubmitOrder, CommandHandler.SUBMIT_ORDER_COMMAND)
+        self._command_dispatcher.register(SubmitOrderList, CommandHandler.SUBMIT_ORDER_LIST_COMMAND)
+        self._command_dispatcher.register(ModifyOrder, CommandHandler.MODIFY_ORDER_COMMAND)
+        self._command_dispatcher.register(CancelOrder, CommandHandler.CANCEL_ORDER_COMMAND)
+        self._command_dispatcher.register(CancelAllOrders, CommandHandler.CANCEL_ALL_ORDERS_COMMAND)
+
+        self._event_dispatcher = TypeDispatcher(default=EventHandler.UNKNOWN_EVENT)
+        self._event_dispatcher.register(OrderEvent, EventHandler.ORDER_EVENT)
+        self._event_dispatcher.register(PositionEvent, EventHandler.POSITION_EVENT)
 
         # Configure
         self._initialize_risk_checks(config)
@@ -163,6 +311,46 @@ cdef class RiskEngine(Component):
         for instrument_id, value in max_notional_config.items():
             self.set_max_notional_per_order(InstrumentId.from_str_c(instrument_id), Decimal(value))
 
+        if config.max_open_orders_per_strategy is not None:
+            self._max_open_orders_per_strategy = config.max_open_orders_per_strategy
+            self._log.info(
+                f"Set MAX_OPEN_ORDERS_PER_STRATEGY: {self._max_open_orders_per_strategy}.",
+                color=LogColor.BLUE,
+            )
+
+        for instrument_id, value in config.max_position_size.items():
+            self._max_position_size[InstrumentId.from_str_c(instrument_id)] = _positive_decimal(value)
+        for strategy_id, value in config.max_gross_exposure_per_strategy.items():
+            self._max_gross_exposure_per_strategy[StrategyId(strategy_id)] = _positive_decimal(value)
+        for strategy_id, value in config.max_net_exposure_per_strategy.items():
+            self._max_net_exposure_per_strategy[StrategyId(strategy_id)] = _positive_decimal(value)
+        for venue, value in config.max_gross_exposure_per_venue.items():
+            self._max_gross_exposure_per_venue[Venue(venue)] = _positive_decimal(value)
+        for venue, value in config.max_net_exposure_per_venue.items():
+            self._max_net_exposure_per_venue[Venue(venue)] = _positive_decimal(value)
+
+        cdef str name
+        cdef dict limits
+        for name, limits in (
+            ("MAX_POSITION_SIZE", self._max_position_size),
+            ("MAX_GROSS_EXPOSURE_PER_STRATEGY", self._max_gross_exposure_per_strategy),
+            ("MAX_NET_EXPOSURE_PER_STRATEGY", self._max_net_exposure_per_strategy),
+            ("MAX_GROSS_EXPOSURE_PER_VENUE", self._max_gross_exposure_per_venue),
+            ("MAX_NET_EXPOSURE_PER_VENUE", self._max_net_exposure_per_venue),
+        ):
+            for key, value in limits.items():
+                self._log.info(f"Set {name}: {key} {value:,}.", color=LogColor.BLUE)
+
+        # Exposures are only maintained when a portfolio level limit is configured
+        self._track_exposures = (
+            self._max_open_orders_per_strategy > 0
+            or self._max_position_size
+            or self._max_gross_exposure_per_strategy
+            or self._max_net_exposure_per_strategy
+            or self._max_gross_exposure_per_venue
+            or self._max_net_exposure_per_venue
+        )
+
 # -- COMMANDS --------------------------------------------------------------------------------------
 
     cpdef void execute(self, Command command) except *:
@@ -271,6 +459,7 @@ cdef class RiskEngine(Component):
 
         old_value: Decimal = self._max_notional_per_order.get(instrument_id)
         self._max_notional_per_order[instrument_id] = new_value
+        self._instrument_limits.pop(instrument_id, None)  # Recompute on next check
 
         cdef str new_value_str = f"{new_value:,}" if new_value is not None else str(None)
         self._log.info(
@@ -317,6 +506,68 @@ cdef class RiskEngine(Component):
         """
         return self._max_notional_per_order.get(instrument_id)
 
+    cpdef int open_order_count(self, StrategyId strategy_id) except *:
+        """
+        Return the count of open orders for the given strategy ID.
+
+        Only maintained when a portfolio level risk limit is configured.
+
+        Parameters
+        ----------
+        strategy_id : StrategyId
+            The strategy ID for the count.
+
+        Returns
+        -------
+        int
+
+        """
+        Condition.not_none(strategy_id, "strategy_id")
+
+        return self._open_order_counts.get(strategy_id, 0)
+
+    cpdef ExposureCounter strategy_exposure(self, StrategyId strategy_id):
+        """
+        Return the exposure of open positions and working orders for the given
+        strategy ID.
+
+        Only maintained when a portfolio level risk limit is configured.
+
+        Parameters
+        ----------
+        strategy_id : StrategyId
+            The strategy ID for the exposure.
+
+        Returns
+        -------
+        ExposureCounter or ``None``
+
+        """
+        Condition.not_none(strategy_id, "strategy_id")
+
+        return self._strategy_exposures.get(strategy_id)
+
+    cpdef ExposureCounter venue_exposure(self, Venue venue):
+        """
+        Return the exposure of open positions and working orders for the given
+        venue.
+
+        Only maintained when a portfolio level risk limit is configured.
+
+        Parameters
+        ----------
+        venue : Venue
+            The venue for the exposure.
+
+        Returns
+        -------
+        ExposureCounter or ``None``
+
+        """
+        Condition.not_none(venue, "venue")
+
+        return self._venue_exposures.get(venue)
+
 # -- ABSTRACT METHODS ------------------------------------------------------------------------------
 
     cpdef void _on_start(self) except *:
@@ -328,7 +579,9 @@ cdef class RiskEngine(Component):
 # -- ACTION IMPLEMENTATIONS ------------------------------------------------------------------------
 
     cpdef void _start(self) except *:
-        # Do nothing else for now
+        if self._track_exposures:
+            self._initialize_exposures()
+
         self._on_start()
 
     cpdef void _stop(self) except *:
@@ -338,6 +591,14 @@ cdef class RiskEngine(Component):
     cpdef void _reset(self) except *:
         self.command_count = 0
         self.event_count = 0
+        self._instrument_limits.clear()
+        self._order_exposures.clear()
+        self._position_exposures.clear()
+        self._open_order_counts.clear()
+        self._strategy_exposures.clear()
+        self._venue_exposures.clear()
+        self._working_quantities.clear()
+        self._position_quantities.clear()
 
     cpdef void _dispose(self) except *:
         pass
@@ -349,15 +610,16 @@ cdef class RiskEngine(Component):
         self._log.debug(f"{RECV}{CMD} {command}.")
         self.command_count += 1
 
-        if isinstance(command, SubmitOrder):
+        cdef int handler = self._command_dispatcher.code_for(command)
+        if handler == CommandHandler.SUBMIT_ORDER_COMMAND:
             self._handle_submit_order(command)
-        elif isinstance(command, SubmitOrderList):
+        elif handler == CommandHandler.SUBMIT_ORDER_LIST_COMMAND:
             self._handle_submit_order_list(command)
-        elif isinstance(command, ModifyOrder):
+        elif handler == CommandHandler.MODIFY_ORDER_COMMAND:
             self._handle_modify_order(command)
-        elif isinstance(command, CancelOrder):
+        elif handler == CommandHandler.CANCEL_ORDER_COMMAND:
             self._handle_cancel_order(command)
-        elif isinstance(command, CancelAllOrders):
+        elif handler == CommandHandler.CANCEL_ALL_ORDERS_COMMAND:
             self._handle_cancel_all_orders(command)
         else:
             self._log.error(f"Cannot handle command: unrecognized {command}.")
@@ -407,6 +669,9 @@ cdef class RiskEngine(Component):
         if not self._check_order(instrument, command.order):
             return  # Denied
 
+        if self._track_exposures and not self._check_portfolio_risk(instrument, command, [command.order]):
+            return  # Denied
+
         self._execution_gateway(instrument, command, order=command.order)
 
     cdef void _handle_submit_order_list(self, SubmitOrderList command) except *:
@@ -440,6 +705,9 @@ cdef class RiskEngine(Component):
             if not self._check_order(instrument, order):
                 return  # Denied
 
+        if self._track_exposures and not self._check_portfolio_risk(instrument, command, command.list.orders):
+            return  # Denied
+
         self._execution_gateway(instrument, command, order=command.list.first)
 
     cdef void _handle_modify_order(self, ModifyOrder command) except *:
@@ -475,26 +743,37 @@ cdef class RiskEngine(Component):
             )
             return  # Denied
 
+        cdef InstrumentRiskLimits limits = self._get_limits(instrument)
         cdef str risk_msg = None
 
         # Check price
-        risk_msg = self._check_price(instrument, command.price)
+        risk_msg = self._check_price(limits, command.price)
         if risk_msg:
             self._deny_command(command=command, reason=risk_msg)
             return  # Denied
 
         # Check trigger
-        risk_msg = self._check_price(instrument, command.trigger)
+        risk_msg = self._check_price(limits, command.trigger)
         if risk_msg:
             self._deny_command(command=command, reason=risk_msg)
             return  # Denied
 
         # Check quantity
-        risk_msg = self._check_quantity(instrument, command.quantity)
+        risk_msg = self._check_quantity(limits, command.quantity)
         if risk_msg:
             self._deny_command(command=command, reason=risk_msg)
             return  # Denied
 
+        # Check notional of the modified order
+        cdef Quantity quantity = command.quantity if command.quantity is not None else order.quantity
+        cdef Price price = None
+        if order.type != OrderType.MARKET:
+            price = command.price if command.price is not None else order.price
+            risk_msg = self._check_notional(limits, quantity, price)
+            if risk_msg:
+                self._deny_command(command=command, reason=risk_msg)
+                return  # Denied
+
         # Check TradingState
         if self.trading_state == TradingState.HALTED:
             self._deny_command(
@@ -517,6 +796,9 @@ cdef class RiskEngine(Component):
                     )
                     return  # Denied
 
+        if self._track_exposures and not self._check_modify_risk(limits, order, command, quantity, price):
+            return  # Denied
+
         # All checks passed: send for execution
         self._msgbus.send(endpoint="ExecEngine.execute", msg=command)
 
@@ -556,6 +838,19 @@ cdef class RiskEngine(Component):
 
 # -- PRE-TRADE CHECKS ------------------------------------------------------------------------------
 
+    cdef InstrumentRiskLimits _get_limits(self, Instrument instrument):
+        # Limits are recomputed only when the cached instrument is replaced
+        cdef InstrumentRiskLimits limits = self._instrument_limits.get(instrument.id)
+        if limits is None or limits.instrument is not instrument:
+            limits = InstrumentRiskLimits(
+                instrument=instrument,
+                max_notional=self._max_notional_per_order.get(instrument.id),
+                max_position_size=self._max_position_size.get(instrument.id),
+            )
+            self._instrument_limits[instrument.id] = limits
+
+        return limits
+
     cdef bint _check_order_id(self, Order order) except *:
         if order is None or not self._cache.order_exists(order.client_order_id):
             return True  # Check passed
@@ -563,31 +858,33 @@ cdef class RiskEngine(Component):
             return False  # Check failed (duplicate ID)
 
     cdef bint _check_order(self, Instrument instrument, Order order) except *:
+        cdef InstrumentRiskLimits limits = self._get_limits(instrument)
+
         ########################################################################
         # Validation checks
         ########################################################################
-        if not self._check_order_price(instrument, order):
+        if not self._check_order_price(limits, order):
             return False  # Denied
-        if not self._check_order_quantity(instrument, order):
+        if not self._check_order_quantity(limits, order):
             return False  # Denied
 
         ########################################################################
         # Risk checks
         ########################################################################
-        if not self._check_order_risk(instrument, order):
+        if not self._check_order_risk(limits, order):
             return False  # Denied
 
         return True  # Check passed
 
-    cdef bint _check_order_quantity(self, Instrument instrument, Order order) except *:
-        cdef str risk_msg = self._check_quantity(instrument, order.quantity)
+    cdef bint _check_order_quantity(self, InstrumentRiskLimits limits, Order order) except *:
+        cdef str risk_msg = self._check_quantity(limits, order.quantity)
         if risk_msg:
             self._deny_order(order=order, reason=risk_msg)
             return False  # Denied
 
         return True  # Passed
 
-    cdef bint _check_order_price(self, Instrument instrument, Order order) except *:
+    cdef bint _check_order_price(self, InstrumentRiskLimits limits, Order order) except *:
         ########################################################################
         # Check price
         ########################################################################
@@ -597,7 +894,7 @@ cdef class RiskEngine(Component):
             or order.type == OrderType.STOP_MARKET
             or order.type == OrderType.STOP_LIMIT
         ):
-            risk_msg = self._check_price(instrument, order.price)
+            risk_msg = self._check_price(limits, order.price)
             if risk_msg:
                 self._deny_order(order=order, reason=risk_msg)
                 return False  # Denied
@@ -606,21 +903,21 @@ cdef class RiskEngine(Component):
         # Check trigger
         ########################################################################
         if order.type == OrderType.STOP_LIMIT:
-            risk_msg = self._check_price(instrument, order.trigger)
+            risk_msg = self._check_price(limits, order.trigger)
             if risk_msg:
                 self._deny_order(order=order, reason=f"trigger {risk_msg}")
                 return False  # Denied
 
         return True  # Passed
 
-    cdef bint _check_order_risk(self, Instrument instrument, Order order) except *:
-        max_notional = self._max_notional_per_order.get(order.instrument_id)
-        if max_notional is None:
+    cdef bint _check_order_risk(self, InstrumentRiskLimits limits, Order order) except *:
+        if limits.max_notional is None:
             return True  # No check
 
+        cdef Price price
         if order.type == OrderType.MARKET:
             # Determine entry price
-            last = self._cache.quote_tick(instrument.id)
+            last = self._cache.quote_tick(limits.instrument.id)
             if last is None:
                 self._deny_order(
                     order=order,
@@ -636,42 +933,259 @@ cdef class RiskEngine(Component):
         else:
             price = order.price
 
-        notional: Decimal = instrument.notional_value(order.quantity, price).as_decimal()
-        if notional > max_notional:
-            self._deny_order(
-                order=order,
-                reason=f"Exceeds MAX_NOTIONAL_PER_ORDER of {max_notional:,} @ {notional:,}",
-            )
+        cdef str risk_msg = self._check_notional(limits, order.quantity, price)
+        if risk_msg:
+            self._deny_order(order=order, reason=risk_msg)
             return False  # Denied
 
-        # TODO(cs): Additional pre-trade risk checks
         return True  # Passed
 
-    cdef str _check_price(self, Instrument instrument, Price price):
+    cdef str _check_notional(self, InstrumentRiskLimits limits, Quantity quantity, Price price):
+        if limits.max_notional is None or price is None:
+            # Nothing to check
+            return None
+
+        cdef double notional
+        if limits.is_inverse:
+            notional = quantity.as_double() * limits.multiplier / price.as_double()
+        else:
+            notional = quantity.as_double() * limits.multiplier * price.as_double()
+
+        # Only orders within floating point error of the limit require the
+        # exact `Decimal` calculation to determine the outcome
+        if notional <= limits.max_notional_double * (1 - 1e-9):
+            return None  # Passed
+
+        notional_exact: Decimal = limits.instrument.notional_value(quantity, price).as_decimal()
+        if notional_exact > limits.max_notional:
+            # Check failed
+            return f"Exceeds MAX_NOTIONAL_PER_ORDER of {limits.max_notional:,} @ {notional_exact:,}"
+
+    cdef str _check_price(self, InstrumentRiskLimits limits, Price price):
         if price is None:
             # Nothing to check
             return None
-        if price.precision > instrument.price_precision:
+        if price.precision > limits.price_precision:
             # Check failed
-            return f"price {price} invalid (precision {price.precision} > {instrument.price_precision})"
-        if instrument.asset_type != AssetType.OPTION:
-            if price.as_decimal() <= 0:
+            return f"price {price} invalid (precision {price.precision} > {limits.price_precision})"
+        if limits.check_price_positive:
+            if price.as_double() <= 0:
                 # Check failed
                 return f"price {price} invalid (not positive)"
 
-    cdef str _check_quantity(self, Instrument instrument, Quantity quantity):
+    cdef str _check_quantity(self, InstrumentRiskLimits limits, Quantity quantity):
         if quantity is None:
             # Nothing to check
             return None
-        if quantity.precision > instrument.size_precision:
-            # Check failed
-            return f"quantity {quantity.to_str()} invalid (precision {quantity.precision} > {instrument.size_precision})"
-        if instrument.max_quantity and quantity > instrument.max_quantity:
-            # Check failed
-            return f"quantity {quantity.to_str()} invalid (> maximum trade size of {instrument.max_quantity})"
-        if instrument.min_quantity and quantity < instrument.min_quantity:
+        if quantity.precision > limits.size_precision:
             # Check failed
-            return f"quantity {quantity.to_str()} invalid (< minimum trade size of {instrument.min_quantity})"
+            return f"quantity {quantity.to_str()} invalid (precision {quantity.precision} > {limits.size_precision})"
+        cdef double value = quantity.as_double()
+        if limits.max_quantity and value >= limits.max_quantity:
+            # Values equal as doubles are compared exactly
+            if value > limits.max_quantity or quantity > limits.instrument.max_quantity:
+                # Check failed
+                return f"quantity {quantity.to_str()} invalid (> maximum trade size of {limits.instrument.max_quantity})"
+        if limits.min_quantity and value <= limits.min_quantity:
+            # Values equal as doubles are compared exactly
+            if value < limits.min_quantity or quantity < limits.instrument.min_quantity:
+                # Check failed
+                return f"quantity {quantity.to_str()} invalid (< minimum trade size of {limits.instrument.min_quantity})"
+
+    cdef bint _check_portfolio_risk(self, Instrument instrument, TradingCommand command, list orders) except *:
+        # Portfolio level checks against the incrementally maintained exposures,
+        # the first order of a list is the entry order which determines exposure
+        cdef InstrumentRiskLimits limits = self._get_limits(instrument)
+        cdef Order order = orders[0]
+        cdef int open_orders
+        if self._max_open_orders_per_strategy > 0:
+            open_orders = self._open_order_counts.get(order.strategy_id, 0)
+            if open_orders + len(orders) > self._max_open_orders_per_strategy:
+                self._deny_command(
+                    command=command,
+                    reason=f"Exceeds MAX_OPEN_ORDERS_PER_STRATEGY of "
+                           f"{self._max_open_orders_per_strategy} with {open_orders} open",
+                )
+                return False  # Denied
+
+        cdef str risk_msg = self._check_position_size(limits, order, order.quantity.as_double())
+        if risk_msg:
+            self._deny_command(command=command, reason=risk_msg)
+            return False  # Denied
+
+        cdef double unit_notional = self._unit_notional(limits, order)
+        cdef bint is_long = order.side == OrderSide.BUY
+        cdef double notional
+        cdef Venue venue = order.instrument_id.venue
+        max_gross_strategy = self._max_gross_exposure_per_strategy.get(order.strategy_id)
+        max_net_strategy = self._max_net_exposure_per_strategy.get(order.strategy_id)
+        max_gross_venue = self._max_gross_exposure_per_venue.get(venue)
+        max_net_venue = self._max_net_exposure_per_venue.get(venue)
+        if not order.is_reduce_only and (
+            max_gross_strategy is not None
+            or max_net_strategy is not None
+            or max_gross_venue is not None
+            or max_net_venue is not None
+        ):
+            if unit_notional == 0:
+                self._deny_command(command=command, reason="No market to check exposure limits")
+                return False  # Denied
+
+            notional = order.quantity.as_double() * unit_notional
+            risk_msg = self._check_exposure(
+                exposure=self._strategy_exposures.get(order.strategy_id),
+                max_gross=max_gross_strategy,
+                max_net=max_net_strategy,
+                is_long=is_long,
+                notional=notional,
+                name="STRATEGY",
+            )
+            if not risk_msg:
+                risk_msg = self._check_exposure(
+                    exposure=self._venue_exposures.get(venue),
+                    max_gross=max_gross_venue,
+                    max_net=max_net_venue,
+                    is_long=is_long,
+                    notional=notional,
+                    name="VENUE",
+                )
+            if risk_msg:
+                self._deny_command(command=command, reason=risk_msg)
+                return False  # Denied
+
+        # Account for the orders until their events arrive
+        self._register_order(order, unit_notional)
+        for order in orders[1:]:
+            self._register_order(order, 0)
+
+        return True  # Passed
+
+    cdef bint _check_modify_risk(
+        self,
+        InstrumentRiskLimits limits,
+        Order order,
+        ModifyOrder command,
+        Quantity quantity,
+        Price price,
+    ) except *:
+        # Portfolio level checks for the increase in the order's quantity and
+        # notional, its current leaves quantity is already in the exposures
+        if order.is_reduce_only:
+            return True  # No check
+
+        cdef double quantity_delta = quantity.as_double() - order.quantity.as_double()
+        cdef str risk_msg
+        if quantity_delta > 0:
+            risk_msg = self._check_position_size(limits, order, quantity_delta)
+            if risk_msg:
+                self._deny_command(command=command, reason=risk_msg)
+                return False  # Denied
+
+        cdef tuple entry = self._order_exposures.get(order.client_order_id)
+        if entry is None or entry[3] == 0 or price is None:
+            return True  # Order adds no exposure
+
+        cdef double notional_delta = (
+            (entry[4] + quantity_delta) * _price_notional(limits, price.as_double())
+            - entry[4] * entry[3]
+        )
+        if notional_delta <= 0:
+            return True  # Exposure not increased
+
+        cdef Venue venue = order.instrument_id.venue
+        cdef bint is_long = order.side == OrderSide.BUY
+        risk_msg = self._check_exposure(
+            exposure=self._strategy_exposures.get(order.strategy_id),
+            max_gross=self._max_gross_exposure_per_strategy.get(order.strategy_id),
+            max_net=self._max_net_exposure_per_strategy.get(order.strategy_id),
+            is_long=is_long,
+            notional=notional_delta,
+            name="STRATEGY",
+        )
+        if not risk_msg:
+            risk_msg = self._check_exposure(
+                exposure=self._venue_exposures.get(venue),
+                max_gross=self._max_gross_exposure_per_venue.get(venue),
+                max_net=self._max_net_exposure_per_venue.get(venue),
+                is_long=is_long,
+                notional=notional_delta,
+                name="VENUE",
+            )
+        if risk_msg:
+            self._deny_command(command=command, reason=risk_msg)
+            return False  # Denied
+
+        return True  # Passed
+
+    cdef str _check_position_size(self, InstrumentRiskLimits limits, Order order, double quantity):
+        # The `quantity` is the additional quantity the order would work
+        if limits.max_position_size is None or order.is_reduce_only:
+            return None  # No check
+
+        cdef ExposureCounter positions = self._position_quantities.get(order.instrument_id)
+        cdef ExposureCounter working = self._working_quantities.get(order.instrument_id)
+        cdef double current = positions.net() if positions is not None else 0
+        cdef double projected
+        if order.side == OrderSide.BUY:
+            projected = current + quantity
+            if working is not None:
+                projected += working.long_value
+        else:
+            projected = current - quantity
+            if working is not None:
+                projected -= working.short_value
+
+        if abs(projected) <= abs(current) or abs(projected) <= limits.max_position_size_double * (1 + 1e-9):
+            return None  # Passed
+
+        return (
+            f"Exceeds MAX_POSITION_SIZE of {limits.max_position_size:,} "
+            f"@ {projected:,.{limits.size_precision}f}"
+        )
+
+    cdef str _check_exposure(
+        self,
+        ExposureCounter exposure,
+        max_gross,
+        max_net,
+        bint is_long,
+        double notional,
+        str name,
+    ):
+        cdef double long_value = 0
+        cdef double short_value = 0
+        if exposure is not None:
+            long_value = exposure.long_value
+            short_value = exposure.short_value
+
+        cdef double gross = long_value + short_value + notional
+        if max_gross is not None and gross > float(max_gross) * (1 + 1e-9):
+            return f"Exceeds MAX_GROSS_EXPOSURE_PER_{name} of {max_gross:,} @ {gross:,.2f}"
+
+        cdef double net_before = long_value - short_value
+        cdef double net_after = net_before + notional if is_long else net_before - notional
+        if (
+            max_net is not None
+            and abs(net_after) > abs(net_before)
+            and abs(net_after) > float(max_net) * (1 + 1e-9)
+        ):
+            return f"Exceeds MAX_NET_EXPOSURE_PER_{name} of {max_net:,} @ {net_after:,.2f}"
+
+        return None  # Passed
+
+    cdef double _unit_notional(self, InstrumentRiskLimits limits, Order order) except *:
+        # Return the notional value per unit of quantity, zero if no price is available
+        cdef QuoteTick last
+        cdef double price
+        if order.type == OrderType.MARKET:
+            last = self._cache.quote_tick(limits.instrument.id)
+            if last is None:
+                return 0
+            price = last.ask.as_double() if order.side == OrderSide.BUY else last.bid.as_double()
+        else:
+            price = order.price.as_double()
+
+        return _price_notional(limits, price)
 
 # -- DENIALS ---------------------------------------------------------------------------------------
 
@@ -765,3 +1279,170 @@ cdef class RiskEngine(Component):
     cpdef void _handle_event(self, Event event) except *:
         self._log.debug(f"{RECV}{EVT} {event}.")
         self.event_count += 1
+
+        if not self._track_exposures:
+            return
+
+        cdef int handler = self._event_dispatcher.code_for(event)
+        if handler == EventHandler.ORDER_EVENT:
+            self._update_order_exposure(event)
+        elif handler == EventHandler.POSITION_EVENT:
+            self._update_position_exposure(event)
+
+# -- EXPOSURES -------------------------------------------------------------------------------------
+
+    cdef void _initialize_exposures(self) except *:
+        # Build the exposures from the cache once, thereafter they are
+        # maintained incrementally from order and position events
+        self._order_exposures.clear()
+        self._position_exposures.clear()
+        self._open_order_counts.clear()
+        self._strategy_exposures.clear()
+        self._venue_exposures.clear()
+        self._working_quantities.clear()
+        self._position_quantities.clear()
+
+        cdef Order order
+        cdef Instrument instrument
+        for order in self._cache.orders_active():
+            instrument = self._cache.instrument(order.instrument_id)
+            if instrument is None:
+                self._register_order(order, 0)
+            else:
+                self._register_order(order, self._unit_notional(self._get_limits(instrument), order))
+
+        cdef Position position
+        cdef double quantity
+        cdef double notional
+        for position in self._cache.positions_open():
+            instrument = self._cache.instrument(position.instrument_id)
+            quantity = position.quantity.as_double()
+            notional = 0
+            if instrument is not None:
+                notional = _position_notional(self._get_limits(instrument), quantity, float(position.avg_px_open))
+            self._position_exposures[position.id] = (
+                position.strategy_id,
+                position.instrument_id,
+                position.side == PositionSide.LONG,
+                quantity,
+                notional,
+            )
+            self._apply_position_exposure(
+                position.strategy_id,
+                position.instrument_id,
+                position.side == PositionSide.LONG,
+                quantity,
+                notional,
+            )
+
+    cdef void _update_order_exposure(self, OrderEvent event) except *:
+        cdef Order order = self._cache.order(event.client_order_id)
+        if order is None:
+            return  # Order not applied
+
+        cdef tuple entry = self._order_exposures.get(order.client_order_id)
+        if entry is not None and (isinstance(event, OrderUpdated) or order.is_completed_c()):
+            # Price or quantity may have changed, re-register with the new values
+            self._unregister_order(order.client_order_id, entry)
+            entry = None
+
+        cdef double leaves
+        cdef Instrument instrument
+        if entry is None:
+            if order.is_completed_c():
+                return  # Nothing to track
+            # Orders which did not pass through the pre-trade checks are also tracked
+            instrument = self._cache.instrument(order.instrument_id)
+            if instrument is None:
+                self._register_order(order, 0)
+            else:
+                self._register_order(order, self._unit_notional(self._get_limits(instrument), order))
+            return
+
+        leaves = order.leaves_qty.as_double()
+        if leaves != entry[4]:
+            self._apply_order_exposure(entry[0], entry[1], entry[2], entry[3], leaves - entry[4])
+            self._order_exposures[order.client_order_id] = (entry[0], entry[1], entry[2], entry[3], leaves)
+
+    cdef void _update_position_exposure(self, PositionEvent event) except *:
+        cdef tuple entry = self._position_exposures.pop(event.position_id, None)
+        if entry is not None:
+            # Remove the previous contribution
+            self._apply_position_exposure(entry[0], entry[1], entry[2], -entry[3], -entry[4])
+
+        if event.side == PositionSide.FLAT:
+            return  # Position closed
+
+        cdef Instrument instrument = self._cache.instrument(event.instrument_id)
+        cdef double quantity = event.quantity.as_double()
+        cdef double notional = 0
+        if instrument is not None:
+            notional = _position_notional(self._get_limits(instrument), quantity, float(event.avg_px_open))
+
+        self._position_exposures[event.position_id] = (
+            event.strategy_id,
+            event.instrument_id,
+            event.side == PositionSide.LONG,
+            quantity,
+            notional,
+        )
+        self._apply_position_exposure(
+            event.strategy_id,
+            event.instrument_id,
+            event.side == PositionSide.LONG,
+            quantity,
+            notional,
+        )
+
+    cdef void _register_order(self, Order order, double unit_notional) except *:
+        if order.client_order_id in self._order_exposures:
+            return  # Already registered
+
+        if order.is_reduce_only or order.is_child_order_c():
+            # Reduce only and contingent child orders do not add exposure
+            unit_notional = 0
+
+        cdef double leaves = order.leaves_qty.as_double()
+        cdef bint is_long = order.side == OrderSide.BUY
+        self._order_exposures[order.client_order_id] = (
+            order.strategy_id,
+            order.instrument_id,
+            is_long,
+            unit_notional,
+            leaves,
+        )
+        self._open_order_counts[order.strategy_id] = self._open_order_counts.get(order.strategy_id, 0) + 1
+        self._apply_order_exposure(order.strategy_id, order.instrument_id, is_long, unit_notional, leaves)
+
+    cdef void _unregister_order(self, ClientOrderId client_order_id, tuple entry) except *:
+        del self._order_exposures[client_order_id]
+        self._open_order_counts[entry[0]] -= 1
+        self._apply_order_exposure(entry[0], entry[1], entry[2], entry[3], -entry[4])
+
+    cdef void _apply_order_exposure(
+        self,
+        StrategyId strategy_id,
+        InstrumentId instrument_id,
+        bint is_long,
+        double unit_notional,
+        double quantity,
+    ) except *:
+        _get_counter(self._working_quantities, instrument_id).update(is_long, quantity)
+        if unit_notional == 0:
+            return  # No exposure
+
+        cdef double notional = quantity * unit_notional
+        _get_counter(self._strategy_exposures, strategy_id).update(is_long, notional)
+        _get_counter(self._venue_exposures, instrument_id.venue).update(is_long, notional)
+
+    cdef void _apply_position_exposure(
+        self,
+        StrategyId strategy_id,
+        InstrumentId instrument_id,
+        bint is_long,
+        double quantity,
+        double notional,
+    ) except *:
+        _get_counter(self._position_quantities, instrument_id).update(is_long, quantity)
+        _get_counter(self._strategy_exposures, strategy_id).update(is_long, notional)
+        _get_counter(self._venue_exposures, instrument_id.venue).update(is_long, notional)
@@ -909,6 +909,35 @@ cdef class TradingStrategy(Actor):
                 self.log.exception(ex)
                 raise
 
+    cpdef void _handle_historical_quote_ticks(self, list ticks) except *:
+        # Update indicators in a single batch (ticks are for one instrument)
+        cdef QuoteTick first = ticks[0]
+        cdef list indicators = self._indicators_for_quotes.get(first.instrument_id)  # Could be None
+        cdef Indicator indicator
+        if indicators:
+            for indicator in indicators:
+                indicator.handle_quote_ticks(ticks)
+
+    cpdef void _handle_historical_trade_ticks(self, list ticks) except *:
+        # Update indicators in a single batch (ticks are for one instrument)
+        cdef TradeTick first = ticks[0]
+        cdef list indicators = self._indicators_for_trades.get(first.instrument_id)  # Could be None
+        cdef Indicator indicator
+        if indicators:
+            for indicator in indicators:
+                indicator.handle_trade_ticks(ticks)
+
+    cpdef void _handle_historical_bars(self, list bars) except *:
+        # Update indicators in a single batch (bars are for one bar type)
+        cdef Bar first = bars[0]
+        cdef list indicators = self._indicators_for_bars.get(first.type)  # Could be None
+        cdef Indicator indicator
+        if indicators:
+            for indicator in indicators:
+                indicator.handle_bars(bars)
+
+        Actor._handle_historical_bars(self, bars)
+
 # -- EGRESS ----------------------------------------------------------------------------------------
 
     cdef void _send_exec_cmd(self, TradingCommand command) except *:
@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
+import itertools
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
@@ -31,7 +32,12 @@ from nautilus_trader.common.logging import LoggerAdapter
 from nautilus_trader.common.logging import LogLevel
 from nautilus_trader.common.uuid import UUIDFactory
 from nautilus_trader.live.execution_engine import LiveExecutionEngine
+from nautilus_trader.model.commands.trading import CancelAllOrders
+from nautilus_trader.model.commands.trading import CancelOrder
+from nautilus_trader.model.commands.trading import SubmitOrder
+from nautilus_trader.model.commands.trading import SubmitOrderList
 from nautilus_trader.model.currencies import GBP
+from nautilus_trader.model.enums import OrderStatus
 from nautilus_trader.model.events.order import OrderAccepted
 from nautilus_trader.model.events.order import OrderCanceled
 from nautilus_trader.model.events.order import OrderCancelRejected
@@ -44,11 +50,13 @@ from nautilus_trader.model.events.order import OrderSubmitted
 from nautilus_trader.model.events.order import OrderUpdated
 from nautilus_trader.model.identifiers import AccountId
 from nautilus_trader.model.identifiers import ClientOrderId
+from nautilus_trader.model.identifiers import OrderListId
 from nautilus_trader.model.identifiers import PositionId
 from nautilus_trader.model.identifiers import VenueOrderId
 from nautilus_trader.model.objects import Money
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.orders.list import OrderList
 from nautilus_trader.msgbus.bus import MessageBus
 from nautilus_trader.portfolio.portfolio import Portfolio
 from tests.integration_tests.adapters.betfair.test_kit import BetfairDataProvider
@@ -56,6 +64,7 @@ from tests.integration_tests.adapters.betfair.test_kit import BetfairResponses
 from tests.integration_tests.adapters.betfair.test_kit import BetfairStreaming
 from tests.integration_tests.adapters.betfair.test_kit import BetfairTestStubs
 from tests.integration_tests.adapters.betfair.test_kit import mock_betfair_request
+from tests.integration_tests.adapters.betfair.test_kit import mock_betfair_request_handler
 from tests.test_kit.stubs import TestStubs
 
 
@@ -193,6 +202,34 @@ class TestBetfairExecutionClient:
 
         self.client.venue_order_id_to_client_order_id = venue_order_id_to_client_order_id
 
+    def _mock_place_orders(self):
+        bet_ids = itertools.count(228302937743)
+
+        def handler(params):
+            response = BetfairResponses.betting_place_order_success()
+            report = response["result"]["instructionReports"][0]
+            response["result"]["instructionReports"] = [
+                {**report, "instruction": instruction, "betId": str(next(bet_ids))}
+                for instruction in params["instructions"]
+            ]
+            return response
+
+        mock_betfair_request_handler(self.betfair_client, handler)
+
+    def _mock_cancel_orders(self):
+        def handler(params):
+            response = BetfairResponses.betting_cancel_orders_success()
+            report = response["result"]["instructionReports"][0]
+            response["result"]["instructionReports"] = [
+                {**report, "instruction": instruction} for instruction in params["instructions"]
+            ]
+            return response
+
+        mock_betfair_request_handler(self.betfair_client, handler)
+
+    def _request_params(self):
+        return [call.kwargs["json"]["params"] for call in self.betfair_client.request.call_args_list]
+
     async def _account_state(self):
         account_details = await self.betfair_client.get_account_details()
         account_funds = await self.betfair_client.get_account_funds()
@@ -238,6 +275,152 @@ class TestBetfairExecutionClient:
         assert isinstance(rejected, OrderRejected)
         assert rejected.reason == "PERMISSION_DENIED: ERROR_IN_ORDER"
 
+    @pytest.mark.asyncio
+    async def test_submit_order_list_places_orders_in_single_request(self):
+        # Arrange
+        orders = [
+            BetfairTestStubs.make_order(client_order_id=ClientOrderId(str(i)))
+            for i in range(1, 3)
+        ]
+        command = SubmitOrderList(
+            trader_id=TestStubs.trader_id(),
+            strategy_id=TestStubs.strategy_id(),
+            order_list=OrderList(list_id=OrderListId("1"), orders=orders),
+            command_id=self.uuid_factory.generate(),
+            ts_init=0,
+        )
+        response = BetfairResponses.betting_place_order_success()
+        report = response["result"]["instructionReports"][0]
+        response["result"]["instructionReports"] = [report, {**report, "betId": "228302937744"}]
+        mock_betfair_request(self.betfair_client, response)
+
+        # Act
+        self.client.submit_order_list(command)
+        await asyncio.sleep(0)
+
+        # Assert
+        assert self.betfair_client.request.call_count == 1
+        submitted1, submitted2, accepted1, accepted2 = self.messages
+        assert isinstance(submitted1, OrderSubmitted)
+        assert isinstance(submitted2, OrderSubmitted)
+        assert accepted1.client_order_id == ClientOrderId("1")
+        assert accepted1.venue_order_id == VenueOrderId("228302937743")
+        assert accepted2.client_order_id == ClientOrderId("2")
+        assert accepted2.venue_order_id == VenueOrderId("228302937744")
+
+    @pytest.mark.asyncio
+    async def test_submit_orders_while_request_in_flight_are_coalesced(self):
+        # Arrange
+        commands = [
+            SubmitOrder(
+                trader_id=TestStubs.trader_id(),
+                strategy_id=TestStubs.strategy_id(),
+                position_id=None,
+                order=BetfairTestStubs.make_order(client_order_id=ClientOrderId(str(i))),
+                command_id=self.uuid_factory.generate(),
+                ts_init=0,
+            )
+            for i in range(1, 4)
+        ]
+        self._mock_place_orders()
+
+        # Act
+        for command in commands:
+            self.client.submit_order(command)
+        await asyncio.sleep(0)
+
+        # Assert: the first order is sent alone, the others wait and are sent together
+        params = self._request_params()
+        assert [len(p["instructions"]) for p in params] == [1, 2]
+        assert params[0]["customerRef"] != params[1]["customerRef"]
+        accepted = [m for m in self.messages if isinstance(m, OrderAccepted)]
+        assert [m.client_order_id for m in accepted] == [c.order.client_order_id for c in commands]
+
+    @pytest.mark.asyncio
+    async def test_submit_orders_when_submit_raises_rejects_queued_orders(self):
+        # Arrange
+        commands = [
+            SubmitOrder(
+                trader_id=TestStubs.trader_id(),
+                strategy_id=TestStubs.strategy_id(),
+                position_id=None,
+                order=BetfairTestStubs.make_order(client_order_id=ClientOrderId(str(i))),
+                command_id=self.uuid_factory.generate(),
+                ts_init=0,
+            )
+            for i in range(1, 4)
+        ]
+
+        # Act
+        with patch(
+            "nautilus_trader.adapters.betfair.execution.orders_submit_to_betfair",
+            side_effect=RuntimeError("boom"),
+        ):
+            for command in commands:
+                self.client.submit_order(command)
+            await asyncio.sleep(0)
+
+        # Assert: the failed order and the orders queued behind it are all rejected
+        rejected = [m for m in self.messages if isinstance(m, OrderRejected)]
+        assert [m.client_order_id for m in rejected] == [c.order.client_order_id for c in commands]
+        assert not self.client._pending_place_orders
+
+    @pytest.mark.asyncio
+    async def test_submit_order_list_over_instruction_limit_uses_unique_customer_refs(self):
+        # Arrange
+        orders = [
+            BetfairTestStubs.make_order(client_order_id=ClientOrderId(str(i)))
+            for i in range(1, 251)
+        ]
+        command = SubmitOrderList(
+            trader_id=TestStubs.trader_id(),
+            strategy_id=TestStubs.strategy_id(),
+            order_list=OrderList(list_id=OrderListId("1"), orders=orders),
+            command_id=self.uuid_factory.generate(),
+            ts_init=0,
+        )
+        self._mock_place_orders()
+
+        # Act
+        self.client.submit_order_list(command)
+        await asyncio.sleep(0)
+
+        # Assert
+        params = self._request_params()
+        assert [len(p["instructions"]) for p in params] == [200, 50]
+        customer_refs = [p["customerRef"] for p in params]
+        assert len(set(customer_refs)) == 2
+        assert all(len(ref) <= 32 for ref in customer_refs)
+        assert len([m for m in self.messages if isinstance(m, OrderAccepted)]) == 250
+
+    @pytest.mark.asyncio
+    async def test_cancel_all_orders_cancels_working_orders_in_chunks(self):
+        # Arrange
+        for i in range(1, 71):
+            order = BetfairTestStubs.make_accepted_order(
+                venue_order_id=VenueOrderId(str(228302937743 + i)),
+                client_order_id=ClientOrderId(str(i)),
+            )
+            self.cache.add_order(order, position_id=None)
+        command = CancelAllOrders(
+            trader_id=TestStubs.trader_id(),
+            strategy_id=TestStubs.strategy_id(),
+            instrument_id=BetfairTestStubs.instrument_id(),
+            command_id=self.uuid_factory.generate(),
+            ts_init=0,
+        )
+        self._mock_cancel_orders()
+
+        # Act
+        self.client.cancel_all_orders(command)
+        await asyncio.sleep(0)
+
+        # Assert
+        params = self._request_params()
+        assert [len(p["instructions"]) for p in params] == [60, 10]
+        assert len({p["customerRef"] for p in params}) == 2
+        assert len([m for m in self.messages if isinstance(m, OrderCanceled)]) == 70
+
     @pytest.mark.asyncio
     async def test_modify_order_success(self):
         # Arrange
@@ -351,6 +534,33 @@ class TestBetfairExecutionClient:
         assert isinstance(pending_cancel, OrderPendingCancel)
         assert isinstance(cancelled, OrderCancelRejected)
 
+    @pytest.mark.asyncio
+    async def test_cancel_order_without_venue_order_id_rejects(self):
+        # Arrange
+        order = BetfairTestStubs.make_submitted_order()
+        self.cache.add_order(order, position_id=BetfairTestStubs.position_id())
+
+        command = CancelOrder(
+            trader_id=TestStubs.trader_id(),
+            strategy_id=TestStubs.strategy_id(),
+            instrument_id=order.instrument_id,
+            client_order_id=order.client_order_id,
+            venue_order_id=None,
+            command_id=self.uuid_factory.generate(),
+            ts_init=0,
+        )
+        mock_betfair_request(self.betfair_client, BetfairResponses.betting_cancel_orders_success())
+
+        # Act
+        self.client.cancel_order(command)
+        await asyncio.sleep(0)
+
+        # Assert
+        (rejected,) = self.messages
+        assert isinstance(rejected, OrderCancelRejected)
+        assert rejected.reason == "ORDER MISSING VENUE_ORDER_ID"
+        assert self.betfair_client.request.call_count == 0
+
     @pytest.mark.asyncio
     async def test_order_multiple_fills(self):
         # Arrange
@@ -377,6 +587,33 @@ class TestBetfairExecutionClient:
         ]
         assert result == expected
 
+    @pytest.mark.asyncio
+    async def test_order_stream_updates_before_bet_id_are_replayed_in_order(self):
+        # Arrange
+        self.exec_engine.start()
+        client_order_id = ClientOrderId("1")
+        venue_order_id = VenueOrderId("246938411724")
+        submitted = BetfairTestStubs.make_submitted_order(
+            client_order_id=client_order_id, quantity=Quantity.from_int(20)
+        )
+        self.cache.add_order(submitted, position_id=BetfairTestStubs.position_id())
+
+        # Act
+        for update in BetfairStreaming.ocm_multiple_fills():
+            await self.client._handle_order_stream_update(update)
+        buffered = list(self.messages)
+        self.client._register_venue_order_id(venue_order_id, client_order_id)
+        await asyncio.sleep(0)
+
+        # Assert
+        assert buffered == []
+        assert venue_order_id not in self.client._pending_order_updates
+        assert [fill.last_qty for fill in self.messages] == [
+            Quantity.from_str("16.1900"),
+            Quantity.from_str("0.77"),
+            Quantity.from_str("0.77"),
+        ]
+
     @pytest.mark.asyncio
     async def test_connection_account_state(self):
         # Arrange, Act, Assert
@@ -530,14 +767,71 @@ class TestBetfairExecutionClient:
         assert isinstance(cancel, OrderCanceled) and cancel.venue_order_id.value == "229430281339"
 
     @pytest.mark.asyncio
-    @pytest.mark.skip(reason="Not implemented")
     async def test_generate_order_status_report(self):
-        # Betfair client login
-        orders = await self.betfair_client.list_current_orders()
-        for order in orders:
-            result = await self.client.generate_order_status_report(order=order)
-        assert result
-        raise NotImplementedError()
+        # Arrange
+        mock_betfair_request(self.betfair_client, BetfairResponses.list_current_orders())
+        venue_order_id = VenueOrderId("228059754671")
+        self.client.venue_order_id_to_client_order_id[venue_order_id] = ClientOrderId("1")
+        order = MagicMock(venue_order_id=venue_order_id)
+
+        # Act
+        report = await self.client.generate_order_status_report(order=order)
+
+        # Assert
+        assert report.client_order_id == ClientOrderId("1")
+        assert report.venue_order_id == venue_order_id
+        assert report.order_status == OrderStatus.ACCEPTED
+        assert report.filled_qty == Quantity.from_str("0.0")
+
+    @pytest.mark.asyncio
+    async def test_generate_order_status_report_when_no_order_returns_none(self):
+        # Arrange
+        mock_betfair_request(self.betfair_client, BetfairResponses.list_current_orders_empty())
+        order = MagicMock(venue_order_id=VenueOrderId("228059754671"))
+
+        # Act
+        report = await self.client.generate_order_status_report(order=order)
+
+        # Assert
+        assert report is None
+
+    @pytest.mark.asyncio
+    async def test_generate_order_status_reports(self):
+        # Arrange
+        mock_betfair_request(self.betfair_client, BetfairResponses.list_current_orders())
+        bet_ids = ("228059754671", "228059760965", "228059821049")  # Last order is unknown
+        for i, bet_id in enumerate(bet_ids):
+            self.client.venue_order_id_to_client_order_id[VenueOrderId(bet_id)] = ClientOrderId(
+                str(i)
+            )
+
+        # Act
+        reports = await self.client.generate_order_status_reports(active_orders=[])
+
+        # Assert
+        assert list(reports) == [VenueOrderId(bet_id) for bet_id in bet_ids]
+        assert [r.client_order_id for r in reports.values()] == [
+            ClientOrderId("0"),
+            ClientOrderId("1"),
+            ClientOrderId("2"),
+        ]
+        assert [r.order_status for r in reports.values()] == [
+            OrderStatus.ACCEPTED,
+            OrderStatus.ACCEPTED,
+            OrderStatus.FILLED,
+        ]
+        assert reports[VenueOrderId("228059821049")].filled_qty == Quantity.from_str("10.0")
+
+    @pytest.mark.asyncio
+    async def test_generate_order_status_reports_when_no_orders_returns_empty(self):
+        # Arrange
+        mock_betfair_request(self.betfair_client, BetfairResponses.list_current_orders_empty())
+
+        # Act
+        reports = await self.client.generate_order_status_reports(active_orders=[])
+
+        # Assert
+        assert reports == {}
 
     @pytest.mark.asyncio
     @pytest.mark.skip
@@ -22,6 +22,7 @@ from nautilus_trader.adapters.betfair.client.core import BetfairClient
 from nautilus_trader.adapters.betfair.parsing import _order_quantity_to_stake
 from nautilus_trader.adapters.betfair.parsing import betfair_account_to_account_state
 from nautilus_trader.adapters.betfair.parsing import build_market_update_messages
+from nautilus_trader.adapters.betfair.parsing import make_customer_ref
 from nautilus_trader.adapters.betfair.parsing import make_order
 from nautilus_trader.adapters.betfair.parsing import order_cancel_to_betfair
 from nautilus_trader.adapters.betfair.parsing import order_submit_to_betfair
@@ -127,6 +128,19 @@ class TestBetfairParsing:
         }
         assert result == expected
 
+    def test_make_customer_ref_is_unique_per_chunk_within_length_limit(self):
+        # Arrange
+        command_id = UUID4()
+
+        # Act
+        refs = [make_customer_ref(command_id, chunk_index=i) for i in range(12)]
+
+        # Assert
+        assert refs[0] == command_id.value.replace("-", "")
+        assert len(set(refs)) == 12
+        assert all(len(ref) <= 32 for ref in refs)
+        assert refs[11].endswith("-11")
+
     @pytest.mark.asyncio
     async def test_account_statement(self):
         with patch.object(
@@ -122,6 +122,21 @@ class TestBetfairInstrumentProvider:
         instrument = self.provider.get_betting_instrument(**kw)
         assert instrument is None
 
+    @pytest.mark.asyncio
+    async def test_list_market_instruments_and_search_by_market_use_index(self):
+        await self.provider.load_all_async(market_filter={"market_id": ["1.180678317"]})
+
+        market_instruments = self.provider.list_market_instruments("1.180678317")
+        instruments = self.provider.search_instruments(
+            instrument_filter={"market_id": "1.180678317", "selection_id": "11313157"}
+        )
+
+        assert market_instruments
+        assert all(ins.market_id == "1.180678317" for ins in market_instruments)
+        assert len(instruments) == 1
+        assert instruments[0] in market_instruments
+        assert self.provider.list_market_instruments("1.0") == []
+
     def test_market_update_runner_removed(self):
         update = BetfairStreaming.market_definition_runner_removed()
 
@@ -97,6 +97,21 @@ def mock_betfair_request(obj, response, attr="request"):
     getattr(obj, attr).return_value.set_result(mock_resp)
 
 
+def mock_betfair_request_handler(obj, handler, attr="request"):
+    """
+    Mock the request with a response built from the JSON-RPC params of each call.
+    """
+
+    def request(method, url, **kwargs):
+        mock_resp = MagicMock(spec=ClientResponse)
+        mock_resp.data = orjson.dumps(handler(kwargs["json"]["params"]))
+        future = Future()
+        future.set_result(mock_resp)
+        return future
+
+    setattr(obj, attr, MagicMock(side_effect=request))
+
+
 class BetfairTestStubs:
     @staticmethod
     def integration_endpoint():
@@ -0,0 +1,105 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pkgutil
+
+import pytest
+
+from nautilus_trader.adapters.binance.decoding import BinanceStreamDecoder
+from nautilus_trader.model.data.bar import BarType
+from nautilus_trader.model.data.tick import QuoteTick
+from nautilus_trader.model.data.tick import TradeTick
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.enums import BookAction
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.orderbook.data import OrderBookDeltas
+
+
+ETHUSDT = InstrumentId.from_str("ETHUSDT.BINANCE")
+
+
+def _capture(resource: str) -> bytes:
+    return pkgutil.get_data(
+        package="tests.integration_tests.adapters.binance.resources.streaming",
+        resource=resource,
+    )
+
+
+class TestBinanceStreamDecoder:
+    def setup(self):
+        # Fixture Setup
+        self.decoder = BinanceStreamDecoder()
+
+    def test_decode_book_ticker(self):
+        # Arrange, Act
+        quote = self.decoder.decode(_capture("ws_book_ticker.json"), ts_init=1)
+
+        # Assert
+        assert isinstance(quote, QuoteTick)
+        assert quote.instrument_id == ETHUSDT
+        assert quote.bid == Price.from_str("4507.24000000")
+        assert quote.ask == Price.from_str("4507.25000000")
+        assert quote.bid_size == Quantity.from_str("2.35950000")
+        assert quote.ask_size == Quantity.from_str("2.84570000")
+
+    def test_decode_trade(self):
+        # Arrange, Act
+        trade = self.decoder.decode(_capture("ws_trade.json"), ts_init=1)
+
+        # Assert
+        assert isinstance(trade, TradeTick)
+        assert trade.instrument_id == ETHUSDT
+        assert trade.price == Price.from_str("4149.74000000")
+        assert trade.aggressor_side == AggressorSide.SELL
+        assert trade.trade_id == "705291099"
+        assert trade.ts_event == 1639351062243000000
+
+    def test_decode_depth_update(self):
+        # Arrange, Act
+        deltas = self.decoder.decode(_capture("ws_depth_update.json"), ts_init=1)
+
+        # Assert
+        assert isinstance(deltas, OrderBookDeltas)
+        assert deltas.update_id == 16001236341
+        assert len(deltas.deltas) == 9
+        assert deltas.deltas[0].order.price == 4149.73
+        assert deltas.deltas[1].action == BookAction.DELETE
+        assert deltas.deltas[5].order.price == 4149.74
+
+    def test_decode_closed_kline(self):
+        # Arrange
+        raw = (
+            b'{"stream":"ethusdt@kline_15m","data":{"e":"kline","E":1639351062244,"s":"ETHUSDT",'
+            b'"k":{"t":1639350162000,"T":1639351061999,"s":"ETHUSDT","i":"15m","o":"4100.00",'
+            b'"c":"4149.74","h":"4150.00","l":"4090.00","v":"10.5","n":100,"x":true,'
+            b'"q":"43000.0","V":"5.2","Q":"21000.0"}}}'
+        )
+
+        # Act
+        bar = self.decoder.decode(raw, ts_init=1)
+
+        # Assert
+        assert bar.type == BarType.from_str("ETHUSDT.BINANCE-15-MINUTE-LAST-EXTERNAL")
+        assert bar.close == Price.from_str("4149.74")
+
+    def test_decode_unsupported_stream_raises_value_error(self):
+        # Arrange
+        raw = b'{"stream":"ethusdt@unknown","data":{}}'
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            self.decoder.decode(raw, ts_init=1)
@@ -12,3 +12,76 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
+
+import pkgutil
+
+import orjson
+
+from nautilus_trader.adapters.binance.parsing import parse_exec_report
+from nautilus_trader.adapters.binance.parsing import parse_order_status_report
+from nautilus_trader.model.enums import LiquiditySide
+from nautilus_trader.model.enums import OrderStatus
+from nautilus_trader.model.identifiers import ClientOrderId
+from nautilus_trader.model.identifiers import ExecutionId
+from nautilus_trader.model.identifiers import VenueOrderId
+from nautilus_trader.model.objects import Money
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+
+
+def _load_response(filename: str):
+    return orjson.loads(
+        pkgutil.get_data(
+            package="tests.integration_tests.adapters.binance.resources.responses",
+            resource=filename,
+        )
+    )
+
+
+class TestBinanceParsing:
+    def test_parse_order_status_report_for_new_order(self):
+        # Arrange
+        msg = _load_response("spot_trade_open_orders.json")[0]
+
+        # Act
+        report = parse_order_status_report(msg, ts_init=0)
+
+        # Assert
+        assert report.client_order_id == ClientOrderId("O-20211120-021300-001-001-1")
+        assert report.venue_order_id == VenueOrderId("6929488041")
+        assert report.order_status == OrderStatus.ACCEPTED
+        assert report.filled_qty == Quantity.from_str("0.00000000")
+        assert report.ts_init == 0
+
+    def test_parse_order_status_report_for_partially_filled_order(self):
+        # Arrange
+        msg = _load_response("spot_trade_open_orders.json")[1]
+
+        # Act
+        report = parse_order_status_report(msg, ts_init=0)
+
+        # Assert
+        assert report.client_order_id == ClientOrderId("O-20211120-021300-001-001-2")
+        assert report.venue_order_id == VenueOrderId("7262488532")
+        assert report.order_status == OrderStatus.PARTIALLY_FILLED
+        assert report.filled_qty == Quantity.from_str("0.20000000")
+
+    def test_parse_exec_report(self):
+        # Arrange
+        msg = _load_response("spot_trade_my_trades.json")[0]
+        client_order_id = ClientOrderId("O-20211120-021300-001-001-2")
+
+        # Act
+        report = parse_exec_report(client_order_id, msg, ts_init=0)
+
+        # Assert
+        assert report.client_order_id == client_order_id
+        assert report.venue_order_id == VenueOrderId("7262488532")
+        assert report.venue_position_id is None
+        assert report.id == ExecutionId("681421935")
+        assert report.last_qty == Quantity.from_str("0.20000000")
+        assert report.last_px == Price.from_str("4500.00000000")
+        assert report.commission == Money.from_str("0.90000000 USDT")
+        assert report.liquidity_side == LiquiditySide.MAKER
+        assert report.ts_event == 1637374390000000000
+        assert report.ts_init == 0
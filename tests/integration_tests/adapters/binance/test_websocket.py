@@ -0,0 +1,105 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+from unittest.mock import AsyncMock
+from unittest.mock import patch
+
+from nautilus_trader.adapters.binance.websocket.client import BinanceWebSocketShard
+from nautilus_trader.adapters.binance.websocket.spot import BinanceSpotWebSocket
+from nautilus_trader.common.clock import LiveClock
+from nautilus_trader.common.logging import Logger
+
+
+class TestBinanceWebSocketClient:
+    def setup(self):
+        # Fixture Setup
+        self.loop = asyncio.get_event_loop()
+        self.clock = LiveClock()
+        self.logger = Logger(clock=self.clock)
+        self.messages = []
+
+        self.client = BinanceSpotWebSocket(
+            loop=self.loop,
+            clock=self.clock,
+            logger=self.logger,
+            handler=self.messages.append,
+            max_streams_per_connection=2,
+        )
+
+    def test_subscribe_shards_streams_across_connections(self):
+        # Arrange, Act
+        self.client.subscribe_trades("BTCUSDT")
+        self.client.subscribe_trades("ETHUSDT")
+        self.client.subscribe_trades("BNBUSDT")
+        self.client.subscribe_trades("BTCUSDT")  # Duplicate ignored
+
+        # Assert
+        assert self.client.shard_count == 2
+        assert self.client.subscriptions == ["btcusdt@trade", "ethusdt@trade", "bnbusdt@trade"]
+
+    def test_unsubscribe_frees_capacity_on_shard(self):
+        # Arrange
+        self.client.subscribe_trades("BTCUSDT")
+        self.client.subscribe_trades("ETHUSDT")
+
+        # Act
+        self.client.unsubscribe_trades("BTCUSDT")
+        self.client.subscribe_book_ticker("BTCUSDT")
+
+        # Assert
+        assert self.client.shard_count == 1
+        assert self.client.subscriptions == ["ethusdt@trade", "btcusdt@bookTicker"]
+
+    def test_unsubscribe_book_depth_removes_all_depth_streams(self):
+        # Arrange
+        self.client.subscribe_partial_book_depth("BTCUSDT", depth=5, speed=100)
+        self.client.subscribe_diff_book_depth("BTCUSDT", speed=100)
+        self.client.subscribe_trades("BTCUSDT")
+
+        # Act
+        self.client.unsubscribe_book_depth("BTCUSDT")
+
+        # Assert
+        assert self.client.subscriptions == ["btcusdt@trade"]
+
+    def test_subscribe_after_connect_opens_connection(self):
+        # Arrange
+        with patch.object(BinanceWebSocketShard, "connect", new_callable=AsyncMock) as connect:
+            self.loop.run_until_complete(self.client.connect())  # <-- no subscriptions yet
+
+            # Act
+            self.client.subscribe_trades("BTCUSDT")
+            self.loop.run_until_complete(asyncio.sleep(0))
+
+        # Assert
+        assert self.client.shard_count == 1
+        assert connect.call_count == 1
+        assert self.client.subscriptions == ["btcusdt@trade"]
+
+    def test_subscribe_after_connect_adds_stream_to_live_connection(self):
+        # Arrange
+        with patch.object(BinanceWebSocketShard, "connect", new_callable=AsyncMock) as connect:
+            self.client.subscribe_trades("BTCUSDT")
+            self.loop.run_until_complete(self.client.connect())
+
+            # Act
+            self.client.subscribe_trades("ETHUSDT")
+            self.loop.run_until_complete(asyncio.sleep(0))
+
+        # Assert
+        assert self.client.shard_count == 1
+        assert connect.call_count == 1
+        assert self.client.subscriptions == ["btcusdt@trade", "ethusdt@trade"]
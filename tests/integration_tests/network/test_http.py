@@ -19,6 +19,8 @@ import sys
 import pytest
 
 from nautilus_trader.network.http import HttpClient
+from nautilus_trader.network.http import RateLimiter
+from nautilus_trader.network.http import get_rate_limiter
 from tests.test_kit.stubs import TestStubs
 
 
@@ -44,3 +46,109 @@ async def test_client_get(client):
 async def test_client_post(client):
     resp = await client.post("https://httpbin.org/post")
     assert len(resp.data) > 100
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="failing on windows")
+@pytest.mark.asyncio
+async def test_client_coalesces_identical_inflight_gets(client):
+    resp1, resp2 = await asyncio.gather(
+        client.get("https://httpbin.org/get"),
+        client.get("https://httpbin.org/get"),
+    )
+    assert resp1 is resp2
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="failing on windows")
+@pytest.mark.asyncio
+async def test_client_does_not_coalesce_gets_with_different_headers(client):
+    resp1, resp2 = await asyncio.gather(
+        client.get("https://httpbin.org/get", headers={"X-Test": "1"}),
+        client.get("https://httpbin.org/get", headers={"X-Test": "2"}),
+    )
+    assert resp1 is not resp2
+    assert b'"X-Test": "1"' in resp1.data
+    assert b'"X-Test": "2"' in resp2.data
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="failing on windows")
+@pytest.mark.asyncio
+async def test_client_cancelling_coalesced_get_does_not_cancel_others(client):
+    # Arrange
+    task1 = asyncio.create_task(client.get("https://httpbin.org/delay/1"))
+    task2 = asyncio.create_task(client.get("https://httpbin.org/delay/1"))
+    await asyncio.sleep(0.1)
+
+    # Act
+    task1.cancel()
+    resp = await task2
+
+    # Assert
+    assert task1.cancelled()
+    assert len(resp.data) > 100
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_acquire_consumes_weight():
+    # Arrange
+    limiter = RateLimiter(capacity=10, interval_secs=60)
+
+    # Act
+    await limiter.acquire(4)
+
+    # Assert
+    assert 5.9 < limiter.available() <= 6.1
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_update_used_only_reduces_available():
+    # Arrange
+    limiter = RateLimiter(capacity=10, interval_secs=60)
+    await limiter.acquire(4)
+
+    # Act
+    limiter.update_used(2)  # Server has not yet counted all in-flight weight
+
+    # Assert
+    assert limiter.available() < 6.1
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_acquire_waits_for_refill():
+    # Arrange
+    limiter = RateLimiter(capacity=10, interval_secs=0.1)
+    limiter.update_used(10)
+
+    # Act
+    start = asyncio.get_event_loop().time()
+    await limiter.acquire(5)
+
+    # Assert
+    assert asyncio.get_event_loop().time() - start >= 0.04
+
+
+def test_rate_limiter_acquire_from_multiple_loops():
+    # Arrange
+    limiter = RateLimiter(capacity=10, interval_secs=60)
+    loop1 = asyncio.new_event_loop()
+    loop2 = asyncio.new_event_loop()
+
+    # Act
+    try:
+        loop1.run_until_complete(limiter.acquire(2))
+        loop2.run_until_complete(limiter.acquire(2))  # <-- must not use the lock of loop1
+    finally:
+        loop1.close()
+        loop2.close()
+
+    # Assert
+    assert 5.9 < limiter.available() <= 6.1
+
+
+def test_get_rate_limiter_shares_limiter_for_key():
+    # Arrange, Act
+    limiter1 = get_rate_limiter("test:shared", capacity=10, interval_secs=1)
+    limiter2 = get_rate_limiter("test:shared", capacity=20, interval_secs=1)
+
+    # Assert
+    assert limiter1 is limiter2
+    assert limiter1.capacity == 10
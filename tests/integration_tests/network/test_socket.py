@@ -26,7 +26,7 @@ async def test_socket_base(socket_server, event_loop):
     messages = []
 
     def handler(raw):
-        messages.append(raw)
+        messages.append(bytes(raw))
         if len(messages) > 5:
             client.stop()
 
@@ -44,3 +44,42 @@ async def test_socket_base(socket_server, event_loop):
     assert messages == [b"hello"] * 6
     await asyncio.sleep(1)
     client.stop()
+
+
+@pytest.mark.asyncio
+async def test_socket_splits_batched_partial_and_large_frames(event_loop):
+    large = b"x" * 100_000
+    sent = asyncio.Event()
+
+    async def serve(reader, writer):
+        writer.write(b"one\r\ntwo\r\nth")  # Several frames in one read
+        await writer.drain()
+        await asyncio.sleep(0.1)
+        writer.write(b"ree\r")  # Delimiter split across reads
+        await writer.drain()
+        await asyncio.sleep(0.1)
+        writer.write(b"\n" + large + b"\r\n")  # Larger than the receive buffer
+        await writer.drain()
+        sent.set()
+        await reader.read()
+
+    server = await asyncio.start_server(serve, "127.0.0.1", 0)
+    host, port = server.sockets[0].getsockname()
+    messages = []
+
+    client = SocketClient(
+        host=host,
+        port=port,
+        loop=event_loop,
+        handler=lambda raw: messages.append(bytes(raw)),
+        logger=TestStubs.logger(),
+        ssl=False,
+        buffer_size=1024,
+    )
+    await client.connect()
+    await sent.wait()
+    await asyncio.sleep(0.5)
+
+    assert messages == [b"one", b"two", b"three", large]
+    await client.disconnect()
+    server.close()
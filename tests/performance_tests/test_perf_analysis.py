@@ -0,0 +1,74 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from datetime import datetime
+from datetime import timedelta
+
+import pandas as pd
+import pytest
+from numpy import float64
+
+from nautilus_trader.analysis.performance import PerformanceAnalyzer
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.identifiers import PositionId
+from nautilus_trader.model.objects import Money
+from tests.test_kit.performance import PerformanceHarness
+
+
+TRADE_COUNT = 10_000
+
+POSITION_IDS = [PositionId(f"P-{i}") for i in range(TRADE_COUNT)]
+REALIZED_PNLS = [Money((i % 7) - 3, USD) for i in range(TRADE_COUNT)]
+TIMESTAMPS = [datetime(2021, 1, 1) + timedelta(minutes=i) for i in range(TRADE_COUNT)]
+
+
+def analyze_with_series_loc():
+    # The previous implementation, which reindexes the series on every add
+    realized_pnls = pd.Series(dtype=float64)
+    returns = pd.Series(dtype=float64)
+    for position_id, pnl, timestamp in zip(POSITION_IDS, REALIZED_PNLS, TIMESTAMPS):
+        realized_pnls.loc[position_id.value] = pnl.as_double()
+        if timestamp not in returns:
+            returns.loc[timestamp] = 0.0
+        returns.loc[timestamp] += 0.01
+    return realized_pnls.max(), returns.sort_index()
+
+
+def analyze_with_analyzer():
+    analyzer = PerformanceAnalyzer()
+    for position_id, pnl, timestamp in zip(POSITION_IDS, REALIZED_PNLS, TIMESTAMPS):
+        analyzer.add_trade(position_id, pnl)
+        analyzer.add_return(timestamp, 0.01)
+    return analyzer.max_winner(USD), analyzer.returns()
+
+
+class TestPerformanceAnalyzerPerformance(PerformanceHarness):
+    @pytest.fixture(autouse=True)
+    def setup_benchmark(self, benchmark):
+        self.benchmark = benchmark
+
+    def test_add_trades_and_returns_with_series_loc(self):
+        self.benchmark.pedantic(
+            target=analyze_with_series_loc,
+            iterations=1,
+            rounds=1,
+        )
+
+    def test_add_trades_and_returns_with_analyzer(self):
+        self.benchmark.pedantic(
+            target=analyze_with_analyzer,
+            iterations=1,
+            rounds=1,
+        )
@@ -0,0 +1,76 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pkgutil
+
+import pytest
+
+from nautilus_trader.adapters.binance.decoding import BinanceStreamDecoder
+from tests.test_kit.performance import PerformanceHarness
+
+
+def _capture(resource: str) -> bytes:
+    return pkgutil.get_data(
+        package="tests.integration_tests.adapters.binance.resources.streaming",
+        resource=resource,
+    )
+
+
+class TestBinanceStreamDecoderPerformance(PerformanceHarness):
+    def setup(self):
+        # Fixture Setup
+        self.decoder = BinanceStreamDecoder()
+
+        # Replay of recorded captures (weighted towards depth updates as live)
+        self.captures = (
+            [_capture("ws_depth_update.json")] * 8
+            + [_capture("ws_trade.json")]
+            + [_capture("ws_book_ticker.json")]
+        )
+
+    @pytest.fixture(autouse=True)
+    def setup_benchmark(self, benchmark):
+        self.benchmark = benchmark
+
+    def replay(self):
+        decode = self.decoder.decode
+        for raw in self.captures:
+            decode(raw, 0)
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    def test_decode_depth_update(self):
+        self.benchmark.pedantic(
+            target=self.decoder.decode,
+            args=(_capture("ws_depth_update.json"), 0),
+            iterations=10_000,
+            rounds=1,
+        )
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    def test_decode_trade(self):
+        self.benchmark.pedantic(
+            target=self.decoder.decode,
+            args=(_capture("ws_trade.json"), 0),
+            iterations=10_000,
+            rounds=1,
+        )
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    def test_replay_captures(self):
+        self.benchmark.pedantic(
+            target=self.replay,
+            iterations=1_000,
+            rounds=1,
+        )
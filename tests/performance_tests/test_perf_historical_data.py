@@ -0,0 +1,129 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.logging import Logger
+from nautilus_trader.indicators.average.ema import ExponentialMovingAverage
+from nautilus_trader.model.data.bar import Bar
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.msgbus.bus import MessageBus
+from nautilus_trader.portfolio.portfolio import Portfolio
+from nautilus_trader.trading.strategy import TradingStrategy
+from tests.test_kit.performance import PerformanceHarness
+from tests.test_kit.stubs import TestStubs
+
+
+class TestHistoricalDataPerformance(PerformanceHarness):
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.logger = Logger(clock=self.clock, bypass=True)
+        self.trader_id = TestStubs.trader_id()
+
+        self.msgbus = MessageBus(
+            trader_id=self.trader_id,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.cache = TestStubs.cache()
+
+        self.portfolio = Portfolio(
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.bar_type = TestStubs.bartype_audusd_1min_bid()
+
+        self.strategy = TradingStrategy()
+        self.strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+        self.strategy.register_indicator_for_bars(self.bar_type, ExponentialMovingAverage(10))
+        self.strategy.register_indicator_for_bars(self.bar_type, ExponentialMovingAverage(20))
+
+        self.bars = [
+            Bar(
+                bar_type=self.bar_type,
+                open=Price.from_str("1.00002"),
+                high=Price.from_str("1.00004"),
+                low=Price.from_str("1.00001"),
+                close=Price.from_str("1.00003"),
+                volume=Quantity.from_int(1_000_000),
+                ts_event=i,
+                ts_init=i,
+            )
+            for i in range(10_000)
+        ]
+
+    @pytest.fixture(autouse=True)
+    def setup_benchmark(self, benchmark):
+        self.benchmark = benchmark
+
+    def handle_bars_per_item(self):
+        for bar in self.bars:
+            self.strategy.handle_bar(bar, is_historical=True)
+
+    def add_bars_batch(self):
+        self.cache.reset()  # Bars are only bulk added to an empty cache
+        self.cache.add_bars(self.bars)
+
+    def add_bars_per_item(self):
+        self.cache.reset()
+        for bar in self.bars:
+            self.cache.add_bar(bar)
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    def test_strategy_handle_bars_batch(self):
+        self.benchmark.pedantic(
+            target=self.strategy.handle_bars,
+            args=(self.bars,),
+            iterations=100,
+            rounds=1,
+        )
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    def test_strategy_handle_bars_per_item(self):
+        self.benchmark.pedantic(
+            target=self.handle_bars_per_item,
+            iterations=100,
+            rounds=1,
+        )
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    def test_cache_add_bars_batch(self):
+        self.benchmark.pedantic(
+            target=self.add_bars_batch,
+            iterations=100,
+            rounds=1,
+        )
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    def test_cache_add_bars_per_item(self):
+        self.benchmark.pedantic(
+            target=self.add_bars_per_item,
+            iterations=100,
+            rounds=1,
+        )
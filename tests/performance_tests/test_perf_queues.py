@@ -17,6 +17,8 @@ from collections import deque
 
 import pytest
 
+from nautilus_trader.common.queue import Queue
+from nautilus_trader.common.queue import RingBuffer
 from tests.test_kit.performance import PerformanceHarness
 
 
@@ -51,3 +53,56 @@ class TestPythonDequePerformance(PerformanceHarness):
             rounds=1,
         )
         # ~0.0ms / ~0.1μs / 144ns minimum of 100,000 runs @ 1 iteration each run.
+
+
+def push_pop_queue(queue):
+    for i in range(1000):
+        queue.put_nowait(i)
+    while not queue.empty():
+        queue.get_nowait()
+
+
+def push_pop_ring_buffer(buffer):
+    for i in range(1000):
+        buffer.push(i)
+    while not buffer.empty():
+        buffer.pop()
+
+
+def push_drain_ring_buffer(buffer):
+    for i in range(1000):
+        buffer.push(i)
+    buffer.drain()
+
+
+class TestQueuePerformance(PerformanceHarness):
+    @pytest.fixture(autouse=True)
+    def setup_benchmark(self, benchmark):
+        self.benchmark = benchmark
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    def test_queue_put_get(self):
+        self.benchmark.pedantic(
+            target=push_pop_queue,
+            args=(Queue(),),
+            iterations=1000,
+            rounds=1,
+        )
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    def test_ring_buffer_push_pop(self):
+        self.benchmark.pedantic(
+            target=push_pop_ring_buffer,
+            args=(RingBuffer(capacity=1024),),
+            iterations=1000,
+            rounds=1,
+        )
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    def test_ring_buffer_push_drain(self):
+        self.benchmark.pedantic(
+            target=push_drain_ring_buffer,
+            args=(RingBuffer(capacity=1024),),
+            iterations=1000,
+            rounds=1,
+        )
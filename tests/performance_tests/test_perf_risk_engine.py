@@ -0,0 +1,109 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.backtest.data.providers import TestInstrumentProvider
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.common.logging import Logger
+from nautilus_trader.common.uuid import UUIDFactory
+from nautilus_trader.model.commands.trading import SubmitOrder
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import StrategyId
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.msgbus.bus import MessageBus
+from nautilus_trader.portfolio.portfolio import Portfolio
+from nautilus_trader.risk.config import RiskEngineConfig
+from nautilus_trader.risk.engine import RiskEngine
+from tests.test_kit.performance import PerformanceHarness
+from tests.test_kit.stubs import TestStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+
+class TestRiskEnginePerformance(PerformanceHarness):
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.logger = Logger(clock=self.clock, bypass=True)
+        self.trader_id = TestStubs.trader_id()
+
+        self.msgbus = MessageBus(
+            trader_id=self.trader_id,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.cache = TestStubs.cache()
+        self.cache.add_instrument(AUDUSD_SIM)
+
+        self.portfolio = Portfolio(
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.risk_engine = RiskEngine(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+            config=RiskEngineConfig(
+                max_order_rate="10000000/00:00:01",
+                max_notional_per_order={AUDUSD_SIM.id.value: 10_000_000},
+            ),
+        )
+
+        # Stand in for the execution engine
+        self.msgbus.register(endpoint="ExecEngine.execute", handler=lambda command: None)
+
+        order_factory = OrderFactory(
+            trader_id=self.trader_id,
+            strategy_id=StrategyId("S-001"),
+            clock=self.clock,
+        )
+
+        order = order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("1.00000"),
+        )
+
+        self.submit_order = SubmitOrder(
+            self.trader_id,
+            order.strategy_id,
+            None,
+            order,
+            UUIDFactory().generate(),
+            self.clock.timestamp_ns(),
+        )
+
+    @pytest.fixture(autouse=True)
+    def setup_benchmark(self, benchmark):
+        self.benchmark = benchmark
+
+    def test_submit_order_pre_trade_checks(self):
+        self.benchmark.pedantic(
+            target=self.risk_engine.execute,
+            args=(self.submit_order,),
+            iterations=100_000,
+            rounds=1,
+        )
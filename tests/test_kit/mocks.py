@@ -162,6 +162,10 @@ class MockActor(Actor):
         self.calls.append(inspect.currentframe().f_code.co_name)
         self.object_storer.store(bar)
 
+    def on_historical_bars(self, bars) -> None:
+        self.calls.append(inspect.currentframe().f_code.co_name)
+        self.object_storer.store(bars)
+
     def on_data(self, data) -> None:
         self.calls.append(inspect.currentframe().f_code.co_name)
         self.object_storer.store(data)
@@ -89,6 +89,23 @@ class TestAnalyzer:
         # Assert
         assert len(result) == 10
 
+    def test_analyzer_returns_sorted_and_aggregated_by_timestamp(self):
+        # Arrange
+        t1 = datetime(year=2010, month=1, day=1)
+        t2 = datetime(year=2010, month=1, day=2)
+        t3 = datetime(year=2010, month=1, day=3)
+
+        # Act
+        self.analyzer.add_return(t3, 0.10)
+        self.analyzer.add_return(t1, 0.05)
+        self.analyzer.add_return(t2, -0.10)
+        self.analyzer.add_return(t3, 0.15)
+        result = self.analyzer.returns()
+
+        # Assert
+        assert list(result.index) == [t1, t2, t3]
+        assert list(result.values) == [0.05, -0.10, 0.25]
+
     def test_get_realized_pnls_when_all_flat_positions_returns_expected_series(self):
         # Arrange
         order1 = self.order_factory.market(
@@ -13,6 +13,9 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+import pyarrow.parquet as pq
+
 from nautilus_trader.accounting.accounts.margin import MarginAccount
 from nautilus_trader.analysis.reports import ReportProvider
 from nautilus_trader.backtest.data.providers import TestInstrumentProvider
@@ -145,10 +148,11 @@ class TestReportProvider:
         assert report.iloc[0]["instrument_id"] == "AUD/USD.SIM"
         assert report.iloc[0]["side"] == "BUY"
         assert report.iloc[0]["type"] == "LIMIT"
-        assert report.iloc[0]["quantity"] == "1500000"
-        assert report.iloc[0]["avg_px"] == "0.80011"
-        assert report.iloc[0]["slippage"] == "0.00001"
-        assert report.iloc[1]["avg_px"] is None
+        assert report.iloc[0]["quantity"] == 1500000.0
+        assert report.iloc[0]["avg_px"] == 0.80011
+        assert report.iloc[0]["slippage"] == 0.00001
+        assert np.isnan(report.iloc[1]["avg_px"])
+        assert report["quantity"].dtype == np.float64
 
     def test_generate_order_fills_report(self):
         # Arrange
@@ -194,9 +198,9 @@ class TestReportProvider:
         assert report.iloc[0]["instrument_id"] == "AUD/USD.SIM"
         assert report.iloc[0]["side"] == "BUY"
         assert report.iloc[0]["type"] == "LIMIT"
-        assert report.iloc[0]["quantity"] == "1500000"
-        assert report.iloc[0]["avg_px"] == "0.80011"
-        assert report.iloc[0]["slippage"] == "0.00001"
+        assert report.iloc[0]["quantity"] == 1500000.0
+        assert report.iloc[0]["avg_px"] == 0.80011
+        assert report.iloc[0]["slippage"] == 0.00001
 
     def test_generate_positions_report(self):
         # Arrange
@@ -246,10 +250,59 @@ class TestReportProvider:
         assert report.iloc[0]["instrument_id"] == "AUD/USD.SIM"
         assert report.iloc[0]["entry"] == "BUY"
         assert report.iloc[0]["side"] == "FLAT"
-        assert report.iloc[0]["peak_qty"] == "100000"
-        assert report.iloc[0]["avg_px_open"] == "1.00010"
-        assert report.iloc[0]["avg_px_close"] == "1.00010"
+        assert report.iloc[0]["peak_qty"] == 100000.0
+        assert report.iloc[0]["avg_px_open"] == 1.0001
+        assert report.iloc[0]["avg_px_close"] == 1.0001
         assert report.iloc[0]["ts_opened"] == UNIX_EPOCH
         assert report.iloc[0]["ts_closed"] == UNIX_EPOCH
-        assert report.iloc[0]["realized_points"] == "0.00000"
-        assert report.iloc[0]["realized_return"] == "0.00000"
+        assert report.iloc[0]["realized_points"] == 0.0
+        assert report.iloc[0]["realized_return"] == 0.0
+        assert report.iloc[0]["realized_pnl"] == -4.0
+        assert report.iloc[0]["currency"] == "USD"
+
+    def test_write_positions_table_to_parquet(self, tmp_path):
+        # Arrange
+        order1 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+        )
+
+        order2 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100000),
+        )
+
+        fill1 = TestStubs.event_order_filled(
+            order1,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-123456"),
+            strategy_id=StrategyId("S-001"),
+            last_px=Price.from_str("1.00010"),
+        )
+
+        fill2 = TestStubs.event_order_filled(
+            order2,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-123456"),
+            strategy_id=StrategyId("S-001"),
+            last_px=Price.from_str("1.00020"),
+        )
+
+        position = Position(instrument=AUDUSD_SIM, fill=fill1)
+        position.apply(fill2)
+
+        path = str(tmp_path / "positions.parquet")
+
+        # Act
+        table = ReportProvider.generate_positions_table([position])
+        ReportProvider.write_parquet(table, path)
+
+        # Assert
+        result = pq.read_table(path)
+        assert result.num_rows == 1
+        assert result.column("position_id").to_pylist() == ["P-123456"]
+        assert result.column("avg_px_close").to_pylist() == [1.0002]
+        assert str(result.schema.field("peak_qty").type) == "double"
+        assert str(result.schema.field("ts_closed").type) == "timestamp[ns, tz=UTC]"
@@ -197,6 +197,22 @@ class TestBacktestConfig:
             "end": datetime.datetime(2020, 1, 31, 20, 59, 54, 501000, tzinfo=datetime.timezone.utc),
         }
 
+    def test_backtest_data_config_catalog_query_cache(self):
+        # Arrange
+        c = BacktestDataConfig(
+            catalog_path="/root/",
+            catalog_fs_protocol="memory",
+            catalog_fs_storage_options={},
+            catalog_query_cache_max_bytes=1_000,
+        )
+
+        # Act
+        catalog = c.catalog()
+
+        # Assert
+        assert catalog.query_cache_max_bytes == 1_000
+        assert c.catalog() is catalog
+
     def test_backtest_config_partial(self):
         # Arrange
         config = BacktestRunConfig()
@@ -66,8 +66,8 @@ class TestQuoteTickDataWrangler:
         assert ticks[0].ask == Price.from_str("86.728")
         assert ticks[0].bid_size == Quantity.from_int(1000000)
         assert ticks[0].ask_size == Quantity.from_int(1000000)
-        assert ticks[0].ts_event == 1357077600295000064
-        assert ticks[0].ts_event == 1357077600295000064
+        assert ticks[0].ts_event == 1357077600295000000
+        assert ticks[0].ts_init == 1357077600295000000
 
     def test_process_tick_data_with_delta(self):
         # Arrange
@@ -90,8 +90,8 @@ class TestQuoteTickDataWrangler:
         assert ticks[0].ask == Price.from_str("86.728")
         assert ticks[0].bid_size == Quantity.from_int(1000000)
         assert ticks[0].ask_size == Quantity.from_int(1000000)
-        assert ticks[0].ts_event == 1357077600295000064
-        assert ticks[0].ts_init == 1357077600296000564  # <-- delta diff
+        assert ticks[0].ts_event == 1357077600295000000
+        assert ticks[0].ts_init == 1357077600296000500  # <-- delta diff
 
     def test_pre_process_bar_data_with_delta(self):
         # Arrange
@@ -147,6 +147,46 @@ class TestQuoteTickDataWrangler:
         assert ticks[3].bid == Price.from_str("91.653")
         assert ticks[3].ask == Price.from_str("91.655")
 
+    def test_pre_process_bar_data_orders_ticks_by_timestamp(self):
+        # Arrange
+        usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+        provider = TestDataProvider()
+        bid_data = provider.read_csv_bars("fxcm-usdjpy-m1-bid-2013.csv")[:100]
+        ask_data = provider.read_csv_bars("fxcm-usdjpy-m1-ask-2013.csv")[:100]
+
+        wrangler = QuoteTickDataWrangler(instrument=usdjpy)
+
+        # Act
+        ticks = wrangler.process_bar_data(bid_data=bid_data, ask_data=ask_data)
+
+        # Assert
+        assert len(ticks) == 400
+        assert [t.ts_event for t in ticks] == sorted(t.ts_event for t in ticks)
+        assert ticks[1].ts_event - ticks[0].ts_event == 100_000_000
+        assert ticks[3].ts_event == 1359676800000000000
+        assert ticks[3].bid == Price.from_str("91.653")  # <-- close
+
+    def test_pre_process_bar_data_aligns_bid_and_ask_by_timestamp(self):
+        # Arrange
+        usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+        provider = TestDataProvider()
+        bid_data = provider.read_csv_bars("fxcm-usdjpy-m1-bid-2013.csv")[:100]
+        ask_data = provider.read_csv_bars("fxcm-usdjpy-m1-ask-2013.csv")[:100]
+
+        wrangler = QuoteTickDataWrangler(instrument=usdjpy)
+        expected = wrangler.process_bar_data(bid_data=bid_data, ask_data=ask_data)
+
+        # Act
+        ticks = wrangler.process_bar_data(
+            bid_data=bid_data,
+            ask_data=ask_data.iloc[::-1].copy(),  # <-- rows in a different order
+        )
+
+        # Assert
+        assert [(t.bid, t.ask, t.ts_event) for t in ticks] == [
+            (t.bid, t.ask, t.ts_event) for t in expected
+        ]
+
 
 class TestTradeTickDataWrangler:
     def setup(self):
@@ -175,8 +215,8 @@ class TestTradeTickDataWrangler:
         assert ticks[0].size == Quantity.from_str("2.67900")
         assert ticks[0].aggressor_side == AggressorSide.SELL
         assert ticks[0].trade_id == "148568980"
-        assert ticks[0].ts_event == 1597399200223000064
-        assert ticks[0].ts_init == 1597399200223000064
+        assert ticks[0].ts_event == 1597399200223000000
+        assert ticks[0].ts_init == 1597399200223000000
 
     def test_process_with_delta(self):
         # Arrange
@@ -196,8 +236,8 @@ class TestTradeTickDataWrangler:
         assert ticks[0].size == Quantity.from_str("2.67900")
         assert ticks[0].aggressor_side == AggressorSide.SELL
         assert ticks[0].trade_id == "148568980"
-        assert ticks[0].ts_event == 1597399200223000064
-        assert ticks[0].ts_init == 1597399200224000564  # <-- delta diff
+        assert ticks[0].ts_event == 1597399200223000000
+        assert ticks[0].ts_init == 1597399200224000500  # <-- delta diff
 
 
 class TestBarDataWrangler:
@@ -322,8 +362,8 @@ class TestTardisQuoteDataWrangler:
         assert ticks[0].ask == Price.from_str("9682.00")
         assert ticks[0].bid_size == Quantity.from_str("0.670000")
         assert ticks[0].ask_size == Quantity.from_str("0.840000")
-        assert ticks[0].ts_event == 1582329603502091776
-        assert ticks[0].ts_init == 1582329603503092277
+        assert ticks[0].ts_event == 1582329603502092000
+        assert ticks[0].ts_init == 1582329603503092501
 
 
 class TestTardisTradeDataWrangler:
@@ -355,5 +395,5 @@ class TestTardisTradeDataWrangler:
         assert ticks[0].size == Quantity.from_str("0.132000")
         assert ticks[0].aggressor_side == AggressorSide.BUY
         assert ticks[0].trade_id == "42377944"
-        assert ticks[0].ts_event == 1582329602418379008
-        assert ticks[0].ts_init == 1582329602418379008
+        assert ticks[0].ts_event == 1582329602418379000
+        assert ticks[0].ts_init == 1582329602418379000
@@ -1045,6 +1045,48 @@ class TestActor:
         assert actor.calls == ["on_start", "on_bar"]
         assert actor.object_storer.get_store()[0] == bar
 
+    def test_handle_bars_sends_batch_to_on_historical_bars(self):
+        # Arrange
+        actor = MockActor()
+        actor.register_base(
+            trader_id=self.trader_id,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        actor.start()
+
+        bars = [TestStubs.bar_5decimal(), TestStubs.bar_5decimal()]
+
+        # Act
+        actor.handle_bars(bars)
+
+        # Assert
+        assert actor.calls == ["on_start", "on_historical_bars"]  # <-- not passed to on_bar
+        assert actor.object_storer.get_store()[0] == bars
+
+    def test_handle_bars_when_not_running_does_not_send_to_on_historical_bars(self):
+        # Arrange
+        actor = MockActor()
+        actor.register_base(
+            trader_id=self.trader_id,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        bars = [TestStubs.bar_5decimal(), TestStubs.bar_5decimal()]
+
+        # Act
+        actor.handle_bars(bars)
+
+        # Assert
+        assert actor.calls == []
+        assert actor.object_storer.get_store() == []
+
     def test_handle_data_when_not_running_does_not_send_to_on_data(self):
         # Arrange
         actor = MockActor()
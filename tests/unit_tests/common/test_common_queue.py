@@ -14,10 +14,13 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
+import threading
 
 import pytest
 
 from nautilus_trader.common.queue import Queue
+from nautilus_trader.common.queue import RingBuffer
+from nautilus_trader.common.queue import SPSCRingBuffer
 
 
 class TestQueue:
@@ -196,3 +199,216 @@ class TestQueue:
         assert result == ["C", "B", "A"]
         assert queue.get_nowait() == "A"
         assert result == ["C", "B", "A"]  # <-- confirm was copy
+
+    def test_put_deferred_when_full_preserves_order(self):
+        # Arrange
+        queue = Queue(maxsize=1)
+
+        # Act
+        deferred = [queue.put_deferred(item) for item in ("A", "B", "C")]
+
+        # Assert
+        assert deferred == [False, True, True]
+        assert queue.qsize() == 3
+        assert queue.count == 1
+        assert queue.overflow_qsize() == 2
+        assert [queue.get_nowait() for _ in range(3)] == ["A", "B", "C"]
+        assert queue.empty()
+        assert queue.overflow_qsize() == 0
+
+    def test_put_deferred_when_overflow_full_raises_queue_full(self):
+        # Arrange
+        queue = Queue(maxsize=1, overflow_maxsize=2)
+        for item in ("A", "B", "C"):
+            queue.put_deferred(item)
+
+        # Act, Assert
+        assert queue.overflow_maxsize == 2
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_deferred("D")
+        assert queue.overflow_qsize() == 2
+        assert queue.get_nowait() == "A"
+        assert queue.put_deferred("D")  # <-- space in overflow again
+        assert [queue.get_nowait() for _ in range(3)] == ["B", "C", "D"]
+
+    def test_peek_and_to_list_include_deferred_items(self):
+        # Arrange
+        queue = Queue(maxsize=2)
+        for item in ("A", "B", "C", "D"):
+            queue.put_deferred(item)
+
+        # Act, Assert
+        assert queue.to_list() == ["D", "C", "B", "A"]
+        assert queue.peek_back() == "D"
+        assert queue.peek_front() == "A"
+        assert [queue.peek_index(i) for i in range(4)] == ["D", "C", "B", "A"]
+        assert [queue.peek_index(i) for i in range(-1, -5, -1)] == ["A", "B", "C", "D"]
+
+
+class TestRingBuffer:
+    def test_instantiation_rounds_capacity_to_power_of_two(self):
+        # Arrange
+        buffer = RingBuffer(capacity=5)
+
+        # Act, Assert
+        assert buffer.capacity == 8
+        assert buffer.count == 0
+        assert len(buffer) == 0
+        assert buffer.empty()
+        assert not buffer.full()
+        assert buffer.peek() is None
+
+    def test_instantiation_with_invalid_capacity_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            RingBuffer(capacity=0)
+
+    def test_push_and_pop_returns_items_in_fifo_order(self):
+        # Arrange
+        buffer = RingBuffer(capacity=4)
+        buffer.push("A")
+        buffer.push("B")
+        buffer.push("C")
+
+        # Act
+        result = [buffer.pop() for _ in range(3)]
+
+        # Assert
+        assert result == ["A", "B", "C"]
+        assert buffer.empty()
+
+    def test_push_and_pop_wraps_around_capacity(self):
+        # Arrange
+        buffer = RingBuffer(capacity=2)
+
+        # Act
+        result = []
+        for i in range(5):
+            buffer.push(i)
+            result.append(buffer.pop())
+
+        # Assert
+        assert result == [0, 1, 2, 3, 4]
+        assert buffer.capacity == 2
+
+    def test_push_when_full_returns_false(self):
+        # Arrange
+        buffer = RingBuffer(capacity=2)
+        buffer.push("A")
+        buffer.push("B")
+
+        # Act
+        result = buffer.push("C")
+
+        # Assert
+        assert not result
+        assert buffer.full()
+        assert buffer.count == 2
+        assert buffer.drain() == ["A", "B"]
+
+    def test_push_when_full_with_auto_grow_grows_buffer(self):
+        # Arrange
+        buffer = RingBuffer(capacity=2, auto_grow=True)
+        buffer.push("A")
+        buffer.push("B")
+        buffer.pop()
+        buffer.push("C")
+
+        # Act
+        result = buffer.push("D")
+
+        # Assert
+        assert result
+        assert buffer.capacity == 4
+        assert buffer.drain() == ["B", "C", "D"]
+
+    def test_pop_from_empty_buffer_raises_index_error(self):
+        # Arrange
+        buffer = RingBuffer()
+
+        # Act, Assert
+        with pytest.raises(IndexError):
+            buffer.pop()
+
+    def test_peek_returns_front_item_without_popping(self):
+        # Arrange
+        buffer = RingBuffer()
+        buffer.push("A")
+        buffer.push("B")
+
+        # Act, Assert
+        assert buffer.peek() == "A"
+        assert buffer.count == 2
+
+    def test_drain_with_limit_returns_front_items(self):
+        # Arrange
+        buffer = RingBuffer()
+        for item in ["A", "B", "C"]:
+            buffer.push(item)
+
+        # Act
+        result = buffer.drain(limit=2)
+
+        # Assert
+        assert result == ["A", "B"]
+        assert buffer.pop() == "C"
+
+    def test_clear_removes_all_items(self):
+        # Arrange
+        buffer = RingBuffer()
+        buffer.push("A")
+        buffer.push("B")
+
+        # Act
+        buffer.clear()
+
+        # Assert
+        assert buffer.empty()
+        assert buffer.peek() is None
+
+
+class TestSPSCRingBuffer:
+    @pytest.mark.asyncio
+    async def test_push_from_producer_thread_hands_all_items_to_handler(self):
+        # Arrange
+        loop = asyncio.get_event_loop()
+        received = []
+        done = asyncio.Event()
+
+        def handler(items):
+            received.extend(items)
+            if len(received) == 1000:
+                done.set()
+
+        buffer = SPSCRingBuffer(capacity=2048, handler=handler, loop=loop)
+
+        def produce():
+            for i in range(1000):
+                buffer.push(i)
+
+        # Act
+        producer = threading.Thread(target=produce)
+        producer.start()
+        await asyncio.wait_for(done.wait(), timeout=5.0)
+        producer.join()
+
+        # Assert
+        assert received == list(range(1000))
+        assert buffer.empty()
+
+    @pytest.mark.asyncio
+    async def test_push_when_full_returns_false(self):
+        # Arrange
+        buffer = SPSCRingBuffer(
+            capacity=1,
+            handler=lambda items: None,
+            loop=asyncio.get_event_loop(),
+        )
+        buffer.push("A")
+
+        # Act
+        result = buffer.push("B")
+
+        # Assert
+        assert not result
+        assert buffer.count == 1
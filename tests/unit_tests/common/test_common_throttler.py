@@ -160,6 +160,36 @@ class TestBufferingThrottler:
         assert self.throttler.sent_count == 6
 
 
+    def test_buffered_items_sent_in_order_received(self):
+        # Arrange
+        items = [f"MESSAGE-{i}" for i in range(12)]
+
+        # Act: Send 11 items (6 buffered)
+        for item in items[:11]:
+            self.throttler.send(item)
+
+        # Act: Trigger refresh token time alert
+        events = self.clock.advance_time(1_000_000_000)
+        events[0].handle_py()
+
+        # Act: Send another item while still limiting
+        self.throttler.send(items[11])
+
+        # Assert: Next 5 buffered items sent in order
+        assert self.throttler.is_limiting
+        assert self.handler == items[:10]
+        assert self.throttler.qsize == 2
+
+        # Act: Trigger refresh token time alert
+        events = self.clock.advance_time(2_000_000_000)
+        events[0].handle_py()
+
+        # Assert: All items sent in the order received
+        assert not self.throttler.is_limiting
+        assert self.handler == items
+        assert self.throttler.qsize == 0
+        assert self.throttler.sent_count == 12
+
 class TestDroppingThrottler:
     def setup(self):
         # Fixture Setup
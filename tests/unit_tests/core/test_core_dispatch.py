@@ -0,0 +1,80 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2021 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.core.dispatch import TypeDispatcher
+from nautilus_trader.model.data.base import DataType
+from nautilus_trader.model.data.base import GenericData
+from nautilus_trader.model.data.tick import QuoteTick
+from nautilus_trader.model.data.tick import Tick
+from nautilus_trader.model.orderbook.data import OrderBookData
+from tests.test_kit.stubs import TestStubs
+
+
+class CustomData(GenericData):
+    pass
+
+
+class TestTypeDispatcher:
+    def test_register_with_default_code_raises_value_error(self):
+        # Arrange
+        dispatcher = TypeDispatcher(default=0)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            dispatcher.register(Tick, 0)
+
+    def test_code_for_registered_type_returns_code(self):
+        # Arrange
+        dispatcher = TypeDispatcher()
+        dispatcher.register(QuoteTick, 1)
+
+        # Act, Assert
+        assert dispatcher.code_for(TestStubs.quote_tick_5decimal()) == 1
+
+    def test_code_for_subclass_resolves_to_registered_base(self):
+        # Arrange
+        dispatcher = TypeDispatcher()
+        dispatcher.register(OrderBookData, 1)
+        dispatcher.register(Tick, 2)
+
+        # Act, Assert
+        assert dispatcher.code_for(TestStubs.quote_tick_5decimal()) == 2
+        assert dispatcher.code_for(TestStubs.trade_tick_5decimal()) == 2
+
+    def test_code_for_unregistered_type_returns_default(self):
+        # Arrange
+        dispatcher = TypeDispatcher(default=-1)
+        dispatcher.register(Tick, 1)
+
+        # Act, Assert
+        assert dispatcher.code_for("not data") == -1
+
+    def test_register_after_resolution_updates_fallback(self):
+        # Arrange
+        dispatcher = TypeDispatcher()
+        data = CustomData(
+            data_type=DataType(QuoteTick),
+            data=TestStubs.quote_tick_5decimal(),
+        )
+
+        assert dispatcher.code_for(data) == 0
+
+        # Act
+        dispatcher.register(GenericData, 3)
+
+        # Assert
+        assert dispatcher.code_for(data) == 3
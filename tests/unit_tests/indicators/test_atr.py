@@ -19,6 +19,9 @@ import pytest
 
 from nautilus_trader.backtest.data.providers import TestInstrumentProvider
 from nautilus_trader.indicators.atr import AverageTrueRange
+from nautilus_trader.model.data.bar import Bar
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
 from tests.test_kit.stubs import TestStubs
 
 
@@ -160,6 +163,33 @@ class TestAverageTrueRange:
         # Act, Assert
         assert floored_atr.value == 5e-05
 
+    def test_handle_bars_matches_handle_bar(self):
+        # Arrange
+        bars = [
+            Bar(
+                bar_type=TestStubs.bartype_audusd_1min_bid(),
+                open=Price.from_str(f"1.0000{i % 5}"),
+                high=Price.from_str(f"1.0001{i % 7}"),
+                low=Price.from_str(f"0.9999{i % 3}"),
+                close=Price.from_str(f"1.0000{i % 9}"),
+                volume=Quantity.from_int(1_000_000),
+                ts_event=i,
+                ts_init=i,
+            )
+            for i in range(20)
+        ]
+        atr = AverageTrueRange(10)
+        for bar in bars:
+            atr.handle_bar(bar)
+
+        # Act
+        self.atr.handle_bars(bars[:5])
+        self.atr.handle_bars(bars[5:])
+
+        # Assert
+        assert self.atr.value == atr.value
+        assert self.atr.initialized
+
     def test_reset_successfully_returns_indicator_to_fresh_state(self):
         # Arrange
         for _i in range(1000):
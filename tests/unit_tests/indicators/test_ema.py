@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+
 from nautilus_trader.backtest.data.providers import TestInstrumentProvider
 from nautilus_trader.indicators.average.ema import ExponentialMovingAverage
 from nautilus_trader.model.enums import PriceType
@@ -121,6 +123,37 @@ class TestExponentialMovingAverage:
         # Act, Assert
         assert self.ema.value == 1.5123966942148757
 
+    def test_update_raws_matches_update_raw(self):
+        # Arrange
+        values = np.arange(1.0, 16.0)
+        ema = ExponentialMovingAverage(10)
+        for value in values:
+            ema.update_raw(value)
+
+        # Act
+        self.ema.update_raws(values[:5])
+        self.ema.update_raws(values[5:])
+
+        # Assert
+        assert self.ema.value == ema.value
+        assert self.ema.count == ema.count == 15
+        assert self.ema.initialized
+
+    def test_handle_bars_updates_with_expected_value(self):
+        # Arrange
+        bars = [TestStubs.bar_5decimal(), TestStubs.bar_5decimal()]
+        ema = ExponentialMovingAverage(10)
+        for bar in bars:
+            ema.handle_bar(bar)
+
+        # Act
+        self.ema.handle_bars(bars)
+
+        # Assert
+        assert self.ema.has_inputs
+        assert self.ema.count == 2
+        assert self.ema.value == ema.value
+
     def test_reset_successfully_returns_indicator_to_fresh_state(self):
         # Arrange
         for _i in range(1000):
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+
 from nautilus_trader.backtest.data.providers import TestInstrumentProvider
 from nautilus_trader.indicators.average.sma import SimpleMovingAverage
 from nautilus_trader.model.enums import PriceType
@@ -160,6 +162,33 @@ class TestSimpleMovingAverage:
         assert sma_for_ticks.has_inputs
         assert sma_for_ticks.value == 1.00001
 
+    def test_update_raws_matches_update_raw(self):
+        # Arrange
+        values = np.arange(1.0, 16.0)
+        sma = SimpleMovingAverage(10)
+        for value in values:
+            sma.update_raw(value)
+
+        # Act
+        self.sma.update_raws(values)
+
+        # Assert
+        assert self.sma.value == sma.value == 10.5
+        assert self.sma.count == sma.count == 15
+        assert self.sma.initialized
+
+    def test_handle_bars_updates_with_expected_value(self):
+        # Arrange
+        bars = [TestStubs.bar_5decimal(), TestStubs.bar_5decimal()]
+
+        # Act
+        self.sma.handle_bars(bars)
+
+        # Assert
+        assert self.sma.has_inputs
+        assert self.sma.count == 2
+        assert self.sma.value == 1.00003
+
     def test_reset_successfully_returns_indicator_to_fresh_state(self):
         # Arrange
         for _i in range(1000):
@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
 import pytest
 
 from nautilus_trader.backtest.data.providers import TestInstrumentProvider
@@ -156,6 +157,35 @@ class TestWeightedMovingAverage:
         # Act, Assert
         assert self.wma.value == 8.0
 
+    def test_update_raws_matches_update_raw(self):
+        # Arrange
+        values = np.arange(1.0, 16.0)
+        wma = WeightedMovingAverage(10, self.w)
+        for value in values[:12]:
+            wma.update_raw(value)
+
+        # Act
+        self.wma.update_raws(values[:3])
+        self.wma.update_raws(values[3:12])
+
+        # Assert
+        assert self.wma.value == wma.value
+        assert self.wma.count == wma.count == 12
+        assert self.wma.initialized
+
+    def test_update_raws_before_initialized_matches_update_raw(self):
+        # Arrange
+        values = np.arange(1.0, 6.0)
+
+        # Act
+        self.wma.update_raws(values)
+        for value in values:
+            self.wma_factory.update_raw(value)
+
+        # Assert
+        assert self.wma.value == self.wma_factory.value
+        assert not self.wma.initialized
+
     def test_reset(self):
         # Arrange
         self.wma.update_raw(1.00000)
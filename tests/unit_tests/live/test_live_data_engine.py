@@ -33,6 +33,7 @@ from nautilus_trader.model.identifiers import ClientId
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.identifiers import Symbol
 from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Price
 from nautilus_trader.msgbus.bus import MessageBus
 from nautilus_trader.portfolio.portfolio import Portfolio
 from tests.test_kit.stubs import TestStubs
@@ -122,7 +123,7 @@ class TestLiveDataEngine:
         await asyncio.sleep(0.1)
 
         # Assert
-        assert self.engine.message_qsize() == 1
+        assert self.engine.message_qsize() == 2  # <-- includes the deferred message
         assert self.engine.command_count == 0
 
     @pytest.mark.asyncio
@@ -165,7 +166,7 @@ class TestLiveDataEngine:
         await asyncio.sleep(0.1)
 
         # Assert
-        assert self.engine.message_qsize() == 1
+        assert self.engine.message_qsize() == 2  # <-- includes the deferred message
         assert self.engine.command_count == 0
 
     @pytest.mark.asyncio
@@ -200,7 +201,7 @@ class TestLiveDataEngine:
         await asyncio.sleep(0.1)
 
         # Assert
-        assert self.engine.message_qsize() == 1
+        assert self.engine.message_qsize() == 2  # <-- includes the deferred message
         assert self.engine.command_count == 0
 
     @pytest.mark.asyncio
@@ -228,9 +229,191 @@ class TestLiveDataEngine:
         await asyncio.sleep(0.1)
 
         # Assert
-        assert self.engine.data_qsize() == 1
+        assert self.engine.data_qsize() == 2  # <-- includes the deferred data
         assert self.engine.data_count == 0
 
+    @pytest.mark.asyncio
+    async def test_process_data_when_queue_full_defers_and_drains_all(self):
+        # Arrange
+        self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
+        self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
+        self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
+
+        self.engine = LiveDataEngine(
+            loop=self.loop,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+            config=LiveDataEngineConfig(qsize=2, drain_batch_size=3),
+        )
+
+        tick = TestStubs.trade_tick_5decimal()
+        for _ in range(5):
+            self.engine.process(tick)  # 3 items deferred over max size
+
+        # Act
+        self.engine.start()
+        await asyncio.sleep(0.1)
+
+        # Assert
+        assert self.engine.data_qsize() == 0
+        assert self.engine.data_count == 5
+        assert self.engine.data_drain_metrics.items == 5
+        assert self.engine.data_drain_metrics.max_batch_size == 3
+
+        # Tear Down
+        self.engine.stop()
+
+    def test_process_data_when_queue_and_overflow_full_drops_data(self):
+        # Arrange
+        self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
+        self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
+        self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
+
+        self.engine = LiveDataEngine(
+            loop=self.loop,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+            config=LiveDataEngineConfig(qsize=2, overflow_qsize=2),
+        )
+
+        tick = TestStubs.trade_tick_5decimal()
+        for _ in range(4):
+            self.engine.process(tick)
+
+        # Act
+        self.engine.process(tick)  # <-- does not raise into the caller
+
+        # Assert
+        assert self.engine.data_qsize() == 4  # <-- includes deferred items
+        assert self.engine.dropped_count == 1
+
+    @pytest.mark.asyncio
+    async def test_process_data_with_conflation_processes_latest_quote_only(self):
+        # Arrange
+        self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
+        self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
+        self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
+
+        self.engine = LiveDataEngine(
+            loop=self.loop,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+            config=LiveDataEngineConfig(conflate=["QuoteTick"]),
+        )
+
+        quote = TestStubs.quote_tick_5decimal()
+        trade = TestStubs.trade_tick_5decimal()
+        for _ in range(3):
+            self.engine.process(quote)
+        self.engine.process(trade)  # Trades are never conflated
+
+        # Act
+        self.engine.start()
+        await asyncio.sleep(0.1)
+
+        # Assert
+        assert self.engine.data_qsize() == 0
+        assert self.engine.data_count == 2
+        assert self.engine.conflated_count == 2
+
+        # Tear Down
+        self.engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_process_data_with_conflation_preserves_order_with_trades(self):
+        # Arrange
+        self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
+        self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
+        self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
+
+        self.engine = LiveDataEngine(
+            loop=self.loop,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+            config=LiveDataEngineConfig(conflate=["QuoteTick"]),
+        )
+
+        received = []
+        self.msgbus.subscribe(topic="data.*", handler=received.append)
+
+        quotes = [
+            TestStubs.quote_tick_5decimal(bid=Price.from_str(f"1.0000{i}")) for i in range(1, 5)
+        ]
+        trade = TestStubs.trade_tick_5decimal()
+        self.engine.process(quotes[0])
+        self.engine.process(quotes[1])  # Replaces quotes[0]
+        self.engine.process(trade)  # Closes the conflation for the instrument
+        self.engine.process(quotes[2])
+        self.engine.process(quotes[3])  # Replaces quotes[2]
+
+        # Act
+        self.engine.start()
+        await asyncio.sleep(0.1)
+
+        # Assert
+        assert received == [quotes[1], trade, quotes[3]]
+        assert self.engine.conflated_count == 2
+
+        # Tear Down
+        self.engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_process_data_with_conflation_preserves_order_with_bars(self):
+        # Arrange
+        self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
+        self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
+        self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
+
+        self.engine = LiveDataEngine(
+            loop=self.loop,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+            config=LiveDataEngineConfig(conflate=["QuoteTick"]),
+        )
+
+        received = []
+        self.msgbus.subscribe(topic="data.*", handler=received.append)
+
+        quotes = [
+            TestStubs.quote_tick_5decimal(bid=Price.from_str(f"1.0000{i}")) for i in range(1, 4)
+        ]
+        bar = TestStubs.bar_5decimal()  # <-- same instrument as the quotes
+        self.engine.process(quotes[0])
+        self.engine.process(bar)  # Closes the conflation for the instrument
+        self.engine.process(quotes[1])
+        self.engine.process(quotes[2])  # Replaces quotes[1]
+
+        # Act
+        self.engine.start()
+        await asyncio.sleep(0.1)
+
+        # Assert
+        assert received == [quotes[0], bar, quotes[2]]
+        assert self.engine.conflated_count == 1
+
+        # Tear Down
+        self.engine.stop()
+
+    def test_config_with_invalid_conflate_type_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            LiveDataEngineConfig(conflate=["TradeTick"])
+
     def test_get_event_loop_returns_expected_loop(self):
         # Arrange, Act
         loop = self.engine.get_event_loop()
@@ -202,7 +202,7 @@ class TestLiveExecutionEngine:
         await asyncio.sleep(0.1)
 
         # Assert
-        assert self.exec_engine.qsize() == 1
+        assert self.exec_engine.qsize() == 2  # <-- includes the deferred message
         assert self.exec_engine.command_count == 0
 
     @pytest.mark.asyncio
@@ -254,7 +254,7 @@ class TestLiveExecutionEngine:
         await asyncio.sleep(0.1)
 
         # Assert
-        assert self.exec_engine.qsize() == 1
+        assert self.exec_engine.qsize() == 2  # <-- includes the deferred message
         assert self.exec_engine.command_count == 0
 
     @pytest.mark.asyncio
@@ -513,6 +513,81 @@ class TestLiveExecutionEngine:
         # Assert
         assert result
 
+    @pytest.mark.asyncio
+    async def test_reconcile_state_with_multiple_orders_reconciles_on_events(self):
+        # Arrange
+        self.exec_engine.start()
+
+        strategy = TradingStrategy()
+        strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        order1 = strategy.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("1.00000"),
+        )
+
+        order2 = strategy.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100000),
+            Price.from_str("1.10000"),
+        )
+
+        for order, venue_order_id in ((order1, VenueOrderId("1")), (order2, VenueOrderId("2"))):
+            submit_order = SubmitOrder(
+                self.trader_id,
+                strategy.id,
+                None,
+                order,
+                self.uuid_factory.generate(),
+                self.clock.timestamp_ns(),
+            )
+            self.exec_engine.execute(submit_order)
+            self.exec_engine.process(TestStubs.event_order_submitted(order))
+            self.exec_engine.process(
+                TestStubs.event_order_accepted(order, venue_order_id=venue_order_id),
+            )
+
+        self.client.add_order_status_report(
+            OrderStatusReport(
+                client_order_id=order1.client_order_id,
+                venue_order_id=VenueOrderId("1"),
+                order_status=OrderStatus.ACCEPTED,
+                filled_qty=Quantity.zero(),
+                ts_init=0,
+            ),
+        )
+        self.client.add_order_status_report(
+            OrderStatusReport(
+                client_order_id=order2.client_order_id,
+                venue_order_id=VenueOrderId("2"),
+                order_status=OrderStatus.CANCELED,  # Requires an OrderCanceled event
+                filled_qty=Quantity.zero(),
+                ts_init=0,
+            ),
+        )
+
+        await asyncio.sleep(0.1)  # Allow processing time
+
+        # Act
+        result = await self.exec_engine.reconcile_state(timeout_secs=10)
+        self.exec_engine.stop()
+
+        # Assert
+        assert result
+        assert order1.status == OrderStatus.ACCEPTED
+        assert order2.status == OrderStatus.CANCELED
+        assert self.client.calls.count("generate_order_status_report") == 2
+
     @pytest.mark.skip(reason="reimplement reconciliation")
     @pytest.mark.asyncio
     async def test_reconcile_state_when_partially_filled_reconciles(self):
@@ -190,7 +190,7 @@ class TestLiveRiskEngine:
         await asyncio.sleep(0.1)
 
         # Assert
-        assert self.risk_engine.qsize() == 1
+        assert self.risk_engine.qsize() == 2  # <-- includes the deferred message
         assert self.risk_engine.command_count == 0
 
     @pytest.mark.asyncio
@@ -240,7 +240,7 @@ class TestLiveRiskEngine:
         await asyncio.sleep(0.1)
 
         # Assert
-        assert self.risk_engine.qsize() == 1
+        assert self.risk_engine.qsize() == 2  # <-- includes the deferred message
         assert self.risk_engine.event_count == 0
 
     @pytest.mark.asyncio
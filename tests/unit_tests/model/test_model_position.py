@@ -539,6 +539,74 @@ class TestPosition:
         assert position.commissions() == [Money(4.00, USD)]
         assert repr(position) == "Position(FLAT AUD/USD.SIM, id=P-19700101-000000-000-001-1)"
 
+    def test_position_without_retained_events_holds_last_event_only(self):
+        # Arrange
+        order1 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+        )
+
+        order2 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100000),
+        )
+
+        fill1 = TestStubs.event_order_filled(
+            order1,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-19700101-000000-000-001-1"),
+        )
+
+        fill2 = TestStubs.event_order_filled(
+            order2,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-19700101-000000-000-001-1"),
+            strategy_id=StrategyId("S-001"),
+            last_px=Price.from_str("1.00000"),
+        )
+
+        position = Position(instrument=AUDUSD_SIM, fill=fill1, retain_events=False)
+
+        # Act
+        position.apply(fill2)
+
+        # Assert
+        assert not position.retain_events
+        assert position.event_count == 2
+        assert position.events == [fill2]
+        assert position.last_event == fill2
+        assert position.client_order_ids == [order1.client_order_id, order2.client_order_id]
+        assert position.execution_ids == [
+            ExecutionId("E-19700101-000000-000-001-1"),
+            ExecutionId("E-19700101-000000-000-001-2"),
+        ]
+        assert position.is_closed
+        assert position.realized_pnl == Money(-4.00, USD)
+
+    def test_position_apply_duplicate_fill_raises_key_error(self):
+        # Arrange
+        order = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+        )
+
+        fill = TestStubs.event_order_filled(
+            order,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-123456"),
+            strategy_id=StrategyId("S-001"),
+            last_qty=Quantity.from_int(50000),
+        )
+
+        position = Position(instrument=AUDUSD_SIM, fill=fill, retain_events=False)
+
+        # Act, Assert
+        with pytest.raises(KeyError):
+            position.apply(fill)
+
     def test_position_long_with_multiple_filled_orders_returns_expected_attributes(
         self,
     ):
@@ -29,11 +29,13 @@ from nautilus_trader.adapters.betfair.providers import BetfairInstrumentProvider
 from nautilus_trader.adapters.betfair.util import make_betfair_reader
 from nautilus_trader.backtest.data.providers import TestInstrumentProvider
 from nautilus_trader.model.data.tick import QuoteTick
+from nautilus_trader.model.instruments.currency import CurrencySpot
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.persistence.catalog import DataCatalog
 from nautilus_trader.persistence.external.core import RawFile
 from nautilus_trader.persistence.external.core import _validate_dataset
+from nautilus_trader.persistence.external.core import compact_instruments
 from nautilus_trader.persistence.external.core import dicts_to_dataframes
 from nautilus_trader.persistence.external.core import process_files
 from nautilus_trader.persistence.external.core import process_raw_file
@@ -464,12 +466,12 @@ class TestPersistenceCore:
             f for f in self.fs.glob(f"{self.catalog.path}/**/*.parquet") if self.fs.isfile(f)
         ]
         ins1, ins2 = self.catalog.instruments()["id"].tolist()
+        instrument_files = [f for f in new_partitions if "betting_instrument" in f]
+        new_partitions = [f for f in new_partitions if f not in instrument_files]
 
-        today_str = pd.Timestamp.utcnow().strftime("%Y%m%d")
         expected = [
             f"/root/data/betfair_ticker.parquet/instrument_id={ins1}/20191220.parquet",
             f"/root/data/betfair_ticker.parquet/instrument_id={ins2}/20191220.parquet",
-            f"/root/data/betting_instrument.parquet/{today_str}.parquet",
             f"/root/data/instrument_status_update.parquet/instrument_id={ins1}/20191220.parquet",
             f"/root/data/instrument_status_update.parquet/instrument_id={ins2}/20191220.parquet",
             f"/root/data/order_book_data.parquet/instrument_id={ins1}/20191220.parquet",
@@ -478,6 +480,65 @@ class TestPersistenceCore:
             f"/root/data/trade_tick.parquet/instrument_id={ins2}/20191220.parquet",
         ]
         assert new_partitions == expected
+        assert len(instrument_files) == 1  # <-- instruments compacted into a single file
+
+    def test_write_instruments_appends_only_new_or_changed(self):
+        # Arrange
+        instruments = [
+            TestInstrumentProvider.default_fx_ccy("AUD/USD"),
+            TestInstrumentProvider.default_fx_ccy("GBP/USD"),
+        ]
+        write_objects(catalog=self.catalog, chunk=instruments)
+        path = f"{self.catalog.path}/data/currency_spot.parquet"
+        files = self.fs.glob(f"{path}/*.parquet")
+
+        # Act
+        write_objects(catalog=self.catalog, chunk=instruments)  # Unchanged
+        unchanged_files = self.fs.glob(f"{path}/*.parquet")
+        write_objects(
+            catalog=self.catalog,
+            chunk=[instruments[0], TestInstrumentProvider.default_fx_ccy("USD/JPY")],
+        )
+
+        # Assert
+        assert unchanged_files == files
+        assert len(self.fs.glob(f"{path}/*.parquet")) == 2
+        assert len(ds.dataset(path, filesystem=self.fs).to_table()) == 3
+        assert len(self.catalog.instruments(as_nautilus=True)) == 3
+
+    def test_write_instruments_with_only_new_timestamps_skips_unchanged(self):
+        # Arrange
+        instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+        write_objects(catalog=self.catalog, chunk=[instrument])
+        path = f"{self.catalog.path}/data/currency_spot.parquet"
+        files = self.fs.glob(f"{path}/*.parquet")
+        rebuilt = CurrencySpot.from_dict(
+            {**CurrencySpot.to_dict(instrument), "ts_event": 1, "ts_init": 2},
+        )
+
+        # Act
+        write_objects(catalog=self.catalog, chunk=[rebuilt])
+
+        # Assert
+        assert self.fs.glob(f"{path}/*.parquet") == files
+        assert len(ds.dataset(path, filesystem=self.fs).to_table()) == 1
+
+    def test_compact_instruments_keeps_latest_by_id(self):
+        # Arrange
+        instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+        path = f"{self.catalog.path}/data/currency_spot.parquet"
+        write_objects(catalog=self.catalog, chunk=[instrument])
+        self.fs.rm(f"{path}/_primary_key_index.json")  # <-- simulate an un-indexed catalog
+        write_objects(catalog=self.catalog, chunk=[instrument])
+        assert len(ds.dataset(path, filesystem=self.fs).to_table()) == 2
+
+        # Act
+        compact_instruments(catalog=self.catalog)
+
+        # Assert
+        assert len(self.fs.glob(f"{path}/*.parquet")) == 1
+        assert len(ds.dataset(path, filesystem=self.fs).to_table()) == 1
+        assert self.catalog.instruments(as_nautilus=True) == [instrument]
 
     def test_split_and_serialize_generic_data_gets_correct_class(self):
         # Arrange
@@ -92,3 +92,19 @@ def test_dict_kwarg():
     assert test1.b == {"hello": "world"}
     instances = {(("a", 1), ("b", (("hello", "world"),))): test1}
     assert Test._instances == instances
+
+
+def test_dict_kwarg_uses_call_cache():
+    # Arrange
+    class Test(metaclass=Singleton):
+        def __init__(self, a, b=None):
+            self.a = a
+            self.b = b
+
+    # Act
+    test1 = Test(1, b={"hello": "world"})
+    test2 = Test(1, b={"hello": "world"})
+
+    # Assert
+    assert test1 is test2
+    assert Test._instances_by_call == {((1,), (("b", (("hello", "world"),)),)): test1}
@@ -99,6 +99,75 @@ class TestPersistenceCatalog:
         instruments = self.catalog.instruments(as_nautilus=True)
         assert all(isinstance(ins, BettingInstrument) for ins in instruments)
 
+    def test_data_catalog_query_cache_enabled_by_default(self):
+        # Arrange
+        self.catalog.clear_cache()
+
+        # Act
+        self.catalog.trade_ticks()
+
+        # Assert
+        assert self.catalog.query_cache_max_bytes == 100_000_000
+        assert len(self.catalog._query_cache) == 1
+
+    def test_data_catalog_query_cache_disabled(self):
+        # Arrange
+        self.catalog.query_cache_max_bytes = 0
+        self.catalog.clear_cache()
+
+        # Act
+        self.catalog.trade_ticks()
+
+        # Assert
+        assert len(self.catalog._query_cache) == 0
+
+    def test_data_catalog_query_results_cached(self):
+        # Arrange
+        self.catalog.query_cache_max_bytes = 100_000_000
+        first = self.catalog.trade_ticks()
+        first.loc[:, "price"] = 0.0  # <-- mutating a result must not affect the cache
+
+        # Act
+        second = self.catalog.trade_ticks()
+
+        # Assert
+        assert len(self.catalog._query_cache) == 1
+        assert (second["price"] != 0.0).all()
+
+    def test_data_catalog_query_cache_evicts_by_bytes(self):
+        # Arrange
+        trade_ticks = self.catalog.trade_ticks()
+        nbytes = int(trade_ticks.memory_usage(index=True, deep=True).sum())
+        self.catalog.query_cache_max_bytes = nbytes
+        self.catalog.trade_ticks()
+
+        # Act
+        self.catalog.trade_ticks(start=0)  # <-- same rows, different query
+
+        # Assert: the least recently used result was evicted to stay within the limit
+        assert self.catalog._query_cache_bytes == nbytes
+        assert len(self.catalog._query_cache) == 1
+
+    def test_data_catalog_query_cache_invalidated_on_write(self):
+        # Arrange
+        self.catalog.query_cache_max_bytes = 100_000_000
+        assert len(self.catalog.instruments(as_nautilus=True)) == 2
+        instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD", venue=Venue("SIM"))
+
+        # Act
+        write_objects(catalog=self.catalog, chunk=[instrument])
+
+        # Assert
+        assert len(self.catalog.instruments(as_nautilus=True)) == 3
+
+    def test_data_catalog_construction_returns_same_instance(self):
+        # Arrange, Act
+        catalog1 = DataCatalog(path="/root/", fs_protocol="memory")
+        catalog2 = DataCatalog(path="/root/", fs_protocol="memory")
+
+        # Assert
+        assert catalog1 is catalog2
+
     def test_data_catalog_currency_with_null_max_price_loads(self):
         # Arrange
         catalog = DataCatalog.from_env()
@@ -26,6 +26,7 @@ from nautilus_trader.model.data.venue import InstrumentStatusUpdate
 from nautilus_trader.persistence.catalog import DataCatalog
 from nautilus_trader.persistence.external.core import process_files
 from nautilus_trader.persistence.external.readers import CSVReader
+from nautilus_trader.persistence.streaming import FeatherWriter
 from tests.integration_tests.adapters.betfair.test_kit import BetfairTestStubs
 from tests.test_kit import PACKAGE_ROOT
 from tests.test_kit.mocks import NewsEventData
@@ -94,6 +95,86 @@ class TestPersistenceStreaming:
         }
         assert result == expected
 
+    def test_feather_writer_buffers_rows_until_flush(self):
+        # Arrange
+        self.fs.mkdir(f"{self.catalog.path}/backtest")
+        writer = FeatherWriter(
+            path=f"{self.catalog.path}/backtest/buffered.feather",
+            fs_protocol=self.fs.protocol,
+            flush_interval=60_000,  # <-- ensure the timer can't flush during the test
+            batch_size=100,
+        )
+        ticks = self.catalog.trade_ticks(as_nautilus=True)[:10]
+
+        # Act
+        for tick in ticks:
+            writer.write(tick)
+        buffered = sum(len(rows) for rows in writer._buffers.values())
+        writer.close()
+
+        # Assert
+        assert buffered == 10
+        result = self.catalog.read_backtest(backtest_run_id="buffered")
+        assert result == ticks
+
+    def test_feather_writer_close_when_flush_fails_stops_thread(self):
+        # Arrange
+        self.fs.mkdir(f"{self.catalog.path}/backtest")
+        writer = FeatherWriter(
+            path=f"{self.catalog.path}/backtest/failed.feather",
+            fs_protocol=self.fs.protocol,
+            flush_interval=60_000,
+        )
+        writer._error = RuntimeError("flush failed")
+
+        # Act
+        with pytest.raises(RuntimeError):
+            writer.close()
+
+        # Assert
+        assert writer._closed
+        assert not writer._thread.is_alive()
+
+    def test_feather_writer_write_raises_first_flush_thread_error(self):
+        # Arrange
+        self.fs.mkdir(f"{self.catalog.path}/backtest")
+        writer = FeatherWriter(
+            path=f"{self.catalog.path}/backtest/failed_write.feather",
+            fs_protocol=self.fs.protocol,
+            flush_interval=60_000,
+            batch_size=1,
+        )
+        errors = iter([RuntimeError("first"), RuntimeError("second")])
+
+        def write_rows(table, rows):
+            raise next(errors)
+
+        writer._write_rows = write_rows
+        tick = self.catalog.trade_ticks(as_nautilus=True)[0]
+        writer.write(tick)  # <-- fails on the flush thread
+        writer._queue.put(("trade_tick", []))  # <-- fails again on the flush thread
+        with pytest.raises(RuntimeError, match="first"):
+            writer.flush()
+
+        # Act, Assert
+        with pytest.raises(RuntimeError, match="first"):
+            writer.write(tick)
+
+    def test_feather_writer_queue_is_bounded(self):
+        # Arrange
+        self.fs.mkdir(f"{self.catalog.path}/backtest")
+
+        # Act
+        writer = FeatherWriter(
+            path=f"{self.catalog.path}/backtest/bounded.feather",
+            fs_protocol=self.fs.protocol,
+            max_queued_batches=4,
+        )
+        writer.close()
+
+        # Assert
+        assert writer._queue.maxsize == 4
+
     def test_feather_writer_generic_data(self):
         # Arrange
         TestStubs.setup_news_event_persistence()
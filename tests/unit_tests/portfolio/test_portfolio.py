@@ -33,6 +33,7 @@ from nautilus_trader.model.data.tick import QuoteTick
 from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import OMSType
 from nautilus_trader.model.events.account import AccountState
+from nautilus_trader.model.events.order import OrderCanceled
 from nautilus_trader.model.identifiers import AccountId
 from nautilus_trader.model.identifiers import PositionId
 from nautilus_trader.model.identifiers import StrategyId
@@ -246,6 +247,67 @@ class TestPortfolio:
         # Assert
         assert self.portfolio.balances_locked(BINANCE)[USDT].as_decimal() == 50100
 
+    def test_update_orders_working_cash_account_incrementally_removes_canceled_order(self):
+        # Arrange
+        AccountFactory.register_calculated_account("BINANCE")
+
+        account_id = AccountId("BINANCE", "000")
+        state = AccountState(
+            account_id=account_id,
+            account_type=AccountType.CASH,
+            base_currency=None,  # Multi-currency account
+            reported=True,
+            balances=[
+                AccountBalance(
+                    USDT,
+                    Money(200000.00000000, USDT),
+                    Money(0.00000000, USDT),
+                    Money(200000.00000000, USDT),
+                ),
+            ],
+            info={},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.portfolio.update_account(state)
+
+        orders = [
+            self.order_factory.limit(
+                BTCUSDT_BINANCE.id,
+                OrderSide.BUY,
+                Quantity.from_str("1.0"),
+                Price.from_str("50000.00"),
+            )
+            for _ in range(3)
+        ]
+        for order in orders:
+            self.cache.add_order(order, position_id=None)
+            self.exec_engine.process(TestStubs.event_order_submitted(order, account_id=account_id))
+            self.exec_engine.process(TestStubs.event_order_accepted(order, account_id=account_id))
+
+        locked_all = self.portfolio.balances_locked(BINANCE)[USDT].as_decimal()
+
+        # Act
+        self.exec_engine.process(
+            OrderCanceled(
+                trader_id=orders[0].trader_id,
+                strategy_id=orders[0].strategy_id,
+                account_id=account_id,
+                instrument_id=orders[0].instrument_id,
+                client_order_id=orders[0].client_order_id,
+                venue_order_id=orders[0].venue_order_id,
+                ts_event=0,
+                event_id=UUID4(),
+                ts_init=0,
+            )
+        )
+
+        # Assert
+        assert locked_all == 150300
+        assert self.portfolio.balances_locked(BINANCE)[USDT].as_decimal() == 100200
+
     def test_update_orders_working_margin_account(self):
         # Arrange
         AccountFactory.register_calculated_account("BINANCE")
@@ -1001,6 +1063,105 @@ class TestPortfolio:
         assert self.portfolio.unrealized_pnl(GBPUSD_SIM.id) == Money(30315.00, USD)
         assert self.portfolio.net_position(AUDUSD_SIM.id) == Decimal(100000)
         assert self.portfolio.net_position(GBPUSD_SIM.id) == Decimal(100000)
+
+    def test_hedged_positions_unrealized_pnl_follows_latest_quote(self):
+        # Arrange
+        AccountFactory.register_calculated_account("SIM")
+
+        account_id = AccountId("SIM", "01234")
+        state = AccountState(
+            account_id=account_id,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            reported=True,
+            balances=[
+                AccountBalance(
+                    USD,
+                    Money(1_000_000, USD),
+                    Money(0, USD),
+                    Money(1_000_000, USD),
+                ),
+            ],
+            info={},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.portfolio.update_account(state)
+
+        last1 = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid=Price.from_str("0.80501"),
+            ask=Price.from_str("0.80505"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.cache.add_quote_tick(last1)
+        self.portfolio.update_tick(last1)
+
+        order1 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+        )
+
+        order2 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(50000),
+        )
+
+        fill1 = TestStubs.event_order_filled(
+            order1,
+            instrument=AUDUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=PositionId("P-1"),
+            last_px=Price.from_str("1.00000"),
+        )
+
+        fill2 = TestStubs.event_order_filled(
+            order2,
+            instrument=AUDUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=PositionId("P-2"),
+            last_px=Price.from_str("0.90000"),
+        )
+
+        position1 = Position(instrument=AUDUSD_SIM, fill=fill1)
+        position2 = Position(instrument=AUDUSD_SIM, fill=fill2)
+
+        self.portfolio.update_position(TestStubs.event_position_opened(position1))
+        self.portfolio.update_position(TestStubs.event_position_opened(position2))
+
+        last2 = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid=Price.from_str("0.90000"),
+            ask=Price.from_str("0.90004"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        # Act
+        pnl1 = self.portfolio.unrealized_pnl(AUDUSD_SIM.id)
+        exposure1 = self.portfolio.net_exposure(AUDUSD_SIM.id)
+        self.cache.add_quote_tick(last2)
+        self.portfolio.update_tick(last2)
+        pnl2 = self.portfolio.unrealized_pnl(AUDUSD_SIM.id)
+
+        # Assert
+        assert pnl1 == Money(-14751.50, USD)
+        assert exposure1 == Money(120753.50, USD)
+        assert pnl2 == Money(-10002.00, USD)
+        assert self.portfolio.unrealized_pnls(SIM) == {USD: Money(-10002.00, USD)}
+        assert self.portfolio.net_position(AUDUSD_SIM.id) == Decimal(50000)
         assert self.portfolio.is_net_long(AUDUSD_SIM.id)
         assert not self.portfolio.is_net_short(AUDUSD_SIM.id)
         assert not self.portfolio.is_flat(AUDUSD_SIM.id)
@@ -1313,3 +1474,287 @@ class TestPortfolio:
         assert self.portfolio.is_net_long(AUDUSD_SIM.id)
         assert self.portfolio.is_flat(GBPUSD_SIM.id)
         assert not self.portfolio.is_completely_flat()
+
+    def test_long_and_short_positions_with_single_currency_account(self):
+        # Arrange
+        AccountFactory.register_calculated_account("SIM")
+
+        account_id = AccountId("SIM", "01234")
+        state = AccountState(
+            account_id=account_id,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            reported=True,
+            balances=[
+                AccountBalance(
+                    USD,
+                    Money(1_000_000, USD),
+                    Money(0, USD),
+                    Money(1_000_000, USD),
+                ),
+            ],
+            info={},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.portfolio.update_account(state)
+
+        last_audusd = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid=Price.from_str("0.80501"),
+            ask=Price.from_str("0.80505"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        last_gbpusd = QuoteTick(
+            instrument_id=GBPUSD_SIM.id,
+            bid=Price.from_str("1.30315"),
+            ask=Price.from_str("1.30317"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.cache.add_quote_tick(last_audusd)
+        self.cache.add_quote_tick(last_gbpusd)
+        self.portfolio.update_tick(last_audusd)
+        self.portfolio.update_tick(last_gbpusd)
+
+        order1 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+        )
+
+        order2 = self.order_factory.market(
+            GBPUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(50000),
+        )
+
+        fill1 = TestStubs.event_order_filled(
+            order1,
+            instrument=AUDUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=PositionId("P-1"),
+            last_px=Price.from_str("0.80000"),
+        )
+
+        fill2 = TestStubs.event_order_filled(
+            order2,
+            instrument=GBPUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=PositionId("P-2"),
+            last_px=Price.from_str("1.30000"),
+        )
+
+        position1 = Position(instrument=AUDUSD_SIM, fill=fill1)
+        position2 = Position(instrument=GBPUSD_SIM, fill=fill2)
+
+        # Act
+        self.portfolio.update_position(TestStubs.event_position_opened(position1))
+        self.portfolio.update_position(TestStubs.event_position_opened(position2))
+
+        # Assert
+        assert self.portfolio.net_exposure(AUDUSD_SIM.id) == Money(80501.00, USD)
+        assert self.portfolio.net_exposure(GBPUSD_SIM.id) == Money(65158.50, USD)
+        assert self.portfolio.net_exposures(SIM) == {USD: Money(145659.50, USD)}
+        assert self.portfolio.unrealized_pnl(AUDUSD_SIM.id) == Money(501.00, USD)
+        assert self.portfolio.unrealized_pnl(GBPUSD_SIM.id) == Money(-158.50, USD)
+        assert self.portfolio.unrealized_pnls(SIM) == {USD: Money(342.50, USD)}
+        assert self.portfolio.net_position(GBPUSD_SIM.id) == Decimal(-50000)
+
+    def test_long_and_short_positions_with_multi_currency_account(self):
+        # Arrange
+        AccountFactory.register_calculated_account("BITMEX")
+
+        account_id = AccountId("BITMEX", "01234")
+        state = AccountState(
+            account_id=account_id,
+            account_type=AccountType.MARGIN,
+            base_currency=None,  # Multi-currency account
+            reported=True,
+            balances=[
+                AccountBalance(
+                    BTC,
+                    Money(10.00000000, BTC),
+                    Money(0.00000000, BTC),
+                    Money(10.00000000, BTC),
+                ),
+                AccountBalance(
+                    ETH,
+                    Money(20.00000000, ETH),
+                    Money(0.00000000, ETH),
+                    Money(20.00000000, ETH),
+                ),
+            ],
+            info={},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.portfolio.update_account(state)
+
+        last_ethusd = QuoteTick(
+            instrument_id=ETHUSD_BITMEX.id,
+            bid=Price.from_str("376.05"),
+            ask=Price.from_str("377.10"),
+            bid_size=Quantity.from_str("16"),
+            ask_size=Quantity.from_str("25"),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        last_btcusd = QuoteTick(
+            instrument_id=BTCUSD_BITMEX.id,
+            bid=Price.from_str("10500.05"),
+            ask=Price.from_str("10501.51"),
+            bid_size=Quantity.from_str("2.54"),
+            ask_size=Quantity.from_str("0.91"),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.cache.add_quote_tick(last_ethusd)
+        self.cache.add_quote_tick(last_btcusd)
+        self.portfolio.update_tick(last_ethusd)
+        self.portfolio.update_tick(last_btcusd)
+
+        order1 = self.order_factory.market(
+            ETHUSD_BITMEX.id,
+            OrderSide.BUY,
+            Quantity.from_int(10000),
+        )
+
+        order2 = self.order_factory.market(
+            BTCUSD_BITMEX.id,
+            OrderSide.SELL,
+            Quantity.from_int(10000),
+        )
+
+        fill1 = TestStubs.event_order_filled(
+            order=order1,
+            instrument=ETHUSD_BITMEX,
+            strategy_id=StrategyId("S-001"),
+            account_id=account_id,
+            position_id=PositionId("P-1"),
+            last_px=Price.from_str("376.05"),
+        )
+
+        fill2 = TestStubs.event_order_filled(
+            order=order2,
+            instrument=BTCUSD_BITMEX,
+            strategy_id=StrategyId("S-001"),
+            account_id=account_id,
+            position_id=PositionId("P-2"),
+            last_px=Price.from_str("10500.0"),
+        )
+
+        position1 = Position(instrument=ETHUSD_BITMEX, fill=fill1)
+        position2 = Position(instrument=BTCUSD_BITMEX, fill=fill2)
+
+        # Act
+        self.portfolio.update_position(TestStubs.event_position_opened(position1))
+        self.portfolio.update_position(TestStubs.event_position_opened(position2))
+
+        # Assert
+        assert self.portfolio.net_exposure(ETHUSD_BITMEX.id) == Money(26.59220848, ETH)
+        assert self.portfolio.net_exposure(BTCUSD_BITMEX.id) == Money(0.95224401, BTC)
+        assert self.portfolio.net_exposures(BITMEX) == {
+            ETH: Money(26.59220848, ETH),
+            BTC: Money(0.95224401, BTC),
+        }
+        assert self.portfolio.unrealized_pnl(ETHUSD_BITMEX.id) == Money(0.00000000, ETH)
+        assert self.portfolio.unrealized_pnl(BTCUSD_BITMEX.id) == Money(-0.00013694, BTC)
+        assert self.portfolio.net_position(BTCUSD_BITMEX.id) == Decimal(-10000)
+
+    def test_net_exposures_skips_instrument_with_no_prices(self):
+        # Arrange
+        AccountFactory.register_calculated_account("SIM")
+
+        account_id = AccountId("SIM", "01234")
+        state = AccountState(
+            account_id=account_id,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            reported=True,
+            balances=[
+                AccountBalance(
+                    USD,
+                    Money(1_000_000, USD),
+                    Money(0, USD),
+                    Money(1_000_000, USD),
+                ),
+            ],
+            info={},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.portfolio.update_account(state)
+
+        last_audusd = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid=Price.from_str("0.80501"),
+            ask=Price.from_str("0.80505"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.cache.add_quote_tick(last_audusd)
+        self.portfolio.update_tick(last_audusd)
+
+        order1 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+        )
+
+        order2 = self.order_factory.market(
+            GBPUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(50000),
+        )
+
+        fill1 = TestStubs.event_order_filled(
+            order1,
+            instrument=AUDUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=PositionId("P-1"),
+            last_px=Price.from_str("0.80000"),
+        )
+
+        fill2 = TestStubs.event_order_filled(
+            order2,
+            instrument=GBPUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=PositionId("P-2"),
+            last_px=Price.from_str("1.30000"),
+        )
+
+        position1 = Position(instrument=AUDUSD_SIM, fill=fill1)
+        position2 = Position(instrument=GBPUSD_SIM, fill=fill2)
+
+        self.portfolio.update_position(TestStubs.event_position_opened(position1))
+        self.portfolio.update_position(TestStubs.event_position_opened(position2))
+
+        # Act
+        result = self.portfolio.net_exposures(SIM)
+
+        # Assert
+        assert result == {USD: Money(80501.00, USD)}
+        assert self.portfolio.net_exposure(GBPUSD_SIM.id) == Money(0, USD)
@@ -795,6 +795,256 @@ class TestRiskEngine:
         # Assert
         assert self.exec_engine.command_count == 0  # <-- command never reaches engine
 
+    def test_submit_order_when_limit_order_at_max_notional_then_sends_to_execution(self):
+        # Arrange
+        self.risk_engine.set_max_notional_per_order(AUDUSD_SIM.id, 1_000_000)
+
+        self.exec_engine.start()
+
+        strategy = TradingStrategy()
+        strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        order = strategy.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(1250000),
+            Price.from_str("0.80000"),
+        )
+
+        submit_order = SubmitOrder(
+            self.trader_id,
+            strategy.id,
+            None,
+            order,
+            self.uuid_factory.generate(),
+            self.clock.timestamp_ns(),
+        )
+
+        # Act
+        self.risk_engine.execute(submit_order)
+
+        # Assert
+        assert self.exec_engine.command_count == 1  # <-- exactly at limit is not exceeded
+
+    def _risk_engine_with_config(self, config):
+        self.msgbus.deregister("RiskEngine.execute", self.risk_engine.execute)
+
+        return RiskEngine(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+            config=config,
+        )
+
+    def test_submit_order_when_exceeds_max_open_orders_per_strategy_then_denies(self):
+        # Arrange
+        risk_engine = self._risk_engine_with_config(
+            RiskEngineConfig(max_open_orders_per_strategy=1),
+        )
+
+        self.exec_engine.start()
+
+        strategy = TradingStrategy()
+        strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        order1 = strategy.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("1.00000"),
+        )
+
+        order2 = strategy.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("0.99000"),
+        )
+
+        risk_engine.execute(
+            SubmitOrder(
+                self.trader_id,
+                strategy.id,
+                None,
+                order1,
+                self.uuid_factory.generate(),
+                self.clock.timestamp_ns(),
+            )
+        )
+
+        # Act
+        risk_engine.execute(
+            SubmitOrder(
+                self.trader_id,
+                strategy.id,
+                None,
+                order2,
+                self.uuid_factory.generate(),
+                self.clock.timestamp_ns(),
+            )
+        )
+
+        # Assert
+        assert risk_engine.open_order_count(strategy.id) == 1
+        assert self.exec_engine.command_count == 1  # <-- second command never reaches engine
+
+    def test_submit_order_when_exceeds_max_gross_exposure_per_strategy_then_denies(self):
+        # Arrange
+        risk_engine = self._risk_engine_with_config(
+            RiskEngineConfig(max_gross_exposure_per_strategy={"TradingStrategy-000": 150_000}),
+        )
+
+        self.exec_engine.start()
+
+        strategy = TradingStrategy()
+        strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        order1 = strategy.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("1.00000"),
+        )
+
+        order2 = strategy.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100000),
+            Price.from_str("1.10000"),
+        )
+
+        risk_engine.execute(
+            SubmitOrder(
+                self.trader_id,
+                strategy.id,
+                None,
+                order1,
+                self.uuid_factory.generate(),
+                self.clock.timestamp_ns(),
+            )
+        )
+
+        # Act
+        risk_engine.execute(
+            SubmitOrder(
+                self.trader_id,
+                strategy.id,
+                None,
+                order2,
+                self.uuid_factory.generate(),
+                self.clock.timestamp_ns(),
+            )
+        )
+
+        # Assert
+        assert risk_engine.strategy_exposure(strategy.id).gross() == 100000
+        assert self.exec_engine.command_count == 1  # <-- second command never reaches engine
+
+    def test_submit_order_when_exceeds_max_position_size_then_denies(self):
+        # Arrange
+        risk_engine = self._risk_engine_with_config(
+            RiskEngineConfig(max_position_size={"AUD/USD.SIM": 150_000}),
+        )
+
+        self.exec_engine.start()
+
+        strategy = TradingStrategy()
+        strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        order1 = strategy.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("1.00000"),
+        )
+
+        risk_engine.execute(
+            SubmitOrder(
+                self.trader_id,
+                strategy.id,
+                None,
+                order1,
+                self.uuid_factory.generate(),
+                self.clock.timestamp_ns(),
+            )
+        )
+
+        self.exec_engine.process(TestStubs.event_order_submitted(order1))
+        self.exec_engine.process(TestStubs.event_order_accepted(order1))
+        self.exec_engine.process(TestStubs.event_order_filled(order1, AUDUSD_SIM))
+
+        order2 = strategy.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("1.00000"),
+        )
+
+        order3 = strategy.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100000),
+            Price.from_str("1.00000"),
+        )
+
+        # Act
+        risk_engine.execute(
+            SubmitOrder(
+                self.trader_id,
+                strategy.id,
+                None,
+                order2,
+                self.uuid_factory.generate(),
+                self.clock.timestamp_ns(),
+            )
+        )
+        risk_engine.execute(
+            SubmitOrder(
+                self.trader_id,
+                strategy.id,
+                None,
+                order3,
+                self.uuid_factory.generate(),
+                self.clock.timestamp_ns(),
+            )
+        )
+
+        # Assert
+        assert risk_engine.open_order_count(strategy.id) == 1  # <-- filled order no longer open
+        assert risk_engine.strategy_exposure(strategy.id).long_value == 100000  # <-- position
+        assert risk_engine.strategy_exposure(strategy.id).short_value == 100000  # <-- order3
+        assert self.exec_engine.command_count == 2  # <-- order2 never reaches engine
+
     def test_submit_order_when_reducing_and_buy_order_adds_then_denies(self):
         # Arrange
         self.risk_engine.set_max_notional_per_order(AUDUSD_SIM.id, 1_000_000)
@@ -1494,6 +1744,195 @@ class TestRiskEngine:
         assert self.risk_engine.command_count == 2
         assert self.exec_engine.command_count == 2
 
+    def test_modify_order_when_quantity_exceeds_max_position_size_then_denies(self):
+        # Arrange
+        risk_engine = self._risk_engine_with_config(
+            RiskEngineConfig(max_position_size={"AUD/USD.SIM": 150_000}),
+        )
+
+        self.exec_engine.start()
+
+        strategy = TradingStrategy()
+        strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        order = strategy.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("1.00000"),
+        )
+
+        risk_engine.execute(
+            SubmitOrder(
+                self.trader_id,
+                strategy.id,
+                None,
+                order,
+                self.uuid_factory.generate(),
+                self.clock.timestamp_ns(),
+            )
+        )
+
+        self.exec_engine.process(TestStubs.event_order_submitted(order))
+        self.exec_engine.process(TestStubs.event_order_accepted(order))
+
+        modify = ModifyOrder(
+            self.trader_id,
+            strategy.id,
+            order.instrument_id,
+            order.client_order_id,
+            VenueOrderId("1"),
+            Quantity.from_int(200000),
+            None,
+            None,
+            self.uuid_factory.generate(),
+            self.clock.timestamp_ns(),
+        )
+
+        # Act
+        risk_engine.execute(modify)
+
+        # Assert
+        assert risk_engine.command_count == 2
+        assert self.exec_engine.command_count == 1  # <-- modify never reaches engine
+
+    def test_modify_order_when_quantity_exceeds_max_gross_exposure_then_denies(self):
+        # Arrange
+        risk_engine = self._risk_engine_with_config(
+            RiskEngineConfig(max_gross_exposure_per_strategy={"TradingStrategy-000": 150_000}),
+        )
+
+        self.exec_engine.start()
+
+        strategy = TradingStrategy()
+        strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        order = strategy.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("1.00000"),
+        )
+
+        risk_engine.execute(
+            SubmitOrder(
+                self.trader_id,
+                strategy.id,
+                None,
+                order,
+                self.uuid_factory.generate(),
+                self.clock.timestamp_ns(),
+            )
+        )
+
+        self.exec_engine.process(TestStubs.event_order_submitted(order))
+        self.exec_engine.process(TestStubs.event_order_accepted(order))
+
+        modify_within = ModifyOrder(
+            self.trader_id,
+            strategy.id,
+            order.instrument_id,
+            order.client_order_id,
+            VenueOrderId("1"),
+            Quantity.from_int(150000),
+            None,
+            None,
+            self.uuid_factory.generate(),
+            self.clock.timestamp_ns(),
+        )
+
+        modify_exceeds = ModifyOrder(
+            self.trader_id,
+            strategy.id,
+            order.instrument_id,
+            order.client_order_id,
+            VenueOrderId("1"),
+            Quantity.from_int(200000),
+            None,
+            None,
+            self.uuid_factory.generate(),
+            self.clock.timestamp_ns(),
+        )
+
+        # Act
+        risk_engine.execute(modify_within)
+        risk_engine.execute(modify_exceeds)
+
+        # Assert
+        assert risk_engine.command_count == 3
+        assert self.exec_engine.command_count == 2  # <-- second modify never reaches engine
+
+    def test_modify_order_when_exceeds_max_notional_then_denies(self):
+        # Arrange
+        self.risk_engine.set_max_notional_per_order(AUDUSD_SIM.id, 150_000)
+
+        self.exec_engine.start()
+
+        strategy = TradingStrategy()
+        strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        order = strategy.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100000),
+            Price.from_str("1.00000"),
+        )
+
+        self.risk_engine.execute(
+            SubmitOrder(
+                self.trader_id,
+                strategy.id,
+                None,
+                order,
+                self.uuid_factory.generate(),
+                self.clock.timestamp_ns(),
+            )
+        )
+
+        self.exec_engine.process(TestStubs.event_order_submitted(order))
+        self.exec_engine.process(TestStubs.event_order_accepted(order))
+
+        modify = ModifyOrder(
+            self.trader_id,
+            strategy.id,
+            order.instrument_id,
+            order.client_order_id,
+            VenueOrderId("1"),
+            Quantity.from_int(100000),
+            Price.from_str("2.00000"),
+            None,
+            self.uuid_factory.generate(),
+            self.clock.timestamp_ns(),
+        )
+
+        # Act
+        self.risk_engine.execute(modify)
+
+        # Assert
+        assert self.risk_engine.command_count == 2
+        assert self.exec_engine.command_count == 1  # <-- modify never reaches engine
+
     # -- CANCEL ORDER TESTS ------------------------------------------------------------------------
 
     def test_cancel_order_when_order_does_not_exist_then_denies(self):
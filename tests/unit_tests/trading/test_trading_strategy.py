@@ -645,6 +645,32 @@ class TestTradingStrategy:
         # Assert
         assert ema.count == 1
 
+    def test_handle_bars_updates_indicators_with_batch(self):
+        # Arrange
+        bar_type = TestStubs.bartype_audusd_1min_bid()
+        strategy = TradingStrategy()
+        strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        ema1 = ExponentialMovingAverage(10)
+        ema2 = ExponentialMovingAverage(20)
+        strategy.register_indicator_for_bars(bar_type, ema1)
+        strategy.register_indicator_for_bars(bar_type, ema2)
+        bars = [TestStubs.bar_5decimal() for _ in range(3)]
+
+        # Act
+        strategy.handle_bars(bars)
+
+        # Assert
+        assert ema1.count == 3
+        assert ema2.count == 3
+
     def test_handle_bars_with_no_bars_logs_and_continues(self):
         # Arrange
         bar_type = TestStubs.bartype_gbpusd_1sec_mid()